@@ -0,0 +1,55 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from fastapi import Depends, Request
+
+from app.api.dependencies.request import get_content_schema_version
+from app.core.helpers.cache.warmup import (
+    WARMUP_USER_AGENT,
+    record_warmup_query,
+)
+from app.models.schemas.cache import WarmupEndpoint, WarmupQuery
+from app.resources.common_headers import DATA_PARTITION_ID
+
+
+async def record_search_query(
+    request: Request,
+    analysis_type: str,
+    content_schema_version: str = Depends(get_content_schema_version),
+) -> None:
+    """Record a search query for the cache warm-up.
+
+    :param request: the request
+    :type request: Request
+    :param analysis_type: analysis type
+    :type analysis_type: str
+    :param content_schema_version: content schema version
+    :type content_schema_version: str
+    """
+    if request.headers.get("User-Agent") == WARMUP_USER_AGENT:
+        return
+    if request.url.path.endswith(WarmupEndpoint.SEARCH_DATA.value):
+        endpoint = WarmupEndpoint.SEARCH_DATA
+    else:
+        endpoint = WarmupEndpoint.SEARCH
+    record_warmup_query(
+        WarmupQuery(
+            data_partition_id=request.headers.get(DATA_PARTITION_ID),
+            analysis_type=analysis_type,
+            content_schema_version=content_schema_version,
+            endpoint=endpoint,
+            params=request.query_params.multi_items(),
+        ),
+    )
@@ -34,6 +34,14 @@ async def get_data_file_source(
 ):
     dataset_id, version = get_id_version(dataset_full_id)
     dataset_record = await storage_service.get_record(dataset_id, version)
+    return await build_data_file_source(dataset_id, dataset_record, dataset_service)
+
+
+async def build_data_file_source(
+    dataset_id: str,
+    dataset_record: dict,
+    dataset_service: dataset.DatasetService,
+) -> DatasetSourceFile:
     mime_type = await get_mime_type(dataset_record)
 
     return DatasetSourceFile(
@@ -51,12 +59,18 @@ async def get_data_file_sources(
 ) -> List[DatasetSourceFile]:
     record = await storage_service.get_record(record_id, version)
     datasets = record["data"].get("Datasets", [])
+    ids_versions = [get_id_version(dataset_full_id) for dataset_full_id in datasets]
+    dataset_ids = [dataset_id for dataset_id, _ in ids_versions]
+    # the latest dataset records are read with batched queries
+    dataset_records = await storage_service.get_records_batch(
+        dataset_ids, [version for _, version in ids_versions],
+    )
 
     tasks = []
     try:
         async with asyncio.TaskGroup() as group:
-            for dataset_id in datasets:
-                tasks.append(group.create_task(get_data_file_source(dataset_id, storage_service, dataset_service)))
+            for dataset_id, dataset_record in zip(dataset_ids, dataset_records):
+                tasks.append(group.create_task(build_data_file_source(dataset_id, dataset_record, dataset_service)))
     except ExceptionGroup as eg:
         for exc in eg.exceptions:  # noqa: WPS328 pylint: disable=not-an-iterable
             raise exc
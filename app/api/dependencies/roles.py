@@ -0,0 +1,38 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from fastapi import Depends
+from loguru import logger
+
+from app.api.dependencies.services import get_async_entitlements_service
+from app.exceptions import exceptions
+from app.resources.required_roles import AdminRequiredRoles
+from app.services import entitlements
+
+
+async def require_admin_role(
+    entitlements_service: entitlements.EntitlementsService = Depends(get_async_entitlements_service),
+) -> None:
+    """Require the caller to be a member of an admin group.
+
+    :param entitlements_service: entitlements service
+    :type entitlements_service: entitlements.EntitlementsService
+    :raises exceptions.ForbiddenException: if the caller isn't an admin
+    """
+    groups_response = await entitlements_service.get_groups()
+    group_names = {group.get("name") for group in groups_response.get("groups", [])}
+    if group_names.isdisjoint(AdminRequiredRoles.ADMIN_ROLES):
+        reason = f"One of the roles {AdminRequiredRoles.ADMIN_ROLES} is required."
+        logger.debug(reason)
+        raise exceptions.ForbiddenException(detail=reason)
@@ -15,7 +15,7 @@
 import asyncio
 import copy
 import json
-from typing import Iterable, List, Optional, Set, Tuple, TypeVar
+from typing import Iterable, List, NamedTuple, Optional, Set, Tuple, TypeVar
 
 from fastapi import Depends, HTTPException, Query, Request
 from loguru import logger
@@ -28,8 +28,10 @@ from app.api.dependencies.services import (
     get_async_storage_service,
 )
 from app.api.routes.utils.api_version import get_api_version_from_url
-from app.api.routes.utils.query import divide_chunks, find_osdu_ids_from_string
-from app.core.config import get_app_settings
+from app.api.routes.utils.query import (
+    find_missing_records,
+    find_osdu_ids_from_string,
+)
 from app.exceptions.exceptions import (
     BadRequestException,
     InvalidDatasetException,
@@ -40,7 +42,7 @@ from app.models.domain.osdu import base as osdu_models_base
 from app.models.schemas.osdu_storage import OsduStorageRecord
 from app.models.schemas.pandas_dataframe import OrientSplit
 from app.resources.errors import FilterValidationError
-from app.resources.filters import DataFrameFilterValidator
+from app.resources.filters import DataFrameFilterValidator, get_filter_plan
 from app.resources.paths import COMMON_RELATIVE_PATHS
 from app.services.schema import SchemaService
 from app.services.storage import StorageService
@@ -49,7 +51,14 @@ SAMPLESANALYSIS_PARENT_RECORDS_FIELD = "ParentSamplesAnalysesReports"
 SAMPLESANALYSIS_TYPE_RECORD_FIELD = "SampleAnalysisTypeIDs"
 
 Model = TypeVar("Model", bound=BaseModel)
-settings = get_app_settings()
+
+
+class SearchDataPagination(NamedTuple):
+    """Pagination parameters of the search data endpoints."""
+
+    offset: int
+    page_limit: int
+    count_total: bool
 
 
 def get_id(id_data):  # noqa: CCR001
@@ -129,12 +138,9 @@ async def validate_referential_integrity(
     validate_ids_from_records(records, fields)
 
     all_test_ids = get_all_ids_from_records(records)
-    missing_ids = []
 
     logger.debug(f"The list of ids to check exist on storage: {all_test_ids}")
-    for ids_to_check in divide_chunks(list(all_test_ids), settings.storage_query_limit):
-        storage_response = await storage_service.query_records(ids_to_check)
-        missing_ids.extend(storage_response["invalidRecords"])
+    missing_ids = await find_missing_records(storage_service, all_test_ids)
 
     logger.debug(missing_ids)
 
@@ -356,18 +362,13 @@ async def validate_filters(
     :return: filter object with validations
     :rtype: DataFrameFilterValidator
     """
-    sql_filter = DataFrameFilterValidator(
-        model=model,
-        raw_columns_filter=columns_filter,
-        raw_rows_filter=rows_filter,
-        raw_columns_aggregation=columns_aggregation,
-    )
     try:
-        any([
-            sql_filter.valid_columns_aggregation,
-            sql_filter.valid_columns_filter,
-            sql_filter.valid_rows_filter,
-        ])
+        sql_filter = get_filter_plan(
+            model,
+            raw_columns_filter=columns_filter,
+            raw_rows_filter=rows_filter,
+            raw_columns_aggregation=columns_aggregation,
+        )
     except FilterValidationError as exc:
         logger.debug(f"Query parameters are invalid: {exc}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
@@ -410,8 +411,12 @@ async def get_search_data_pagination_parameters(
         example=100,
         ge=0,
     ),
-) -> Tuple[int, int]:
-    return offset, page_limit
+    count_total: bool = Query(
+        default=True,
+        description="Read all the data to get the exact total_size",
+    ),
+) -> SearchDataPagination:
+    return SearchDataPagination(offset, page_limit, count_total)
 
 
 async def get_search_pagination_parameters(
@@ -14,9 +14,10 @@
 
 from fastapi import APIRouter
 
-from app.api.routes import healthz, info, readiness
+from app.api.routes import cache, healthz, info, readiness
 
 router = APIRouter()
 router.include_router(info.router, tags=["info"])
 router.include_router(healthz.router, tags=["healthz"])
 router.include_router(readiness.router, tags=["healthz"])
+router.include_router(cache.router, tags=["cache"])
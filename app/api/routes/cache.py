@@ -0,0 +1,95 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Body, Depends, Query, Request
+
+from app.api.dependencies.auth import require_authorized_user
+from app.api.dependencies.roles import require_admin_role
+from app.api.routes.utils.api_description_helper import APIDescriptionHelper
+from app.core.config import get_app_settings
+from app.core.helpers.cache.warmup import get_warmup_queries, warm_up_cache
+from app.core.helpers.cache_helper import get_top_keys
+from app.models.schemas.cache import (
+    CacheKeySize,
+    CacheTopKeysResponse,
+    WarmupQuery,
+    WarmupReport,
+)
+from app.models.schemas.user import User
+
+DEFAULT_TOP_KEYS_LIMIT = 20
+MAX_TOP_KEYS_LIMIT = 1000
+
+router = APIRouter()
+
+
+@router.get(
+    "/cache/top-keys",
+    response_model=CacheTopKeysResponse,
+    dependencies=[Depends(require_admin_role)],
+    description=APIDescriptionHelper.append_admin_roles(
+        "Get the biggest cache entries, to tune the cache ttl and budgets.",
+    ),
+)
+async def get_cache_top_keys(
+    limit: int = Query(default=DEFAULT_TOP_KEYS_LIMIT, ge=1, le=MAX_TOP_KEYS_LIMIT),
+) -> CacheTopKeysResponse:
+    """Get the biggest cache entries.
+
+    :param limit: max number of keys, defaults to 20
+    :type limit: int
+    :return: keys and sizes in bytes, biggest first
+    :rtype: CacheTopKeysResponse
+    """
+    if not get_app_settings().cache_enable:
+        return CacheTopKeysResponse(keys=[])
+    top_keys = await get_top_keys(limit)
+    return CacheTopKeysResponse(keys=[CacheKeySize(key=key, size=size) for key, size in top_keys])
+
+
+@router.post(
+    "/cache/warmup",
+    response_model=WarmupReport,
+    dependencies=[Depends(require_admin_role)],
+    description=APIDescriptionHelper.append_admin_roles(
+        "Replay search queries to fill the cache, with the caller token. <br><br>\
+        Without a body, the queries of the warm-up file and the most frequent \
+        recorded ones are replayed.",
+    ),
+)
+async def post_cache_warmup(
+    request: Request,
+    queries: Optional[List[WarmupQuery]] = Body(default=None),
+    user: User = Depends(require_authorized_user),
+) -> WarmupReport:
+    """Replay search queries to fill the cache.
+
+    :param request: the request
+    :type request: Request
+    :param queries: queries to replay, defaults to the configured and
+        recorded ones
+    :type queries: Optional[List[WarmupQuery]]
+    :param user: the caller
+    :type user: User
+    :return: number of replayed and failed queries
+    :rtype: WarmupReport
+    """
+    settings = get_app_settings()
+    if not settings.cache_enable:
+        return WarmupReport(replayed=0, failed=0)
+    if queries is None:
+        queries = await get_warmup_queries(settings)
+    return await warm_up_cache(request.app, queries, user.access_token, settings.cache_warmup_concurrency)
@@ -20,7 +20,6 @@ import pandas as pd
 import pyarrow
 from fastapi import APIRouter, Depends, Path, Request, Response
 from fastapi.responses import JSONResponse
-from fastapi_cache.decorator import cache
 from loguru import logger
 from pydantic import BaseModel
 from starlette import status
@@ -46,6 +45,7 @@ from app.api.routes.utils.records import (
     dataset_id_exist,
     find_dataset_id,
     find_schema_versions_for_dataset_id,
+    find_versioned_dataset_id,
     generate_dataset_urn,
     get_id_version,
     update_dataset_id,
@@ -53,14 +53,15 @@ from app.api.routes.utils.records import (
 from app.bulk_data_validation.data_validation import DataValidator
 from app.core.config import get_app_settings
 from app.core.helpers.cache.coder import ResponseCoder
-from app.core.helpers.cache.key_builder import key_builder_using_token
 from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+from app.core.helpers.cache.shared_cache import shared_cache
 from app.dataframe.parquet_filter import apply_filters_from_bytes
 from app.exceptions import exceptions
 from app.models.data_schemas.data_schema import build_data_schema
 from app.resources.filters import DataFrameFilterValidator
 from app.resources.mime_types import SupportedMimeTypes
 from app.services import dataset, storage
+from app.services.asyncify import run_in_threadpool, run_until_disconnected
 
 
 class BaseDataView:
@@ -109,7 +110,7 @@ class BaseDataView:
         self._prepare_get_data_route()
         self._prepare_post_data_route()
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder, key_builder=key_builder_using_token)
+    @shared_cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder)
     async def get_data(
         self,
         request: Request,
@@ -229,7 +230,8 @@ class BaseDataView:
         if dataset_id_exist(ddms_datasets, dataset_id):
             logger.debug(f"Retrieving dataset: {dataset_id}")
             self._check_content_schema_version(content_schema_version, ddms_datasets, dataset_id)
-            parquet_bytes = await dataset_service.download_file(dataset_id)
+            versioned_dataset_id = find_versioned_dataset_id(ddms_datasets, dataset_id)
+            parquet_bytes = await dataset_service.download_file(versioned_dataset_id or dataset_id)
 
             if not parquet_bytes:
                 reason = f"{dataset_id} exist in record but without content."
@@ -238,15 +240,22 @@ class BaseDataView:
                     detail=reason,
                 )
 
-            df = apply_filters_from_bytes(parquet_bytes, df_filter)
+            df = await run_until_disconnected(
+                request,
+                run_in_threadpool(apply_filters_from_bytes, parquet_bytes, df_filter),
+                get_app_settings().disconnect_poll_interval,
+            )
             logger.debug(f"Dataset info: {df.size} elements; {df.columns}")
 
             if mime_type == SupportedMimeTypes.PARQUET:
                 df.astype(str)
-                response = Response(content=df.to_parquet(), media_type=SupportedMimeTypes.PARQUET.mime_type)
+                response = Response(
+                    content=await run_in_threadpool(df.to_parquet),
+                    media_type=SupportedMimeTypes.PARQUET.mime_type,
+                )
             else:
                 response = Response(
-                    content=df.to_json(orient="split"),
+                    content=await run_in_threadpool(df.to_json, orient="split"),
                     media_type=SupportedMimeTypes.JSON.mime_type,
                 )
             del df
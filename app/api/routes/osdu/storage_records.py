@@ -26,6 +26,7 @@ from app.api.dependencies.services import (
 from app.api.routes.utils.api_description_helper import APIDescriptionHelper
 from app.core.helpers.cache.key_builder import key_builder_using_token
 from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+from app.core.helpers.cache.shared_cache import shared_cache
 from app.models.schemas.osdu_storage import (
     OsduStorageRecord,
     StorageUpsertResponse,
@@ -47,7 +48,7 @@ class BaseStorageRecordView:
         self._id_regex_str = id_regex_str
         self._prepare_api_routes()
 
-    @cache(expire=CACHE_DEFAULT_TTL, key_builder=key_builder_using_token)
+    @shared_cache(expire=CACHE_DEFAULT_TTL)
     async def get_record(
         self,
         record_id: str,
@@ -81,7 +82,7 @@ class BaseStorageRecordView:
         """
         return await storage_service.get_record_versions(record_id)
 
-    @cache(expire=CACHE_DEFAULT_TTL, key_builder=key_builder_using_token)
+    @shared_cache(expire=CACHE_DEFAULT_TTL)
     async def get_record_specific_version(
         self,
         version: int,
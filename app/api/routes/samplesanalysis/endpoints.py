@@ -13,40 +13,33 @@
 #  limitations under the License.
 
 import json
+from contextlib import aclosing
 from typing import Annotated, AsyncGenerator, Dict, List, Optional, Tuple
 
 import pandas as pd
 from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
-from fastapi_cache.decorator import cache
 from loguru import logger
 from starlette import status
 
+from app.api.dependencies import services, validation
+from app.api.dependencies.cache import record_search_query
 from app.api.dependencies.request import (
     get_content_schema_version,
     validate_bulkdata_content_type,
     validate_json_content_type,
 )
-from app.api.dependencies.services import (
-    get_async_dataset_service,
-    get_async_search_service,
-    get_async_storage_service,
-    get_blob_storage_service,
-)
-from app.api.dependencies.validation import (
-    get_search_data_pagination_parameters,
-    get_search_pagination_parameters,
-    validate_filters,
-)
 from app.api.routes.osdu.storage_records import BaseStorageRecordView
 from app.api.routes.utils.api_description_helper import APIDescriptionHelper
 from app.core.config import get_app_settings
-from app.core.helpers.cache.coder import ResponseCoder
-from app.core.helpers.cache.key_builder import key_builder_using_token
-from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+from app.core.helpers.cache import coder
+from app.core.helpers.cache import settings as cache_settings
+from app.core.helpers.cache import shared_cache
 from app.dataframe.blob_parquet_loader import BlobParquetLoader
 from app.dataframe.filter_processor import DFFilterProcessor
 from app.dataframe.parquet_loader import DFPayload, ParquetLoader
+from app.dataframe.partial_aggregation import PartialAggregation
+from app.exceptions.exceptions import UnprocessableContentException
 from app.models.data_schemas.base import (
     ALL_PATHS_TO_DATA_MODEL,
     ENDPOINT_PATTERNS,
@@ -59,10 +52,12 @@ from app.providers.dependencies.blob_storage import IBlobStorage
 from app.resources.filters import DataFrameFilterValidator
 from app.resources.load_model_example import load_data_example
 from app.resources.mime_types import SupportedMimeTypes
+from app.resources.schema_registry import get_schema_entry
 from app.search.analysis_type_ids_fetcher import (
     SearchServiceSamplesAnalysisTypeIdsFetcher,
 )
 from app.services import dataset, search, storage
+from app.services.asyncify import run_in_threadpool
 
 SAMPLESANALYSIS_ID_REGEX_STR = r"^[\w\-\.]+:work-product-component--SamplesAnalysis:[\w\-\.\:\%]+$"
 SEARCH_READ_BATCH_SIZE = 100  # max number of parquet files retrieved
@@ -86,7 +81,7 @@ class SamplesAnalysisRecordView(BaseStorageRecordView):
         self,
         request: Request,
         request_records: Annotated[List[dict], Body(example=load_data_example("samples_analysis.json"))],
-        storage_service: storage.StorageService = Depends(get_async_storage_service),
+        storage_service: storage.StorageService = Depends(services.get_async_storage_service),
     ) -> StorageUpsertResponse:
         return await super().post_records(request, request_records, storage_service)
 
@@ -94,14 +89,14 @@ class SamplesAnalysisRecordView(BaseStorageRecordView):
         """Add api route for post_records without dependencies."""
         async def validate_request_records(
             request_records: List[OsduStorageRecord],
-            storage_service: storage.StorageService = Depends(get_async_storage_service),
+            storage_service: storage.StorageService = Depends(services.get_async_storage_service),
         ) -> List[dict]:
             """Validate request records.
 
             :param request_records: request records
             :type request_records: List[OsduStorageRecord]
             :param storage_service: storage service instance, defaults
-                  to Depends(get_async_storage_service)
+                  to Depends(services.get_async_storage_service)
             :type storage_service: storage.StorageService, optional
             :return: validated records
             :rtype: List[dict]
@@ -165,7 +160,7 @@ class SamplesAnalysisSchemasView:
         self,
         analysistype: str,
         content_schema_version: str = Depends(get_content_schema_version),
-    ) -> JSONResponse:
+    ) -> Response:
         """Get the schema of the given analysis type and version."""
         model_versions = None
         for pattern in ENDPOINT_PATTERNS:
@@ -173,8 +168,9 @@ class SamplesAnalysisSchemasView:
             if model_versions:
                 break
         if model_versions and (model := model_versions.get(content_schema_version)):  # noqa: WPS332
-            return JSONResponse(
-                content=model.schema(),
+            return Response(
+                content=get_schema_entry(model).schema_json,
+                media_type=JSONResponse.media_type,
             )
         return JSONResponse(
             {"message": f"Schema not found for {analysistype} and version {content_schema_version}"},
@@ -212,7 +208,9 @@ class SamplesAnalysisSearchDataView:
             The  `columns_filter`, `rows_filter`, and  `columns_aggregation` \
                 query parameters can be used to manage data in response. <br><br>\
             Use `offset`, `page_limit` query parameters to control response data size. \
-                The `page_limit` and `total_size (found in response)` refers to the number of parquet files read.",
+                The `page_limit` and `total_size (found in response)` refers to the number of parquet files read. \
+                All the data is read to get the exact `total_size`, use `count_total=false` to stop reading \
+                once the page is full, `total_size` is then `null` if more results may follow.",
         )
         self.description_template_search = APIDescriptionHelper.append_joined_roles(
             "Get the (`samples analysis`) ids list that comply with `{query}` for given`{analysis_type}`. <br><br>\
@@ -228,17 +226,24 @@ class SamplesAnalysisSearchDataView:
         if kwargs:
             self.__dict__.update(kwargs)
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder, key_builder=key_builder_using_token)
+    @shared_cache.shared_cache(
+        expire=cache_settings.CACHE_DEFAULT_TTL,
+        coder=coder.ResponseCoder,
+        scope=shared_cache.SharedCacheScope.GROUPS,
+        stale_ttl=cache_settings.CACHE_SEARCH_STALE_TTL,
+    )
     async def get_search_data(
         self,
         request: Request,
         analysis_type: str,
-        dataset_service: dataset.DatasetService = Depends(get_async_dataset_service),
-        blob_storage_service: IBlobStorage = Depends(get_blob_storage_service),
-        search_service: search.SearchService = Depends(get_async_search_service),
-        df_filter: DataFrameFilterValidator = Depends(validate_filters),
+        dataset_service: dataset.DatasetService = Depends(services.get_async_dataset_service),
+        blob_storage_service: IBlobStorage = Depends(services.get_blob_storage_service),
+        search_service: search.SearchService = Depends(services.get_async_search_service),
+        df_filter: DataFrameFilterValidator = Depends(validation.validate_filters),
         content_schema_version: str = Depends(get_content_schema_version),
-        pagination_parameters: Tuple[int, int] = Depends(get_search_data_pagination_parameters),
+        pagination_parameters: validation.SearchDataPagination = Depends(
+            validation.get_search_data_pagination_parameters,
+        ),
     ) -> Response:
         """Search Data Endpoint.
 
@@ -247,30 +252,31 @@ class SamplesAnalysisSearchDataView:
         :param analysis_type: the analysis type
         :type analysis_type: str
         :param dataset_service: dataset service instance, defaults to
-            Depends(get_async_dataset_service)
+            Depends(services.get_async_dataset_service)
         :type dataset_service: dataset.DatasetService, optional
         :param blob_storage_service: blob storage service instance,
-            defaults to Depends(get_blob_storage_service)
+            defaults to Depends(services.get_blob_storage_service)
         :type blob_storage_service: IBlobStorage, optional
         :param search_service: search service instance, defaults to
-            Depends(get_async_search_service)
+            Depends(services.get_async_search_service)
         :type search_service: search.SearchService, optional
         :param df_filter: dataframe filter, defaults to
-            Depends(validate_filters)
+            Depends(validation.validate_filters)
         :type df_filter: DataFrameFilterValidator, optional
         :param content_schema_version: content schema version, defaults
             to Depends(get_content_schema_version)
         :type content_schema_version: str, optional
-        :param pagination_parameters: oagination parameters, defaults to
-            Depends(get_pagination_parameters)
-        :type pagination_parameters: Tuple[int, int], optional
+        :param pagination_parameters: offset, page limit and whether to
+            count the total size, defaults to
+            Depends(validation.get_search_data_pagination_parameters)
+        :type pagination_parameters: validation.SearchDataPagination, optional
         :return: Either json or parquet response from concatenated
             dataframes from search result
         :rtype: Response
         """
         data_partition_id = request.headers.get("data-partition-id")
         mime_type = SupportedMimeTypes.find_by_mime_type(request.headers["content-type"])
-        offset, page_limit = pagination_parameters
+        offset, page_limit, count_total = pagination_parameters
 
         analysis_type_ids_fetcher = SearchServiceSamplesAnalysisTypeIdsFetcher(
             search_service=search_service,
@@ -283,6 +289,7 @@ class SamplesAnalysisSearchDataView:
         logger.debug(analysis_type_ids)
 
         df_triplets_gen = await self._get_search_data(
+            data_partition_id=data_partition_id,
             analysis_type_ids=analysis_type_ids,
             dataset_service=dataset_service,
             blob_storage_service=blob_storage_service,
@@ -290,7 +297,7 @@ class SamplesAnalysisSearchDataView:
         )
 
         result_df, total_size = await self._build_result_df(
-            df_triplets_gen, df_filter, offset, page_limit, analysis_type_ids,
+            df_triplets_gen, df_filter, offset, page_limit, analysis_type_ids, count_total,
         )
 
         if mime_type == SupportedMimeTypes.PARQUET:
@@ -314,17 +321,22 @@ class SamplesAnalysisSearchDataView:
 
         return response
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder, key_builder=key_builder_using_token)
+    @shared_cache.shared_cache(
+        expire=cache_settings.CACHE_DEFAULT_TTL,
+        coder=coder.ResponseCoder,
+        scope=shared_cache.SharedCacheScope.GROUPS,
+        stale_ttl=cache_settings.CACHE_SEARCH_STALE_TTL,
+    )
     async def get_search(
         self,
         request: Request,
         analysis_type: str,
-        dataset_service: dataset.DatasetService = Depends(get_async_dataset_service),
-        blob_storage_service: IBlobStorage = Depends(get_blob_storage_service),
-        search_service: search.SearchService = Depends(get_async_search_service),
-        df_filter: DataFrameFilterValidator = Depends(validate_filters),
+        dataset_service: dataset.DatasetService = Depends(services.get_async_dataset_service),
+        blob_storage_service: IBlobStorage = Depends(services.get_blob_storage_service),
+        search_service: search.SearchService = Depends(services.get_async_search_service),
+        df_filter: DataFrameFilterValidator = Depends(validation.validate_filters),
         content_schema_version: str = Depends(get_content_schema_version),
-        pagination_parameters: Tuple[int, int] = Depends(get_search_pagination_parameters),
+        pagination_parameters: Tuple[int, int] = Depends(validation.get_search_pagination_parameters),
     ) -> JSONResponse:
         """Search Endpoint.
 
@@ -333,16 +345,16 @@ class SamplesAnalysisSearchDataView:
         :param analysis_type: the analysis type
         :type analysis_type: str
         :param dataset_service: dataset service instance, defaults to
-            Depends(get_async_dataset_service)
+            Depends(services.get_async_dataset_service)
         :type dataset_service: dataset.DatasetService, optional
         :param blob_storage_service: blob storage service instance,
-            defaults to Depends(get_blob_storage_service)
+            defaults to Depends(services.get_blob_storage_service)
         :type blob_storage_service: IBlobStorage, optional
         :param search_service: search service instance, defaults to
-            Depends(get_async_search_service)
+            Depends(services.get_async_search_service)
         :type search_service: search.SearchService, optional
         :param df_filter: dataframe filter, defaults to
-            Depends(validate_filters)
+            Depends(validation.validate_filters)
         :type df_filter: DataFrameFilterValidator, optional
         :param content_schema_version: content schema version, defaults
             to Depends(get_content_schema_version)
@@ -365,6 +377,7 @@ class SamplesAnalysisSearchDataView:
         analysis_type_ids.sort(key=lambda analysis_type_id: analysis_type_id[1])
 
         df_triplets_gen = await self._get_search_data(
+            data_partition_id=data_partition_id,
             analysis_type_ids=analysis_type_ids,
             dataset_service=dataset_service,
             blob_storage_service=blob_storage_service,
@@ -399,6 +412,7 @@ class SamplesAnalysisSearchDataView:
 
     async def _get_search_data(  # noqa: WPS234
         self,
+        data_partition_id: str,
         analysis_type_ids: List[Tuple[str, str]],
         dataset_service: dataset.DatasetService,
         blob_storage_service: IBlobStorage,
@@ -409,6 +423,7 @@ class SamplesAnalysisSearchDataView:
         settings = get_app_settings()
         if settings.use_blob_storage:
             df_payload_gen = self._get_search_data_for_blobs(
+                data_partition_id=data_partition_id,
                 analysis_type_ids=analysis_type_ids,
                 blob_storage_service=blob_storage_service,
                 df_filter=df_filter,
@@ -423,6 +438,7 @@ class SamplesAnalysisSearchDataView:
 
     async def _get_search_data_for_blobs(  # noqa: WPS234
         self,
+        data_partition_id: str,
         analysis_type_ids: List[Tuple[str, str]],
         blob_storage_service: IBlobStorage,
         df_filter: DataFrameFilterValidator,
@@ -431,7 +447,7 @@ class SamplesAnalysisSearchDataView:
         service."""
         blob_ids = [result_id[0] for result_id in analysis_type_ids]
         df_filter_processor = DFFilterProcessor(df_filter=df_filter)
-        parquet_loader = BlobParquetLoader()
+        parquet_loader = BlobParquetLoader(data_partition_id)
 
         for n_batch in range((len(blob_ids) // self._batch_size) + 1):
             batch_offset = self._batch_size * n_batch
@@ -453,7 +469,7 @@ class SamplesAnalysisSearchDataView:
         service."""
         dataset_ids = [result_id[0] for result_id in analysis_type_ids]
         df_filter_processor = DFFilterProcessor(df_filter=df_filter)
-        parquet_loader = ParquetLoader()
+        parquet_loader = ParquetLoader(dataset_service)
 
         for n_batch in range((len(dataset_ids) // self._batch_size) + 1):
             batch_offset = self._batch_size * n_batch
@@ -470,21 +486,56 @@ class SamplesAnalysisSearchDataView:
         offset: int,
         page_limit: Optional[int] = None,
         select_all: Optional[bool] = False,
-    ) -> Tuple[List[pd.DataFrame], int, List[Tuple[str, str]]]:
-        """Paginate the list of pd.DataFrame."""
+        count_total: Optional[bool] = True,
+    ) -> Tuple[List[pd.DataFrame], Optional[int], List[Tuple[str, str]]]:
+        """Paginate the list of pd.DataFrame.
+
+        Unless select_all or count_total, reading stops after the first
+        result past the page and the total size is None.
+        """
         paged_dfs = []
         errors = []
         df_i = 0
-        async for dataset_id, df, error_msg in df_triplets:
-            if error_msg:
-                logger.error(error_msg)
-                errors.append((dataset_id, error_msg))
-            elif select_all or (df_i >= offset and df_i < offset + page_limit):  # noqa: WPS333
-                paged_dfs.append(df)
-            df_i += 1
+        async with aclosing(df_triplets):
+            async for dataset_id, df, error_msg in df_triplets:
+                if not (select_all or count_total) and df_i >= offset + page_limit:
+                    return paged_dfs, None, errors
+                if error_msg:
+                    logger.error(error_msg)
+                    errors.append((dataset_id, error_msg))
+                elif select_all or (df_i >= offset and df_i < offset + page_limit):  # noqa: WPS333
+                    paged_dfs.append(df)
+                df_i += 1
 
         return paged_dfs, df_i, errors
 
+    async def _aggregate_dfs(  # noqa: WPS234
+        self,
+        df_triplets: AsyncGenerator[DFPayload, None],
+        df_filter_processor: DFFilterProcessor,
+    ) -> Tuple[pd.DataFrame, int, List[Tuple[str, str]]]:
+        """Aggregate the pd.DataFrames as they are read, without keeping
+        them."""
+        partial_aggregation = PartialAggregation(df_filter_processor.df_filter.valid_columns_aggregation.function)
+        errors = []
+        df_i = 0
+        async with aclosing(df_triplets):
+            async for dataset_id, df, error_msg in df_triplets:
+                if error_msg:
+                    logger.error(error_msg)
+                    errors.append((dataset_id, error_msg))
+                else:
+                    await _update_aggregation(partial_aggregation, df_filter_processor, df)
+                df_i += 1
+
+        if df_i and not errors and partial_aggregation.is_empty:
+            # the aggregated column is missing from all the dataframes, e.g. excluded by the columns filter
+            column = df_filter_processor.df_filter.valid_columns_aggregation.column
+            raise UnprocessableContentException(
+                detail=f"Processing filter exception: column '{column}' to aggregate is not in the filtered data.",
+            )
+        return partial_aggregation.get_result(), df_i, errors
+
     async def _build_result_df(
         self,
         df_triplets: AsyncGenerator[DFPayload, None],
@@ -492,19 +543,19 @@ class SamplesAnalysisSearchDataView:
         offset: int,
         page_limit: int,
         analysis_type_ids: List[Tuple[str, str]],
-    ) -> Tuple[pd.DataFrame, int]:
+        count_total: bool = True,
+    ) -> Tuple[pd.DataFrame, Optional[int]]:
         """Build a concatenated or aggregated pd.DataFrame."""
 
         filtered_df_triplets = self._filter_dfs(df_triplets)
 
         if df_filter.valid_columns_aggregation:
             df_filter_processor = DFFilterProcessor(df_filter=df_filter)
-            paged_dfs, total_size, errors = await self._paginate_dfs(filtered_df_triplets, offset=0, select_all=True)
-            result_df = df_filter_processor.apply_filters_from_df(
-                pd.concat(paged_dfs, ignore_index=True),
-            ) if paged_dfs else pd.DataFrame()
+            result_df, total_size, errors = await self._aggregate_dfs(filtered_df_triplets, df_filter_processor)
         else:
-            paged_dfs, total_size, errors = await self._paginate_dfs(filtered_df_triplets, offset, page_limit)
+            paged_dfs, total_size, errors = await self._paginate_dfs(
+                filtered_df_triplets, offset, page_limit, count_total=count_total,
+            )
             result_df = pd.concat(paged_dfs, ignore_index=True) if paged_dfs else pd.DataFrame()
 
         if errors:
@@ -518,10 +569,10 @@ class SamplesAnalysisSearchDataView:
     ) -> AsyncGenerator[DFPayload, None]:
         """Async generator of pd.DataFrames."""
 
-        async for batch_df_triplets in df_triplets:
-            for dataset_id, df, error_msg in batch_df_triplets:
-                if not (df.empty and error_msg is None):
-                    yield dataset_id, df, error_msg
+        async with aclosing(df_triplets):
+            async for batch_df_triplets in df_triplets:
+                for df_triplet in filter(_is_not_empty, batch_df_triplets):
+                    yield df_triplet
 
     def _handle_errors(self, analysis_type_ids: List[Tuple[str, str]], errors: List[Tuple[str, str]]):
         """Handle errors."""
@@ -546,6 +597,7 @@ class SamplesAnalysisSearchDataView:
             description=self.description_template_search_data,
             dependencies=[
                 Depends(validate_bulkdata_content_type),
+                Depends(record_search_query),
             ],
         )
 
@@ -558,4 +610,22 @@ class SamplesAnalysisSearchDataView:
             methods=["GET"],
             status_code=status.HTTP_200_OK,
             description=self.description_template_search,
+            dependencies=[
+                Depends(record_search_query),
+            ],
         )
+
+
+async def _update_aggregation(
+    partial_aggregation: PartialAggregation,
+    df_filter_processor: DFFilterProcessor,
+    df: pd.DataFrame,
+) -> None:
+    """Merge the aggregated column of the pd.DataFrame, if any."""
+    aggregated_column = await run_in_threadpool(df_filter_processor.get_aggregation_values, df)
+    if aggregated_column is not None:
+        partial_aggregation.update(aggregated_column)
+
+
+def _is_not_empty(df_triplet: DFPayload) -> bool:
+    return not (df_triplet.df.empty and df_triplet.error_msg is None)
@@ -12,7 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from app.resources.required_roles import RecordRequiredRoles
+from app.resources.required_roles import (
+    AdminRequiredRoles,
+    RecordRequiredRoles,
+)
 
 
 class APIDescriptionHelper:
@@ -73,6 +76,23 @@ class APIDescriptionHelper:
             anyof,
         )
 
+    @classmethod
+    def append_admin_roles(cls, description: str, anyof: bool = True) -> str:
+        """Append admin roles to description.
+
+        :param description: description
+        :type description: str
+        :param anyof: anyof, defaults to True
+        :type anyof: bool
+        :return: description with admin roles
+        :rtype: str
+        """
+        return cls._join(
+            description,
+            AdminRequiredRoles.ADMIN_ROLES,
+            anyof,
+        )
+
     @classmethod
     def _join(cls, description: str, roles: list, anyof: bool) -> str:
         """Update description with roles.
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import partial
 from typing import Any, Dict, List
 
 from fastapi import Request
@@ -27,6 +28,7 @@ from app.api.routes.utils.records import (
     get_id_version,
 )
 from app.core.config import get_app_settings
+from app.core.helpers.cache.content_cache import get_content
 from app.dataframe.parquet_filter import apply_filters_from_bytes
 from app.exceptions import exceptions
 from app.providers.dependencies.blob_storage import (
@@ -36,6 +38,7 @@ from app.providers.dependencies.blob_storage import (
 )
 from app.resources.filters import DataFrameFilterValidator
 from app.resources.mime_types import SupportedMimeTypes
+from app.services.asyncify import run_in_threadpool, run_until_disconnected
 from app.services.storage import StorageService
 
 
@@ -120,6 +123,22 @@ async def upsert_parquet_data(
     )
 
 
+async def download_blob_data(blob_storage_service: IBlobStorage, blob_metadata: BlobMetadata) -> bytes:
+    """Download the content of a blob.
+
+    :param blob_storage_service: blob storage service
+    :type blob_storage_service: IBlobStorage
+    :param blob_metadata: the blob metadata
+    :type blob_metadata: BlobMetadata
+    :return: blob content
+    :rtype: bytes
+    """
+    blob = await blob_storage_service.get_blob(blob_metadata)
+    blob_info = blob.blob_metadata.metadata
+    logger.info(f"Downloaded {blob_info}")
+    return blob.blob_data
+
+
 async def get_parquet_data(
     request: Request,
     record_id: str,
@@ -155,10 +174,11 @@ async def get_parquet_data(
     if find_object_name_index(ddms_datasets, object_name) is not None:
         logger.debug(f"Retrieving parquet: {object_name}")
         check_object_name_schema_version(blob_metadata.version, ddms_datasets, object_name)
-        blob = await blob_storage_service.get_blob(blob_metadata)
-        parquet_bytes = blob.blob_data
-        blob_info = blob.blob_metadata.metadata
-        logger.info(f"Downloaded {blob_info}")
+        parquet_bytes = await get_content(
+            storage_service.data_partition_id,
+            object_name,
+            partial(download_blob_data, blob_storage_service, blob_metadata),
+        )
 
         if not parquet_bytes:
             reason = f"{object_name} exist in record but without content."
@@ -167,15 +187,22 @@ async def get_parquet_data(
                 detail=reason,
             )
 
-        df = apply_filters_from_bytes(parquet_bytes, df_filter)
+        df = await run_until_disconnected(
+            request,
+            run_in_threadpool(apply_filters_from_bytes, parquet_bytes, df_filter),
+            get_app_settings().disconnect_poll_interval,
+        )
         logger.debug(f"Dataframe info: {df.size} elements; {df.columns}")
 
         if mime_type == SupportedMimeTypes.PARQUET:
             df.astype(str)
-            response = Response(content=df.to_parquet(), media_type=SupportedMimeTypes.PARQUET.mime_type)
+            response = Response(
+                content=await run_in_threadpool(df.to_parquet),
+                media_type=SupportedMimeTypes.PARQUET.mime_type,
+            )
         else:
             response = Response(
-                content=df.to_json(orient="split"),
+                content=await run_in_threadpool(df.to_json, orient="split"),
                 media_type=SupportedMimeTypes.JSON.mime_type,
             )
         del df
@@ -12,11 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import re
 from typing import Any, Iterable, List
 
 from app.api.routes.utils.records import FULLID_ID_INDEX, get_id_version
+from app.core.config import get_app_settings
+from app.core.helpers.cache.existence_cache import get_existence_cache
 from app.resources.common_osdu_regex import ALL_OSDU_REGEXES
+from app.services.base import IStorageService
 
 
 def divide_chunks(elements: List[Any], chunk_size: int) -> Iterable:
@@ -49,3 +53,38 @@ def find_osdu_ids_from_string(input_string: str) -> set:
         }
         ids_set.update(found_ids)
     return ids_set
+
+
+async def find_missing_records(storage_service: IStorageService, record_ids: Iterable[str]) -> List[str]:
+    """Find the records missing from the storage.
+
+    Ids are queried in chunks of storage_query_limit, up to
+    storage_query_concurrency chunks at once. Reference and master data
+    ids found are cached, so they aren't queried again for
+    reference_exists_cache_ttl seconds.
+
+    :param storage_service: the storage service instance
+    :type storage_service: IStorageService
+    :param record_ids: ids of the records to check
+    :type record_ids: Iterable[str]
+    :return: ids of the missing records
+    :rtype: List[str]
+    """
+    settings = get_app_settings()
+    existence_cache = get_existence_cache()
+    data_partition_id = storage_service.data_partition_id
+    ids_to_check = existence_cache.get_unknown_ids(data_partition_id, dict.fromkeys(record_ids))
+    semaphore = asyncio.Semaphore(settings.storage_query_concurrency)
+
+    async def query_missing_records(ids_chunk: List[str]) -> List[str]:
+        async with semaphore:
+            storage_response = await storage_service.query_records(ids_chunk)
+        return storage_response["invalidRecords"]
+
+    missing_chunks = await asyncio.gather(*(
+        query_missing_records(ids_chunk) for ids_chunk in divide_chunks(ids_to_check, settings.storage_query_limit)
+    ))
+    missing_ids = [missing_id for missing_chunk in missing_chunks for missing_id in missing_chunk]
+    missing_id_set = set(missing_ids)
+    existence_cache.add(data_partition_id, (record_id for record_id in ids_to_check if record_id not in missing_id_set))
+    return missing_ids
@@ -181,6 +181,24 @@ def dataset_id_exist(ddms_datasets: List[str], dataset_id: str) -> bool:
     return False
 
 
+def find_versioned_dataset_id(ddms_datasets: List[str], dataset_id: str) -> Optional[str]:
+    """Find the dataset id with its version in ddms_datasets list.
+
+    :param ddms_datasets: ddms datasets list
+    :type ddms_datasets: List[str]
+    :param dataset_id: dataset id without version
+    :type dataset_id: str
+    :return: the dataset id with its version, None if not versioned
+    :rtype: Optional[str]
+    """
+    for ddms_dataset in ddms_datasets:
+        full_dataset_id = ddms_dataset.split("/")[DATASET_ID_INDEX]
+        ddms_dataset_id, version = get_id_version(full_dataset_id)
+        if dataset_id == ddms_dataset_id and version:
+            return full_dataset_id
+    return None
+
+
 def find_schema_versions_for_dataset_id(ddms_datasets: List[str], dataset_id: str) -> set:
     """Find schema versions for dataset id.
 
@@ -15,7 +15,6 @@
 import uuid
 
 from fastapi import APIRouter, Depends, Path, Request, Response
-from fastapi_cache.decorator import cache
 from loguru import logger
 from pydantic import BaseModel
 from starlette import status
@@ -40,8 +39,8 @@ from app.api.routes.utils.ddms_datasets import (
 from app.api.routes.utils.records import get_family_type_from_url
 from app.core.config import get_app_settings
 from app.core.helpers.cache.coder import ResponseCoder
-from app.core.helpers.cache.key_builder import key_builder_using_token
 from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+from app.core.helpers.cache.shared_cache import shared_cache
 from app.core.settings.app import AppSettings
 from app.providers.dependencies.blob_storage import (
     Blob,
@@ -86,7 +85,7 @@ class BaseDataViewV2(BaseDataView):
         if kwargs:
             self.__dict__.update(kwargs)
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder, key_builder=key_builder_using_token)
+    @shared_cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder)
     async def get_data_v2(
         self,
         request: Request,
@@ -19,12 +19,12 @@ import pandas as pd
 import pandera as pa
 from loguru import logger
 
-from app.api.routes.utils.query import divide_chunks, find_osdu_ids_from_string
-from app.core.config import get_app_settings
+from app.api.routes.utils.query import (
+    find_missing_records,
+    find_osdu_ids_from_string,
+)
 from app.services.storage import StorageService
 
-settings = get_app_settings()
-
 
 @dataclass
 class DataValidator:
@@ -69,18 +69,6 @@ class DataValidator:
 
         return errors
 
-    async def _find_missing_records(self, ids_to_check: list) -> set:
-        """From a list of ids find if there is any record missing in storage.
-
-        :param ids_to_check: list of ids to check
-        :type ids_to_check: list
-        :return: returns the set of missing (invalid) record ids
-        :rtype: set
-        """
-        logger.debug(f"The list of ids to check exist on storage: {ids_to_check}")
-        storage_response = await self.storage_service.query_records(ids_to_check)
-        return set(storage_response["invalidRecords"])
-
     async def _validate_integrity(self, df: pd.DataFrame) -> set:
         """Validate data referential integrity.
 
@@ -92,11 +80,8 @@ class DataValidator:
         df_string = df.to_string()
         ids_to_check = find_osdu_ids_from_string(df_string)
 
-        missing_records = set()
-        for ids_to_check_batch in divide_chunks(list(ids_to_check), settings.storage_query_limit):
-            missing_records.update(await self._find_missing_records(ids_to_check=ids_to_check_batch))
-
-        return missing_records
+        logger.debug(f"The list of ids to check exist on storage: {ids_to_check}")
+        return set(await find_missing_records(self.storage_service, ids_to_check))
 
     def _get_excluded_records(self, records: Iterable, skip_types: Iterable) -> set:
         """Get excluded record ids from a list given skip types."""
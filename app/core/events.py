@@ -17,9 +17,27 @@ from typing import Callable
 from fastapi import FastAPI
 from loguru import logger
 
-from app.core.helpers.cache_helper import clear_cache, init_cache
+from app.core.helpers.cache.content_cache import get_content_cache
+from app.core.helpers.cache.warmup import (
+    save_warmup_queries,
+    start_cache_warmup,
+    stop_cache_warmup,
+)
+from app.core.helpers.cache_helper import clear_cache, close_cache, init_cache
 from app.core.helpers.pandas_conf import init_pandas
 from app.core.settings.app import AppSettings
+from app.models.data_schemas.base import ALL_PATHS_TO_DATA_MODEL
+from app.providers.dependencies.blob_storage import close_blob_storages
+from app.resources.schema_registry import init_schema_registry
+from app.services.asyncify import (
+    init_worker_pools,
+    run_in_threadpool,
+    shutdown_worker_pools,
+)
+from app.services.osdu_clients.http_client import (
+    close_http_clients,
+    init_http_clients,
+)
 
 
 def create_start_app_handler(
@@ -31,6 +49,15 @@ def create_start_app_handler(
         logger.debug(f"App started with settings: {settings}")
         await init_cache(settings)
         await init_pandas()
+        init_worker_pools(settings)
+        init_http_clients(settings)
+        get_content_cache()
+        if settings.schema_registry_preload:
+            await run_in_threadpool(
+                init_schema_registry,
+                (model for version_models in ALL_PATHS_TO_DATA_MODEL.values() for model in version_models.values()),
+            )
+        start_cache_warmup(app, settings)
 
     return start_app
 
@@ -41,6 +68,14 @@ def create_stop_app_handler(
 ) -> Callable:  # type: ignore
     @logger.catch
     async def stop_app() -> None:
-        await clear_cache(settings)
+        await stop_cache_warmup()
+        if settings.cache_clear_on_stop:
+            await clear_cache(settings)
+        # saved after clearing the cache, so they are kept for the next start
+        await save_warmup_queries()
+        await close_cache(settings)
+        shutdown_worker_pools()
+        await close_http_clients()
+        await close_blob_storages()
 
     return stop_app
@@ -0,0 +1,61 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Optional, Tuple, Union
+
+from fastapi_cache.backends import Backend
+
+from app.core.helpers.cache.metrics import observe_fill, observe_lookup
+
+CachedValue = Union[str, bytes]
+
+
+class InstrumentedBackend(Backend):
+    """Backend wrapper observing the cache metrics of any backend."""
+
+    def __init__(self, backend: Backend) -> None:
+        """Init.
+
+        :param backend: wrapped backend
+        :type backend: Backend
+        """
+        self.backend = backend
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[CachedValue]]:
+        ttl, cached_value = await self.backend.get_with_ttl(key)
+        observe_lookup(key, hit=cached_value is not None)
+        return ttl, cached_value
+
+    async def get(self, key: str) -> Optional[CachedValue]:
+        cached_value = await self.backend.get(key)
+        observe_lookup(key, hit=cached_value is not None)
+        return cached_value
+
+    async def set(self, key: str, cached_value: CachedValue, expire: Optional[int] = None) -> None:  # noqa: WPS125
+        await self.backend.set(key, cached_value, expire)
+        observe_fill(key, len(cached_value))
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        return await self.backend.clear(namespace, key)
+
+
+def unwrap_backend(backend: Backend) -> Backend:
+    """Get the backend wrapped for the metrics, if any.
+
+    :param backend: fastapi-cache backend
+    :type backend: Backend
+    :return: the wrapped backend
+    :rtype: Backend
+    """
+    return backend.backend if isinstance(backend, InstrumentedBackend) else backend
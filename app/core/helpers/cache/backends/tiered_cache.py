@@ -0,0 +1,235 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+import math
+import time
+import uuid
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple, Union
+
+from fastapi_cache.backends import Backend
+from fastapi_cache.backends.redis import RedisBackend
+from loguru import logger
+from redis.asyncio.client import Redis
+
+from app.core.helpers.cache.backends.redis_cache import (
+    RedisCacheBackend,
+    redis_client,
+)
+from app.core.helpers.cache.config import TieredCacheConfig
+from app.core.helpers.cache.metrics import EvictingCache, observe_eviction
+from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+
+
+class LocalEntry(NamedTuple):
+    cached_value: bytes
+    expire_at: float
+
+
+class LocalLRUCache:
+    """Least recently used entries kept within a byte budget."""
+
+    def __init__(self, max_bytes: int, name: str = EvictingCache.TIERED_LOCAL) -> None:
+        """Init.
+
+        :param max_bytes: max size of the kept values
+        :type max_bytes: int
+        :param name: cache name used in metrics, defaults to
+            EvictingCache.TIERED_LOCAL
+        :type name: str
+        """
+        self.max_bytes = max_bytes
+        self.name = name
+        self.size = 0
+        self._entries: OrderedDict[str, LocalEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        """Get a value and its remaining ttl.
+
+        :param key: cache key
+        :type key: str
+        :return: ttl and value, -1 ttl if the value doesn't expire, (0,
+            None) if missing or expired
+        :rtype: Tuple[int, Optional[bytes]]
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0, None
+        ttl = entry.expire_at - time.monotonic()
+        if ttl <= 0:
+            self.delete(key)
+            return 0, None
+        self._entries.move_to_end(key)
+        return (-1 if ttl == math.inf else int(ttl)), entry.cached_value
+
+    def set(self, key: str, cached_value: bytes, expire: Optional[int] = None) -> None:  # noqa: WPS125
+        """Keep a value, evicting the least recently used ones if needed.
+
+        Values bigger than the budget are not kept.
+
+        :param key: cache key
+        :type key: str
+        :param cached_value: value
+        :type cached_value: bytes
+        :param expire: ttl in seconds, defaults to None for no expiry
+        :type expire: Optional[int]
+        """
+        self.delete(key)
+        if len(cached_value) > self.max_bytes or (expire is not None and expire <= 0):
+            return
+        while self.size + len(cached_value) > self.max_bytes:
+            _, evicted_entry = self._entries.popitem(last=False)
+            self.size -= len(evicted_entry.cached_value)
+            observe_eviction(self.name)
+        expire_at = math.inf if expire is None else time.monotonic() + expire
+        self._entries[key] = LocalEntry(cached_value, expire_at)
+        self.size += len(cached_value)
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry.cached_value)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        for key in list(self._entries):
+            if namespace is None or key.startswith(namespace):
+                self.delete(key)
+
+
+class TieredBackend(Backend):
+    """In-process LRU cache in front of Redis.
+
+    Writes and clears are published on a Redis channel, so the other
+    workers drop their local copy of the rewritten entries.
+    """
+
+    def __init__(self, redis: Redis, max_bytes: int, channel: str) -> None:
+        """Init.
+
+        :param redis: redis client
+        :type redis: Redis
+        :param max_bytes: max size of the local values
+        :type max_bytes: int
+        :param channel: invalidation channel
+        :type channel: str
+        """
+        self.redis = redis
+        self.channel = channel
+        self.local_cache = LocalLRUCache(max_bytes)
+        self._remote = RedisBackend(redis)
+        self._node_id = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        ttl, cached_value = self.local_cache.get_with_ttl(key)
+        if cached_value is not None:
+            return ttl, cached_value
+        ttl, cached_value = await self._remote.get_with_ttl(key)
+        if cached_value is not None:
+            # no ttl means no expiry in redis, the local copy still expires
+            self.local_cache.set(key, cached_value, ttl if ttl > 0 else CACHE_DEFAULT_TTL)
+        return ttl, cached_value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        _, cached_value = await self.get_with_ttl(key)
+        return cached_value
+
+    async def set(  # noqa: WPS125
+        self, key: str, cached_value: Union[str, bytes], expire: Optional[int] = None,
+    ) -> None:
+        await self._remote.set(key, cached_value, expire)
+        self.local_cache.set(key, _to_bytes(cached_value), expire or CACHE_DEFAULT_TTL)
+        await self._publish(key=key)
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        if namespace:
+            self.local_cache.clear(namespace)
+        elif key:
+            self.local_cache.delete(key)
+        await self._publish(namespace=namespace, key=key)
+        return await self._remote.clear(namespace, key)
+
+    def start_listener(self) -> None:
+        """Listen to the invalidations published by the other workers."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    def invalidate(self, message: dict) -> None:
+        """Drop the local entries of an invalidation message.
+
+        :param message: published invalidation
+        :type message: dict
+        """
+        if message.get("node") == self._node_id:
+            return
+        if message.get("namespace"):
+            self.local_cache.clear(message["namespace"])
+        elif message.get("key"):
+            self.local_cache.delete(message["key"])
+
+    async def _publish(self, namespace: Optional[str] = None, key: Optional[str] = None) -> None:
+        message = json.dumps({"node": self._node_id, "namespace": namespace, "key": key})
+        try:
+            await self.redis.publish(self.channel, message)
+        except Exception as exc:  # noqa: B902
+            logger.warning(f"Cache invalidation can't be published: {exc}")
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self._listen_subscribed()
+            except Exception as exc:  # noqa: B902
+                # local entries may have missed invalidations while disconnected
+                self.local_cache.clear()
+                logger.warning(f"Cache invalidation listener error: {exc}")
+                await asyncio.sleep(1)
+
+    async def _listen_subscribed(self) -> None:
+        async with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(self.channel)
+            async for message in pubsub.listen():
+                self.invalidate(json.loads(message["data"]))
+
+
+class TieredCacheBackend(RedisCacheBackend):
+    async def get_backend(self) -> TieredBackend:
+        """Init and return instance of TieredBackend.
+
+        :return TieredBackend: instance of TieredBackend
+        """
+        await self._validate_redis_settings(redis_client)
+        tiered_settings = TieredCacheConfig()
+        backend = TieredBackend(
+            redis_client,
+            max_bytes=tiered_settings.tiered_cache_max_bytes,
+            channel=tiered_settings.tiered_cache_channel,
+        )
+        backend.start_listener()
+        return backend
+
+
+def _to_bytes(cached_value: Union[str, bytes]) -> bytes:
+    # same type as returned by redis
+    return cached_value.encode() if isinstance(cached_value, str) else cached_value
@@ -0,0 +1,56 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import os
+import uuid
+from typing import Union
+
+import pyarrow as pa
+
+
+def get_cache_file_path(directory: str, entry_id: str, suffix: str) -> str:
+    """Get the path of the file of a cache entry, named after the hash of
+    its id.
+
+    :param directory: directory of the cache files
+    :type directory: str
+    :param entry_id: cache entry id
+    :type entry_id: str
+    :param suffix: file suffix of the cache
+    :type suffix: str
+    :return: the file path
+    :rtype: str
+    """
+    file_name = hashlib.sha256(entry_id.encode()).hexdigest()
+    return os.path.join(directory, f"{file_name}{suffix}")
+
+
+def write_cache_file(file_path: str, file_content: Union[str, bytes, pa.Buffer]) -> None:
+    """Write the file of a cache entry.
+
+    The file is written aside then renamed, so readers sharing the
+    directory never read a partial file.
+
+    :param file_path: the file path
+    :type file_path: str
+    :param file_content: text or binary content
+    :type file_content: Union[str, bytes, pa.Buffer]
+    """
+    tmp_suffix = uuid.uuid4().hex
+    tmp_path = f"{file_path}.{tmp_suffix}.tmp"
+    open_mode = "w" if isinstance(file_content, str) else "wb"
+    with open(tmp_path, open_mode) as cache_file:
+        cache_file.write(file_content)
+    os.replace(tmp_path, file_path)
@@ -0,0 +1,228 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List, Optional, Set
+from weakref import WeakValueDictionary
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends import Backend
+from fastapi_cache.backends.redis import RedisBackend
+from loguru import logger
+from redis.asyncio.client import Redis
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache.backends.instrumented_cache import unwrap_backend
+from app.core.helpers.cache.backends.tiered_cache import TieredBackend
+from app.core.helpers.cache.settings import CACHE_SEARCH_INDEX_DELAY
+from app.resources.paths import SAMPLESANALYSIS_TYPE_MAPPING
+
+SAMPLE_ANALYSIS_TYPE_IDS = "SampleAnalysisTypeIDs"
+
+CacheTags = Set[str]
+
+_filled_cache_tags: ContextVar[Optional[CacheTags]] = ContextVar("filled_cache_tags", default=None)
+_delayed_invalidations: Set[asyncio.Task] = set()
+# the json lists of the tags are rewritten under a lock, kept while in use
+_tag_locks: "WeakValueDictionary[str, asyncio.Lock]" = WeakValueDictionary()
+
+
+class CacheTag:
+    RECORD = "record"
+    DATASET = "dataset"
+    ANALYSIS_TYPE = "analysistype"
+
+
+@contextmanager
+def collect_cache_tags() -> Iterator[CacheTags]:
+    """Collect the tags of the data read while filling a cache entry.
+
+    :yield: the collected tags
+    :rtype: Iterator[CacheTags]
+    """
+    cache_tags: CacheTags = set()
+    context_token = _filled_cache_tags.set(cache_tags)
+    try:
+        yield cache_tags
+    finally:
+        _filled_cache_tags.reset(context_token)
+
+
+def add_cache_tags(*tags: str) -> None:
+    """Tag the cache entry being filled, if any.
+
+    :param tags: tags of the data the entry depends on
+    :type tags: str
+    """
+    cache_tags = _filled_cache_tags.get()
+    if cache_tags is not None:
+        cache_tags.update(tags)
+
+
+def get_record_tag(record_id: str) -> str:
+    return f"{CacheTag.RECORD}:{record_id}"
+
+
+def get_dataset_tag(dataset_id: str) -> str:
+    return f"{CacheTag.DATASET}:{dataset_id}"
+
+
+def get_analysis_type_tag(data_partition_id: str, analysis_type: str) -> str:
+    return f"{CacheTag.ANALYSIS_TYPE}:{data_partition_id}:{analysis_type}"
+
+
+def get_upserted_records_tags(data_partition_id: str, records: List[dict]) -> List[str]:
+    """Get the tags of the entries depending on upserted records.
+
+    :param data_partition_id: data partition id
+    :type data_partition_id: str
+    :param records: upserted records
+    :type records: List[dict]
+    :return: the record tags and the tags of their analysis types
+    :rtype: List[str]
+    """
+    tags = set()
+    for record in records:
+        if record.get("id"):
+            tags.add(get_record_tag(record["id"]))
+        # SampleAnalysisTypeIDs are like {partition}:reference-data--SampleAnalysisType:{name}:
+        type_names = {
+            type_id.split(":")[2]
+            for type_id in record.get("data", {}).get(SAMPLE_ANALYSIS_TYPE_IDS) or []
+            if type_id.count(":") >= 2
+        }
+        tags.update(
+            get_analysis_type_tag(data_partition_id, analysis_type)
+            for analysis_type, mapped_names in SAMPLESANALYSIS_TYPE_MAPPING.items()
+            if type_names.intersection(mapped_names)
+        )
+    return sorted(tags)
+
+
+async def tag_entry(cache_key: str, tags: Iterable[str], expire: int) -> None:
+    """Register a cache entry under its tags.
+
+    :param cache_key: cache key of the entry
+    :type cache_key: str
+    :param tags: tags of the entry
+    :type tags: Iterable[str]
+    :param expire: ttl of the entry in seconds
+    :type expire: int
+    """
+    if not get_app_settings().cache_enable:
+        return
+    try:
+        backend = FastAPICache.get_backend()
+        redis = _get_redis(backend)
+        for tag in tags:
+            if redis is not None:
+                await _add_to_tag_set(redis, _get_tag_key(tag), cache_key, expire)
+            else:
+                await _add_to_tag_list(backend, _get_tag_key(tag), cache_key, expire)
+    except Exception:  # noqa: B902
+        logger.warning(f"Error tagging cache key '{cache_key}' in backend")
+
+
+async def invalidate_cache_tags(tags: Iterable[str]) -> None:
+    """Clear the cache entries registered under any of the tags.
+
+    :param tags: tags of the changed data
+    :type tags: Iterable[str]
+    """
+    if not get_app_settings().cache_enable:
+        return
+    try:
+        backend = FastAPICache.get_backend()
+        redis = _get_redis(backend)
+        for tag in tags:
+            tag_key = _get_tag_key(tag)
+            if redis is not None:
+                tagged_keys = [tagged_key.decode() for tagged_key in await redis.smembers(tag_key)]
+                await _clear_tagged_keys(backend, tag_key, tagged_keys)
+            else:
+                async with _get_tag_lock(tag_key):
+                    tagged_keys = json.loads(await backend.get(tag_key) or "[]")
+                    await _clear_tagged_keys(backend, tag_key, tagged_keys)
+            cleared_count = len(tagged_keys)
+            logger.debug(f"Cleared {cleared_count} cache entries tagged with '{tag}'")
+    except Exception:  # noqa: B902
+        logger.warning(f"Error invalidating cache tags {tags} in backend")
+
+
+def invalidate_search_tags_later(tags: Iterable[str]) -> None:
+    """Clear the entries tagged with the analysis types again once the
+    Search service had time to index the changed records.
+
+    Search responses filled between the change and its indexing still
+    list the former records, the first invalidation can't clear them.
+
+    :param tags: tags of the changed data
+    :type tags: Iterable[str]
+    """
+    search_tags = [tag for tag in tags if tag.startswith(f"{CacheTag.ANALYSIS_TYPE}:")]
+    if not search_tags or not CACHE_SEARCH_INDEX_DELAY or not get_app_settings().cache_enable:
+        return
+    invalidation_task = asyncio.create_task(_invalidate_later(search_tags, CACHE_SEARCH_INDEX_DELAY))
+    _delayed_invalidations.add(invalidation_task)
+    invalidation_task.add_done_callback(_delayed_invalidations.discard)
+
+
+async def _invalidate_later(tags: List[str], delay: float) -> None:
+    await asyncio.sleep(delay)
+    await invalidate_cache_tags(tags)
+
+
+async def _add_to_tag_set(redis: Redis, tag_key: str, cache_key: str, expire: int) -> None:
+    await redis.sadd(tag_key, cache_key)
+    # the tag is kept as long as its longest lived entry
+    if await redis.ttl(tag_key) < expire:
+        await redis.expire(tag_key, expire)
+
+
+async def _add_to_tag_list(backend: Backend, tag_key: str, cache_key: str, expire: int) -> None:
+    async with _get_tag_lock(tag_key):
+        tag_ttl, tagged_value = await backend.get_with_ttl(tag_key)
+        tagged_keys = set(json.loads(tagged_value or "[]"))
+        tagged_keys.add(cache_key)
+        # the tag is kept as long as its longest lived entry
+        await backend.set(tag_key, json.dumps(sorted(tagged_keys)), max(tag_ttl or 0, expire))
+
+
+async def _clear_tagged_keys(backend: Backend, tag_key: str, tagged_keys: List[str]) -> None:
+    for cache_key in (*tagged_keys, tag_key):
+        with suppress(KeyError):
+            await backend.clear(key=cache_key)
+
+
+def _get_tag_lock(tag_key: str) -> asyncio.Lock:
+    tag_lock = _tag_locks.get(tag_key)
+    if tag_lock is None:
+        tag_lock = asyncio.Lock()
+        _tag_locks[tag_key] = tag_lock
+    return tag_lock
+
+
+def _get_tag_key(tag: str) -> str:
+    return f"{FastAPICache.get_prefix()}:tag:{tag}"
+
+
+def _get_redis(backend: Backend) -> Optional[Redis]:
+    # redis sets keep the tagged keys atomically, other backends keep them as json lists
+    backend = unwrap_backend(backend)
+    if isinstance(backend, (RedisBackend, TieredBackend)):
+        return backend.redis
+    return None
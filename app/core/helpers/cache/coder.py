@@ -13,32 +13,81 @@
 #  limitations under the License.
 
 import json
-from typing import Any
+import pickle  # noqa: S403
+import struct
+from typing import Any, List, NamedTuple, Sequence, Tuple
 
+import pyarrow as pa
 from fastapi import Response
 from fastapi_cache.coder import Coder, JsonCoder, PickleCoder
 
+from app.core.helpers.cache.metrics import observe_decode
+from app.core.helpers.cache.settings import CACHE_COMPRESSION
 from app.resources.mime_types import SupportedMimeTypes
 
+MAGIC = b"RAFS"
+FORMAT_VERSION = 1
+COMPRESSIONS = ("", "lz4", "zstd")
+# magic, format version, compression, media type size, uncompressed body size
+RESPONSE_HEADER = struct.Struct("!4sBBHQ")
+# magic, format version, metadata size
+DATAFRAMES_HEADER = struct.Struct("!4sBI")
+ARROW_FORMAT = "arrow"
+PICKLE_FORMAT = "pickle"
+
+
+class ResponseHeader(NamedTuple):
+    magic: bytes
+    format_version: int
+    compression_id: int
+    media_type_size: int
+    body_size: int
+
 
 class ResponseCoder(Coder):
+    """Keep response bodies as raw bytes behind a binary header.
+
+    The body is compressed when CACHE_COMPRESSION is set. Values stored
+    in the former json format are still decoded.
+    """
+
     @classmethod
-    def encode(cls, response: Response) -> str:
+    def encode(cls, response: Response) -> bytes:
         """Encode to keep value in storage."""
-        media_type = response.media_type
-        if media_type == SupportedMimeTypes.JSON.mime_type:
-            coder = JsonCoder
-        else:
-            coder = PickleCoder
-        encoded_content = coder.encode(response.body)
-        return json.dumps({
-            "encoded_content": encoded_content,
-            "media_type": media_type,
-        })
+        media_type = (response.media_type or "").encode()
+        body = bytes(response.body)
+        header = RESPONSE_HEADER.pack(
+            MAGIC, FORMAT_VERSION, COMPRESSIONS.index(CACHE_COMPRESSION), len(media_type), len(body),
+        )
+        if CACHE_COMPRESSION:
+            body = pa.compress(body, codec=CACHE_COMPRESSION, asbytes=True)
+        return b"".join((header, media_type, body))
 
     @classmethod
-    def decode(cls, value_to_decode: str) -> Any:
+    def decode(cls, value_to_decode: Any) -> Any:
         """Decode value returned from storage."""
+        with observe_decode(cls.__name__):
+            if not _has_magic(value_to_decode):
+                return cls._decode_json(value_to_decode)
+            return cls._decode_binary(value_to_decode)
+
+    @classmethod
+    def _decode_binary(cls, value_to_decode: Any) -> Response:
+        header = ResponseHeader(*RESPONSE_HEADER.unpack_from(value_to_decode))
+        media_type_end = RESPONSE_HEADER.size + header.media_type_size
+        media_type = bytes(value_to_decode[RESPONSE_HEADER.size:media_type_end]).decode()
+        body = memoryview(value_to_decode)[media_type_end:]
+        if header.compression_id:
+            body = pa.decompress(
+                body, decompressed_size=header.body_size, codec=COMPRESSIONS[header.compression_id], asbytes=True,
+            )
+        return Response(
+            content=bytes(body),
+            media_type=media_type or None,
+        )
+
+    @classmethod
+    def _decode_json(cls, value_to_decode: Any) -> Response:
         value_to_decode = json.loads(value_to_decode)
         media_type = value_to_decode.get("media_type")
         encoded_content = value_to_decode.get("encoded_content")
@@ -50,3 +99,78 @@ class ResponseCoder(Coder):
             content=coder.decode(encoded_content),
             media_type=media_type,
         )
+
+
+class DataFramesCoder(Coder):
+    """Keep (content id, dataframe, error message) tuples as Arrow IPC
+    streams.
+
+    Decoding reads the streams in place from the stored value.
+    Dataframes that Arrow can't convert are pickled. Values stored in
+    the former pickle format are still decoded.
+    """
+
+    @classmethod
+    def encode(cls, payloads: Sequence[Tuple[str, Any, Any]]) -> bytes:
+        """Encode to keep value in storage."""
+        metadata = []
+        encoded_dfs = []
+        for content_id, df, error_msg in payloads:
+            encoded_df, df_format = _encode_dataframe(df)
+            metadata.append({
+                "content_id": content_id,
+                "error_msg": error_msg,
+                "format": df_format,
+                "size": len(encoded_df),
+            })
+            encoded_dfs.append(encoded_df)
+        encoded_metadata = json.dumps(metadata).encode()
+        header = DATAFRAMES_HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded_metadata))
+        return b"".join((header, encoded_metadata, *encoded_dfs))
+
+    @classmethod
+    def decode(cls, value_to_decode: Any) -> List[Any]:
+        """Decode value returned from storage."""
+        with observe_decode(cls.__name__):
+            if not _has_magic(value_to_decode):
+                return [cls.make_payload(*payload) for payload in PickleCoder.decode(value_to_decode)]
+            return cls._decode_payloads(value_to_decode)
+
+    @classmethod
+    def make_payload(cls, content_id: str, df: Any, error_msg: Any) -> Tuple[str, Any, Any]:
+        return content_id, df, error_msg
+
+    @classmethod
+    def _decode_payloads(cls, value_to_decode: Any) -> List[Any]:
+        _, _, metadata_size = DATAFRAMES_HEADER.unpack_from(value_to_decode)
+        buffer = pa.py_buffer(value_to_decode)
+        offset = DATAFRAMES_HEADER.size + metadata_size
+        metadata = json.loads(buffer.slice(DATAFRAMES_HEADER.size, metadata_size).to_pybytes())
+
+        payloads = []
+        for df_metadata in metadata:
+            df_buffer = buffer.slice(offset, df_metadata["size"])
+            offset += df_metadata["size"]
+            if df_metadata["format"] == ARROW_FORMAT:
+                df = pa.ipc.open_stream(df_buffer).read_all().to_pandas()
+            else:
+                df = pickle.loads(df_buffer)  # noqa: S301
+            payloads.append(cls.make_payload(df_metadata["content_id"], df, df_metadata["error_msg"]))
+        return payloads
+
+
+def _encode_dataframe(df: Any) -> Tuple[bytes, str]:
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL), PICKLE_FORMAT
+
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=CACHE_COMPRESSION or None)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes(), ARROW_FORMAT
+
+
+def _has_magic(value_to_decode: Any) -> bool:
+    return isinstance(value_to_decode, (bytes, bytearray, memoryview)) and bytes(value_to_decode[:len(MAGIC)]) == MAGIC
@@ -34,3 +34,13 @@ class RedisCacheConfig(BaseSettings):
 
     class Config:
         env_file = ".env"
+
+
+class TieredCacheConfig(BaseSettings):
+    """Config with settings for the in-process tier of the tiered cache."""
+    tiered_cache_max_bytes: conint(gt=0) = 64 * 1024 * 1024
+
+    tiered_cache_channel: str = "rafs-cache-invalidation"
+
+    class Config:
+        env_file = ".env"
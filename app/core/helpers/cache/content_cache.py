@@ -0,0 +1,236 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Awaitable, Callable, Optional, Union
+
+import pyarrow as pa
+from loguru import logger
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache.backends.tiered_cache import LocalLRUCache
+from app.core.helpers.cache.cache_files import (
+    get_cache_file_path,
+    write_cache_file,
+)
+from app.core.helpers.cache.metrics import (
+    CONTENT_NAMESPACE,
+    EvictingCache,
+    observe_eviction,
+    observe_fill,
+    observe_lookup,
+)
+from app.core.helpers.cache.single_flight import SingleFlight
+from app.services.asyncify import run_in_threadpool
+
+CONTENT_FILE_SUFFIX = ".content"
+
+Blob = Union[bytes, pa.Buffer]
+BlobDownload = Callable[[], Awaitable[Optional[Blob]]]
+
+
+class DiskLRUCache:
+    """Least recently used contents kept as files within a byte budget.
+
+    Files are read through memory maps. Workers sharing the directory
+    each account for the files they wrote or read.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """Init.
+
+        :param directory: directory of the content files
+        :type directory: str
+        :param max_bytes: max size of the content files
+        :type max_bytes: int
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._files: OrderedDict[str, int] = OrderedDict()
+        content_files = [
+            dir_entry
+            for dir_entry in os.scandir(directory)
+            if dir_entry.is_file() and dir_entry.name.endswith(CONTENT_FILE_SUFFIX)
+        ]
+        content_files.sort(key=_get_access_time)
+        for content_file in content_files:
+            self._files[content_file.path] = content_file.stat().st_size
+            self.size += content_file.stat().st_size
+
+    def get(self, content_id: str) -> Optional[pa.Buffer]:
+        """Get a content, memory mapped.
+
+        :param content_id: immutable content id
+        :type content_id: str
+        :return: the content, None if missing
+        :rtype: Optional[pa.Buffer]
+        """
+        file_path = self._get_path(content_id)
+        try:
+            blob = pa.memory_map(file_path).read_buffer()
+        except OSError:
+            self._forget(file_path)
+            return None
+        if file_path not in self._files:
+            self.size += blob.size
+        self._files[file_path] = blob.size
+        self._files.move_to_end(file_path)
+        return blob
+
+    def set(self, content_id: str, blob: Blob) -> None:  # noqa: WPS125
+        """Write a content, evicting the least recently used ones if
+        needed.
+
+        :param content_id: immutable content id
+        :type content_id: str
+        :param blob: content
+        :type blob: Blob
+        """
+        content_size = len(blob)
+        if content_size > self.max_bytes:
+            return
+        file_path = self._get_path(content_id)
+        write_cache_file(file_path, blob)
+        self._forget(file_path)
+        self._files[file_path] = content_size
+        self.size += content_size
+        while self.size > self.max_bytes:
+            evicted_path = next(iter(self._files))
+            self._forget(evicted_path)
+            _remove_file(evicted_path)
+            observe_eviction(EvictingCache.CONTENT_DISK)
+
+    def _forget(self, file_path: str) -> None:
+        self.size -= self._files.pop(file_path, 0)
+
+    def _get_path(self, content_id: str) -> str:
+        return get_cache_file_path(self.directory, content_id, CONTENT_FILE_SUFFIX)
+
+
+class ContentCache:
+    """Contents that never change once written, e.g. blobs or versioned
+    datasets.
+
+    Kept in memory and optionally on disk, without ttl, until evicted
+    for space.
+    """
+
+    def __init__(self, max_bytes: int, disk_directory: Optional[str] = None, disk_max_bytes: int = 0) -> None:
+        """Init.
+
+        :param max_bytes: max size of the contents kept in memory
+        :type max_bytes: int
+        :param disk_directory: directory of the disk tier, defaults to
+            None for no disk tier
+        :type disk_directory: Optional[str]
+        :param disk_max_bytes: max size of the contents kept on disk
+        :type disk_max_bytes: int
+        """
+        self.memory_cache = LocalLRUCache(max_bytes, name=EvictingCache.CONTENT_MEMORY)
+        self.disk_cache = DiskLRUCache(disk_directory, disk_max_bytes) if disk_directory else None
+
+    async def get_content(self, content_id: str, download: BlobDownload) -> Blob:
+        """Get a content, downloaded on cache miss.
+
+        :param content_id: immutable content id
+        :type content_id: str
+        :param download: downloads the content
+        :type download: BlobDownload
+        :return: the content
+        :rtype: Blob
+        """
+        _, blob = self.memory_cache.get_with_ttl(content_id)
+        if blob is None and self.disk_cache is not None:
+            blob = await run_in_threadpool(self.disk_cache.get, content_id)
+        observe_lookup(content_id, hit=blob is not None, namespace=CONTENT_NAMESPACE)
+        if blob is not None:
+            return blob
+
+        blob = await download()
+        if blob:
+            observe_fill(content_id, len(blob), namespace=CONTENT_NAMESPACE)
+            self.memory_cache.set(content_id, blob)
+            if self.disk_cache is not None:
+                await run_in_threadpool(self.disk_cache.set, content_id, blob)
+        return blob
+
+
+_content_flights = SingleFlight(copy_results=False)
+
+
+@lru_cache
+def get_content_cache() -> Optional[ContentCache]:
+    """Get the content cache, configured with the app settings on first
+    use.
+
+    :return: the content cache, None if not enabled
+    :rtype: Optional[ContentCache]
+    """
+    settings = get_app_settings()
+    if not (settings.content_cache_max_bytes or settings.content_cache_dir):
+        return None
+    memory_size = settings.content_cache_max_bytes
+    disk_cache = f"{settings.content_cache_dir} {settings.content_cache_disk_max_bytes} bytes"
+    logger.info(f"Content cache enabled: memory {memory_size} bytes, disk {disk_cache}")
+    return ContentCache(
+        max_bytes=settings.content_cache_max_bytes,
+        disk_directory=settings.content_cache_dir,
+        disk_max_bytes=settings.content_cache_disk_max_bytes,
+    )
+
+
+async def get_content(
+    data_partition_id: str,
+    content_id: Optional[str],
+    download: BlobDownload,
+) -> Optional[Blob]:
+    """Get a content through the content cache, if enabled.
+
+    Contents are kept per data partition, as the same content id may
+    name different contents in different partitions. Concurrent reads
+    of the same content share one download.
+
+    :param data_partition_id: data partition id
+    :type data_partition_id: str
+    :param content_id: immutable content id, None if the content may
+        change
+    :type content_id: Optional[str]
+    :param download: downloads the content
+    :type download: BlobDownload
+    :return: the content
+    :rtype: Optional[Blob]
+    """
+    if not content_id:
+        return await download()
+    content_key = f"{data_partition_id}/{content_id}"
+    content_cache = get_content_cache()
+    if content_cache is not None:
+        download = partial(content_cache.get_content, content_key, download)
+    blob, _ = await _content_flights.run(content_key, download)
+    return blob
+
+
+def _remove_file(file_path: str) -> None:
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        logger.debug(f"Content file already removed: {file_path}")
+
+
+def _get_access_time(dir_entry: os.DirEntry) -> float:
+    return dir_entry.stat().st_atime
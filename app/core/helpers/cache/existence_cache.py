@@ -0,0 +1,102 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from app.core.config import get_app_settings
+
+# ids of the record types cached once found, they are rarely deleted
+CACHED_ID_TYPES = (":reference-data--", ":master-data--")
+EXISTENCE_CACHE_MAX_SIZE = 100000
+
+
+class ExistenceCache:
+    """Reference and master data ids known to exist, per data partition.
+
+    Ids are kept for ttl seconds, the oldest ones are evicted past
+    max_size ids.
+    """
+
+    def __init__(self, ttl: int, max_size: int = EXISTENCE_CACHE_MAX_SIZE) -> None:
+        """Init.
+
+        :param ttl: seconds an id is known to exist, 0 disables the
+            cache
+        :type ttl: int
+        :param max_size: max number of ids, defaults to 100 000
+        :type max_size: int
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._expire_at: OrderedDict[Tuple[str, str], float] = OrderedDict()
+
+    def get_unknown_ids(self, data_partition_id: str, record_ids: Iterable[str]) -> List[str]:
+        """Get the ids not known to exist.
+
+        :param data_partition_id: data partition id
+        :type data_partition_id: str
+        :param record_ids: record ids
+        :type record_ids: Iterable[str]
+        :return: the unknown ids
+        :rtype: List[str]
+        """
+        now = time.time()
+        return [
+            record_id
+            for record_id in record_ids
+            if self._expire_at.get((data_partition_id, record_id), 0) <= now
+        ]
+
+    def add(self, data_partition_id: str, record_ids: Iterable[str]) -> None:
+        """Keep the reference and master data ids found.
+
+        :param data_partition_id: data partition id
+        :type data_partition_id: str
+        :param record_ids: ids of existing records
+        :type record_ids: Iterable[str]
+        """
+        if not self.ttl:
+            return
+        expire_at = time.time() + self.ttl
+        for record_id in record_ids:
+            if any(id_type in record_id for id_type in CACHED_ID_TYPES):
+                self._expire_at.pop((data_partition_id, record_id), None)
+                self._expire_at[(data_partition_id, record_id)] = expire_at
+        while len(self._expire_at) > self.max_size:
+            self._expire_at.popitem(last=False)
+
+    def discard(self, data_partition_id: str, record_id: str) -> None:
+        """Forget an id, e.g. of a deleted record.
+
+        :param data_partition_id: data partition id
+        :type data_partition_id: str
+        :param record_id: record id
+        :type record_id: str
+        """
+        self._expire_at.pop((data_partition_id, record_id), None)
+
+
+@lru_cache
+def get_existence_cache() -> ExistenceCache:
+    """Get the existence cache, configured with the app settings on first
+    use.
+
+    :return: the existence cache
+    :rtype: ExistenceCache
+    """
+    return ExistenceCache(ttl=get_app_settings().reference_exists_cache_ttl)
@@ -45,3 +45,33 @@ def key_builder_using_token(
     ).hexdigest()
 
     return f"{prefix}:{hash_key}"
+
+
+def shared_key_builder(
+    func: Callable,
+    namespace: Optional[str] = "",
+    request: Optional[Request] = None,
+    groups_meta: Optional[str] = "",
+) -> str:
+    """Key builder for responses shared across callers.
+
+    The token is left out of the key, access to the cached response is
+    checked against the acls kept along with it.
+    """
+    from fastapi_cache import FastAPICache
+
+    func_meta = f"{func.__module__}:{func.__name__}"
+    prefix = f"{FastAPICache.get_prefix()}:{namespace}"
+
+    data_partition_id = request.headers.get("data-partition-id")
+    content_type = request.headers.get("content-type")
+    accept = request.headers.get("accept")
+    url = request.url
+    query_params = request.query_params.multi_items()
+    query_meta = f"{data_partition_id}:{groups_meta}:{url}:{query_params}:{content_type}:{accept}"
+
+    hash_key = hashlib.sha256(
+        f"{func_meta}:{query_meta}".encode(),
+    ).hexdigest()
+
+    return f"{prefix}:shared:{hash_key}"
@@ -0,0 +1,153 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from fastapi_cache import FastAPICache
+from prometheus_client import Counter, Histogram
+from starlette.requests import Request
+
+DEFAULT_NAMESPACE = "default"
+CONTENT_NAMESPACE = "content"
+SIZE_BUCKETS = (1024, 8192, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+# perf counter of the misses by cache key
+MissTimes = Dict[str, float]
+
+CACHE_REQUESTS = Counter(
+    "rafs_cache_requests",
+    "Number of cache lookups by result",
+    ["namespace", "route", "result"],
+)
+CACHE_FILL_SECONDS = Histogram(
+    "rafs_cache_fill_seconds",
+    "Time from a cache miss to the entry being filled",
+    ["namespace", "route"],
+)
+CACHE_ENTRY_BYTES = Histogram(
+    "rafs_cache_entry_bytes",
+    "Size of the encoded cache entries",
+    ["namespace", "route"],
+    buckets=SIZE_BUCKETS,
+)
+CACHE_DECODE_SECONDS = Histogram(
+    "rafs_cache_decode_seconds",
+    "Time to decode the cached values",
+    ["coder", "route"],
+)
+CACHE_EVICTIONS = Counter(
+    "rafs_cache_evictions",
+    "Number of entries evicted from the size bounded caches",
+    ["cache"],
+)
+
+_cache_route: ContextVar[str] = ContextVar("cache_route", default="")
+_missed_at: ContextVar[Optional[MissTimes]] = ContextVar("missed_at", default=None)
+
+
+class CacheResult:
+    HIT = "hit"
+    MISS = "miss"
+
+
+class EvictingCache:
+    TIERED_LOCAL = "tiered_local"
+    CONTENT_MEMORY = "content_memory"
+    CONTENT_DISK = "content_disk"
+
+
+def set_cache_route(request: Optional[Request]) -> None:
+    """Label the cache metrics of the request with its route.
+
+    :param request: the request
+    :type request: Optional[Request]
+    """
+    route = request.scope.get("route") if request is not None else None
+    _cache_route.set(getattr(route, "path", ""))
+
+
+def get_key_namespace(cache_key: str) -> str:
+    """Get the namespace of a cache key.
+
+    Keys are like {prefix}:{namespace}:{hash}, shared keys like
+    {prefix}::shared:{hash} and stale while revalidate ones like
+    {prefix}::swr:{hash}.
+
+    :param cache_key: cache key
+    :type cache_key: str
+    :return: the first non empty segment before the hash
+    :rtype: str
+    """
+    key_segments = cache_key.removeprefix(f"{FastAPICache.get_prefix()}:").split(":")
+    return next((key_segment for key_segment in key_segments[:-1] if key_segment), DEFAULT_NAMESPACE)
+
+
+def observe_lookup(cache_key: str, hit: bool, namespace: Optional[str] = None) -> None:
+    """Count a lookup, and keep the miss time to observe the fill.
+
+    :param cache_key: cache key
+    :type cache_key: str
+    :param hit: whether the value was found
+    :type hit: bool
+    :param namespace: namespace, defaults to the one of the key
+    :type namespace: Optional[str]
+    """
+    lookup_result = CacheResult.HIT if hit else CacheResult.MISS
+    CACHE_REQUESTS.labels(namespace or get_key_namespace(cache_key), _cache_route.get(), lookup_result).inc()
+    if not hit:
+        missed_at = _missed_at.get()
+        if missed_at is None:
+            missed_at = {}
+            _missed_at.set(missed_at)
+        missed_at[cache_key] = time.perf_counter()
+
+
+def observe_fill(cache_key: str, size: int, namespace: Optional[str] = None) -> None:
+    """Observe the size of an entry, and the fill time after a miss.
+
+    :param cache_key: cache key
+    :type cache_key: str
+    :param size: encoded size in bytes
+    :type size: int
+    :param namespace: namespace, defaults to the one of the key
+    :type namespace: Optional[str]
+    """
+    labels = (namespace or get_key_namespace(cache_key), _cache_route.get())
+    CACHE_ENTRY_BYTES.labels(*labels).observe(size)
+    missed_at = (_missed_at.get() or {}).pop(cache_key, None)
+    if missed_at is not None:
+        CACHE_FILL_SECONDS.labels(*labels).observe(time.perf_counter() - missed_at)
+
+
+@contextmanager
+def observe_decode(coder_name: str) -> Iterator[None]:
+    """Observe the time to decode a cached value.
+
+    :param coder_name: name of the coder
+    :type coder_name: str
+    :yield: while decoding
+    :rtype: Iterator[None]
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        CACHE_DECODE_SECONDS.labels(coder_name, _cache_route.get()).observe(time.perf_counter() - start)
+
+
+def observe_eviction(cache_name: str) -> None:
+    CACHE_EVICTIONS.labels(cache_name).inc()
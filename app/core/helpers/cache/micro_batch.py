@@ -0,0 +1,106 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+import copy
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
+
+BatchLoader = Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]
+# loader of the first caller and the futures of the requested keys
+Batch = Tuple[BatchLoader, Dict[Hashable, asyncio.Future]]
+
+
+class MicroBatcher:
+    """Merge the keys requested within a short window into one batch
+    call.
+
+    Batches are grouped by a batch key, e.g. the caller, and dispatched
+    once the window is over or max_batch_size keys are pending. Keys
+    requested more than once in a batch are loaded once, the other
+    callers get a deep copy of the value.
+    """
+
+    def __init__(self, window: float, max_batch_size: int) -> None:
+        """Init.
+
+        :param window: seconds the keys are collected before the batch
+            call
+        :type window: float
+        :param max_batch_size: max number of keys of a batch call
+        :type max_batch_size: int
+        """
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._batches: Dict[Hashable, Batch] = {}
+
+    async def load(self, batch_key: Hashable, key: Hashable, load_batch: BatchLoader) -> Optional[Any]:
+        """Load a key within the pending batch of batch_key.
+
+        :param batch_key: key of the callers sharing batches
+        :type batch_key: Hashable
+        :param key: key to load
+        :type key: Hashable
+        :param load_batch: loads the values of a batch of keys, the
+            first caller's one is used
+        :type load_batch: BatchLoader
+        :return: the value, None if missing from the batch result
+        :rtype: Optional[Any]
+        """
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            batch = (load_batch, {})
+            self._batches[batch_key] = batch
+            asyncio.get_running_loop().call_later(self.window, self._dispatch, batch_key, batch)
+        _, futures = batch
+        shared = key in futures
+        if not shared:
+            futures[key] = asyncio.get_running_loop().create_future()
+        future = futures[key]
+        if len(futures) >= self.max_batch_size:
+            self._dispatch(batch_key, batch)
+        loaded = await asyncio.shield(future)
+        return copy.deepcopy(loaded) if shared else loaded
+
+    def _dispatch(self, batch_key: Hashable, batch: Batch) -> None:
+        # called by the window timer and on full batches, only once per batch
+        if self._batches.get(batch_key) is not batch:
+            return
+        del self._batches[batch_key]
+        load_batch, futures = batch
+        batch_call = asyncio.ensure_future(load_batch(list(futures)))
+        batch_call.add_done_callback(lambda done_call: _resolve(futures, done_call))
+
+
+def _resolve(futures: Dict[Hashable, asyncio.Future], batch_call: asyncio.Future) -> None:
+    for key, future in futures.items():
+        if future.done():
+            continue
+        if batch_call.cancelled():
+            future.cancel()
+        elif batch_call.exception() is not None:
+            future.set_exception(batch_call.exception())
+            # retrieved even if all the callers were cancelled
+            future.add_done_callback(lambda done_future: done_future.exception())
+        else:
+            future.set_result(batch_call.result().get(key))
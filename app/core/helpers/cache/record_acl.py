@@ -0,0 +1,64 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List, Optional
+
+RecordAcls = List[dict]
+
+_filled_record_acls: ContextVar[Optional[RecordAcls]] = ContextVar("filled_record_acls", default=None)
+
+
+@contextmanager
+def collect_record_acls() -> Iterator[RecordAcls]:
+    """Collect the acls of the records read while filling a cache entry.
+
+    :yield: the collected record acls
+    :rtype: Iterator[RecordAcls]
+    """
+    record_acls: RecordAcls = []
+    context_token = _filled_record_acls.set(record_acls)
+    try:
+        yield record_acls
+    finally:
+        _filled_record_acls.reset(context_token)
+
+
+def capture_record_acl(record: dict) -> None:
+    """Keep the acl of a record if a cache entry is being filled.
+
+    :param record: storage record
+    :type record: dict
+    """
+    record_acls = _filled_record_acls.get()
+    if record_acls is not None:
+        record_acls.append(record.get("acl", {}))
+
+
+def is_entitled(groups: Iterable[str], record_acls: List[dict]) -> bool:
+    """Check the groups give access to all the records.
+
+    :param groups: entitlement groups of the caller
+    :type groups: Iterable[str]
+    :param record_acls: acls of the records
+    :type record_acls: List[dict]
+    :return: True if each record has a viewer or owner in the groups
+    :rtype: bool
+    """
+    groups = set(groups)
+    return all(
+        groups.intersection([*record_acl.get("viewers", []), *record_acl.get("owners", [])])
+        for record_acl in record_acls
+    )
@@ -0,0 +1,178 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+import json
+import os
+import time
+from functools import lru_cache, partial
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastapi_cache import FastAPICache
+from loguru import logger
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache.cache_files import (
+    get_cache_file_path,
+    write_cache_file,
+)
+from app.core.helpers.cache.single_flight import SingleFlight
+from app.services.asyncify import run_in_threadpool
+
+SCHEMA_ENTRY_TTL = 7 * 24 * 60 * 60  # ttl in seconds of the shared entries
+SCHEMA_FILE_SUFFIX = ".schema.json"
+
+# gets the schema of a kind, None if it matches the given etag
+SchemaFetcher = Callable[[str, Optional[str]], Awaitable[Tuple[Optional[dict], str]]]
+
+
+class SchemaEntry(NamedTuple):
+    schema: dict
+    etag: str
+    fetched_at: float
+
+
+class SchemaCache:
+    """Process-wide schemas keyed by data partition and kind.
+
+    Schemas are also kept in the cache backend, shared by the workers,
+    and in an optional directory, so restarted workers don't fetch them
+    again. Schemas older than revalidate_after seconds are still served
+    while a background call revalidates them with their etag.
+    """
+
+    def __init__(self, revalidate_after: int, directory: Optional[str] = None) -> None:
+        """Init.
+
+        :param revalidate_after: seconds before a schema is revalidated
+        :type revalidate_after: int
+        :param directory: directory of the schema files, defaults to
+            None for no files
+        :type directory: Optional[str]
+        """
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.revalidate_after = revalidate_after
+        self.directory = directory
+        self._entries: Dict[str, SchemaEntry] = {}
+        # schemas are shared as is, the callers don't modify them
+        self._flights = SingleFlight(copy_results=False)
+
+    async def get_schema(self, data_partition_id: str, kind: str, fetch: SchemaFetcher) -> dict:
+        """Get the schema of a kind, fetched if it isn't cached.
+
+        :param data_partition_id: data partition id
+        :type data_partition_id: str
+        :param kind: schema kind
+        :type kind: str
+        :param fetch: gets the schema of a kind, None if it matches the
+            given etag
+        :type fetch: SchemaFetcher
+        :return: the schema
+        :rtype: dict
+        """
+        entry_id = f"{data_partition_id}:{kind}"
+        schema_entry = self._entries.get(entry_id)
+        if schema_entry is None:
+            schema_entry, _ = await self._flights.run(entry_id, partial(self._load_entry, entry_id, kind, fetch))
+        elif schema_entry.fetched_at + self.revalidate_after < time.time() and entry_id not in self._flights:
+            revalidation = self._flights.start(
+                entry_id, partial(self._revalidate_entry, entry_id, kind, schema_entry, fetch),
+            )
+            revalidation.add_done_callback(partial(_log_revalidation_error, kind))
+        return schema_entry.schema
+
+    async def _load_entry(self, entry_id: str, kind: str, fetch: SchemaFetcher) -> SchemaEntry:
+        schema_entry = await self._get_stored_entry(entry_id)
+        if schema_entry is None:
+            schema, etag = await fetch(kind, None)
+            schema_entry = SchemaEntry(schema, etag, time.time())
+            await self._store_entry(entry_id, schema_entry)
+        self._entries[entry_id] = schema_entry
+        return schema_entry
+
+    async def _revalidate_entry(
+        self,
+        entry_id: str,
+        kind: str,
+        schema_entry: SchemaEntry,
+        fetch: SchemaFetcher,
+    ) -> SchemaEntry:
+        # not revalidated again before revalidate_after if the call fails
+        self._entries[entry_id] = schema_entry._replace(fetched_at=time.time())
+        schema, etag = await fetch(kind, schema_entry.etag)
+        # the same schema object is kept if not modified, so are its validators
+        schema_entry = SchemaEntry(schema_entry.schema if schema is None else schema, etag, time.time())
+        self._entries[entry_id] = schema_entry
+        await self._store_entry(entry_id, schema_entry)
+        return schema_entry
+
+    async def _get_stored_entry(self, entry_id: str) -> Optional[SchemaEntry]:
+        encoded_entry = None
+        if get_app_settings().cache_enable:
+            try:
+                encoded_entry = await FastAPICache.get_backend().get(_get_entry_key(entry_id))
+            except Exception:  # noqa: B902
+                logger.warning(f"Error retrieving schema '{entry_id}' from the cache backend")
+        if encoded_entry is None and self.directory:
+            encoded_entry = await run_in_threadpool(_read_file, self._get_path(entry_id))
+        if encoded_entry is None:
+            return None
+        return SchemaEntry(**json.loads(encoded_entry))
+
+    async def _store_entry(self, entry_id: str, schema_entry: SchemaEntry) -> None:
+        encoded_entry = json.dumps(schema_entry._asdict())
+        if get_app_settings().cache_enable:
+            try:
+                await FastAPICache.get_backend().set(_get_entry_key(entry_id), encoded_entry, SCHEMA_ENTRY_TTL)
+            except Exception:  # noqa: B902
+                logger.warning(f"Error setting schema '{entry_id}' in the cache backend")
+        if self.directory:
+            await run_in_threadpool(write_cache_file, self._get_path(entry_id), encoded_entry)
+
+    def _get_path(self, entry_id: str) -> str:
+        return get_cache_file_path(self.directory, entry_id, SCHEMA_FILE_SUFFIX)
+
+
+@lru_cache
+def get_schema_cache() -> SchemaCache:
+    """Get the schema cache, configured with the app settings on first
+    use.
+
+    :return: the schema cache
+    :rtype: SchemaCache
+    """
+    settings = get_app_settings()
+    return SchemaCache(
+        revalidate_after=settings.schema_cache_revalidate_after,
+        directory=settings.schema_cache_dir,
+    )
+
+
+def _get_entry_key(entry_id: str) -> str:
+    return f"{FastAPICache.get_prefix()}:schema:{entry_id}"
+
+
+def _read_file(file_path: str) -> Optional[str]:
+    try:
+        with open(file_path) as schema_file:
+            return schema_file.read()
+    except FileNotFoundError:
+        return None
+
+
+def _log_revalidation_error(kind: str, revalidation: asyncio.Future) -> None:
+    if not revalidation.cancelled() and revalidation.exception() is not None:
+        logger.warning(f"Error revalidating schema '{kind}': {revalidation.exception()}")
@@ -15,4 +15,9 @@
 import os
 
 CACHE_DEFAULT_TTL = int(os.environ.get("CACHE_DEFAULT_TTL", default="60"))  # ttl in seconds
+# seconds an expired search response is served while it is refreshed, 0 (default) disables it
+CACHE_SEARCH_STALE_TTL = int(os.environ.get("CACHE_SEARCH_STALE_TTL", default="0"))
+# seconds after a record change the search entries are cleared again, once indexed, 0 disables it
+CACHE_SEARCH_INDEX_DELAY = float(os.environ.get("CACHE_SEARCH_INDEX_DELAY", default="5"))
 STORAGE_ACCOUNT_INFO_CACHE_DEFAULT_TTL = 24 * 60 * 60  # ttl in seconds
+CACHE_COMPRESSION = os.environ.get("CACHE_COMPRESSION", default="")  # "", "lz4" or "zstd"
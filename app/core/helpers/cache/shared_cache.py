@@ -0,0 +1,389 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import hashlib
+import inspect
+import json
+import time
+from functools import partial, wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from fastapi.security.utils import get_authorization_scheme_param
+from fastapi_cache import FastAPICache
+from fastapi_cache.coder import Coder
+from fastapi_cache.decorator import cache
+from loguru import logger
+from starlette.requests import Request
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache.cache_tags import collect_cache_tags, tag_entry
+from app.core.helpers.cache.key_builder import (
+    key_builder_using_token,
+    shared_key_builder,
+)
+from app.core.helpers.cache.metrics import set_cache_route
+from app.core.helpers.cache.record_acl import collect_record_acls, is_entitled
+from app.core.helpers.cache.single_flight import SingleFlight
+from app.exceptions.exceptions import ClientDisconnectedException
+from app.models.schemas.user import User
+from app.resources.common_headers import (
+    AUTHORIZATION,
+    CORRELATION_ID,
+    DATA_PARTITION_ID,
+)
+from app.services.asyncify import run_detached
+from app.services.entitlements import EntitlementsService
+
+NO_CACHE_DIRECTIVES = ("no-store", "no-cache")
+ENTRY_SEPARATOR = b"\n"
+
+_token_flights = SingleFlight()
+# followers decode the encoded value, so the results aren't copied
+_shared_flights = SingleFlight(copy_results=False)
+
+TOKEN_FLIGHT_HEADERS = (AUTHORIZATION, DATA_PARTITION_ID, "content-type", "accept")
+
+
+class SharedEntry(NamedTuple):
+    record_acls: List[dict]
+    fresh_until: float
+    encoded_value: Union[str, bytes]
+
+
+class SharedCacheScope:
+    # shared by the callers entitled to all the records read to fill the entry
+    RECORD = "record"
+    # shared by the callers with the same data groups
+    GROUPS = "groups"
+
+
+class SharedCacheOptions(NamedTuple):
+    expire: int
+    coder: Optional[Type[Coder]]
+    scope: str
+    stale_ttl: int
+
+
+class CachedFunc(NamedTuple):
+    func: Callable[..., Awaitable]
+    func_params: Mapping[str, inspect.Parameter]
+    token_cached_func: Callable[..., Awaitable]
+    options: SharedCacheOptions
+
+
+class SharedCall(NamedTuple):
+    cached_func: CachedFunc
+    args: tuple
+    func_kwargs: dict
+    cache_key: str
+    # None if the entry is kept per token
+    caller_groups: Optional[List[str]]
+
+
+class FilledCall(NamedTuple):
+    ret: Any
+    record_acls: List[dict]
+    cache_tags: Set[str]
+
+
+class FilledEntry(NamedTuple):
+    ret: Any
+    # None if the entry isn't shared
+    encoded_value: Optional[Union[str, bytes]]
+    record_acls: List[dict]
+
+
+def shared_cache(
+    expire: int,
+    coder: Optional[Type[Coder]] = None,
+    scope: str = SharedCacheScope.RECORD,
+    stale_ttl: int = 0,
+) -> Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]]:
+    """Cache responses across callers when shared cache keys are enabled.
+
+    Falls back to the per token cache otherwise. Record scoped entries
+    are only filled if the response read records from the storage, and
+    only served to the callers whose groups are in their acls. Concurrent
+    misses of the same key share one call. Entries are tagged with the
+    data read to fill them, so writes of the data clear them. With a
+    stale ttl, expired entries are still served for stale_ttl seconds
+    while a background call refreshes them.
+
+    :param expire: ttl in seconds
+    :type expire: int
+    :param coder: coder of the responses, defaults to the app coder
+    :type coder: Optional[Type[Coder]]
+    :param scope: callers sharing an entry, defaults to
+        SharedCacheScope.RECORD
+    :type scope: str
+    :param stale_ttl: seconds an expired entry is served while it is
+        refreshed, defaults to 0
+    :type stale_ttl: int
+    :return: the decorator
+    :rtype: Callable
+    """
+    options = SharedCacheOptions(expire, coder, scope, stale_ttl)
+
+    def wrapper(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        token_cached_func = cache(expire=expire, coder=coder, key_builder=key_builder_using_token)(func)
+        cached_func = CachedFunc(func, inspect.signature(func).parameters, token_cached_func, options)
+
+        @wraps(token_cached_func)
+        async def inner(*args, **kwargs) -> Any:
+            return await _call_cached(cached_func, args, kwargs)
+
+        return inner
+
+    return wrapper
+
+
+async def get_caller_groups(request: Request, expire: int) -> List[str]:
+    """Get the data groups of the caller, cached per token.
+
+    :param request: the request
+    :type request: Request
+    :param expire: ttl in seconds
+    :type expire: int
+    :return: data groups emails
+    :rtype: List[str]
+    """
+    _, token = get_authorization_scheme_param(request.headers.get(AUTHORIZATION))
+    data_partition_id = request.headers.get(DATA_PARTITION_ID)
+    groups_key = _get_groups_key(data_partition_id, token)
+
+    cached_groups = await _get_entry(groups_key)
+    if cached_groups is not None:
+        return json.loads(cached_groups)
+
+    entitlements_service = EntitlementsService(
+        data_partition_id=data_partition_id,
+        settings=get_app_settings(),
+        user=User(access_token=token),
+        extra_headers={CORRELATION_ID: request.headers.get(CORRELATION_ID)},
+    )
+    groups = await entitlements_service.get_data_groups()
+    await _set_entry(groups_key, json.dumps(groups), expire)
+    return groups
+
+
+def _is_cacheable(request: Optional[Request]) -> bool:
+    if request is None or not get_app_settings().cache_enable:
+        return False
+    return request.method == "GET" and request.headers.get("Cache-Control") not in NO_CACHE_DIRECTIVES
+
+
+def _get_token_flight_key(func: Callable, request: Request) -> Tuple[Any, ...]:
+    flight_headers = tuple(request.headers.get(header_name) for header_name in TOKEN_FLIGHT_HEADERS)
+    return (func, str(request.url), *flight_headers)
+
+
+async def _call_cached(cached_func: CachedFunc, args: tuple, kwargs: dict) -> Any:
+    request: Optional[Request] = kwargs.get("request")
+    set_cache_route(request)
+    if not _is_cacheable(request):
+        return await cached_func.token_cached_func(*args, **kwargs)
+    if not get_app_settings().cache_shared_keys and not cached_func.options.stale_ttl:
+        return await _call_token_cached(cached_func, request, args, kwargs)
+    return await _call_shared_cached(await _get_shared_call(cached_func, request, args, kwargs))
+
+
+async def _call_token_cached(cached_func: CachedFunc, request: Request, args: tuple, kwargs: dict) -> Any:
+    flight_key = _get_token_flight_key(cached_func.func, request)
+    is_follower = flight_key in _token_flights
+    try:
+        ret, _ = await _token_flights.run(flight_key, partial(_fill_token_entry, cached_func, args, kwargs))
+    except ClientDisconnectedException:
+        if not is_follower:
+            raise
+        # the shared call was cancelled once the client of the leader disconnected
+        ret = await _fill_token_entry(cached_func, args, kwargs)
+    return ret
+
+
+async def _fill_token_entry(cached_func: CachedFunc, args: tuple, kwargs: dict) -> Any:
+    # tags are only collected if the entry is filled, not served from the cache
+    filled_call = await _call_collecting(cached_func.token_cached_func, args, kwargs)
+    if filled_call.cache_tags:
+        token_key = key_builder_using_token(cached_func.func, request=kwargs["request"])
+        await tag_entry(token_key, filled_call.cache_tags, cached_func.options.expire)
+    return filled_call.ret
+
+
+async def _call_collecting(func: Callable[..., Awaitable], args: tuple, kwargs: dict) -> FilledCall:
+    with collect_record_acls() as record_acls:
+        with collect_cache_tags() as cache_tags:
+            ret = await func(*args, **kwargs)
+            return FilledCall(ret, record_acls, cache_tags)
+
+
+async def _get_shared_call(cached_func: CachedFunc, request: Request, args: tuple, kwargs: dict) -> SharedCall:
+    func_kwargs = {name: arg_value for name, arg_value in kwargs.items() if name in cached_func.func_params}
+    options = cached_func.options
+    if get_app_settings().cache_shared_keys:
+        caller_groups = await get_caller_groups(request, options.expire)
+        groups_meta = _get_groups_hash(caller_groups) if options.scope == SharedCacheScope.GROUPS else ""
+        cache_key = shared_key_builder(cached_func.func, request=request, groups_meta=groups_meta)
+    else:
+        # the token is part of the key, so the entry is only served to its caller
+        caller_groups = None
+        cache_key = _get_stale_entry_key(key_builder_using_token(cached_func.func, request=request))
+    return SharedCall(cached_func, args, func_kwargs, cache_key, caller_groups)
+
+
+async def _call_shared_cached(shared_call: SharedCall) -> Any:
+    cache_entry = await _get_served_entry(shared_call)
+    if cache_entry is None:
+        return await _call_through_flight(shared_call)
+    if cache_entry.fresh_until < time.time():
+        _refresh_entry(shared_call)
+    return _get_coder(shared_call).decode(cache_entry.encoded_value)
+
+
+async def _get_served_entry(shared_call: SharedCall) -> Optional[SharedEntry]:
+    cached_entry = await _get_entry(shared_call.cache_key)
+    cache_entry = _decode_shared_entry(shared_call.cache_key, cached_entry) if cached_entry is not None else None
+    if cache_entry is None or not _is_served_to(shared_call.caller_groups, cache_entry.record_acls):
+        return None
+    return cache_entry
+
+
+async def _call_through_flight(shared_call: SharedCall) -> Any:
+    if shared_call.cache_key in _shared_flights:
+        return await _follow_flight(shared_call)
+    filled_entry, _ = await _shared_flights.run(shared_call.cache_key, partial(_fill_entry, shared_call))
+    return filled_entry.ret
+
+
+async def _follow_flight(shared_call: SharedCall) -> Any:
+    try:
+        filled_entry, _ = await _shared_flights.run(shared_call.cache_key, partial(_fill_entry, shared_call))
+    except Exception:  # noqa: B902
+        # the leader may have failed on its own, e.g. not entitled to a record the follower can read
+        filled_entry = None
+    if _is_filled_for(shared_call, filled_entry):
+        return _get_coder(shared_call).decode(filled_entry.encoded_value)
+    return await _call_func(shared_call)
+
+
+def _is_filled_for(shared_call: SharedCall, filled_entry: Optional[FilledEntry]) -> bool:
+    if filled_entry is None or filled_entry.encoded_value is None:
+        return False
+    return _is_served_to(shared_call.caller_groups, filled_entry.record_acls)
+
+
+async def _fill_entry(shared_call: SharedCall) -> FilledEntry:
+    options = shared_call.cached_func.options
+    filled_call = await _call_collecting(shared_call.cached_func.func, shared_call.args, shared_call.func_kwargs)
+    is_shared = shared_call.caller_groups is not None
+    if is_shared and not filled_call.record_acls and options.scope != SharedCacheScope.GROUPS:
+        return FilledEntry(filled_call.ret, None, filled_call.record_acls)
+
+    encoded_value = _get_coder(shared_call).encode(filled_call.ret)
+    cache_entry = SharedEntry(filled_call.record_acls, time.time() + options.expire, encoded_value)
+    entry_ttl = options.expire + options.stale_ttl
+    await _set_entry(shared_call.cache_key, _encode_shared_entry(cache_entry), entry_ttl)
+    await tag_entry(shared_call.cache_key, filled_call.cache_tags, entry_ttl)
+    return FilledEntry(filled_call.ret, encoded_value, filled_call.record_acls)
+
+
+async def _call_func(shared_call: SharedCall) -> Any:
+    return await shared_call.cached_func.func(*shared_call.args, **shared_call.func_kwargs)
+
+
+def _get_coder(shared_call: SharedCall) -> Type[Coder]:
+    return shared_call.cached_func.options.coder or FastAPICache.get_coder()
+
+
+async def _get_entry(cache_key: str) -> Any:
+    try:
+        _, cached_value = await FastAPICache.get_backend().get_with_ttl(cache_key)
+    except Exception:  # noqa: B902
+        logger.warning(f"Error retrieving cache key '{cache_key}' from backend")
+        return None
+    return cached_value
+
+
+async def _set_entry(cache_key: str, cache_value: Union[str, bytes], expire: int) -> None:
+    try:
+        await FastAPICache.get_backend().set(cache_key, cache_value, expire)
+    except Exception:  # noqa: B902
+        logger.warning(f"Error setting cache key '{cache_key}' in backend")
+
+
+def _is_served_to(caller_groups: Optional[List[str]], record_acls: List[dict]) -> bool:
+    # per token entries are only read by their caller
+    return caller_groups is None or is_entitled(caller_groups, record_acls)
+
+
+def _refresh_entry(shared_call: SharedCall) -> None:
+    if shared_call.cache_key in _shared_flights:
+        return
+    # the refresh outlives the request that started it
+    refresh = _shared_flights.start(shared_call.cache_key, partial(run_detached, partial(_fill_entry, shared_call)))
+    refresh.add_done_callback(partial(_log_refresh_error, shared_call.cache_key))
+
+
+def _log_refresh_error(cache_key: str, refresh: asyncio.Future) -> None:
+    if not refresh.cancelled() and refresh.exception() is not None:
+        logger.warning(f"Error refreshing cache key '{cache_key}': {refresh.exception()}")
+
+
+def _encode_shared_entry(cache_entry: SharedEntry) -> bytes:
+    # metadata json line followed by the coder value, which may be binary
+    encoded_value = cache_entry.encoded_value
+    if isinstance(encoded_value, str):
+        encoded_value = encoded_value.encode()
+    entry_meta = {"acls": cache_entry.record_acls, "fresh_until": cache_entry.fresh_until}
+    return b"".join((json.dumps(entry_meta).encode(), ENTRY_SEPARATOR, encoded_value))
+
+
+def _decode_shared_entry(cache_key: str, cache_entry: Union[str, bytes]) -> Optional[SharedEntry]:
+    if isinstance(cache_entry, str):
+        cache_entry = cache_entry.encode()
+    encoded_meta, _, encoded_value = cache_entry.partition(ENTRY_SEPARATOR)
+    try:
+        entry_meta = json.loads(encoded_meta)
+        return SharedEntry(entry_meta["acls"], entry_meta["fresh_until"], encoded_value)
+    except (ValueError, TypeError, KeyError):
+        # entries of another format are refilled
+        logger.warning(f"Error decoding cache key '{cache_key}', treated as a miss")
+        return None
+
+
+def _get_stale_entry_key(token_key: str) -> str:
+    # apart from the entries of the token cache, which are stored without acls
+    prefix, _, hash_key = token_key.rpartition(":")
+    return f"{prefix}:swr:{hash_key}"
+
+
+def _get_groups_key(data_partition_id: str, token: str) -> str:
+    token_hash = hashlib.sha256(f"{data_partition_id}:{token}".encode()).hexdigest()
+    return f"{FastAPICache.get_prefix()}:groups:{token_hash}"
+
+
+def _get_groups_hash(groups: List[str]) -> str:
+    return hashlib.sha256(json.dumps(sorted(groups)).encode()).hexdigest()
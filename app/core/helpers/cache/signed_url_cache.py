@@ -0,0 +1,175 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+
+SIGNED_DATE_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+def _parse_sas_time(sas_time: str) -> float:
+    # Azure SAS times are ISO 8601 UTC, with or without seconds
+    return datetime.fromisoformat(sas_time.replace("Z", "+00:00")).replace(tzinfo=timezone.utc).timestamp()
+
+
+def _parse_signed_date(signed_date: str) -> float:
+    return datetime.strptime(signed_date, SIGNED_DATE_FORMAT).replace(tzinfo=timezone.utc).timestamp()
+
+
+def get_signed_url_expiry(signed_url: str) -> Optional[float]:
+    """Get when a signed url expires, from its query parameters.
+
+    Azure SAS (se), AWS SigV4 (X-Amz-Date, X-Amz-Expires) and GCS V4
+    (X-Goog-Date, X-Goog-Expires) or V2 (Expires) urls are supported.
+
+    :param signed_url: signed url
+    :type signed_url: str
+    :return: the expiry timestamp, None if unknown
+    :rtype: Optional[float]
+    """
+    query = {name.lower(): query_values[0] for name, query_values in parse_qs(urlsplit(signed_url).query).items()}
+    try:
+        expiry = _get_query_expiry(query)
+    except ValueError:
+        expiry = None
+    return expiry
+
+
+def _get_query_expiry(query: Dict[str, str]) -> Optional[float]:
+    sas_expiry = query.get("se")
+    if sas_expiry:
+        return _parse_sas_time(sas_expiry)
+    expiries = (_get_signed_date_expiry(query, provider) for provider in ("amz", "goog"))
+    expiry = next((signed_expiry for signed_expiry in expiries if signed_expiry is not None), None)
+    v2_expiry = query.get("expires")
+    if expiry is None and v2_expiry:
+        expiry = float(v2_expiry)
+    return expiry
+
+
+def _get_signed_date_expiry(query: Dict[str, str], provider: str) -> Optional[float]:
+    signed_date = query.get(f"x-{provider}-date")
+    expires = query.get(f"x-{provider}-expires")
+    if signed_date and expires:
+        return _parse_signed_date(signed_date) + int(expires)
+    return None
+
+
+class SignedUrlCache:
+    """Signed urls of datasets, kept until shortly before they expire.
+
+    Urls are keyed by the caller, e.g. its data partition and token,
+    and the dataset id, the oldest ones are evicted past max_size urls.
+    """
+
+    def __init__(self, margin: int, max_size: int, default_ttl: int = CACHE_DEFAULT_TTL) -> None:
+        """Init.
+
+        :param margin: seconds a url is dropped before it expires
+        :type margin: int
+        :param max_size: max number of urls, 0 disables the cache
+        :type max_size: int
+        :param default_ttl: seconds a url is kept if its expiry is
+            unknown, defaults to CACHE_DEFAULT_TTL
+        :type default_ttl: int
+        """
+        self.margin = margin
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._urls: OrderedDict[Tuple[Hashable, str], Tuple[str, float]] = OrderedDict()
+
+    def get_many(self, caller_key: Hashable, dataset_ids: Iterable[str]) -> Dict[str, str]:
+        """Get the signed urls still valid.
+
+        :param caller_key: key of the caller
+        :type caller_key: Hashable
+        :param dataset_ids: dataset ids
+        :type dataset_ids: Iterable[str]
+        :return: the signed url per cached dataset id
+        :rtype: Dict[str, str]
+        """
+        now = time.time()
+        signed_urls = {}
+        for dataset_id in dataset_ids:
+            signed_url, expire_at = self._urls.get((caller_key, dataset_id), (None, 0))
+            if expire_at > now:
+                signed_urls[dataset_id] = signed_url
+        return signed_urls
+
+    def get(self, caller_key: Hashable, dataset_id: str) -> Optional[str]:
+        """Get a signed url still valid.
+
+        :param caller_key: key of the caller
+        :type caller_key: Hashable
+        :param dataset_id: dataset id
+        :type dataset_id: str
+        :return: the signed url, None if not cached
+        :rtype: Optional[str]
+        """
+        return self.get_many(caller_key, [dataset_id]).get(dataset_id)
+
+    def add(self, caller_key: Hashable, signed_urls: Iterable[Tuple[str, str]]) -> None:
+        """Keep signed urls until their expiry minus the margin.
+
+        :param caller_key: key of the caller
+        :type caller_key: Hashable
+        :param signed_urls: pairs of dataset id and signed url
+        :type signed_urls: Iterable[Tuple[str, str]]
+        """
+        if not self.max_size:
+            return
+        now = time.time()
+        for dataset_id, signed_url in signed_urls:
+            expiry = get_signed_url_expiry(signed_url)
+            expire_at = now + self.default_ttl if expiry is None else expiry - self.margin
+            if expire_at <= now:
+                continue
+            self._urls.pop((caller_key, dataset_id), None)
+            self._urls[(caller_key, dataset_id)] = (signed_url, expire_at)
+        while len(self._urls) > self.max_size:
+            self._urls.popitem(last=False)
+
+    def discard(self, caller_key: Hashable, dataset_ids: List[str]) -> None:
+        """Forget the signed urls of datasets, e.g. rejected or updated.
+
+        :param caller_key: key of the caller
+        :type caller_key: Hashable
+        :param dataset_ids: dataset ids
+        :type dataset_ids: List[str]
+        """
+        for dataset_id in dataset_ids:
+            self._urls.pop((caller_key, dataset_id), None)
+
+
+@lru_cache
+def get_signed_url_cache() -> SignedUrlCache:
+    """Get the signed url cache, configured with the app settings on
+    first use.
+
+    :return: the signed url cache
+    :rtype: SignedUrlCache
+    """
+    settings = get_app_settings()
+    return SignedUrlCache(
+        margin=settings.signed_url_expiry_margin,
+        max_size=settings.signed_url_cache_size,
+    )
@@ -0,0 +1,89 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import copy
+from functools import partial
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+TResult = TypeVar("TResult")
+
+
+class SingleFlight:
+    """Share one call between the concurrent callers of the same key.
+
+    The call runs in its own task, so it isn't cancelled with the caller
+    that started it. Unless results are immutable, each caller gets its
+    own deep copy of the result, the result of the call itself is never
+    handed out, so no caller sees the changes of another.
+    """
+
+    def __init__(self, copy_results: bool = True) -> None:
+        """Init.
+
+        :param copy_results: deep copy the shared results, defaults to
+            True
+        :type copy_results: bool
+        """
+        self._copy_results = copy_results
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._flights
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[TResult]]) -> Tuple[TResult, bool]:
+        """Call func, unless a call of the same key is already running.
+
+        :param key: call key
+        :type key: Hashable
+        :param func: the call
+        :type func: Callable[[], Awaitable[TResult]]
+        :return: the call result and whether it was shared with another
+            caller
+        :rtype: Tuple[TResult, bool]
+        """
+        flight = self._flights.get(key)
+        is_shared = flight is not None
+        if not is_shared:
+            flight = self.start(key, func)
+        flight_result = await asyncio.shield(flight)
+        return (copy.deepcopy(flight_result) if self._copy_results else flight_result), is_shared
+
+    def start(self, key: Hashable, func: Callable[[], Awaitable[TResult]]) -> "asyncio.Future[TResult]":
+        """Start func in the background, unless a call of the same key is
+        already running.
+
+        :param key: call key
+        :type key: Hashable
+        :param func: the call
+        :type func: Callable[[], Awaitable[TResult]]
+        :return: the running call
+        :rtype: asyncio.Future[TResult]
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(func())
+            self._flights[key] = flight
+            flight.add_done_callback(partial(self._land, key))
+        return flight
+
+    def _land(self, key: Hashable, flight: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            # retrieved even if all the callers were cancelled
+            flight.exception()
@@ -0,0 +1,325 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+import json
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+import httpx
+from fastapi import FastAPI
+from fastapi_cache import FastAPICache
+from loguru import logger
+from pydantic import parse_file_as
+
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.models.schemas.cache import WarmupQuery, WarmupReport
+from app.resources.common_headers import (
+    ACCEPT,
+    AUTHORIZATION,
+    DATA_PARTITION_ID,
+)
+from app.services.osdu_clients.http_client import get_http_client
+
+SEARCH_PATH_TEMPLATE = "{openapi_prefix}/v2/samplesanalysis/{analysis_type}/{endpoint}"
+RECORDED_QUERIES_TTL = 7 * 24 * 60 * 60  # ttl in seconds
+WARMUP_BASE_URL = "http://warmup"
+WARMUP_USER_AGENT = "rafs-cache-warmup"
+TOKEN_REFRESH_MARGIN = 60  # seconds before expiry the token is refreshed
+
+
+class WarmupRecorder:
+    """Most frequent search queries, to warm up the cache after a
+    restart.
+
+    Counted in memory, and merged into the cache backend on
+    shutdown.
+    """
+
+    def __init__(self, max_queries: int) -> None:
+        """Init.
+
+        :param max_queries: max number of queries kept
+        :type max_queries: int
+        """
+        self.max_queries = max_queries
+        self._counts: Counter = Counter()
+
+    def record(self, query: WarmupQuery) -> None:
+        """Count a query.
+
+        :param query: the query
+        :type query: WarmupQuery
+        """
+        self._counts[query.query_key] += 1
+        # the least frequent queries are dropped once twice the max is reached
+        if len(self._counts) >= 2 * self.max_queries:
+            self._counts = Counter(dict(self._counts.most_common(self.max_queries)))
+
+    async def save(self) -> None:
+        """Merge the counted queries into the ones kept in the cache
+        backend."""
+        if not self._counts:
+            return
+        counts = await _get_recorded_counts()
+        counts.update(self._counts)
+        recorded_counts = counts.most_common(self.max_queries)
+        try:
+            await FastAPICache.get_backend().set(
+                _get_recorded_queries_key(), json.dumps(recorded_counts), RECORDED_QUERIES_TTL,
+            )
+        except Exception:  # noqa: B902
+            logger.warning("Error saving the recorded warm-up queries in the cache backend")
+            return
+        self._counts.clear()
+
+
+class WarmupCredential:
+    """Service credential of the warm-up on startup.
+
+    Tokens are requested with the OAuth2 client credentials grant and
+    refreshed before they expire, so a long warm-up keeps a valid one.
+    """
+
+    def __init__(self, settings: AppSettings) -> None:
+        """Init.
+
+        :param settings: app settings
+        :type settings: AppSettings
+        """
+        self._settings = settings
+        self._access_token: Optional[str] = None
+        self._expires_at: float = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_configured(self) -> bool:
+        settings = self._settings
+        return bool(
+            settings.cache_warmup_token_url and settings.cache_warmup_client_id and settings.cache_warmup_client_secret,
+        )
+
+    async def get_token(self) -> str:
+        """Get the current token, requesting a new one when it's about to
+        expire.
+
+        :return: access token
+        :rtype: str
+        """
+        async with self._lock:
+            if self._access_token is None or time.monotonic() >= self._expires_at - TOKEN_REFRESH_MARGIN:
+                await self._refresh()
+        return self._access_token
+
+    async def _refresh(self) -> None:
+        settings = self._settings
+        token_request = {
+            "grant_type": "client_credentials",
+            "client_id": settings.cache_warmup_client_id,
+            "client_secret": settings.cache_warmup_client_secret,
+        }
+        if settings.cache_warmup_scope:
+            token_request["scope"] = settings.cache_warmup_scope
+        response = await get_http_client().post(settings.cache_warmup_token_url, data=token_request)
+        response.raise_for_status()
+        token_response = response.json()
+        self._access_token = token_response["access_token"]
+        self._expires_at = time.monotonic() + token_response.get("expires_in", TOKEN_REFRESH_MARGIN)
+
+
+_warmup_tasks: Set[asyncio.Task] = set()
+
+
+@lru_cache
+def get_warmup_recorder() -> Optional[WarmupRecorder]:
+    """Get the warm-up queries recorder, configured with the app settings
+    on first use.
+
+    :return: the recorder, None if not enabled
+    :rtype: Optional[WarmupRecorder]
+    """
+    settings = get_app_settings()
+    if settings.cache_enable and settings.cache_warmup_recorded_queries:
+        return WarmupRecorder(settings.cache_warmup_recorded_queries)
+    return None
+
+
+def record_warmup_query(query: WarmupQuery) -> None:
+    """Count a query for the next warm-up, if the recorder is enabled.
+
+    :param query: the query
+    :type query: WarmupQuery
+    """
+    recorder = get_warmup_recorder()
+    if recorder is not None:
+        recorder.record(query)
+
+
+async def save_warmup_queries() -> None:
+    """Save the recorded queries, if the recorder is enabled."""
+    recorder = get_warmup_recorder()
+    if recorder is not None:
+        await recorder.save()
+
+
+async def get_warmup_queries(settings: AppSettings) -> List[WarmupQuery]:
+    """Get the queries of the warm-up file followed by the most
+    frequent recorded ones.
+
+    :param settings: app settings
+    :type settings: AppSettings
+    :return: the queries, without duplicates
+    :rtype: List[WarmupQuery]
+    """
+    warmup_queries = []
+    if settings.cache_warmup_file:
+        try:
+            warmup_queries = parse_file_as(List[WarmupQuery], settings.cache_warmup_file)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Error reading the warm-up file '{settings.cache_warmup_file}': {exc}")
+    if settings.cache_warmup_recorded_queries:
+        for query_key, _ in (await _get_recorded_counts()).most_common():
+            warmup_queries.append(WarmupQuery.parse_raw(query_key))
+    unique_queries: Dict[str, WarmupQuery] = {}
+    for query in warmup_queries:
+        unique_queries.setdefault(query.query_key, query)
+    return list(unique_queries.values())
+
+
+async def warm_up_cache(
+    app: FastAPI,
+    queries: Iterable[WarmupQuery],
+    token: Union[str, WarmupCredential],
+    concurrency: int,
+) -> WarmupReport:
+    """Replay queries through the app, to fill the cache.
+
+    :param app: the app
+    :type app: FastAPI
+    :param queries: the queries
+    :type queries: Iterable[WarmupQuery]
+    :param token: authorization token of the replayed queries, or the
+        credential refreshing it
+    :type token: Union[str, WarmupCredential]
+    :param concurrency: max number of queries replayed at once
+    :type concurrency: int
+    :return: number of replayed and failed queries
+    :rtype: WarmupReport
+    """
+    openapi_prefix = get_app_settings().openapi_prefix
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url=WARMUP_BASE_URL) as client:
+
+        async def replay(query: WarmupQuery) -> bool:
+            url = SEARCH_PATH_TEMPLATE.format(
+                openapi_prefix=openapi_prefix,
+                analysis_type=query.analysis_type,
+                endpoint=query.endpoint,
+            )
+            async with semaphore:
+                try:
+                    bearer_token = token if isinstance(token, str) else await token.get_token()
+                    headers = {
+                        AUTHORIZATION: f"Bearer {bearer_token}",
+                        DATA_PARTITION_ID: query.data_partition_id,
+                        ACCEPT: f"*/*;version={query.content_schema_version}",
+                        "User-Agent": WARMUP_USER_AGENT,
+                    }
+                    response = await client.get(url, params=query.params, headers=headers)
+                except Exception as exc:  # noqa: B902
+                    logger.warning(f"Error replaying warm-up query {query.query_key}: {exc}")
+                    return False
+            if response.is_error:
+                logger.warning(f"Warm-up query {query.query_key} failed with status {response.status_code}")
+            return not response.is_error
+
+        replayed = await asyncio.gather(*(replay(query) for query in queries))
+
+    report = WarmupReport(replayed=len(replayed), failed=replayed.count(False))
+    logger.info(f"Cache warmed up: {report.replayed} queries replayed, {report.failed} failed")
+    return report
+
+
+async def warm_up_cache_on_start(app: FastAPI, settings: AppSettings) -> None:
+    """Replay the warm-up queries on startup, if enabled.
+
+    :param app: the app
+    :type app: FastAPI
+    :param settings: app settings
+    :type settings: AppSettings
+    """
+    if not (settings.cache_enable and settings.cache_warmup_on_start):
+        return
+    if not settings.cache_shared_keys:
+        # entries filled with the service credential would only be reused by the service itself
+        logger.warning("Cache warm-up skipped, CACHE_SHARED_KEYS is not enabled")
+        return
+    credential = WarmupCredential(settings)
+    if not credential.is_configured:
+        logger.warning("Cache warm-up skipped, CACHE_WARMUP_TOKEN_URL, CLIENT_ID or CLIENT_SECRET not set")
+        return
+    queries = await get_warmup_queries(settings)
+    try:
+        await asyncio.wait_for(
+            warm_up_cache(app, queries, credential, settings.cache_warmup_concurrency),
+            timeout=settings.cache_warmup_timeout,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Cache warm-up stopped after {settings.cache_warmup_timeout} sec")
+
+
+def start_cache_warmup(app: FastAPI, settings: AppSettings) -> asyncio.Task:
+    """Start the warm-up on startup in the background, so the app
+    serves requests meanwhile.
+
+    :param app: the app
+    :type app: FastAPI
+    :param settings: app settings
+    :type settings: AppSettings
+    :return: the warm-up task
+    :rtype: asyncio.Task
+    """
+    warmup_task = asyncio.create_task(warm_up_cache_on_start(app, settings))
+    _warmup_tasks.add(warmup_task)
+    warmup_task.add_done_callback(_warmup_tasks.discard)
+    return warmup_task
+
+
+async def stop_cache_warmup() -> None:
+    """Cancel the warm-up started on startup, if still running."""
+    while _warmup_tasks:
+        warmup_task = _warmup_tasks.pop()
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, return_exceptions=True)
+
+
+async def _get_recorded_counts() -> Counter:
+    try:
+        recorded_counts = await FastAPICache.get_backend().get(_get_recorded_queries_key())
+    except Exception:  # noqa: B902
+        logger.warning("Error retrieving the recorded warm-up queries from the cache backend")
+        return Counter()
+    if recorded_counts is None:
+        return Counter()
+    return Counter(dict(json.loads(recorded_counts)))
+
+
+def _get_recorded_queries_key() -> str:
+    return f"{FastAPICache.get_prefix()}:warmup:queries"
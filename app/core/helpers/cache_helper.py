@@ -12,12 +12,25 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import heapq
+from typing import Iterable, List, Tuple
+
 from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
 from loguru import logger
+from redis.asyncio.client import Redis
 
 from app.core.helpers.cache.backend_builder import BackendBuilder
+from app.core.helpers.cache.backends.instrumented_cache import (
+    InstrumentedBackend,
+    unwrap_backend,
+)
+from app.core.helpers.cache.backends.tiered_cache import TieredBackend
 from app.core.settings.app import AppSettings
 
+SCAN_BATCH_SIZE = 500
+
 
 async def init_cache(settings: AppSettings) -> None:
     """Init cache layer for the app.
@@ -33,7 +46,7 @@ async def init_cache(settings: AppSettings) -> None:
         backend_builder = BackendBuilder(
             cache_backend_path=cache_backend,
         )
-        backend = await backend_builder.build_backend()
+        backend = InstrumentedBackend(await backend_builder.build_backend())
         logger.debug("Fastapi cache enabled")
     else:
         logger.debug("Fastapi cache disabled")
@@ -57,3 +70,65 @@ async def clear_cache(settings: AppSettings) -> None:
     if settings.cache_enable:
         await FastAPICache.clear()
         logger.debug("Fastapi cache cleared")
+
+
+async def close_cache(settings: AppSettings) -> None:
+    """Stop the background tasks of the cache backend.
+
+    :param settings: app settings
+    :type settings: AppSettings
+    """
+    if settings.cache_enable:
+        backend = unwrap_backend(FastAPICache.get_backend())
+        if isinstance(backend, TieredBackend):
+            await backend.stop_listener()
+            logger.debug("Tiered cache listener stopped")
+
+
+async def get_top_keys(limit: int) -> List[Tuple[str, int]]:
+    """Get the biggest cache entries.
+
+    Redis keys are scanned and sized by Redis, in memory entries by the
+    size of their values.
+
+    :param limit: max number of keys
+    :type limit: int
+    :return: keys and sizes in bytes, biggest first
+    :rtype: List[Tuple[str, int]]
+    """
+    backend = unwrap_backend(FastAPICache.get_backend())
+    prefix = FastAPICache.get_prefix()
+    if isinstance(backend, (RedisBackend, TieredBackend)):
+        return await _get_redis_top_keys(backend.redis, prefix, limit)
+    if isinstance(backend, InMemoryBackend):
+        key_sizes = (
+            (key, len(cached_value.data))
+            for key, cached_value in backend._store.items()  # noqa: WPS437
+            if key.startswith(prefix)
+        )
+        return _get_largest(key_sizes, limit)
+    return []
+
+
+async def _get_redis_top_keys(redis: Redis, prefix: str, limit: int) -> List[Tuple[str, int]]:
+    top_keys: List[Tuple[str, int]] = []
+    keys_batch = []
+    async for key in redis.scan_iter(match=f"{prefix}:*", count=SCAN_BATCH_SIZE):
+        keys_batch.append(key)
+        if len(keys_batch) == SCAN_BATCH_SIZE:
+            top_keys = _get_largest([*top_keys, *await _get_redis_key_sizes(redis, keys_batch)], limit)
+            keys_batch = []
+    return _get_largest([*top_keys, *await _get_redis_key_sizes(redis, keys_batch)], limit)
+
+
+async def _get_redis_key_sizes(redis: Redis, keys: List[bytes]) -> List[Tuple[str, int]]:
+    async with redis.pipeline(transaction=False) as pipe:
+        for scanned_key in keys:
+            pipe.memory_usage(scanned_key)
+        sizes = await pipe.execute()
+    # keys expired while scanning have no size
+    return [(key.decode(), size) for key, size in zip(keys, sizes) if size is not None]
+
+
+def _get_largest(key_sizes: Iterable[Tuple[str, int]], limit: int) -> List[Tuple[str, int]]:
+    return heapq.nlargest(limit, key_sizes, key=lambda key_size: key_size[1])
@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 import logging
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -61,8 +61,40 @@ class AppSettings(BaseAppSettings):
 
     cache_backend: str = ""
 
+    cache_shared_keys: bool = False
+
+    cache_clear_on_stop: bool = True
+
+    cache_warmup_on_start: bool = False
+
+    cache_warmup_file: Optional[str] = None
+
+    cache_warmup_token_url: Optional[str] = None
+
+    cache_warmup_client_id: Optional[str] = None
+
+    cache_warmup_client_secret: Optional[str] = None
+
+    cache_warmup_scope: Optional[str] = None
+
+    cache_warmup_concurrency: int = 4
+
+    cache_warmup_timeout: float = 120.0
+
+    cache_warmup_recorded_queries: int = 0
+
     storage_query_limit: int = 100
 
+    storage_batch_window: float = 0
+
+    storage_query_concurrency: int = 8
+
+    reference_exists_cache_ttl: int = 24 * 60 * 60
+
+    signed_url_expiry_margin: int = 5 * 60
+
+    signed_url_cache_size: int = 10000
+
     service_readiness_urls: str = None
 
     redis_index_enable: bool = False
@@ -75,6 +107,38 @@ class AppSettings(BaseAppSettings):
 
     enable_gc_collect: bool = True
 
+    worker_pool_max_workers: Optional[int] = None
+
+    worker_process_pool_max_workers: int = 0
+
+    disconnect_poll_interval: float = 1.0
+
+    http_max_connections: int = 100
+
+    http_max_keepalive_connections: int = 20
+
+    http_keepalive_expiry: float = 30.0
+
+    http2_enable: bool = True
+
+    blob_max_connections: int = 100
+
+    blob_max_concurrency: int = 4
+
+    schema_registry_preload: bool = False
+
+    schema_cache_revalidate_after: int = 60 * 60
+
+    schema_cache_dir: Optional[str] = None
+
+    content_cache_max_bytes: int = 0
+
+    content_cache_dir: Optional[str] = None
+
+    content_cache_disk_max_bytes: int = 1024 * 1024 * 1024
+
+    metrics_enable: bool = False
+
     @property
     def fastapi_kwargs(self) -> Dict[str, Any]:
         return {
@@ -29,3 +29,5 @@ class TestAppSettings(AppSettings):
     use_blob_storage: bool = False
     local_dev_mode: bool = True
     enable_gc_collect = False
+    reference_exists_cache_ttl: int = 0
+    signed_url_cache_size: int = 0
@@ -0,0 +1,214 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import compute as pc
+from pyarrow import parquet as pq
+
+from app.dataframe.errors import PushdownNotSupportedError
+from app.resources.filters import RowsFilter
+
+ARROW_OPERATORS = {
+    "=": pc.equal,
+    "!=": pc.not_equal,
+    "<=": pc.less_equal,
+    ">=": pc.greater_equal,
+    "<": pc.less,
+    ">": pc.greater,
+}
+NULL_MATCHING_OPERATORS = frozenset(("!=",))
+EQUALITY_OPERATORS = frozenset(("=", "!="))
+RANGE_INDEX_KIND = "range"
+
+
+def read_parquet_with_pushdown(
+    parquet_bytes: bytes,
+    columns: Optional[List[str]] = None,
+    rows_filter: Optional[RowsFilter] = None,
+) -> pd.DataFrame:
+    """Read parquet applying projection and rows filter natively with Arrow.
+
+    Only the required columns are decoded, row groups whose statistics can't
+    satisfy the rows filter are skipped, and just the surviving rows are
+    converted to pandas. Index labels are kept the same as if the filter was
+    applied over the full pandas.DataFrame.
+
+    :param parquet_bytes: parquet content
+    :type parquet_bytes: bytes
+    :param columns: columns to project, defaults to None (all)
+    :type columns: Optional[List[str]]
+    :param rows_filter: rows filter, defaults to None
+    :type rows_filter: Optional[RowsFilter]
+    :raises PushdownNotSupportedError: if filters can't be evaluated by
+        Arrow with the same semantics as pandas
+    :return: filtered dataframe
+    :rtype: pd.DataFrame
+    """
+    parquet_file = pq.ParquetFile(pa.BufferReader(parquet_bytes))
+    read_columns = _get_read_columns(parquet_file.schema_arrow, columns, rows_filter)
+    row_groups = _get_candidate_row_groups(parquet_file, rows_filter)
+    table = parquet_file.read_row_groups(row_groups, columns=read_columns, use_pandas_metadata=True)
+
+    if rows_filter:
+        mask = build_mask(table, rows_filter)
+        positions = pc.filter(_get_row_positions(parquet_file, row_groups), mask)
+        df = table.filter(mask).to_pandas()
+        _restore_range_index(df, parquet_file.schema_arrow, positions)
+    else:
+        df = table.to_pandas()
+
+    return df[columns] if columns else df
+
+
+def build_mask(table: pa.Table, rows_filter: RowsFilter) -> pa.ChunkedArray:
+    """Build boolean mask with pandas comparison semantics.
+
+    :param table: arrow table
+    :type table: pa.Table
+    :param rows_filter: rows filter
+    :type rows_filter: RowsFilter
+    :raises PushdownNotSupportedError: if the filter is not supported
+    :return: boolean mask without nulls
+    :rtype: pa.ChunkedArray
+    """
+    filtered_column = _get_filtered_column(table.column(rows_filter.column), rows_filter)
+    _check_comparable(filtered_column.type, rows_filter.comp_value)
+    compare = ARROW_OPERATORS[rows_filter.operator]
+    try:
+        mask = compare(filtered_column, rows_filter.comp_value)
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+        raise PushdownNotSupportedError(exc)
+    return pc.fill_null(mask, rows_filter.operator in NULL_MATCHING_OPERATORS)
+
+
+def _get_read_columns(
+    schema: pa.Schema,
+    columns: Optional[List[str]],
+    rows_filter: Optional[RowsFilter],
+) -> Optional[List[str]]:
+    required_columns = list(columns) if columns else []
+    if rows_filter:
+        required_columns.append(rows_filter.column)
+
+    missing_columns = set(required_columns) - set(schema.names)
+    if missing_columns:
+        raise PushdownNotSupportedError(f"Columns not found: {missing_columns}")
+
+    if not columns:
+        return None
+    return list(dict.fromkeys(required_columns))
+
+
+def _get_filtered_column(column: pa.ChunkedArray, rows_filter: RowsFilter) -> pa.ChunkedArray:
+    if not rows_filter.field:
+        return column
+
+    if not pa.types.is_struct(column.type) or column.type.get_field_index(rows_filter.field) < 0:
+        raise PushdownNotSupportedError(f"'{rows_filter.field}' is not a field of '{rows_filter.column}'")
+    if column.null_count:
+        # pandas fails accessing a field of a missing object
+        raise PushdownNotSupportedError(f"'{rows_filter.column}' contains nulls")
+
+    field_column = pc.struct_field(column, [column.type.get_field_index(rows_filter.field)])
+    if field_column.null_count and rows_filter.operator not in EQUALITY_OPERATORS:
+        # pandas fails ordering None values of an object
+        raise PushdownNotSupportedError(f"'{rows_filter.column}.{rows_filter.field}' contains nulls")
+    return field_column
+
+
+def _check_comparable(value_type: pa.DataType, comp_value: Any) -> None:
+    is_comparable = False
+    if isinstance(comp_value, bool):
+        is_comparable = pa.types.is_boolean(value_type)
+    elif isinstance(comp_value, (int, float)):
+        is_comparable = pa.types.is_integer(value_type) or pa.types.is_floating(value_type)
+    elif isinstance(comp_value, str):
+        is_comparable = pa.types.is_string(value_type) or pa.types.is_large_string(value_type)
+
+    if not is_comparable:
+        comp_type = type(comp_value)
+        raise PushdownNotSupportedError(f"Can't compare {value_type} with {comp_type}")
+
+
+def _get_candidate_row_groups(parquet_file: pq.ParquetFile, rows_filter: Optional[RowsFilter]) -> List[int]:
+    row_groups = list(range(parquet_file.num_row_groups))
+    if not rows_filter or rows_filter.field:
+        return row_groups
+
+    parquet_schema = parquet_file.metadata.schema
+    column_paths = [parquet_schema.column(column_index).path for column_index in range(len(parquet_schema))]
+    if rows_filter.column not in column_paths:
+        return row_groups
+
+    column_index = column_paths.index(rows_filter.column)
+    return [
+        row_group
+        for row_group in row_groups
+        if _may_match(parquet_file.metadata.row_group(row_group).column(column_index).statistics, rows_filter)
+    ]
+
+
+def _may_match(statistics: Optional[pq.Statistics], rows_filter: RowsFilter) -> bool:
+    if statistics is None or not statistics.has_min_max:
+        return True
+
+    min_value, max_value, comp_value = statistics.min, statistics.max, rows_filter.comp_value
+    try:
+        match rows_filter.operator:
+            case "=":
+                may_match = min_value <= comp_value <= max_value
+            case "<":
+                may_match = min_value < comp_value
+            case "<=":
+                may_match = min_value <= comp_value
+            case ">":
+                may_match = max_value > comp_value
+            case ">=":
+                may_match = max_value >= comp_value
+            case _:
+                may_match = True
+    except TypeError:
+        may_match = True
+    return may_match
+
+
+def _get_row_positions(parquet_file: pq.ParquetFile, row_groups: List[int]) -> pa.Array:
+    row_counts = [
+        parquet_file.metadata.row_group(row_group_index).num_rows
+        for row_group_index in range(parquet_file.num_row_groups)
+    ]
+    # offsets[i] is the position of the first row of the row group i
+    offsets = np.cumsum([0, *row_counts])
+    positions = [np.arange(offsets[row_group], offsets[row_group + 1]) for row_group in row_groups]
+    return pa.array(np.concatenate(positions) if positions else [], type=pa.int64())
+
+
+def _restore_range_index(df: pd.DataFrame, schema: pa.Schema, positions: pa.Array) -> None:
+    pandas_metadata = schema.pandas_metadata or {}
+    # no index columns, e.g. written with index=False, are read back with a default range index
+    index_columns = pandas_metadata.get("index_columns") or [{"kind": RANGE_INDEX_KIND, "start": 0, "step": 1}]
+    if len(index_columns) != 1 or not isinstance(index_columns[0], dict):
+        # index was materialized as a column and already filtered with the rows
+        return
+
+    range_index = index_columns[0]
+    if range_index.get("kind") != RANGE_INDEX_KIND:
+        return
+
+    labels = positions.to_numpy(zero_copy_only=False) * range_index["step"] + range_index["start"]
+    df.index = pd.Index(labels, name=range_index.get("name"))
@@ -13,26 +13,39 @@
 #  limitations under the License.
 
 import asyncio
+from functools import partial
 from typing import List, Optional
 
 import pandas as pd
 import pyarrow as pa
-from fastapi_cache.coder import PickleCoder
 from fastapi_cache.decorator import cache
 from loguru import logger
-from pyarrow import parquet as pq
 
+from app.core.helpers.cache.content_cache import get_content
 from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
 from app.dataframe.filter_processor import FilterProcessor
-from app.dataframe.parquet_loader import DFPayload
+from app.dataframe.parquet_loader import (
+    DFPayload,
+    DFPayloadCoder,
+    read_parquet,
+)
 from app.exceptions.exceptions import NotFoundException
 from app.providers.dependencies.blob_storage import BlobMetadata, IBlobStorage
 from app.resources.mime_types import SupportedMimeTypes
+from app.services.asyncify import run_in_threadpool
 
 
 class BlobParquetLoader:
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=PickleCoder)
+    def __init__(self, data_partition_id: str) -> None:
+        """Init.
+
+        :param data_partition_id: data partition id of the blobs
+        :type data_partition_id: str
+        """
+        self._data_partition_id = data_partition_id
+
+    @cache(expire=CACHE_DEFAULT_TTL, coder=DFPayloadCoder)
     async def read_parquet_files(
         self,
         blob_ids: List[str],
@@ -74,12 +87,12 @@ class BlobParquetLoader:
             content_type=SupportedMimeTypes.PARQUET,
         )
         try:
-            blob = await blob_storage_service.get_blob(blob_metadata=blob_metadata)
-            if df_filter_processor:
-                df_filter_processor = df_filter_processor.get_filters_without_aggregation()
-                df = df_filter_processor.apply_filters_from_bytes(blob.blob_data)
-            else:
-                df = pq.read_table(pa.BufferReader(blob.blob_data)).to_pandas()
+            blob_data = await get_content(
+                self._data_partition_id,
+                blob_metadata.object_name,
+                partial(_get_blob_data, blob_storage_service, blob_metadata),
+            )
+            df = await run_in_threadpool(read_parquet, blob_data, df_filter_processor)
             error_msg = None
         except NotFoundException as u_exc:
             object_name = blob_metadata.object_name
@@ -104,3 +117,8 @@ class BlobParquetLoader:
             df = pd.DataFrame()
 
         return DFPayload(blob_metadata.object_name, df, error_msg)
+
+
+async def _get_blob_data(blob_storage_service: IBlobStorage, blob_metadata: BlobMetadata) -> bytes:
+    blob = await blob_storage_service.get_blob(blob_metadata=blob_metadata)
+    return blob.blob_data
@@ -14,3 +14,7 @@
 
 class EntityDoesNotExist(Exception):
     """Raised when entity was not found in database."""
+
+
+class PushdownNotSupportedError(Exception):
+    """Raised when a filter can't be evaluated natively by Arrow."""
@@ -13,12 +13,14 @@
 #  limitations under the License.
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import pandas as pd
 
 from app.dataframe.parquet_filter import (
     apply_filters_from_bytes,
     apply_filters_from_df,
+    get_aggregation_values,
 )
 from app.resources.filters import DataFrameFilterValidator
 
@@ -45,6 +47,17 @@ class FilterProcessor(ABC):
         :rtype: pd.DataFrame
         """
 
+    @abstractmethod
+    def get_aggregation_values(self, df: pd.DataFrame) -> Optional[pd.Series]:
+        """Get the values to aggregate from a filtered dataframe.
+
+        :param df: filtered dataframe
+        :type df: pd.DataFrame
+        :return: the values, None if the dataframe has not the
+            aggregated column
+        :rtype: Optional[pd.Series]
+        """
+
     @abstractmethod
     def get_filters_without_aggregation(self) -> "FilterProcessor":
         """_summary_
@@ -75,10 +88,9 @@ class DFFilterProcessor(FilterProcessor):
     def apply_filters_from_df(self, df: pd.DataFrame) -> pd.DataFrame:
         return apply_filters_from_df(df, self._df_filter)
 
+    def get_aggregation_values(self, df: pd.DataFrame) -> Optional[pd.Series]:
+        return get_aggregation_values(df, self._df_filter)
+
     def get_filters_without_aggregation(self) -> "DFFilterProcessor":
-        df_filter_wo_agg = DataFrameFilterValidator(
-            model=self._df_filter.model,
-            raw_rows_filter=self._df_filter.raw_rows_filter,
-            raw_columns_filter=self._df_filter.raw_columns_filter,
-        )
+        df_filter_wo_agg = self._df_filter.without_aggregation
         return DFFilterProcessor(df_filter_wo_agg)
@@ -12,14 +12,23 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import List, Optional
+
 import pandas as pd
 import pyarrow as pa
 from loguru import logger
 from pyarrow import parquet as pq
 
+from app.dataframe.arrow_filter import read_parquet_with_pushdown
+from app.dataframe.errors import PushdownNotSupportedError
 from app.dataframe.query import PandasDFQueryBase
 from app.exceptions.exceptions import UnprocessableContentException
-from app.resources.filters import DataFrameFilterValidator
+from app.resources.filters import (
+    ColumnsAggregation,
+    ColumnsFilter,
+    DataFrameFilterValidator,
+    RowsFilter,
+)
 
 
 def apply_filters_from_bytes(
@@ -28,11 +37,29 @@ def apply_filters_from_bytes(
 ) -> pd.DataFrame:
     """Apply filters to parquet data and return a filtered pandas.DataFrame.
 
+    Projection and rows filter are pushed down to Arrow when possible, falling
+    back to filtering the whole pandas.DataFrame otherwise.
+
     :param bytes parquet_bytes: parquet as read from blob storage
     :param DataFrameFilterValidator df_filter: df filter validator
     :return pd.DataFrame: the pd.DataFrame result from applying filters
     """
-    return apply_filters_from_df(pq.read_table(pa.BufferReader(parquet_bytes)).to_pandas(), df_filter)
+    rows_filter = df_filter.valid_rows_filter
+    columns_filter = df_filter.valid_columns_filter
+    columns_aggregation = df_filter.valid_columns_aggregation
+
+    try:
+        df = read_parquet_with_pushdown(
+            parquet_bytes,
+            columns=_get_projected_columns(columns_filter, columns_aggregation),
+            rows_filter=rows_filter,
+        )
+    except PushdownNotSupportedError as exc:
+        logger.debug(f"Filter pushdown is not supported, fallback to pandas: {exc}")
+        df = pq.read_table(pa.BufferReader(parquet_bytes)).to_pandas()
+        return _apply_filters(df, rows_filter, columns_filter, columns_aggregation)
+
+    return _apply_filters(df, columns_aggregation=columns_aggregation)
 
 
 def apply_filters_from_df(
@@ -50,22 +77,76 @@ def apply_filters_from_df(
     :return: filtered dataframe
     :rtype: pd.DataFrame
     """
+    return _apply_filters(
+        df,
+        df_filter.valid_rows_filter,
+        df_filter.valid_columns_filter,
+        df_filter.valid_columns_aggregation,
+    )
+
+
+def get_aggregation_values(
+    df: pd.DataFrame,
+    df_filter: DataFrameFilterValidator,
+) -> Optional[pd.Series]:
+    """Get the values to aggregate from a filtered dataframe.
+
+    :param df: filtered dataframe
+    :type df: pd.DataFrame
+    :param df_filter: dataframe filter
+    :type df_filter: DataFrameFilterValidator
+    :raises UnprocessableContentException: if there are issue with
+        filter
+    :return: the values, None if the dataframe has not the aggregated
+        column
+    :rtype: Optional[pd.Series]
+    """
+    columns_aggregation = df_filter.valid_columns_aggregation
+    if columns_aggregation.column not in df.columns:
+        return None
+
+    try:
+        return PandasDFQueryBase(df).get_values(columns_aggregation.column, columns_aggregation.field)
+    except Exception as exc:  # noqa: B902
+        exc_type = type(exc)
+        error_msg = f"Processing filter exception ({exc_type}): {exc}"
+        logger.debug(error_msg)
+        raise UnprocessableContentException(detail=error_msg)
+
+
+def _get_projected_columns(
+    columns_filter: Optional[ColumnsFilter],
+    columns_aggregation: Optional[ColumnsAggregation],
+) -> Optional[List[str]]:
+    if columns_filter:
+        return columns_filter.colums
+    if columns_aggregation:
+        return [columns_aggregation.column]
+    return None
+
+
+def _apply_filters(
+    df: pd.DataFrame,
+    rows_filter: Optional[RowsFilter] = None,
+    columns_filter: Optional[ColumnsFilter] = None,
+    columns_aggregation: Optional[ColumnsAggregation] = None,
+) -> pd.DataFrame:
     query_df = PandasDFQueryBase(df)
     try:
-        if df_filter.valid_rows_filter:
+        if rows_filter:
             query_df = query_df.select(
-                df_filter.valid_rows_filter.column,
-                df_filter.valid_rows_filter.operator,
-                df_filter.valid_rows_filter.comp_value,
-                field=df_filter.valid_rows_filter.field,
+                rows_filter.column,
+                rows_filter.operator,
+                rows_filter.comp_value,
+                field=rows_filter.field,
             )
-        if df_filter.valid_columns_filter:
-            query_df = query_df.project(df_filter.valid_columns_filter.colums)
-        if df_filter.valid_columns_aggregation:
+        if columns_filter:
+            query_df = query_df.project(columns_filter.colums)
+        if columns_aggregation:
             query_df = query_df.aggregate(
-                df_filter.valid_columns_aggregation.column,
-                df_filter.valid_columns_aggregation.function,
-                field=df_filter.valid_columns_aggregation.field,
+                columns_aggregation.column,
+                columns_aggregation.function,
+                field=columns_aggregation.field,
             )
     except Exception as exc:  # noqa: B902
         exc_type = type(exc)
@@ -13,20 +13,28 @@
 #  limitations under the License.
 
 import asyncio
+from functools import partial
 from typing import List, NamedTuple, Optional, Tuple
 
 import httpx
 import pandas as pd
 import pyarrow as pa
-from fastapi_cache.coder import PickleCoder
 from fastapi_cache.decorator import cache
 from loguru import logger
 from pyarrow import parquet as pq
+from starlette import status
 
+from app.api.routes.utils.records import get_id_version
+from app.core.helpers.cache.coder import DataFramesCoder
+from app.core.helpers.cache.content_cache import get_content
 from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
 from app.dataframe.filter_processor import FilterProcessor
+from app.exceptions.exceptions import UnprocessableContentException
+from app.services.asyncify import run_in_threadpool
+from app.services.dataset import DatasetService
+from app.services.osdu_clients.http_client import get_http_client
 
-RETRIES = 3
+REJECTED_URL_STATUS_CODES = (status.HTTP_403_FORBIDDEN, status.HTTP_404_NOT_FOUND)
 
 
 class DFPayload(NamedTuple):
@@ -35,9 +43,38 @@ class DFPayload(NamedTuple):
     error_msg: Optional[str]
 
 
+class DFPayloadCoder(DataFramesCoder):
+    @classmethod
+    def make_payload(cls, content_id: str, df: pd.DataFrame, error_msg: Optional[str]) -> DFPayload:
+        return DFPayload(content_id, df, error_msg)
+
+
+def read_parquet(parquet_bytes: bytes, df_filter_processor: Optional[FilterProcessor] = None) -> pd.DataFrame:
+    """Decode parquet content applying filters except aggregation.
+
+    :param parquet_bytes: parquet content
+    :type parquet_bytes: bytes
+    :param df_filter_processor: filter processor, defaults to None
+    :type df_filter_processor: Optional[FilterProcessor]
+    :return: dataframe
+    :rtype: pd.DataFrame
+    """
+    if df_filter_processor:
+        return df_filter_processor.get_filters_without_aggregation().apply_filters_from_bytes(parquet_bytes)
+    return pq.read_table(pa.BufferReader(parquet_bytes)).to_pandas()
+
+
 class ParquetLoader:
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=PickleCoder)
+    def __init__(self, dataset_service: DatasetService) -> None:
+        """Init.
+
+        :param dataset_service: dataset service of the signed urls
+        :type dataset_service: DatasetService
+        """
+        self._dataset_service = dataset_service
+
+    @cache(expire=CACHE_DEFAULT_TTL, coder=DFPayloadCoder)
     async def read_parquet_files(
         self,
         signed_urls: List[Tuple[str, str]],
@@ -53,13 +90,12 @@ class ParquetLoader:
         :return: pairs of dataset_id, pd.DataFrame
         :rtype: List[DFPayload]
         """
-        transport = httpx.AsyncHTTPTransport(retries=RETRIES)
-        async with httpx.AsyncClient(transport=transport) as client:
-            tasks = [
-                self._read_parquet_from_url(dataset_id, url, df_filter_processor, client)
-                for (dataset_id, url) in signed_urls
-            ]
-            return await asyncio.gather(*tasks)
+        client = get_http_client()
+        tasks = [
+            self._read_parquet_from_url(dataset_id, url, df_filter_processor, client)
+            for (dataset_id, url) in signed_urls
+        ]
+        return await asyncio.gather(*tasks)
 
     async def _read_parquet_from_url(  # noqa: WPS234
         self,
@@ -70,16 +106,17 @@ class ParquetLoader:
     ) -> DFPayload:
         """Read parquet file from url and apply df_filter."""
         try:
-            async with client.stream("GET", url) as response:
-                response.raise_for_status()
-                read_content = await response.aread()
-                if df_filter_processor:
-                    df_filter_processor = df_filter_processor.get_filters_without_aggregation()
-                    df = df_filter_processor.apply_filters_from_bytes(read_content)
-                else:
-                    df = pq.read_table(pa.BufferReader(read_content)).to_pandas()
-                error_msg = None
+            read_content = await get_content(
+                self._dataset_service.data_partition_id,
+                _get_versioned_id(dataset_id),
+                partial(_download, client, url),
+            )
+            df = await run_in_threadpool(read_parquet, read_content, df_filter_processor)
+            error_msg = None
         except httpx.HTTPStatusError as http_exc:
+            if http_exc.response.status_code in REJECTED_URL_STATUS_CODES:
+                # the signed url may have been revoked, a kept one is not reused
+                self._dataset_service.discard_signed_url(dataset_id)
             error_msg = f"HTTP status error {http_exc.response.status_code} for URL: {url}"  # noqa: WPS237
             logger.error(error_msg)
             df = pd.DataFrame()
@@ -105,3 +142,18 @@ class ParquetLoader:
             df = pd.DataFrame()
 
         return DFPayload(dataset_id, df, error_msg)
+
+
+async def _download(client: httpx.AsyncClient, url: str) -> bytes:
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        return await response.aread()
+
+
+def _get_versioned_id(dataset_id: str) -> Optional[str]:
+    # only versioned datasets never change
+    try:
+        _, dataset_version = get_id_version(dataset_id)
+    except UnprocessableContentException:
+        return None
+    return dataset_id if dataset_version else None
@@ -0,0 +1,119 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from app.exceptions.exceptions import UnprocessableContentException
+
+DESCRIBE = "describe"
+MEAN = "mean"
+
+# partial aggregates kept for each aggregation function
+PARTIAL_FUNCTIONS = {
+    "count": ("count",),
+    "max": ("max",),
+    "min": ("min",),
+    "sum": ("sum",),
+    MEAN: ("sum", "count"),
+}
+MERGE_FUNCTIONS = {"count": "sum", "max": "max", "min": "min", "sum": "sum"}
+
+
+class PartialAggregation:
+    """Aggregation of a column merged dataframe by dataframe.
+
+    Only the partial aggregates are kept, except for describe which keeps
+    the column values to compute exact quantiles.
+    """
+
+    def __init__(self, agg_func: str) -> None:
+        """Init.
+
+        :param agg_func: the aggregation function name
+        :type agg_func: str
+        """
+        self._agg_func = agg_func
+        self._name = None
+        self._partials: Dict[str, Any] = {}
+        self._columns: List[pd.Series] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return self._name is None
+
+    def update(self, column: pd.Series) -> None:
+        """Merge the values of the aggregated column.
+
+        :param column: aggregated column
+        :type column: pd.Series
+        :raises UnprocessableContentException: if the values can't be
+            aggregated
+        """
+        self._name = column.name
+        if self._agg_func == DESCRIBE:
+            self._columns.append(column)
+            return
+
+        try:
+            for partial_func in PARTIAL_FUNCTIONS[self._agg_func]:
+                self._partials[partial_func] = self._merge_partial(partial_func, column.agg(partial_func))
+        except Exception as exc:  # noqa: B902
+            raise _get_aggregation_exception(exc)
+
+    def get_result(self) -> pd.DataFrame:
+        """Get the aggregation of all the merged values.
+
+        :raises UnprocessableContentException: if the values can't be
+            aggregated
+        :return: the aggregation, as aggregated from all the values
+        :rtype: pd.DataFrame
+        """
+        if self.is_empty:
+            return pd.DataFrame()
+
+        try:
+            if self._agg_func == DESCRIBE:
+                agg = pd.concat(self._columns, ignore_index=True).agg([DESCRIBE])
+            else:
+                agg = pd.Series([self._get_value()], index=[self._agg_func], name=self._name)
+        except Exception as exc:  # noqa: B902
+            raise _get_aggregation_exception(exc)
+
+        if isinstance(agg, pd.Series):
+            agg = agg.to_frame()
+        return agg
+
+    def _merge_partial(self, partial_func: str, partial: Any) -> Any:
+        merged_partial = self._partials.get(partial_func)
+        if merged_partial is None:
+            return partial
+        partials = pd.Series([merged_partial, partial])
+        return partials.dropna().agg(MERGE_FUNCTIONS[partial_func])
+
+    def _get_value(self) -> Any:
+        if self._agg_func == MEAN:
+            count = self._partials["count"]
+            return self._partials["sum"] / count if count else np.nan
+        return self._partials[self._agg_func]
+
+
+def _get_aggregation_exception(exc: Exception) -> UnprocessableContentException:
+    exc_type = type(exc)
+    error_msg = f"Processing filter exception ({exc_type}): {exc}"
+    logger.debug(error_msg)
+    return UnprocessableContentException(detail=error_msg)
@@ -13,9 +13,12 @@
 #  limitations under the License.
 
 import operator
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import compute as pc
 
 OPERATOR_TYPES = {
     "=": operator.eq,
@@ -25,6 +28,96 @@ OPERATOR_TYPES = {
     "<": operator.lt,
     ">": operator.gt,
 }
+NESTED_VALUE_TYPES = (
+    pa.types.is_integer,
+    pa.types.is_floating,
+    pa.types.is_boolean,
+    pa.types.is_string,
+    pa.types.is_large_string,
+)
+
+
+def get_struct_array(df_col: pd.Series) -> Optional[pa.Array]:
+    """Convert a column of objects to an Arrow struct array.
+
+    :param df_col: column of objects
+    :type df_col: pd.Series
+    :return: struct array, None if the column is heterogeneous
+    :rtype: Optional[pa.Array]
+    """
+    try:
+        return pa.array(df_col, from_pandas=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+def get_nested_values(struct_array: Optional[pa.Array], prop_path: List[str]) -> Optional[pa.Array]:
+    """Extract a nested field of a struct array as a typed array.
+
+    The values are null where an object along the path or the field is
+    missing.
+
+    :param struct_array: struct array of a column of objects
+    :type struct_array: Optional[pa.Array]
+    :param prop_path: path to the nested field
+    :type prop_path: List[str]
+    :return: nested field values, None if not applicable
+    :rtype: Optional[pa.Array]
+    """
+    nested_values = struct_array
+    for prop in prop_path:
+        nested_values = _get_struct_field(nested_values, prop)
+
+    if nested_values is None or not any(is_type(nested_values.type) for is_type in NESTED_VALUE_TYPES):
+        return None
+    return nested_values
+
+
+def get_nested_mask(
+    df_col: pd.Series,
+    nested_values: Optional[pa.Array],
+    oper: Callable[[Any, Any], bool],
+    comp_val: Any,
+    get_row_value: Callable[[Any], Any],
+) -> pd.Series:
+    """Get the boolean mask of rows whose nested field matches a condition.
+
+    The nested values are compared vectorized. Rows where the value is
+    null, and all the rows when nested_values is None, are compared row
+    by row, as that evaluation must decide the outcome (or error) then.
+
+    :param df_col: column of objects
+    :type df_col: pd.Series
+    :param nested_values: nested field values of the column
+    :type nested_values: Optional[pa.Array]
+    :param oper: the operator
+    :type oper: Callable[[Any, Any], bool]
+    :param comp_val: the comparison value
+    :type comp_val: Any
+    :param get_row_value: gets the nested field of a row
+    :type get_row_value: Callable[[Any], Any]
+    :return: boolean mask aligned with the column
+    :rtype: pd.Series
+    """
+    if nested_values is None:
+        return df_col.apply(lambda row: oper(get_row_value(row), comp_val))
+
+    is_valid = nested_values.is_valid().to_numpy(zero_copy_only=False)
+    valid_values = pd.Series(nested_values.drop_null().to_numpy(zero_copy_only=False))
+    rows_mask = np.empty(len(df_col), dtype=bool)
+    rows_mask[is_valid] = oper(valid_values, comp_val).to_numpy(dtype=bool)
+    if not is_valid.all():
+        null_rows = df_col.iloc[~is_valid]
+        rows_mask[~is_valid] = null_rows.apply(lambda row: oper(get_row_value(row), comp_val)).to_numpy(dtype=bool)
+    return pd.Series(rows_mask, index=df_col.index)
+
+
+def _get_struct_field(nested_values: Optional[pa.Array], prop: str) -> Optional[pa.Array]:
+    # None unless the values are objects with the field, null where the object is missing
+    if nested_values is None or not pa.types.is_struct(nested_values.type):
+        return None
+    field_index = nested_values.type.get_field_index(prop)
+    return pc.struct_field(nested_values, [field_index]) if field_index >= 0 else None
 
 
 class PandasDFQueryBase:
@@ -36,6 +129,8 @@ class PandasDFQueryBase:
         :param pd.DataFrame df: the DataFrame to query
         """
         self._df = df
+        # object columns converted to Arrow, shared by the predicates on the same frame
+        self._struct_arrays: Dict[str, Optional[pa.Array]] = {}
 
     @property
     def df(self) -> pd.DataFrame:
@@ -77,11 +172,44 @@ class PandasDFQueryBase:
         df_col = self.df[column]
 
         if oper:
-            cond = df_col.apply(lambda row: oper(row[field], comp_val)) if field else oper(df_col, comp_val)
+            if field:
+                nested_values = self.get_nested_values(column, [field])
+                cond = get_nested_mask(df_col, nested_values, oper, comp_val, lambda row: row[field])
+            else:
+                cond = oper(df_col, comp_val)
             df_query = PandasDFQueryBase(self.df[cond])
 
         return df_query
 
+    def get_nested_values(self, column: str, prop_path: List[str]) -> Optional[pa.Array]:
+        """Get a nested field of an object column as a typed array.
+
+        :param column: the column name
+        :type column: str
+        :param prop_path: path to the nested field
+        :type prop_path: List[str]
+        :return: nested field values, None if not applicable
+        :rtype: Optional[pa.Array]
+        """
+        if column not in self._struct_arrays:
+            self._struct_arrays[column] = get_struct_array(self.df[column])
+        return get_nested_values(self._struct_arrays[column], prop_path)
+
+    def get_values(self, column: str, field: Optional[str] = None) -> pd.Series:
+        """Get the values of a column or column field.
+
+        :param column: the column name
+        :type column: str
+        :param field: an optional field of the column, defaults to None
+        :type field: Optional[str], optional
+        :return: the values
+        :rtype: pd.Series
+        """
+        df_col = self.df[column]
+        if field:
+            return df_col.apply(lambda row: row[field])
+        return df_col
+
     def aggregate(self, column: str, agg_func: str, field: Optional[str] = None) -> "PandasDFQueryBase":
         """Aggregate DataFrame column based on an operator function.
 
@@ -94,12 +222,7 @@ class PandasDFQueryBase:
         :return: an updated PandasDFQueryBase object
         :rtype: PandasDFQueryBase
         """
-        df_col = self.df[column]
-
-        if field:
-            agg = df_col.apply(lambda row: row[field]).agg([agg_func])
-        else:
-            agg = df_col.agg([agg_func])
+        agg = self.get_values(column, field).agg([agg_func])
 
         if isinstance(agg, pd.Series):
             agg = agg.to_frame()
@@ -15,9 +15,11 @@ from fastapi import Depends
 from loguru import logger
 
 from app.api.dependencies.request import require_data_partition_id
-from app.api.dependencies.services import get_async_search_service
+from app.api.dependencies.services import (
+    get_async_entitlements_service,
+    get_async_search_service,
+)
 from app.core.config import get_app_settings
-from app.dev.api.dependencies.services import get_async_entitlements_service
 from app.dev.core.helpers.redis_index import (
     SAMPLESANALYSIS_IX,
     get_redis_client,
@@ -26,12 +28,11 @@ from app.dev.core.helpers.redis_index import (
 from app.dev.search.redis_analysis_type_ids_fetcher import (
     RedisSamplesAnalysisTypeIdsFetcher,
 )
-from app.dev.services import entitlements
 from app.search.analysis_type_ids_fetcher import (
     SamplesAnalysisTypeIdsFetcher,
     SearchServiceSamplesAnalysisTypeIdsFetcher,
 )
-from app.services import search
+from app.services import entitlements, search
 
 
 async def get_analysis_type_ids_fetcher(
@@ -28,6 +28,7 @@ from app.dev.core.helpers.redis_index import build_samplesanalysis_schema
 from app.dev.resources.multiple_nested_filters import (
     DFMultipleNestedFilterValidator,
     FilterExamples,
+    get_filter_plan,
 )
 from app.dev.services import partition
 from app.resources.errors import FilterValidationError
@@ -80,20 +81,14 @@ async def validate_multiple_nested_filters(
     :return: _description_
     :rtype: DFMultipleNestedFilterValidator
     """
-    df_filter = DFMultipleNestedFilterValidator(
-        schema=model.schema(),
-        raw_columns_filter=columns_filter,
-        raw_rows_filter=rows_filter,
-        raw_columns_aggregation=columns_aggregation,
-        raw_rows_multiple_filter=rows_multiple_filter,
-    )
     try:
-        any([
-            df_filter.valid_columns_aggregation,
-            df_filter.valid_columns_filter,
-            df_filter.valid_rows_filter,
-            df_filter.valid_rows_multiple_filter,
-        ])
+        df_filter = get_filter_plan(
+            model,
+            raw_columns_filter=columns_filter,
+            raw_rows_filter=rows_filter,
+            raw_columns_aggregation=columns_aggregation,
+            raw_rows_multiple_filter=rows_multiple_filter,
+        )
     except FilterValidationError as exc:
         logger.error(f"Query parameters are invalid: {exc}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
@@ -12,16 +12,23 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import partial
+
 from fastapi import Request
 from fastapi.responses import JSONResponse, Response
 from loguru import logger
 from starlette import status
 
-from app.api.routes.utils.ddms_datasets import check_object_name_schema_version
+from app.api.routes.utils.ddms_datasets import (
+    check_object_name_schema_version,
+    download_blob_data,
+)
 from app.api.routes.utils.records import (
     find_object_name_from_type,
     get_id_version,
 )
+from app.core.config import get_app_settings
+from app.core.helpers.cache.content_cache import get_content
 from app.dev.dataframe.multiple_nested_filter_processor import (
     DFMultipleNestedFilterProcessor,
 )
@@ -31,6 +38,11 @@ from app.dev.resources.multiple_nested_filters import (
 from app.exceptions import exceptions
 from app.providers.dependencies.blob_storage import BlobMetadata, IBlobStorage
 from app.resources.mime_types import SupportedMimeTypes
+from app.services.asyncify import (
+    run_in_processpool,
+    run_in_threadpool,
+    run_until_disconnected,
+)
 from app.services.storage import StorageService
 
 
@@ -69,10 +81,11 @@ async def get_parquet_data(
         blob_metadata.uuid = object_name.split("/")[-1]
         logger.debug(f"Retrieving dataset: {object_name}")
         check_object_name_schema_version(blob_metadata.version, ddms_datasets, blob_metadata.object_name)
-        blob = await blob_storage_service.get_blob(blob_metadata)
-        parquet_bytes = blob.blob_data
-        blob_info = blob.blob_metadata.metadata
-        logger.info(f"Downloaded {blob_info}")
+        parquet_bytes = await get_content(
+            storage_service.data_partition_id,
+            blob_metadata.object_name,
+            partial(download_blob_data, blob_storage_service, blob_metadata),
+        )
 
         if not parquet_bytes:
             reason = f"{object_name} exist in record but without content."
@@ -82,15 +95,22 @@ async def get_parquet_data(
             )
 
         filter_processor = DFMultipleNestedFilterProcessor(df_filter)
-        df = filter_processor.apply_filters_from_bytes(parquet_bytes)
+        df = await run_until_disconnected(
+            request,
+            run_in_processpool(filter_processor.apply_filters_from_bytes, parquet_bytes),
+            get_app_settings().disconnect_poll_interval,
+        )
         logger.debug(f"Dataset info: {df.size} elements; {df.columns}")
 
         if mime_type == SupportedMimeTypes.PARQUET:
             df.astype(str)
-            response = Response(content=df.to_parquet(), media_type=SupportedMimeTypes.PARQUET.mime_type)
+            response = Response(
+                content=await run_in_threadpool(df.to_parquet),
+                media_type=SupportedMimeTypes.PARQUET.mime_type,
+            )
         else:
             response = Response(
-                content=df.to_json(orient="split"),
+                content=await run_in_threadpool(df.to_json, orient="split"),
                 media_type=SupportedMimeTypes.JSON.mime_type,
             )
         del df
@@ -16,7 +16,6 @@ import uuid
 
 from fastapi import APIRouter, Depends, Path, Request, Response
 from fastapi.responses import JSONResponse
-from fastapi_cache.decorator import cache
 from loguru import logger
 from pydantic import BaseModel
 from starlette import status
@@ -41,8 +40,8 @@ from app.api.routes.utils.records import (
 )
 from app.core.config import get_app_settings
 from app.core.helpers.cache.coder import ResponseCoder
-from app.core.helpers.cache.key_builder import key_builder_using_token
 from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+from app.core.helpers.cache.shared_cache import shared_cache
 from app.core.settings.app import AppSettings
 from app.dev.api.dependencies.validation import (
     validate_multiple_nested_filters,
@@ -63,6 +62,11 @@ from app.providers.dependencies.blob_storage import (
 )
 from app.resources.mime_types import SupportedMimeTypes
 from app.services import dataset, storage
+from app.services.asyncify import (
+    run_in_processpool,
+    run_in_threadpool,
+    run_until_disconnected,
+)
 
 
 class BaseDataViewDev(BaseDataView):
@@ -95,7 +99,7 @@ class BaseDataViewDev(BaseDataView):
         if kwargs:
             self.__dict__.update(kwargs)
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder, key_builder=key_builder_using_token)
+    @shared_cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder)
     async def get_data_dev(
         self,
         request: Request,
@@ -280,9 +284,10 @@ class BaseDataViewDev(BaseDataView):
         dataset_id = find_dataset_id_from_type(ddms_datasets, analysis_type, content_schema_version)
 
         if dataset_id:
-            dataset_id, _ = get_id_version(dataset_id)
+            full_dataset_id = dataset_id
+            dataset_id, _ = get_id_version(full_dataset_id)
             logger.debug(f"Retrieving dataset: {dataset_id}")
-            parquet_bytes = await dataset_service.download_file(dataset_id)
+            parquet_bytes = await dataset_service.download_file(full_dataset_id)
 
             if not parquet_bytes:
                 reason = f"{dataset_id} exist in record but without content."
@@ -292,15 +297,22 @@ class BaseDataViewDev(BaseDataView):
                 )
 
             filter_processor = DFMultipleNestedFilterProcessor(df_filter)
-            df = filter_processor.apply_filters_from_bytes(parquet_bytes)
+            df = await run_until_disconnected(
+                request,
+                run_in_processpool(filter_processor.apply_filters_from_bytes, parquet_bytes),
+                get_app_settings().disconnect_poll_interval,
+            )
             logger.debug(f"Dataset info: {df.size} elements; {df.columns}")
 
             if mime_type == SupportedMimeTypes.PARQUET:
                 df.astype(str)
-                response = Response(content=df.to_parquet(), media_type=SupportedMimeTypes.PARQUET.mime_type)
+                response = Response(
+                    content=await run_in_threadpool(df.to_parquet),
+                    media_type=SupportedMimeTypes.PARQUET.mime_type,
+                )
             else:
                 response = Response(
-                    content=df.to_json(orient="split"),
+                    content=await run_in_threadpool(df.to_json, orient="split"),
                     media_type=SupportedMimeTypes.JSON.mime_type,
                 )
         else:
@@ -116,11 +116,11 @@ class RedisIndexView:
         record_to_index: dict,
         partition: str,
     ) -> None:
-        samples_response = await storage_service.query_records(sample_ids)
+        sample_records = await storage_service.get_records_batch(sample_ids, skip_missing=True)
 
         sample_type_ids, basin_ids, field_ids, wellbore_ids = [], [], [], []
 
-        for sample_record in samples_response["records"]:
+        for sample_record in sample_records:
             sample_record_data = sample_record.get("data", {})
 
             if sample_record_data.get("SampleTypeID"):
@@ -164,9 +164,9 @@ class RedisIndexView:
         record_to_index: dict,
     ) -> None:
         if query_ids:
-            records_response = await storage_service.query_records(query_ids)
+            records = await storage_service.get_records_batch(query_ids, skip_missing=True)
             alias_names = [
-                alias_name.get("AliasName") for record in records_response.get("records", [])
+                alias_name.get("AliasName") for record in records
                 for alias_name in record.get("data", {}).get("NameAliases", [])  # noqa: WPS361
                 if alias_name.get("AliasName")
             ]
@@ -176,17 +176,7 @@ class RedisIndexView:
         self,
         search_service: search.SearchService,
     ):
-        cursor = None
-        while True:
-            search_response = await search_service.find_records(
-                kind=SAMPLESANALYSIS_KIND,
-                limit=search.QUERY_LIMIT,
-                cursor=cursor,
-            )
-            records = search_response.get("results", [])
-            cursor = search_response.get("cursor", None)
-            if not records:
-                break
+        async for records in search.iter_search_pages(search_service, kind=SAMPLESANALYSIS_KIND):
             yield records
 
     def _prepare_api_routes(self) -> None:
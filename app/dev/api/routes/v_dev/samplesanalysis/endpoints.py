@@ -13,12 +13,12 @@
 #  limitations under the License.
 
 import json
+from contextlib import aclosing
 from typing import AsyncGenerator, List, Optional, Tuple
 
 import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
-from fastapi_cache.decorator import cache
 from loguru import logger
 from starlette import status
 
@@ -31,16 +31,18 @@ from app.api.dependencies.services import (
     get_blob_storage_service,
 )
 from app.api.dependencies.validation import (
+    SearchDataPagination,
     get_search_data_pagination_parameters,
     get_search_pagination_parameters,
 )
 from app.api.routes.utils.api_description_helper import APIDescriptionHelper
 from app.core.config import get_app_settings
-from app.core.helpers.cache.coder import ResponseCoder
-from app.core.helpers.cache.key_builder import key_builder_using_token
-from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+from app.core.helpers.cache import coder
+from app.core.helpers.cache import settings as cache_settings
+from app.core.helpers.cache import shared_cache
 from app.dataframe.blob_parquet_loader import BlobParquetLoader
 from app.dataframe.parquet_loader import DFPayload, ParquetLoader
+from app.dataframe.partial_aggregation import PartialAggregation
 from app.dev.api.dependencies.search import (
     SamplesAnalysisTypeIdsFetcher,
     get_analysis_type_ids_fetcher,
@@ -55,9 +57,11 @@ from app.dev.dataframe.multiple_nested_filter_processor import (
 from app.dev.resources.multiple_nested_filters import (
     DFMultipleNestedFilterValidator,
 )
+from app.exceptions.exceptions import UnprocessableContentException
 from app.providers.dependencies.blob_storage import IBlobStorage
 from app.resources.mime_types import SupportedMimeTypes
 from app.services import dataset
+from app.services.asyncify import run_in_threadpool
 
 SEARCH_READ_BATCH_SIZE = 100  # max number of parquet files retrieved
 
@@ -77,7 +81,9 @@ class SamplesAnalysisSearchDataView:
             The  `columns_filter`, `rows_filter`, and  `columns_aggregation` \
                 query parameters can be used to manage data in response. <br><br>\
             Use `offset`, `page_limit` query parameters to control response data size. \
-                The `page_limit` and `total_size (found in response)` refers to the number of parquet files read.",
+                The `page_limit` and `total_size (found in response)` refers to the number of parquet files read. \
+                All the data is read to get the exact `total_size`, use `count_total=false` to stop reading \
+                once the page is full, `total_size` is then `null` if more results may follow.",
         )
         self.description_template_search = APIDescriptionHelper.append_joined_roles(
             "Get the (`samples analysis`) ids list that comply with `{query}` for given`{analysis_type}`. <br><br>\
@@ -93,7 +99,12 @@ class SamplesAnalysisSearchDataView:
         if kwargs:
             self.__dict__.update(kwargs)
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder, key_builder=key_builder_using_token)
+    @shared_cache.shared_cache(
+        expire=cache_settings.CACHE_DEFAULT_TTL,
+        coder=coder.ResponseCoder,
+        scope=shared_cache.SharedCacheScope.GROUPS,
+        stale_ttl=cache_settings.CACHE_SEARCH_STALE_TTL,
+    )
     async def get_search_data(
         self,
         request: Request,
@@ -102,7 +113,7 @@ class SamplesAnalysisSearchDataView:
         blob_storage_service: IBlobStorage = Depends(get_blob_storage_service),
         df_filter: DFMultipleNestedFilterValidator = Depends(validate_multiple_nested_filters),
         content_schema_version: str = Depends(get_content_schema_version),
-        pagination_parameters: Tuple[int, int] = Depends(get_search_data_pagination_parameters),
+        pagination_parameters: SearchDataPagination = Depends(get_search_data_pagination_parameters),
         wks_parameters: Optional[dict] = Depends(get_search_wks_parameters),
         analysis_type_ids_fetcher: SamplesAnalysisTypeIdsFetcher = Depends(get_analysis_type_ids_fetcher),
     ) -> Response:
@@ -124,9 +135,10 @@ class SamplesAnalysisSearchDataView:
         :param content_schema_version: content schema version, defaults
             to Depends(get_content_schema_version)
         :type content_schema_version: str, optional
-        :param pagination_parameters: pagination parameters, defaults to
-            Depends(get_pagination_parameters)
-        :type pagination_parameters: Tuple[int, int], optional
+        :param pagination_parameters: offset, page limit and whether to
+            count the total size, defaults to
+            Depends(get_search_data_pagination_parameters)
+        :type pagination_parameters: SearchDataPagination, optional
         :param wks_parameters: wks search parameters, defaults to
             Depends(get_search_wks_parameters)
         :type wks_parameters: Optiona[dict], optional
@@ -136,7 +148,7 @@ class SamplesAnalysisSearchDataView:
         """
         data_partition_id = request.headers.get("data-partition-id")
         mime_type = SupportedMimeTypes.find_by_mime_type(request.headers["content-type"])
-        offset, page_limit = pagination_parameters
+        offset, page_limit, count_total = pagination_parameters
 
         analysis_type_ids = await analysis_type_ids_fetcher.get_ids(
             data_partition_id, analysis_type, content_schema_version, wks_parameters,
@@ -145,6 +157,7 @@ class SamplesAnalysisSearchDataView:
 
         if self._is_non_empty_filter(df_filter):
             df_triplets_gen = await self._get_search_data(
+                data_partition_id=data_partition_id,
                 analysis_type_ids=analysis_type_ids,
                 dataset_service=dataset_service,
                 blob_storage_service=blob_storage_service,
@@ -152,10 +165,11 @@ class SamplesAnalysisSearchDataView:
             )
 
             result_df, total_size = await self._build_result_df(
-                df_triplets_gen, df_filter, offset, page_limit, analysis_type_ids,
+                df_triplets_gen, df_filter, offset, page_limit, analysis_type_ids, count_total,
             )
         else:
             df_triplets_gen = await self._get_search_data(
+                data_partition_id=data_partition_id,
                 analysis_type_ids=analysis_type_ids[offset:offset + page_limit],
                 dataset_service=dataset_service,
                 blob_storage_service=blob_storage_service,
@@ -187,7 +201,12 @@ class SamplesAnalysisSearchDataView:
 
         return response
 
-    @cache(expire=CACHE_DEFAULT_TTL, coder=ResponseCoder, key_builder=key_builder_using_token)
+    @shared_cache.shared_cache(
+        expire=cache_settings.CACHE_DEFAULT_TTL,
+        coder=coder.ResponseCoder,
+        scope=shared_cache.SharedCacheScope.GROUPS,
+        stale_ttl=cache_settings.CACHE_SEARCH_STALE_TTL,
+    )
     async def get_search(  # noqa: CCR001
         self,
         request: Request,
@@ -237,6 +256,7 @@ class SamplesAnalysisSearchDataView:
 
         if self._is_non_empty_filter(df_filter):
             df_triplets_gen = await self._get_search_data(
+                data_partition_id=data_partition_id,
                 analysis_type_ids=analysis_type_ids,
                 dataset_service=dataset_service,
                 blob_storage_service=blob_storage_service,
@@ -268,6 +288,7 @@ class SamplesAnalysisSearchDataView:
 
     async def _get_search_data(  # noqa: WPS234
         self,
+        data_partition_id: str,
         analysis_type_ids: List[Tuple[str, str]],
         dataset_service: dataset.DatasetService,
         blob_storage_service: IBlobStorage,
@@ -278,6 +299,7 @@ class SamplesAnalysisSearchDataView:
         settings = get_app_settings()
         if settings.use_blob_storage:
             df_payload_gen = self._get_search_data_for_blobs(
+                data_partition_id=data_partition_id,
                 analysis_type_ids=analysis_type_ids,
                 blob_storage_service=blob_storage_service,
                 df_filter=df_filter,
@@ -292,6 +314,7 @@ class SamplesAnalysisSearchDataView:
 
     async def _get_search_data_for_blobs(  # noqa: WPS234
         self,
+        data_partition_id: str,
         analysis_type_ids: List[Tuple[str, str]],
         blob_storage_service: IBlobStorage,
         df_filter: DFMultipleNestedFilterValidator,
@@ -300,7 +323,7 @@ class SamplesAnalysisSearchDataView:
         service."""
         blob_ids = [result_id[0] for result_id in analysis_type_ids]
         df_filter_processor = DFMultipleNestedFilterProcessor(df_filter=df_filter)
-        parquet_loader = BlobParquetLoader()
+        parquet_loader = BlobParquetLoader(data_partition_id)
 
         for n_batch in range((len(blob_ids) // self._batch_size) + 1):
             batch_offset = self._batch_size * n_batch
@@ -322,7 +345,7 @@ class SamplesAnalysisSearchDataView:
         service."""
         dataset_ids = [result_id[0] for result_id in analysis_type_ids]
         df_filter_processor = DFMultipleNestedFilterProcessor(df_filter=df_filter)
-        parquet_loader = ParquetLoader()
+        parquet_loader = ParquetLoader(dataset_service)
 
         for n_batch in range((len(dataset_ids) // self._batch_size) + 1):
             batch_offset = self._batch_size * n_batch
@@ -339,21 +362,56 @@ class SamplesAnalysisSearchDataView:
         offset: int,
         page_limit: Optional[int] = None,
         select_all: Optional[bool] = False,
-    ) -> Tuple[List[pd.DataFrame], int, List[Tuple[str, str]]]:
-        """Paginate the list of pd.DataFrame."""
+        count_total: Optional[bool] = True,
+    ) -> Tuple[List[pd.DataFrame], Optional[int], List[Tuple[str, str]]]:
+        """Paginate the list of pd.DataFrame.
+
+        Unless select_all or count_total, reading stops after the first
+        result past the page and the total size is None.
+        """
         paged_dfs = []
         errors = []
         df_i = 0
-        async for dataset_id, df, error_msg in df_triplets:
-            if error_msg:
-                logger.error(error_msg)
-                errors.append((dataset_id, error_msg))
-            elif select_all or (df_i >= offset and df_i < offset + page_limit):  # noqa: WPS333
-                paged_dfs.append(df)
-            df_i += 1
+        async with aclosing(df_triplets):
+            async for dataset_id, df, error_msg in df_triplets:
+                if not (select_all or count_total) and df_i >= offset + page_limit:
+                    return paged_dfs, None, errors
+                if error_msg:
+                    logger.error(error_msg)
+                    errors.append((dataset_id, error_msg))
+                elif select_all or (df_i >= offset and df_i < offset + page_limit):  # noqa: WPS333
+                    paged_dfs.append(df)
+                df_i += 1
 
         return paged_dfs, df_i, errors
 
+    async def _aggregate_dfs(  # noqa: WPS234
+        self,
+        df_triplets: AsyncGenerator[DFPayload, None],
+        df_filter_processor: DFMultipleNestedFilterProcessor,
+    ) -> Tuple[pd.DataFrame, int, List[Tuple[str, str]]]:
+        """Aggregate the pd.DataFrames as they are read, without keeping
+        them."""
+        partial_aggregation = PartialAggregation(df_filter_processor.df_filter.valid_columns_aggregation.function)
+        errors = []
+        df_i = 0
+        async with aclosing(df_triplets):
+            async for dataset_id, df, error_msg in df_triplets:
+                if error_msg:
+                    logger.error(error_msg)
+                    errors.append((dataset_id, error_msg))
+                else:
+                    await _update_aggregation(partial_aggregation, df_filter_processor, df)
+                df_i += 1
+
+        if df_i and not errors and partial_aggregation.is_empty:
+            # the aggregated column is missing from all the dataframes, e.g. excluded by the columns filter
+            column = df_filter_processor.df_filter.valid_columns_aggregation.column
+            raise UnprocessableContentException(
+                detail=f"Processing filter exception: column '{column}' to aggregate is not in the filtered data.",
+            )
+        return partial_aggregation.get_result(), df_i, errors
+
     async def _build_result_df(
         self,
         df_triplets: AsyncGenerator[DFPayload, None],
@@ -361,19 +419,19 @@ class SamplesAnalysisSearchDataView:
         offset: int,
         page_limit: int,
         analysis_type_ids: List[Tuple[str, str]],
-    ) -> Tuple[pd.DataFrame, int]:
+        count_total: bool = True,
+    ) -> Tuple[pd.DataFrame, Optional[int]]:
         """Build a concatenated or aggregated pd.DataFrame."""
 
         filtered_df_triplets = self._filter_dfs(df_triplets)
 
         if df_filter.valid_columns_aggregation:
             df_filter_processor = DFMultipleNestedFilterProcessor(df_filter=df_filter)
-            paged_dfs, total_size, errors = await self._paginate_dfs(filtered_df_triplets, offset=0, select_all=True)
-            result_df = df_filter_processor.apply_filters_from_df(
-                pd.concat(paged_dfs, ignore_index=True),
-            ) if paged_dfs else pd.DataFrame()
+            result_df, total_size, errors = await self._aggregate_dfs(filtered_df_triplets, df_filter_processor)
         else:
-            paged_dfs, total_size, errors = await self._paginate_dfs(filtered_df_triplets, offset, page_limit)
+            paged_dfs, total_size, errors = await self._paginate_dfs(
+                filtered_df_triplets, offset, page_limit, count_total=count_total,
+            )
             result_df = pd.concat(paged_dfs, ignore_index=True) if paged_dfs else pd.DataFrame()
 
         if errors:
@@ -387,10 +445,10 @@ class SamplesAnalysisSearchDataView:
     ) -> AsyncGenerator[DFPayload, None]:
         """Async generator of pd.DataFrames."""
 
-        async for batch_df_triplets in df_triplets:
-            for dataset_id, df, error_msg in batch_df_triplets:
-                if not (df.empty and error_msg is None):
-                    yield dataset_id, df, error_msg
+        async with aclosing(df_triplets):
+            async for batch_df_triplets in df_triplets:
+                for df_triplet in filter(_is_not_empty, batch_df_triplets):
+                    yield df_triplet
 
     def _is_non_empty_filter(self, df_filter: DFMultipleNestedFilterValidator) -> bool:
         is_column_filter = df_filter.raw_columns_aggregation or df_filter.raw_columns_filter
@@ -438,3 +496,18 @@ class SamplesAnalysisSearchDataView:
             status_code=status.HTTP_200_OK,
             description=self.description_template_search,
         )
+
+
+async def _update_aggregation(
+    partial_aggregation: PartialAggregation,
+    df_filter_processor: DFMultipleNestedFilterProcessor,
+    df: pd.DataFrame,
+) -> None:
+    """Merge the aggregated column of the pd.DataFrame, if any."""
+    aggregated_column = await run_in_threadpool(df_filter_processor.get_aggregation_values, df)
+    if aggregated_column is not None:
+        partial_aggregation.update(aggregated_column)
+
+
+def _is_not_empty(df_triplet: DFPayload) -> bool:
+    return not (df_triplet.df.empty and df_triplet.error_msg is None)
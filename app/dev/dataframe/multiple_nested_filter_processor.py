@@ -12,12 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Optional
+
 import pandas as pd
 
 from app.dataframe.filter_processor import FilterProcessor
 from app.dev.dataframe.multiple_nested_parquet_filter import (
     apply_filters_from_bytes,
     apply_filters_from_df,
+    get_aggregation_values,
 )
 from app.dev.resources.multiple_nested_filters import (
     DFMultipleNestedFilterValidator,
@@ -44,11 +47,9 @@ class DFMultipleNestedFilterProcessor(FilterProcessor):
     def apply_filters_from_df(self, df: pd.DataFrame) -> pd.DataFrame:
         return apply_filters_from_df(df, self._df_filter)
 
+    def get_aggregation_values(self, df: pd.DataFrame) -> Optional[pd.Series]:
+        return get_aggregation_values(df, self._df_filter)
+
     def get_filters_without_aggregation(self) -> "DFMultipleNestedFilterProcessor":
-        df_filter_wo_agg = DFMultipleNestedFilterValidator(
-            schema=self._df_filter.schema,
-            raw_rows_filter=self._df_filter.raw_rows_filter,
-            raw_columns_filter=self._df_filter.raw_columns_filter,
-            raw_rows_multiple_filter=self._df_filter.raw_rows_multiple_filter,
-        )
+        df_filter_wo_agg = self._df_filter.without_aggregation
         return DFMultipleNestedFilterProcessor(df_filter_wo_agg)
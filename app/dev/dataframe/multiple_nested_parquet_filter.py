@@ -13,8 +13,9 @@
 #  limitations under the License.
 
 import re
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 from loguru import logger
@@ -92,9 +93,76 @@ def apply_filters_from_df(
     return query_df.df
 
 
+class ArrayCase:
+    NOT_ARRAY = "not_array"
+    ARRAY_COLUMN = "array_column"
+    ARRAY_PROPERTY = "array_property"
+    NESTED_ARRAY = "nested_array"
+
+
+def get_aggregation_values(
+    df: pd.DataFrame,
+    df_filter: DFMultipleNestedFilterValidator,
+) -> Optional[pd.Series]:
+    """Get the values to aggregate from a filtered dataframe.
+
+    :param df: filtered dataframe
+    :type df: pd.DataFrame
+    :param df_filter: dataframe filter
+    :type df_filter: DFMultipleNestedFilterValidator
+    :raises UnprocessableContentException: if there are issue with
+        filter
+    :return: the values, None if the dataframe has not the aggregated
+        column
+    :rtype: Optional[pd.Series]
+    """
+    columns_aggregation = df_filter.valid_columns_aggregation
+    column_name = columns_aggregation.column.split(Separator.DOT)[0].replace(Separator.ARRAY, "")
+    if column_name not in df.columns:
+        return None
+
+    try:
+        return ColumnsAggregationProcessor().get_aggregation_values(PandasDFQueryNested(df), columns_aggregation)
+    except Exception as exc:  # noqa: B902
+        exc_type = type(exc)
+        error_msg = f"Processing filter exception ({exc_type}): {exc}"
+        logger.error(error_msg)
+        raise UnprocessableContentException(detail=error_msg)
+
+
+class RowsSelection(NamedTuple):
+    rows_mask: np.ndarray
+    # matched items of the reduced array columns by row position, None keeps the whole row array
+    array_items: Dict[str, np.ndarray]
+
+
+def select_rows(df: pd.DataFrame, rows_selection: RowsSelection) -> pd.DataFrame:
+    """Slice the selected rows, keeping only the matched items of the
+    reduced array columns.
+
+    :param df: the dataframe
+    :type df: pd.DataFrame
+    :param rows_selection: the rows selection
+    :type rows_selection: RowsSelection
+    :return: the selected rows
+    :rtype: pd.DataFrame
+    """
+    positions = np.flatnonzero(rows_selection.rows_mask)
+    selected_df = df.iloc[positions]
+    if rows_selection.array_items:
+        selected_df = selected_df.copy()
+    for column_name, array_items in rows_selection.array_items.items():
+        matched_items = array_items[positions]
+        selected_df[column_name] = pd.Series(
+            np.where(pd.notna(matched_items), matched_items, selected_df[column_name].to_numpy()),
+            index=selected_df.index,
+        )
+    return selected_df
+
+
 class RowsFilterProcessor:
 
-    def apply_rows_filter(  # noqa:CCR001
+    def apply_rows_filter(
         self,
         query_df: PandasDFQueryNested,
         rows_filter: RowsFilter,
@@ -110,29 +178,78 @@ class RowsFilterProcessor:
         :return: the query result over the filtering
         :rtype: PandasDFQueryNested
         """
-        prop_names = rows_filter.column.split(Separator.DOT)
+        match self._get_array_case(rows_filter):
+            case ArrayCase.NOT_ARRAY:
+                query_df = self._select_not_array(query_df, rows_filter)
+            case ArrayCase.ARRAY_PROPERTY:
+                query_df = self._select_in_array_property(query_df, rows_filter)
+            case ArrayCase.ARRAY_COLUMN | ArrayCase.NESTED_ARRAY:
+                query_df = self._select_in_array_column(query_df, rows_filter)
 
-        array_indices = []
-        for prop_name in prop_names:
-            array_indices.append(Separator.ARRAY in prop_name)
-
-        case_not_array = not (any(array_indices))
-        case_array_column = array_indices.count(True) == 1 and array_indices.index(True) == 0
-        case_array_property = array_indices.count(True) == 1 and array_indices.index(True) > 0
-        case_nested_array = array_indices.count(True) == 2 and array_indices.index(True) == 0
-
-        if case_not_array:
-            query_df = self._select_not_array(query_df, rows_filter)
-        elif case_array_column:
-            query_df = self._select_in_array_column(query_df, rows_filter)
-        elif case_array_property:
-            query_df = self._select_in_array_property(query_df, rows_filter)
-        elif case_nested_array:
-            query_df = self._select_in_array_column(query_df, rows_filter, case_nested_array=True)
+        return query_df
+
+    def get_rows_selection(self, query_df: PandasDFQueryNested, rows_filter: RowsFilter) -> RowsSelection:
+        """Get the rows matching the rows filter, with the matching items of
+        the array column for array column and nested array filters.
+
+        :param query_df: the query dataframe
+        :type query_df: PandasDFQueryNested
+        :param rows_filter: a valid rows filter tuple
+        :type rows_filter: RowsFilter
+        :raises NotImplementedError: If a filter is from a not supported
+            case
+        :return: the rows selection
+        :rtype: RowsSelection
+        """
+        df = query_df.df
+        array_items = {}
+        match self._get_array_case(rows_filter):
+            case ArrayCase.NOT_ARRAY:
+                prop_names = rows_filter.column.split(Separator.DOT)
+                rows_mask = query_df.get_mask(
+                    prop_names[0],
+                    rows_filter.operator,
+                    rows_filter.comp_value,
+                    prop_names[1:] or None,
+                ).to_numpy(dtype=bool)
+            case ArrayCase.ARRAY_PROPERTY:
+                rows_mask = self._get_array_property_mask(df, rows_filter).to_numpy(dtype=bool)
+            case array_case:
+                array_column_name, matched_items = self._get_matched_array_items(
+                    df, rows_filter, case_nested_array=array_case == ArrayCase.NESTED_ARRAY,
+                )
+                filtered_arrays = matched_items.groupby(level=0).agg(list)
+                rows_mask = np.zeros(len(df), dtype=bool)
+                rows_mask[filtered_arrays.index] = True
+                array_items[array_column_name] = np.full(len(df), None, dtype=object)
+                array_items[array_column_name][filtered_arrays.index] = filtered_arrays.to_numpy()
+        return RowsSelection(rows_mask, array_items)
+
+    def _get_array_case(self, rows_filter: RowsFilter) -> str:
+        """Classify the rows filter column by its array properties.
+
+        :param rows_filter: a valid rows filter tuple
+        :type rows_filter: RowsFilter
+        :raises NotImplementedError: If a filter is from a not supported
+            case
+        :return: the array case
+        :rtype: str
+        """
+        prop_names = rows_filter.column.split(Separator.DOT)
+        array_indices = [Separator.ARRAY in prop_name for prop_name in prop_names]
+
+        arrays_count = array_indices.count(True)
+        if arrays_count == 0:
+            array_case = ArrayCase.NOT_ARRAY
+        elif arrays_count == 1 and array_indices[0]:
+            array_case = ArrayCase.ARRAY_COLUMN
+        elif arrays_count == 1:
+            array_case = ArrayCase.ARRAY_PROPERTY
+        elif arrays_count == 2 and array_indices[0]:
+            array_case = ArrayCase.NESTED_ARRAY
         else:
             raise NotImplementedError(f"Filter over this nested level array is not supported: {prop_names}")
-
-        return query_df
+        return array_case
 
     def _get_array_path_and_props_path(self, prop_names: List[str]) -> Tuple[List[str], List[str]]:
         """Retrieves the array property path and the remaining properties path.
@@ -176,30 +293,48 @@ class RowsFilterProcessor:
             props_path,
         )
 
-    def _select_in_array_column(
+    def _select_in_array_column(self, query_df: PandasDFQueryNested, rows_filter: RowsFilter) -> PandasDFQueryNested:
+        """Performs the row filter selection when the column is an array,
+        keeping the matching items of the array.
+
+        :param query_df: the query dataframe
+        :type query_df: PandasDFQueryNested
+        :param rows_filter: the rows filter
+        :type rows_filter: RowsFilter
+        :return: the query result over the filtering
+        :rtype: PandasDFQueryNested
+        """
+        filtered_df = select_rows(query_df.df, self.get_rows_selection(query_df, rows_filter))
+        if not filtered_df.index.is_monotonic_increasing:
+            filtered_df = filtered_df.sort_index(kind="stable")
+        return PandasDFQueryNested(filtered_df)
+
+    def _get_matched_array_items(
         self,
-        query_df: PandasDFQueryNested,
+        df: pd.DataFrame,
         rows_filter: RowsFilter,
         case_nested_array: bool = False,
-    ) -> PandasDFQueryNested:
-        """Performs the row filter selection when the column is an array.
+    ) -> Tuple[str, pd.Series]:
+        """Get the array column items matching the rows filter.
 
-        :param query_df: the query dataframe
-        :type query_df: PandasDFQueryNested
+        :param df: the dataframe
+        :type df: pd.DataFrame
         :param rows_filter: the rows filter
         :type rows_filter: RowsFilter
         :param case_nested_array: flags a nested array, defaults to
             False
         :type case_nested_array: bool, optional
-        :return: the query result over the filtering
-        :rtype: PandasDFQueryNested
+        :return: the array column name and its matching items indexed by
+            the parent row position
+        :rtype: Tuple[str, pd.Series]
         """
         prop_names = rows_filter.column.split(Separator.DOT)
         array_path, props_path = self._get_array_path_and_props_path(prop_names=prop_names)
         array_column_name = array_path[0]
 
-        original_df = query_df.df
-        query_df = PandasDFQueryNested(query_df.df.explode(array_column_name))
+        # only the array column is exploded; its index holds the parent row positions
+        array_items = df[array_column_name].reset_index(drop=True).explode()
+        array_items_df = array_items.to_frame(array_column_name)
 
         if case_nested_array:
             nested_array_rows_filter = RowsFilter(
@@ -207,24 +342,16 @@ class RowsFilterProcessor:
                 operator=rows_filter.operator,
                 comp_value=rows_filter.comp_value,
             )
-            query_df = self._select_in_array_property(query_df, nested_array_rows_filter)
+            items_mask = self._get_array_property_mask(array_items_df, nested_array_rows_filter)
         else:
-            query_df = query_df.select(
+            items_mask = PandasDFQueryNested(array_items_df).get_mask(
                 array_column_name,
                 rows_filter.operator,
                 rows_filter.comp_value,
                 props_path,
             )
 
-        columns_agg = {}
-        for col_name in original_df.columns:
-            if col_name == array_column_name:
-                columns_agg[col_name] = list
-            else:
-                columns_agg[col_name] = "first"
-
-        grouped = query_df.df.groupby(query_df.df.index).agg(columns_agg)
-        return PandasDFQueryNested(grouped)
+        return array_column_name, array_items[items_mask.to_numpy(dtype=bool)]
 
     def _select_in_array_property(self, query_df: PandasDFQueryNested, rows_filter: RowsFilter) -> PandasDFQueryNested:
         """Performs the row filter selection when the array is a property of
@@ -237,6 +364,20 @@ class RowsFilterProcessor:
         :return: the query result over the filtering
         :rtype: PandasDFQueryNested
         """
+        df = query_df.df
+        return PandasDFQueryNested(df[self._get_array_property_mask(df, rows_filter)])
+
+    def _get_array_property_mask(self, df: pd.DataFrame, rows_filter: RowsFilter) -> pd.Series:
+        """Get the boolean mask of rows with any array item matching the rows
+        filter, when the array is a property of the value object.
+
+        :param df: the dataframe
+        :type df: pd.DataFrame
+        :param rows_filter: the rows filter
+        :type rows_filter: RowsFilter
+        :return: boolean mask aligned with the dataframe
+        :rtype: pd.Series
+        """
         prop_names = rows_filter.column.split(Separator.DOT)
         array_path, props_path = self._get_array_path_and_props_path(prop_names)
 
@@ -260,8 +401,7 @@ class RowsFilterProcessor:
         # Apply the filter to the column
         column_name = array_path[0]
         array_prop_path = array_path[1:]
-        df = query_df.df
-        cond = df[column_name].apply(
+        return df[column_name].apply(
             filter_array_values,
             prop_path=array_prop_path,
             key_path=props_path,
@@ -269,8 +409,6 @@ class RowsFilterProcessor:
             comp_value=rows_filter.comp_value,
         )
 
-        return PandasDFQueryNested(df[cond])
-
 
 class ColumnsFilterProcessor:
 
@@ -331,6 +469,23 @@ class ColumnsAggregationProcessor:
             columns_aggregation.function,
         )
 
+    def get_aggregation_values(
+        self,
+        query_df: PandasDFQueryNested,
+        columns_aggregation: ColumnsAggregation,
+    ) -> pd.Series:
+        """Get the values of the aggregated column or property.
+
+        :param query_df: the query dataframe
+        :type query_df: PandasDFQueryNested
+        :param columns_aggregation: valid columns aggregation tuple
+        :type columns_aggregation: ColumnsAggregation
+        :return: the values to aggregate
+        :rtype: pd.Series
+        """
+        query_df = self._expand_query_df_for_aggregation(query_df, columns_aggregation)
+        return query_df.get_values(columns_aggregation.column.replace(Separator.ARRAY, ""))
+
     def _expand_query_df_for_aggregation(
         self,
         query_df: PandasDFQueryNested,
@@ -358,97 +513,111 @@ class ColumnsAggregationProcessor:
         return query_df
 
 
-class RowsMultipleFilterProcessor:
+class CompiledCondition(NamedTuple):
+    operator: Optional[str] = None
+    rows_filter: Optional[RowsFilter] = None
+    conditions: Tuple["CompiledCondition", ...] = ()
+
+
+def compile_rows_multiple_filter(conditions: dict) -> CompiledCondition:
+    """Compile validated rows multiple filter conditions into a tree of
+    predicates and logical operators.
 
-    SOLVED_FILTER: str = "solved_filter"
+    :param conditions: validated conditions
+    :type conditions: dict
+    :return: compiled condition
+    :rtype: CompiledCondition
+    """
+    rows_filter = conditions.get(RowsFilterValidator.VALID_FILTER)
+    if rows_filter is not None:
+        return CompiledCondition(rows_filter=rows_filter)
+
+    operator = next(oper for oper in Predicate.LOGICAL_OPERATORS if oper in conditions)
+    return CompiledCondition(
+        operator=operator,
+        conditions=tuple(compile_rows_multiple_filter(condition) for condition in conditions[operator]),
+    )
+
+
+class RowsMultipleFilterProcessor:
 
     def __init__(self, rows_filter_processor: RowsFilterProcessor = None):
         self._rows_filter_processor = rows_filter_processor or RowsFilterProcessor()
 
-    def apply_rows_multiple_filter(  # noqa: CCR001
+    def apply_rows_multiple_filter(
         self,
         query_df: PandasDFQueryNested,
         rows_multiple_filter: RowsMultipleFilter,
     ) -> PandasDFQueryNested:
-        stack = [rows_multiple_filter.conditions]
-        while stack:
-            current_condition = stack.pop()
-            if self._is_logical_oper(current_condition):
-                current_op = self._get_operator(current_condition)
-                conditions_list = current_condition[current_op]
-                if self._is_all_predicate_or_solved(conditions_list):
-                    current_condition[self.SOLVED_FILTER] = self._apply_oper(query_df, current_op, conditions_list)
-                    del current_condition[current_op]
-                else:
-                    stack.append(current_condition)
-                    for nested_condition in conditions_list:
-                        if self._is_logical_oper(nested_condition):  # noqa: WPS220
-                            stack.append(nested_condition)  # noqa: WPS220
-            else:
-                current_condition[self.SOLVED_FILTER] = self._apply_oper(
-                    query_df, LogicalOperators.AND, [current_condition],
-                )
-        return rows_multiple_filter.conditions[self.SOLVED_FILTER]
+        """Applies the rows multiple filter.
 
-    def _apply_conjunction(  # noqa: CCR001
-        self,
-        query_df: PandasDFQueryNested,
-        predicates: List[dict],
-    ) -> PandasDFQueryNested:
-        dfs = self._get_dfs_from_predicates(query_df, predicates)
-
-        if dfs and all((not check_df.empty for check_df in dfs)):
-            if len(dfs) > 1:
-                common_indexes = dfs[0].index
-                for df in dfs[1:]:
-                    common_indexes = common_indexes.intersection(df.index)
-                common_indexes = common_indexes.tolist()
-                merged_df = dfs[0].loc[common_indexes]
-            else:
-                merged_df = dfs[0]
-        else:
-            merged_df = pd.DataFrame()
-
-        return PandasDFQueryNested(merged_df)
-
-    def _apply_disjunction(self, query_df: PandasDFQueryNested, predicates: List[dict]) -> PandasDFQueryNested:
-        concatenated_df = pd.concat(self._get_dfs_from_predicates(query_df, predicates))
-        unique_df = concatenated_df[~concatenated_df.index.duplicated()]
-        return PandasDFQueryNested(unique_df)
-
-    def _is_all_predicate_or_solved(self, predicates: List[dict]) -> bool:
-        predicate_or_solved = []
-        for predicate in predicates:
-            if RowsFilterValidator.VALID_FILTER in predicate or self.SOLVED_FILTER in predicate:
-                predicate_or_solved.append(True)
-            else:
-                predicate_or_solved.append(False)
-        return all(predicate_or_solved)
-
-    def _apply_oper(self, query_df, operator, predicates):
-        if LogicalOperators.AND == operator:
-            query_df = self._apply_conjunction(query_df, predicates)
-        elif LogicalOperators.OR == operator:
-            query_df = self._apply_disjunction(query_df, predicates)
-        return query_df
+        The conditions are evaluated as boolean masks and the dataframe
+        is sliced once. $and keeps the array items matched by its first
+        condition, $or the array items matched by the first condition
+        matching the row.
 
-    def _get_dfs_from_predicates(self, query_df, predicates) -> List[pd.DataFrame]:
-        dfs = []
-        for predicate in predicates:
-            if RowsFilterValidator.VALID_FILTER in predicate:
-                dfs.append(
-                    self._rows_filter_processor.apply_rows_filter(
-                        query_df, predicate.get(RowsFilterValidator.VALID_FILTER),
-                    ).df,
-                )
-            elif self.SOLVED_FILTER in predicate:
-                dfs.append(predicate.get(self.SOLVED_FILTER).df)
-        return dfs
+        :param query_df: the query dataframe
+        :type query_df: PandasDFQueryNested
+        :param rows_multiple_filter: a valid rows multiple filter
+        :type rows_multiple_filter: RowsMultipleFilter
+        :return: the query result over the filtering
+        :rtype: PandasDFQueryNested
+        """
+        compiled_condition = compile_rows_multiple_filter(rows_multiple_filter.conditions)
+        rows_selection = self.get_rows_selection(query_df, compiled_condition)
+        if compiled_condition.operator != LogicalOperators.OR and not rows_selection.rows_mask.any():
+            # a conjunction without rows has no columns either
+            return PandasDFQueryNested(pd.DataFrame())
+        return PandasDFQueryNested(select_rows(query_df.df, rows_selection))
+
+    def get_rows_selection(self, query_df: PandasDFQueryNested, compiled_condition: CompiledCondition) -> RowsSelection:
+        """Evaluate a compiled condition into a rows selection.
+
+        $and stops evaluating once no row matches and $or once all rows
+        match.
 
-    def _is_logical_oper(self, condition: dict) -> bool:
-        return any(oper in condition for oper in Predicate.LOGICAL_OPERATORS)
+        :param query_df: the query dataframe
+        :type query_df: PandasDFQueryNested
+        :param compiled_condition: compiled condition
+        :type compiled_condition: CompiledCondition
+        :return: the rows selection
+        :rtype: RowsSelection
+        """
+        if compiled_condition.rows_filter:
+            rows_selection = self._rows_filter_processor.get_rows_selection(query_df, compiled_condition.rows_filter)
+        elif compiled_condition.operator == LogicalOperators.AND:
+            rows_selection = self._get_conjunction_selection(query_df, compiled_condition.conditions)
+        else:
+            rows_selection = self._get_disjunction_selection(query_df, compiled_condition.conditions)
+        return rows_selection
 
-    def _get_operator(self, conditions: dict):
-        for operator in Predicate.LOGICAL_OPERATORS:
-            if operator in conditions:
-                return operator
+    def _get_conjunction_selection(
+        self,
+        query_df: PandasDFQueryNested,
+        conditions: Tuple[CompiledCondition, ...],
+    ) -> RowsSelection:
+        first_condition, *other_conditions = conditions
+        rows_mask, array_items = self.get_rows_selection(query_df, first_condition)
+        for condition in other_conditions:
+            if not rows_mask.any():
+                break
+            rows_mask &= self.get_rows_selection(query_df, condition).rows_mask
+        return RowsSelection(rows_mask, array_items)
+
+    def _get_disjunction_selection(
+        self,
+        query_df: PandasDFQueryNested,
+        conditions: Tuple[CompiledCondition, ...],
+    ) -> RowsSelection:
+        rows_mask = np.zeros(len(query_df.df), dtype=bool)
+        array_items = {}
+        for condition in conditions:
+            condition_selection = self.get_rows_selection(query_df, condition)
+            new_rows = np.logical_and(condition_selection.rows_mask, np.logical_not(rows_mask))
+            for column_name, column_items in condition_selection.array_items.items():
+                matched_items = array_items.setdefault(column_name, np.full(len(rows_mask), None, dtype=object))
+                matched_items[new_rows] = column_items[new_rows]
+            rows_mask |= condition_selection.rows_mask
+            if rows_mask.all():
+                break
+        return RowsSelection(rows_mask, array_items)
@@ -12,9 +12,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import partial
 from typing import Any, List, Optional
 
-from app.dataframe.query import OPERATOR_TYPES, PandasDFQueryBase
+import pandas as pd
+
+from app.dataframe.query import (
+    OPERATOR_TYPES,
+    PandasDFQueryBase,
+    get_nested_mask,
+)
 
 
 class PandasDFQueryNested(PandasDFQueryBase):
@@ -41,8 +48,34 @@ class PandasDFQueryNested(PandasDFQueryBase):
         :return: an updated PandasDFQueryNested object
         :rtype: PandasDFQueryNested
         """
-        oper = OPERATOR_TYPES.get(op_type)
         df_query = self
+        if OPERATOR_TYPES.get(op_type):
+            df_query = PandasDFQueryNested(self.df[self.get_mask(column, op_type, comp_val, prop_path)])
+
+        return df_query
+
+    def get_mask(
+        self,
+        column: str,
+        op_type: str,
+        comp_val: Any,
+        prop_path: Optional[List[str]] = None,
+    ) -> pd.Series:
+        """Get the boolean mask of rows matching a condition.
+
+        :param column: the column name
+        :type column: str
+        :param op_type: the operator type
+        :type op_type: str
+        :param comp_val: the comparison value
+        :type comp_val: Any
+        :param prop_path: an optional prop_path of the column, defaults
+            to None
+        :type prop_path: Optional[List[str]], optional
+        :return: boolean mask aligned with the DataFrame
+        :rtype: pd.Series
+        """
+        oper = OPERATOR_TYPES[op_type]
         df_col = self.df[column]
 
         def get_field(row: dict, prop_path: List[str]) -> Any:
@@ -51,10 +84,7 @@ class PandasDFQueryNested(PandasDFQueryBase):
                 field = field.get(path)
             return field
 
-        if oper:
-            cond = df_col.apply(
-                lambda row: oper(get_field(row, prop_path), comp_val),
-            ) if prop_path else oper(df_col, comp_val)
-            df_query = PandasDFQueryNested(self.df[cond])
-
-        return df_query
+        if not prop_path:
+            return oper(df_col, comp_val)
+        nested_values = self.get_nested_values(column, prop_path)
+        return get_nested_mask(df_col, nested_values, oper, comp_val, partial(get_field, prop_path=prop_path))
@@ -12,14 +12,23 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, NamedTuple, Optional, Set
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Type
 
 import jsonref
 from loguru import logger
+from pydantic import BaseModel
 
 from app.resources.errors import FilterValidationError
+from app.resources.filters import FILTER_PLAN_CACHE_SIZE
+from app.resources.schema_registry import (
+    PropertyInfo,
+    get_schema_entry,
+    merge_all_of,
+)
 
 
 class Aggregation:
@@ -90,11 +99,6 @@ class FilterIndex:
     COMP_VALUE = 2
 
 
-class PropertyInfo(NamedTuple):
-    name: str
-    type: str
-
-
 class RowsFilter(NamedTuple):
     column: str
     operator: str
@@ -126,10 +130,16 @@ class DFMultipleNestedFilterValidator:
     raw_rows_filter: Optional[str] = None
     raw_columns_aggregation: Optional[str] = None
     raw_rows_multiple_filter: Optional[str] = None
+    model: Optional[Type[BaseModel]] = None
 
     def __post_init__(self):
-        self._expanded_schema = jsonref.loads(json.dumps(self.schema))
-        self._prop_processor = PropertyInfoProcessor(self._expanded_schema)
+        if self.model:
+            schema_entry = get_schema_entry(self.model)
+            self._expanded_schema = schema_entry.expanded_schema
+            self._prop_processor = PropertyInfoProcessor(self._expanded_schema, schema_entry.prop_infos)
+        else:
+            self._expanded_schema = jsonref.loads(json.dumps(self.schema))
+            self._prop_processor = PropertyInfoProcessor(self._expanded_schema)
         self._rows_filter_validator = RowsFilterValidator(self._prop_processor)
         self._columns_aggregation_validator = ColumnsAggregationValidator(self._prop_processor)
         self._columns_filter_validator = ColumnsFilterValidator(self._prop_processor)
@@ -138,34 +148,58 @@ class DFMultipleNestedFilterValidator:
     def all_valid_columns(self) -> Set[str]:
         return set(self._expanded_schema["properties"].keys())
 
-    @property
+    @cached_property
     def valid_columns_filter(self) -> Optional[ColumnsFilter]:
         columns_filter = None
         if self.raw_columns_filter:
             columns_filter = self._validate_columns_filter()
         return columns_filter
 
-    @property
+    @cached_property
     def valid_rows_filter(self) -> Optional[RowsFilter]:
         rows_filter = None
         if self.raw_rows_filter:
             rows_filter = self._validate_rows_filter()
         return rows_filter
 
-    @property
+    @cached_property
     def valid_rows_multiple_filter(self) -> Optional[dict]:
         rows_multiple_filter = None
         if self.raw_rows_multiple_filter:
             rows_multiple_filter = self._validate_rows_multiple_filter()
         return rows_multiple_filter
 
-    @property
+    @cached_property
     def valid_columns_aggregation(self) -> Optional[ColumnsAggregation]:
         columns_aggregation = None
         if self.raw_columns_aggregation:
             columns_aggregation = self._validate_columns_aggregation()
         return columns_aggregation
 
+    @cached_property
+    def without_aggregation(self) -> "DFMultipleNestedFilterValidator":
+        """The same filters without columns aggregation, reusing the expanded
+        schema and the already validated filters.
+
+        :return: filter validator without columns aggregation
+        :rtype: DFMultipleNestedFilterValidator
+        """
+        df_filter = copy.copy(self)
+        df_filter.raw_columns_aggregation = None
+        df_filter.__dict__.pop("valid_columns_aggregation", None)  # noqa: WPS609
+        return df_filter
+
+    def validate(self) -> None:
+        """Validate all the filters, keeping the validated ones.
+
+        :raises FilterValidationError: If any validation error occurs
+        """
+        # the cached properties validate the filters on first access
+        self.valid_columns_aggregation  # noqa: WPS428
+        self.valid_columns_filter  # noqa: WPS428
+        self.valid_rows_filter  # noqa: WPS428
+        self.valid_rows_multiple_filter  # noqa: WPS428
+
     def _get_filter_from_json_str(self, json_str: str, error_str: str) -> Dict:
         try:
             return json.loads(json_str)
@@ -199,12 +233,68 @@ class DFMultipleNestedFilterValidator:
         return self._columns_filter_validator.validate(columns_filter_list)
 
 
+@lru_cache(maxsize=FILTER_PLAN_CACHE_SIZE)
+def get_filter_plan(
+    model: Type[BaseModel],
+    raw_columns_filter: Optional[str] = None,
+    raw_rows_filter: Optional[str] = None,
+    raw_columns_aggregation: Optional[str] = None,
+    raw_rows_multiple_filter: Optional[str] = None,
+) -> DFMultipleNestedFilterValidator:
+    """Get the validated multiple nested filters shared across requests.
+
+    Unlike app.resources.filters.get_filter_plan, the plan also holds the
+    registered model schema and the property lookups.
+
+    :param model: data model
+    :type model: Type[BaseModel]
+    :param raw_columns_filter: columns filter, defaults to None
+    :type raw_columns_filter: Optional[str]
+    :param raw_rows_filter: rows filter, defaults to None
+    :type raw_rows_filter: Optional[str]
+    :param raw_columns_aggregation: columns aggregation, defaults to None
+    :type raw_columns_aggregation: Optional[str]
+    :param raw_rows_multiple_filter: rows multiple filter, defaults to
+        None
+    :type raw_rows_multiple_filter: Optional[str]
+    :raises FilterValidationError: If any validation error occurs
+    :return: validated filters
+    :rtype: DFMultipleNestedFilterValidator
+    """
+    df_filter = DFMultipleNestedFilterValidator(
+        model=model,
+        raw_columns_filter=raw_columns_filter,
+        raw_rows_filter=raw_rows_filter,
+        raw_columns_aggregation=raw_columns_aggregation,
+        raw_rows_multiple_filter=raw_rows_multiple_filter,
+    )
+    df_filter.validate()
+    return df_filter
+
+
 class PropertyInfoProcessor:
 
-    def __init__(self, schema: dict):
+    def __init__(self, schema: dict, prop_infos: Optional[Dict[str, PropertyInfo]] = None):
         self._schema = schema
+        self._prop_infos = dict(prop_infos or {})
 
     def get_prop_info(self, flatten_prop_name: str) -> PropertyInfo:
+        """Get the property info, traversing the schema on first lookup.
+
+        :param flatten_prop_name: the flatten property name
+        :type flatten_prop_name: str
+        :raises FilterValidationError: when a property does not exist in
+            the schema
+        :return: the property info
+        :rtype: PropertyInfo
+        """
+        prop_info = self._prop_infos.get(flatten_prop_name)
+        if prop_info is None:
+            prop_info = self._get_prop_info_from_schema(flatten_prop_name)
+            self._prop_infos[flatten_prop_name] = prop_info
+        return prop_info
+
+    def _get_prop_info_from_schema(self, flatten_prop_name: str) -> PropertyInfo:
         """Traverses the schema to get the property info.
 
         :param flatten_prop_name: the flatten property name
@@ -219,7 +309,7 @@ class PropertyInfoProcessor:
         prop_names = []
         for prop_name in flatten_prop_name.split(Separator.DOT):
             try:
-                prop_schema = self._handle_jsonschema_refs(prop_schema)
+                prop_schema = merge_all_of(prop_schema)
                 prop_type = prop_schema["type"]
                 if prop_type == "object":
                     prop_schema = prop_schema["properties"][prop_name]
@@ -238,15 +328,8 @@ class PropertyInfoProcessor:
                 raise FilterValidationError(
                     f"Wrong property name: {flatten_prop_name}. Reason: {prop_name} not in {valid_schema_keys}",
                 )
-        return PropertyInfo(name=Separator.DOT.join(prop_names), type=prop_schema.get("type"))
-
-    def _handle_jsonschema_refs(self, prop_schema: dict):
-        if "allOf" in prop_schema:
-            new_prop_schema = {}
-            for schema in prop_schema.get("allOf"):
-                new_prop_schema.update(schema)
-            prop_schema = new_prop_schema
-        return prop_schema
+        prop_type = prop_schema.get("type")
+        return PropertyInfo(name=Separator.DOT.join(prop_names), type=prop_type, is_array=prop_type == "array")
 
 
 class RowsFilterValidator:
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import json
 from typing import List, Optional, Tuple
 
@@ -20,10 +21,17 @@ from redis.asyncio.client import Redis
 from redis.commands.search.query import Query as RedisQuery
 
 from app.api.routes.utils.search import get_valid_ids_from_ddms_datasets
+from app.core.helpers.cache.cache_tags import (
+    add_cache_tags,
+    get_analysis_type_tag,
+)
 from app.dev.core.helpers.redis_index import SAMPLESANALYSIS_IX
-from app.dev.services import entitlements
 from app.resources.paths import SAMPLESANALYSIS_TYPE_MAPPING
 from app.search.analysis_type_ids_fetcher import SamplesAnalysisTypeIdsFetcher
+from app.services import entitlements
+
+REDIS_PAGE_LIMIT = 1000
+REDIS_PAGES_CONCURRENCY = 4
 
 
 class RedisSamplesAnalysisTypeIdsFetcher(SamplesAnalysisTypeIdsFetcher):
@@ -55,6 +63,7 @@ class RedisSamplesAnalysisTypeIdsFetcher(SamplesAnalysisTypeIdsFetcher):
             type and wks_parameters
         :rtype: List[Tuple[str, str]]
         """
+        add_cache_tags(get_analysis_type_tag(data_partition_id, analysis_type))
         index_name = SAMPLESANALYSIS_IX.format(partition=data_partition_id)
         data_acl_groups = await self._entitlements_service.get_data_groups()
 
@@ -62,19 +71,23 @@ class RedisSamplesAnalysisTypeIdsFetcher(SamplesAnalysisTypeIdsFetcher):
             data_partition_id, SAMPLESANALYSIS_TYPE_MAPPING[analysis_type], wks_parameters,
         )
 
-        query_offset = 0
-        query_limit = 1000
-        result_records = []
-        while True:
-            records_response = await self._redis_client.ft(index_name).search(
-                RedisQuery(query).paging(query_offset, query_limit),
-            )
-            records = [json.loads(record.json) for record in records_response.docs]
+        semaphore = asyncio.Semaphore(REDIS_PAGES_CONCURRENCY)
 
-            if not records:
-                break
-            result_records.extend(self._validate_acl(records, data_acl_groups))
-            query_offset += query_limit
+        async def search_page(query_offset: int) -> Tuple[int, list]:
+            async with semaphore:
+                records_response = await self._redis_client.ft(index_name).search(
+                    RedisQuery(query).paging(query_offset, REDIS_PAGE_LIMIT),
+                )
+            records = [json.loads(record.json) for record in records_response.docs]
+            return records_response.total, self._validate_acl(records, data_acl_groups)
+
+        # the total is known after the first page, the next ones are searched in parallel
+        total, result_records = await search_page(0)
+        next_pages = await asyncio.gather(*(
+            search_page(query_offset) for query_offset in range(REDIS_PAGE_LIMIT, total, REDIS_PAGE_LIMIT)
+        ))
+        for _, records in next_pages:
+            result_records.extend(records)
 
         return self._build_result_ids(result_records, target_schema_version, analysis_type)
 
@@ -14,7 +14,6 @@
 
 from typing import NamedTuple
 
-import httpx
 from loguru import logger
 
 from app.resources.common_headers import (
@@ -22,7 +21,7 @@ from app.resources.common_headers import (
     CONTENT_TYPE,
     DATA_PARTITION_ID,
 )
-from app.services.osdu_clients.conf import DEFAULT_RETRIES, TIMEOUT
+from app.services.osdu_clients.http_client import get_http_client
 
 
 class PartitionServicePaths(NamedTuple):
@@ -62,13 +61,11 @@ class PartitionServiceApiClient(object):
         :return: the list of partition names
         :rtype: list
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.get(PartitionServicePaths.PARTITIONS, headers=self.headers)
-            logger.debug(f"{self.name}: partitions response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        response = await client.get(PartitionServicePaths.PARTITIONS, headers=self.headers)
+        logger.debug(f"{self.name}: partitions response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_partition(self, partition: str) -> dict:
         """Get the partition info.
@@ -78,22 +75,10 @@ class PartitionServiceApiClient(object):
         :return: dict with info of the partition
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.get(
-                PartitionServicePaths.PARTITION.format(partition=partition), headers=self.headers,
-            )
-            logger.debug(f"{self.name}: partition response: {response}")
-            response.raise_for_status()
-            return response.json()
-
-    def _transport(self, retries: int = DEFAULT_RETRIES, **kwargs) -> httpx.AsyncHTTPTransport:
-        """Create a new transport object.
-
-        :param retries: the number of retries, defaults to RETRIES
-        :type retries: int, optional
-        :return: A new transport object
-        :rtype: httpx.AsyncHTTPTransport
-        """
-        return httpx.AsyncHTTPTransport(retries=retries, **kwargs)
+        client = get_http_client(self.base_url)
+        response = await client.get(
+            PartitionServicePaths.PARTITION.format(partition=partition), headers=self.headers,
+        )
+        logger.debug(f"{self.name}: partition response: {response}")
+        response.raise_for_status()
+        return response.json()
@@ -70,6 +70,24 @@ class OsduApiException(HTTPException):
     pass
 
 
+class ForbiddenException(HTTPException):
+    def __init__(
+        self,
+        detail: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(status_code=403, detail=detail, headers=headers)
+
+
+class ClientDisconnectedException(HTTPException):
+    def __init__(
+        self,
+        detail: Any = "Client disconnected.",
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(status_code=499, detail=detail, headers=headers)
+
+
 class NotFoundException(HTTPException):
     def __init__(
         self,
@@ -0,0 +1,60 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+from enum import Enum
+from typing import Any, List, Tuple
+
+from pydantic import BaseModel, validator
+
+
+class CacheKeySize(BaseModel):
+    key: str
+    size: int
+
+
+class CacheTopKeysResponse(BaseModel):
+    keys: List[CacheKeySize]
+
+
+class WarmupEndpoint(str, Enum):
+    SEARCH = "search"
+    SEARCH_DATA = "search/data"
+
+
+class WarmupQuery(BaseModel):
+    data_partition_id: str
+    analysis_type: str
+    content_schema_version: str
+    endpoint: WarmupEndpoint = WarmupEndpoint.SEARCH.value
+    params: List[Tuple[str, str]] = []
+
+    class Config:
+        use_enum_values = True
+
+    @validator("params", pre=True)
+    def params_as_pairs(cls, params: Any) -> Any:  # noqa: N805
+        # pairs keep repeated query params, a mapping is accepted as well
+        if isinstance(params, dict):
+            return list(params.items())
+        return params
+
+    @property
+    def query_key(self) -> str:
+        return json.dumps(self.dict(), sort_keys=True)
+
+
+class WarmupReport(BaseModel):
+    replayed: int
+    failed: int
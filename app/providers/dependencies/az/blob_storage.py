@@ -12,8 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List
+import asyncio
+from typing import List, Optional
 
+import aiohttp
 from azure.core.exceptions import (
     HttpResponseError,
     ResourceExistsError,
@@ -22,10 +24,12 @@ from azure.core.exceptions import (
     ServiceRequestError,
     ServiceResponseError,
 )
+from azure.core.pipeline.transport import AioHttpTransport
 from azure.storage.blob import BlobType, ContentSettings
-from azure.storage.blob.aio import BlobServiceClient
+from azure.storage.blob.aio import BlobServiceClient, ContainerClient
 from loguru import logger
 
+from app.core.settings.app import AppSettings
 from app.exceptions.exceptions import (
     NotFoundException,
     UnprocessableContentException,
@@ -52,12 +56,44 @@ ALL_AZURE_CORE_ERRORS = (
 
 
 class AzureBlobStorage(IBlobStorage):
+    """Blob storage of a data partition storage account.
 
-    def __init__(self, storage_partition_info: StoragePartitionInfo):
-        account_name = storage_partition_info.storage_account_info[STORAGE_ACCOUNT_NAME]
-        self._account_url = f"https://{account_name}.blob.core.windows.net/"
-        self._account_key = storage_partition_info.storage_account_info[STORAGE_ACCOUNT_KEY]
-        self._container_name = storage_partition_info.storage_account_info["container_name"]
+    One connection pool is kept for the lifetime of the instance and
+    shared by all the requests. Refreshed account info only replaces
+    the service client, which reuses the pooled connections.
+    """
+
+    def __init__(
+        self,
+        storage_partition_info: StoragePartitionInfo,
+        settings: AppSettings,
+    ):
+        self._max_connections = settings.blob_max_connections
+        self._max_concurrency = settings.blob_max_concurrency
+        self._container_client: Optional[ContainerClient] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._set_account(storage_partition_info)
+
+    def update_partition_info(self, storage_partition_info: StoragePartitionInfo) -> None:
+        """Use the refreshed storage account info, e.g. a rotated key.
+
+        :param storage_partition_info: the storage account info
+        :type storage_partition_info: StoragePartitionInfo
+        """
+        account = (self._account_url, self._account_key, self._container_name)
+        self._set_account(storage_partition_info)
+        if account != (self._account_url, self._account_key, self._container_name):
+            logger.info(f"Storage account info changed for: {storage_partition_info.data_partition_id}")
+            # requests in flight keep the previous client, its transport doesn't own the session
+            self._container_client = None
+
+    async def close(self) -> None:
+        # a session of another event loop is left to the teardown of that loop
+        if self._session is not None and self._loop is asyncio.get_running_loop():
+            await self._session.close()
+        self._container_client = None
+        self._session = None
 
     async def create_blob(self, blob) -> BlobMetadata:
         return await self._upload_blob(blob)
@@ -67,79 +103,85 @@ class AzureBlobStorage(IBlobStorage):
 
     async def get_blob(self, blob_metadata: BlobMetadata) -> Blob:
         object_name = blob_metadata.object_name
-        async with BlobServiceClient(
-            account_url=self._account_url, credential=self._account_key,
-        ) as blob_service_client:
-            container_client = blob_service_client.get_container_client(container=self._container_name)
-            blob_client = container_client.get_blob_client(object_name)
-
-            try:
-                blob_metadata.metadata = await blob_client.get_blob_properties()
-                blob_stream = await blob_client.download_blob()
-                blob_data = await blob_stream.readall()
-                return Blob(blob_data=blob_data, blob_metadata=blob_metadata)
-            except (HttpResponseError, ResourceNotFoundError) as exc:
-                exc_msg = str(exc)
-                object_name = blob_metadata.object_name
-                error_msg = f"Unable to get the blob {object_name}: {exc_msg}"
-                logger.error(error_msg)
-                raise NotFoundException(detail=error_msg)
+        blob_client = self._get_container_client().get_blob_client(object_name)
+
+        try:
+            blob_metadata.metadata = await blob_client.get_blob_properties()
+            blob_stream = await blob_client.download_blob(max_concurrency=self._max_concurrency)
+            blob_data = await blob_stream.readall()
+            return Blob(blob_data=blob_data, blob_metadata=blob_metadata)
+        except (HttpResponseError, ResourceNotFoundError) as exc:
+            exc_msg = str(exc)
+            object_name = blob_metadata.object_name
+            error_msg = f"Unable to get the blob {object_name}: {exc_msg}"
+            logger.error(error_msg)
+            raise NotFoundException(detail=error_msg)
 
     async def list_blobs(self, subpath: str) -> List[str]:
-        async with BlobServiceClient(
-            account_url=self._account_url, credential=self._account_key,
-        ) as blob_service_client:
-            container_client = blob_service_client.get_container_client(container=self._container_name)
-
-            blob_names = []
-            async for blob in container_client.list_blobs(subpath):
-                blob_names.append(blob["name"])
+        blob_names = []
+        async for blob in self._get_container_client().list_blobs(subpath):
+            blob_names.append(blob["name"])
 
         return blob_names
 
     async def delete_blob(self, blob_metadata: BlobMetadata) -> bool:
         object_name = blob_metadata.object_name
-        async with BlobServiceClient(
-            account_url=self._account_url, credential=self._account_key,
-        ) as blob_service_client:
-            container_client = blob_service_client.get_container_client(container=self._container_name)
-            blob_client = container_client.get_blob_client(object_name)
-
-            resource_deleted = False
-            try:
-                await blob_client.delete_blob()
-                resource_deleted = True
-            except ResourceNotFoundError:
-                error_msg = f"Blob not found: {object_name}"
-                logger.error(error_msg)
-                raise NotFoundException(detail=error_msg)
+        blob_client = self._get_container_client().get_blob_client(object_name)
+
+        resource_deleted = False
+        try:
+            await blob_client.delete_blob()
+            resource_deleted = True
+        except ResourceNotFoundError:
+            error_msg = f"Blob not found: {object_name}"
+            logger.error(error_msg)
+            raise NotFoundException(detail=error_msg)
 
         return resource_deleted
 
+    def _set_account(self, storage_partition_info: StoragePartitionInfo) -> None:
+        account_name = storage_partition_info.storage_account_info[STORAGE_ACCOUNT_NAME]
+        self._account_url = f"https://{account_name}.blob.core.windows.net/"
+        self._account_key = storage_partition_info.storage_account_info[STORAGE_ACCOUNT_KEY]
+        self._container_name = storage_partition_info.storage_account_info["container_name"]
+
+    def _get_container_client(self) -> ContainerClient:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # a session of another event loop can't be used, nor closed, from this one
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self._max_connections))
+            self._loop = loop
+            self._container_client = None
+        if self._container_client is None:
+            blob_service_client = BlobServiceClient(
+                account_url=self._account_url,
+                credential=self._account_key,
+                transport=AioHttpTransport(session=self._session, session_owner=False),
+            )
+            self._container_client = blob_service_client.get_container_client(container=self._container_name)
+        return self._container_client
+
     async def _upload_blob(
         self,
         blob: Blob,
         overwrite: bool = False,
         blob_type: BlobType = BlobType.BLOCKBLOB,
     ) -> BlobMetadata:
-        async with BlobServiceClient(
-            account_url=self._account_url, credential=self._account_key,
-        ) as blob_service_client:
-            container_client = blob_service_client.get_container_client(container=self._container_name)
-            blob_client = container_client.get_blob_client(blob.blob_metadata.object_name)
-
-            content_settings = ContentSettings(content_type=blob.blob_metadata.content_type.mime_type)
-            try:
-                blob.blob_metadata.metadata = await blob_client.upload_blob(
-                    data=blob.blob_data,
-                    metadata=blob.blob_metadata.metadata,
-                    blob_type=blob_type,
-                    overwrite=overwrite,
-                    content_settings=content_settings,
-                )
-                return blob.blob_metadata
-            except ALL_AZURE_CORE_ERRORS as exc:
-                exc_msg = str(exc)
-                error_msg = f"Unable to upload the blob: {exc_msg}"
-                logger.error(error_msg)
-                raise UnprocessableContentException(detail=error_msg)
+        blob_client = self._get_container_client().get_blob_client(blob.blob_metadata.object_name)
+
+        content_settings = ContentSettings(content_type=blob.blob_metadata.content_type.mime_type)
+        try:
+            blob.blob_metadata.metadata = await blob_client.upload_blob(
+                data=blob.blob_data,
+                metadata=blob.blob_metadata.metadata,
+                blob_type=blob_type,
+                overwrite=overwrite,
+                content_settings=content_settings,
+                max_concurrency=self._max_concurrency,
+            )
+            return blob.blob_metadata
+        except ALL_AZURE_CORE_ERRORS as exc:
+            exc_msg = str(exc)
+            error_msg = f"Unable to upload the blob: {exc_msg}"
+            logger.error(error_msg)
+            raise UnprocessableContentException(detail=error_msg)
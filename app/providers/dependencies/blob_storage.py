@@ -13,13 +13,19 @@
 #  limitations under the License.
 
 import os
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiofiles
 from pydantic import BaseSettings
 
+from app.core.helpers.cache.settings import (
+    STORAGE_ACCOUNT_INFO_CACHE_DEFAULT_TTL,
+)
+from app.core.helpers.cache.single_flight import SingleFlight
 from app.core.settings.app import AppSettings
 from app.exceptions.exceptions import (
     NotFoundException,
@@ -144,6 +150,9 @@ class IBlobStorage(ABC):
         """
         raise NotImplementedError
 
+    async def close(self) -> None:  # noqa: B027
+        """Release the connections of the storage backend."""
+
 
 class LocalFilesystemBlobStorage(IBlobStorage):
     def __init__(self, base_path: str):
@@ -196,6 +205,11 @@ class LocalFilesystemBlobStorage(IBlobStorage):
         ]
 
 
+# blob storages are kept per data partition with the time their account info is refreshed
+_blob_storages: Dict[str, Tuple[IBlobStorage, float]] = {}
+_blob_storage_flights = SingleFlight(copy_results=False)
+
+
 async def get_blob_storage(
     data_partition_id: str,
     settings: AppSettings,
@@ -206,6 +220,21 @@ async def get_blob_storage(
     if settings.local_dev_mode:
         return LocalFilesystemBlobStorage("./blobdata")
 
+    blob_storage, refresh_at = _blob_storages.get(data_partition_id, (None, 0))
+    if blob_storage is None or refresh_at <= time.time():
+        blob_storage, _ = await _blob_storage_flights.run(
+            data_partition_id,
+            partial(_refresh_blob_storage, data_partition_id, settings, cloud_provider_config),
+        )
+    return blob_storage
+
+
+async def _refresh_blob_storage(
+    data_partition_id: str,
+    settings: AppSettings,
+    cloud_provider_config: Optional[BaseSettings],
+) -> IBlobStorage:
+    blob_storage, _ = _blob_storages.get(data_partition_id, (None, 0))
     match settings.cloud_provider:
         case "azure":
             from app.providers.dependencies.az.blob_storage import (
@@ -218,6 +247,20 @@ async def get_blob_storage(
                 data_partition_id, settings, cloud_provider_config,
             ) as azure_storage_account_info:
                 account_info = await azure_storage_account_info.get_info()
-                return AzureBlobStorage(StoragePartitionInfo(data_partition_id, account_info))
+            storage_partition_info = StoragePartitionInfo(data_partition_id, account_info)
+            if blob_storage is None:
+                blob_storage = AzureBlobStorage(storage_partition_info, settings)
+            else:
+                blob_storage.update_partition_info(storage_partition_info)
         case _:
             raise NotImplementedError()
+
+    _blob_storages[data_partition_id] = (blob_storage, time.time() + STORAGE_ACCOUNT_INFO_CACHE_DEFAULT_TTL)
+    return blob_storage
+
+
+async def close_blob_storages() -> None:
+    """Close the blob storages of all the data partitions."""
+    while _blob_storages:
+        _, (blob_storage, _) = _blob_storages.popitem()
+        await blob_storage.close()
@@ -19,6 +19,7 @@ from app.core.settings.base import AppEnvTypes
 
 
 def init_metric(app: FastAPI, settings: AppSettings):
-    if settings.app_env == AppEnvTypes.prod and settings.cloud_provider == "azure":
+    azure_prod = settings.app_env == AppEnvTypes.prod and settings.cloud_provider == "azure"
+    if settings.metrics_enable or azure_prod:
         from prometheus_fastapi_instrumentator import Instrumentator
         Instrumentator().instrument(app).expose(app)
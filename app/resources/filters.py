@@ -12,15 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
 import re
 from dataclasses import dataclass
-from typing import Any, List, NamedTuple, Optional, Set, Tuple
+from functools import cached_property, lru_cache
+from typing import Any, List, NamedTuple, Optional, Set, Tuple, Type
 
 from loguru import logger
 from pydantic.main import BaseModel
 
 from app.resources.errors import FilterValidationError
 
+FILTER_PLAN_CACHE_SIZE = 256
+
 
 class Aggregation(NamedTuple):
     FUNCTIONS = {"mean", "count", "max", "min", "sum", "describe"}
@@ -82,27 +86,50 @@ class DataFrameFilterValidator:
     def all_valid_columns(self) -> Set[str]:
         return set(self.model.__fields__.keys())
 
-    @property
+    @cached_property
     def valid_columns_filter(self) -> Optional[ColumnsFilter]:
         columns_filter = None
         if self.raw_columns_filter:
             columns_filter = self._validate_columns_filter()
         return columns_filter
 
-    @property
+    @cached_property
     def valid_rows_filter(self) -> Optional[RowsFilter]:
         rows_filter = None
         if self.raw_rows_filter:
             rows_filter = self._validate_rows_filter()
         return rows_filter
 
-    @property
+    @cached_property
     def valid_columns_aggregation(self) -> Optional[ColumnsAggregation]:
         columns_aggregation = None
         if self.raw_columns_aggregation:
             columns_aggregation = self._validate_columns_aggregation()
         return columns_aggregation
 
+    @cached_property
+    def without_aggregation(self) -> "DataFrameFilterValidator":
+        """The same filters without columns aggregation, reusing the already
+        validated ones.
+
+        :return: filter validator without columns aggregation
+        :rtype: DataFrameFilterValidator
+        """
+        df_filter = copy.copy(self)
+        df_filter.raw_columns_aggregation = None
+        df_filter.__dict__.pop("valid_columns_aggregation", None)  # noqa: WPS609
+        return df_filter
+
+    def validate(self) -> None:
+        """Validate all the filters, keeping the validated ones.
+
+        :raises FilterValidationError: If any validation error occurs
+        """
+        # the cached properties validate the filters on first access
+        self.valid_columns_aggregation  # noqa: WPS428
+        self.valid_columns_filter  # noqa: WPS428
+        self.valid_rows_filter  # noqa: WPS428
+
     def _validate_column_value(self, column: str, comp_value: str, field: Optional[str] = None) -> Any:
         val_type = self._get_type_from_schema(column, field)
         try:
@@ -210,3 +237,37 @@ class DataFrameFilterValidator:
             column_definition = schema.get("definitions", {}).get(def_name, {})
 
         return column_definition
+
+
+@lru_cache(maxsize=FILTER_PLAN_CACHE_SIZE)
+def get_filter_plan(
+    model: Type[BaseModel],
+    raw_columns_filter: Optional[str] = None,
+    raw_rows_filter: Optional[str] = None,
+    raw_columns_aggregation: Optional[str] = None,
+) -> DataFrameFilterValidator:
+    """Get the validated filters shared across requests.
+
+    Models are resolved per content schema version, so the model class and
+    raw filters identify the plan. Invalid filters are not cached.
+
+    :param model: data model
+    :type model: Type[BaseModel]
+    :param raw_columns_filter: columns filter, defaults to None
+    :type raw_columns_filter: Optional[str]
+    :param raw_rows_filter: rows filter, defaults to None
+    :type raw_rows_filter: Optional[str]
+    :param raw_columns_aggregation: columns aggregation, defaults to None
+    :type raw_columns_aggregation: Optional[str]
+    :raises FilterValidationError: If any validation error occurs
+    :return: validated filters
+    :rtype: DataFrameFilterValidator
+    """
+    df_filter = DataFrameFilterValidator(
+        model=model,
+        raw_columns_filter=raw_columns_filter,
+        raw_rows_filter=raw_rows_filter,
+        raw_columns_aggregation=raw_columns_aggregation,
+    )
+    df_filter.validate()
+    return df_filter
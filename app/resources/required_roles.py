@@ -17,3 +17,9 @@ class RecordRequiredRoles:
 
     RECORD_READ_ROLES = ["users.datalake.viewers"]
     RECORD_MANAGE_ROLES = ["users.datalake.editors", "users.datalake.admins"]
+
+
+class AdminRequiredRoles:
+    """Class contains the OSDU roles of the admin endpoints."""
+
+    ADMIN_ROLES = ["users.datalake.admins"]
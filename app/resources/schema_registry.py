@@ -0,0 +1,126 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Type
+
+import jsonref
+from loguru import logger
+from pydantic import BaseModel
+
+DOT = "."
+ARRAY = "[]"
+
+
+class PropertyInfo(NamedTuple):
+    name: str
+    type: str
+    is_array: bool = False
+
+
+class SchemaEntry(NamedTuple):
+    schema: dict
+    expanded_schema: dict
+    schema_json: bytes
+    prop_infos: Dict[str, PropertyInfo]
+
+
+@lru_cache(maxsize=None)
+def get_schema_entry(model: Type[BaseModel]) -> SchemaEntry:
+    """Get the schema of a data model, built once per model.
+
+    :param model: data model
+    :type model: Type[BaseModel]
+    :return: the model schema, its dereferenced version, its json encoding
+        and the property info by dotted property name
+    :rtype: SchemaEntry
+    """
+    schema = model.schema()
+    expanded_schema = jsonref.loads(json.dumps(schema))
+    return SchemaEntry(
+        schema=schema,
+        expanded_schema=expanded_schema,
+        # same encoding as JSONResponse
+        schema_json=json.dumps(schema, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8"),
+        prop_infos=get_prop_infos(expanded_schema),
+    )
+
+
+def init_schema_registry(models: Iterable[Type[BaseModel]]) -> None:
+    """Build the schema entries of the given data models.
+
+    :param models: data models
+    :type models: Iterable[Type[BaseModel]]
+    """
+    for model in set(models):
+        get_schema_entry(model)
+    models_count = get_schema_entry.cache_info().currsize
+    logger.info(f"Schema registry built for {models_count} models")
+
+
+def get_prop_infos(expanded_schema: dict) -> Dict[str, PropertyInfo]:
+    """Flatten the properties of an expanded schema.
+
+    Keys are dotted property names, array markers are only kept in the
+    property info names, e.g. "Column.ArrayProperty.field" ->
+    "Column.ArrayProperty[].field".
+
+    :param expanded_schema: schema without references
+    :type expanded_schema: dict
+    :return: property info by dotted property name
+    :rtype: Dict[str, PropertyInfo]
+    """
+    prop_infos = {}
+    stack = [([], [], expanded_schema, ())]
+    while stack:
+        prop_names, info_names, prop_schema, parents = stack.pop()
+        # references are resolved to the same definition, recursive ones are not followed
+        schema_id = id(getattr(prop_schema, "__subject__", prop_schema))
+        prop_schema = merge_all_of(prop_schema)
+        properties, info_parent_names = _get_child_properties(prop_schema, info_names)
+        if properties is None or schema_id in parents:
+            continue
+        for prop_name, child_schema in properties.items():
+            child_prop_names = [*prop_names, prop_name]
+            child_info_names = [*info_parent_names, prop_name]
+            child_type = child_schema.get("type")
+            prop_infos[DOT.join(child_prop_names)] = PropertyInfo(
+                name=DOT.join(child_info_names),
+                type=child_type,
+                is_array=child_type == "array",
+            )
+            stack.append((child_prop_names, child_info_names, child_schema, (*parents, schema_id)))
+    return prop_infos
+
+
+def merge_all_of(prop_schema: dict) -> dict:
+    if "allOf" in prop_schema:
+        new_prop_schema = {}
+        for schema in prop_schema.get("allOf"):
+            new_prop_schema.update(schema)
+        prop_schema = new_prop_schema
+    return prop_schema
+
+
+def _get_child_properties(prop_schema: dict, info_names: List[str]) -> tuple:
+    properties: Optional[dict] = None
+    match prop_schema.get("type"):
+        case "object":
+            properties = prop_schema.get("properties")
+        case "array" if info_names:
+            properties = prop_schema.get("items", {}).get("properties")
+            array_name = info_names[-1]
+            info_names = [*info_names[:-1], f"{array_name}{ARRAY}"]
+    return properties, info_names
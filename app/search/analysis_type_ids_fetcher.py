@@ -16,6 +16,10 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple
 
 from app.api.routes.utils.search import get_valid_ids_from_ddms_datasets
+from app.core.helpers.cache.cache_tags import (
+    add_cache_tags,
+    get_analysis_type_tag,
+)
 from app.models.domain.osdu.base import SAMPLESANALYSIS_KIND
 from app.resources.paths import SAMPLESANALYSIS_TYPE_MAPPING
 from app.services import search
@@ -48,21 +52,11 @@ class SearchServiceSamplesAnalysisTypeIdsFetcher(SamplesAnalysisTypeIdsFetcher):
     ):
         """Performs a query to search service to build a list of tuples
         dataset_id, samples_analysis_id."""
+        add_cache_tags(get_analysis_type_tag(data_partition_id, analysis_type))
         query = self._build_sampleanalysistype_query(data_partition_id, SAMPLESANALYSIS_TYPE_MAPPING[analysis_type])
 
         result_records = []
-        cursor = None
-        while True:
-            search_response = await self._search_service.find_records(
-                kind=SAMPLESANALYSIS_KIND,
-                query=query,
-                limit=search.QUERY_LIMIT,
-                cursor=cursor,
-            )
-            records = search_response.get("results", [])
-            cursor = search_response.get("cursor", None)
-            if not records:
-                break
+        async for records in search.iter_search_pages(self._search_service, kind=SAMPLESANALYSIS_KIND, query=query):
             result_records.extend(records)
 
         return self._build_result_ids(result_records, target_schema_version, analysis_type)
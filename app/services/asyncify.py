@@ -13,38 +13,251 @@
 #  limitations under the License.
 
 import asyncio
+import multiprocessing
 import os
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial, wraps
-from typing import Any, Callable, Optional, TypeVar
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
 
-TFunc = TypeVar("TFunc", bound=Callable[..., Any])
+from loguru import logger
+from prometheus_client import Gauge
+from starlette.requests import Request
+
+from app.core.settings.app import AppSettings
+from app.exceptions.exceptions import ClientDisconnectedException
+
+TResult = TypeVar("TResult")
 
 DEFAULT_MAX_WORKERS = 32
 EXTRA_WORKERS = 4
 
+WORKER_POOL_TASKS = Gauge(
+    "rafs_worker_pool_tasks",
+    "Number of tasks submitted to the worker pool by state",
+    ["pool", "state"],
+)
+
+
+# set in the tasks not serving a client, e.g. background cache refreshes
+_is_detached: ContextVar[bool] = ContextVar("is_detached", default=False)
+
+
+class PoolName:
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class TaskState:
+    QUEUED = "queued"
+    RUNNING = "running"
+
+
+def get_default_max_workers() -> int:
+    return min(DEFAULT_MAX_WORKERS, (os.cpu_count() or 1) + EXTRA_WORKERS)
+
+
+class WorkerPool:
+    """Long-lived executor to run CPU-bound work out of the event loop."""
+
+    def __init__(self, name: str, executor: Executor) -> None:
+        """Init.
+
+        :param name: pool name used in metrics
+        :type name: str
+        :param executor: executor running the tasks
+        :type executor: Executor
+        """
+        self._name = name
+        self._executor = executor
+        self._queued = WORKER_POOL_TASKS.labels(name, TaskState.QUEUED)
+        self._running = WORKER_POOL_TASKS.labels(name, TaskState.RUNNING)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def run(self, func: Callable[..., TResult], *args: Any, **kwargs: Any) -> TResult:
+        """Run func in the pool and wait for its result.
+
+        If the awaiting task is cancelled (e.g. the client disconnected),
+        the work is cancelled as well unless it has already started.
+
+        :param func: function to run
+        :type func: Callable[..., TResult]
+        :return: func result
+        :rtype: TResult
+        """
+        future = self._submit(partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, job: Callable[[], TResult]) -> Future:
+        self._queued.inc()
+        if isinstance(self._executor, ThreadPoolExecutor):
+            future = self._executor.submit(self._run_tracked, job)
+            future.add_done_callback(self._untrack_cancelled)
+        else:
+            # running state can't be observed from other processes
+            future = self._executor.submit(job)
+            future.add_done_callback(lambda _: self._queued.dec())
+        return future
+
+    def _run_tracked(self, job: Callable[[], TResult]) -> TResult:
+        self._queued.dec()
+        with self._running.track_inprogress():
+            return job()
+
+    def _untrack_cancelled(self, future: Future) -> None:
+        if future.cancelled():
+            self._queued.dec()
+
+
+_worker_pools: Dict[str, WorkerPool] = {}
+
+
+def init_worker_pools(settings: AppSettings) -> None:
+    """Create the process-wide worker pools.
+
+    :param settings: app settings
+    :type settings: AppSettings
+    """
+    shutdown_worker_pools()
+    thread_workers = settings.worker_pool_max_workers or get_default_max_workers()
+    _worker_pools[PoolName.THREAD] = WorkerPool(
+        PoolName.THREAD,
+        ThreadPoolExecutor(max_workers=thread_workers, thread_name_prefix="rafs-worker"),
+    )
+    logger.info(f"Thread worker pool started with {thread_workers} workers")
+
+    if settings.worker_process_pool_max_workers:
+        _worker_pools[PoolName.PROCESS] = WorkerPool(
+            PoolName.PROCESS,
+            ProcessPoolExecutor(
+                max_workers=settings.worker_process_pool_max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ),
+        )
+        logger.info(f"Process worker pool started with {settings.worker_process_pool_max_workers} workers")
+
+
+def shutdown_worker_pools() -> None:
+    """Shutdown the worker pools cancelling pending tasks."""
+    while _worker_pools:
+        _, worker_pool = _worker_pools.popitem()
+        worker_pool.shutdown()
+
+
+def get_worker_pool(name: str = PoolName.THREAD) -> Optional[WorkerPool]:
+    """Get worker pool by name.
+
+    The thread pool is always available, created on demand if the app
+    startup was skipped (e.g. scripts or tests).
+
+    :param name: pool name, defaults to PoolName.THREAD
+    :type name: str
+    :return: the worker pool, None if not enabled
+    :rtype: Optional[WorkerPool]
+    """
+    if name == PoolName.THREAD and name not in _worker_pools:
+        _worker_pools[name] = WorkerPool(
+            name,
+            ThreadPoolExecutor(max_workers=get_default_max_workers(), thread_name_prefix="rafs-worker"),
+        )
+    return _worker_pools.get(name)
 
-def run_in_threadpool(method: TFunc) -> TFunc:
-    """Run the decorated method in a thread pool.
 
-    :param method: The method to decorate
-    :type method: TFunc
-    :return: The decorated method
-    :rtype: TFunc
+async def run_in_threadpool(func: Callable[..., TResult], *args: Any, **kwargs: Any) -> TResult:
+    """Run GIL-releasing work (e.g. Arrow decoding) in the shared thread pool.
+
+    :param func: function to run
+    :type func: Callable[..., TResult]
+    :return: func result
+    :rtype: TResult
     """
-    @wraps(method)
-    def wrapper(
-        self: Any,
-        *args: Any,
-        loop: Optional[asyncio.AbstractEventLoop] = None,
-        max_workers: Optional[int] = None,
-        **kwargs: Any,
-    ) -> Any:
-        if loop is None:
-            loop = asyncio.get_event_loop()
-        if max_workers is None:
-            max_workers = min(DEFAULT_MAX_WORKERS, (os.cpu_count() or 1) + EXTRA_WORKERS)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            pfunc = partial(method, self, *args, **kwargs)
-            return loop.run_in_executor(executor, pfunc)
-    return wrapper
+    return await get_worker_pool(PoolName.THREAD).run(func, *args, **kwargs)
+
+
+async def run_in_processpool(func: Callable[..., TResult], *args: Any, **kwargs: Any) -> TResult:
+    """Run pandas-heavy work in the shared process pool.
+
+    Falls back to the thread pool if the process pool is not enabled. func
+    and arguments must be picklable.
+
+    :param func: function to run
+    :type func: Callable[..., TResult]
+    :return: func result
+    :rtype: TResult
+    """
+    worker_pool = get_worker_pool(PoolName.PROCESS) or get_worker_pool(PoolName.THREAD)
+    return await worker_pool.run(func, *args, **kwargs)
+
+
+async def run_until_disconnected(request: Request, job: Awaitable[TResult], poll_interval: float) -> TResult:
+    """Await a job, cancelled once the client of the request disconnects.
+
+    Worker pool tasks of the job are cancelled unless already started.
+    Jobs of detached tasks are never cancelled, as their request may
+    have been answered already.
+
+    :param request: the request of the client
+    :type request: Request
+    :param job: the job, e.g. a worker pool run
+    :type job: Awaitable[TResult]
+    :param poll_interval: seconds between checks of the client
+        connection
+    :type poll_interval: float
+    :raises ClientDisconnectedException: if the client disconnected
+        before the job was done
+    :return: the job result
+    :rtype: TResult
+    """
+    if _is_detached.get():
+        return await job
+    job_task = asyncio.ensure_future(job)
+    try:
+        is_disconnected = await _wait_or_disconnect(request, job_task, poll_interval)
+    except asyncio.CancelledError:
+        job_task.cancel()
+        raise
+    if is_disconnected:
+        job_task.cancel()
+        # let the job cancel its worker pool tasks before giving up on it
+        await asyncio.wait({job_task})
+        raise ClientDisconnectedException()
+    return job_task.result()
+
+
+async def run_detached(func: Callable[[], Awaitable[TResult]]) -> TResult:
+    """Run func for no client in particular, so its jobs go on once the
+    client of the current request disconnects.
+
+    Meant to be the function of a new task, the detached state is only
+    set in the task context.
+
+    :param func: function to run
+    :type func: Callable[[], Awaitable[TResult]]
+    :return: func result
+    :rtype: TResult
+    """
+    _is_detached.set(True)
+    return await func()
+
+
+async def _wait_or_disconnect(request: Request, job_task: asyncio.Future, poll_interval: float) -> bool:
+    while not job_task.done():
+        await asyncio.wait({job_task}, timeout=poll_interval)
+        if not job_task.done() and await request.is_disconnected():
+            return True
+    return False
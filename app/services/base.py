@@ -15,9 +15,23 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+RecordVersions = List[Optional[int]]
+
 
 class IStorageService(ABC):
 
+    @property
+    @abstractmethod
+    def data_partition_id(self) -> str:
+        """Data partition id of the records.
+
+        :raises NotImplementedError: property is supposed to be
+            implemented
+        :return: data partition id
+        :rtype: str
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     async def get_record(self, record_id: str, version: Optional[str] = None) -> dict:
         """Get record.
@@ -83,6 +97,28 @@ class IStorageService(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    async def get_records_batch(
+        self,
+        record_ids: List[str],
+        versions: Optional[RecordVersions] = None,
+        skip_missing: bool = False,
+    ) -> List[dict]:
+        """Get records in batches.
+
+        :param record_ids: record ids
+        :type record_ids: List[str]
+        :param versions: version of each record, defaults to None
+        :type versions: Optional[RecordVersions]
+        :param skip_missing: skip the missing records, defaults to False
+        :type skip_missing: bool
+        :raises NotImplementedError: method is supposed to be
+            implemented
+        :return: records
+        :rtype: List[dict]
+        """
+        raise NotImplementedError()
+
 
 class IDatasetService(ABC):
 
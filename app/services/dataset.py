@@ -14,14 +14,23 @@
 
 import asyncio
 import sys
+from functools import partial
 from typing import List, Optional, Tuple
 
-from fastapi_cache.decorator import cache
 from loguru import logger
 from starlette import status
 
-from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+from app.api.routes.utils.records import get_id_version
+from app.core.helpers.cache.cache_tags import (
+    add_cache_tags,
+    get_dataset_tag,
+    invalidate_cache_tags,
+)
+from app.core.helpers.cache.content_cache import get_content
+from app.core.helpers.cache.signed_url_cache import get_signed_url_cache
+from app.core.helpers.cache.single_flight import SingleFlight
 from app.core.settings.app import AppSettings
+from app.exceptions.exceptions import UnprocessableContentException
 from app.models.schemas.user import User
 from app.providers.dependencies.blob_loader import get_blob_loader
 from app.services.base import IDatasetService
@@ -29,6 +38,9 @@ from app.services.error_handlers import handle_core_services_http_status_error
 from app.services.osdu_clients.dataset_client import DatasetServiceApiClient
 from app.services.utils.dataset import create_default_dataset_record
 
+# downloaded files are immutable, so the results aren't copied
+_download_flights = SingleFlight(copy_results=False)
+
 
 class DatasetService(IDatasetService):
 
@@ -48,25 +60,29 @@ class DatasetService(IDatasetService):
         )
         self.blob_loader = get_blob_loader(settings)
         self.name = "DatasetService"
+        self._data_partition_id = data_partition_id
+        self._caller_key = (data_partition_id, user.access_token)
+
+    @property
+    def data_partition_id(self) -> str:
+        return self._data_partition_id
 
     async def download_file(self, dataset_id: str) -> Optional[bytes]:
         """Download file.
 
-        :param dataset_id: dataset id
+        The signed url of a versioned dataset is kept for the caller, as
+        the file of an unversioned one changes once it is updated, and
+        its file is kept in the content cache.
+
+        :param dataset_id: dataset id, with its version if known
         :type dataset_id: str
         :return: file content
         :rtype: Optional[bytes]
         """
-        retrieval_instruction = await self.dataset_client.get_retrieval_instructions(dataset_id)
-        if retrieval_instruction.get("datasets"):
-            signed_url = retrieval_instruction["datasets"][0]["retrievalProperties"]["signedUrl"]
-            blob = await self.blob_loader.download_blob(signed_url)
-            logger.debug(f"{self.name}: blob has been downloaded for: {dataset_id}")
-            return blob
-        else:
-            logger.debug(
-                f"{self.name}: blob hasn't been downloaded due to improper retrieval instructions for: {dataset_id}.",
-            )
+        # concurrent downloads of the same dataset by the same caller share one request
+        blob, _ = await _download_flights.run((*self._caller_key, dataset_id), partial(self._download_file, dataset_id))
+        add_cache_tags(get_dataset_tag(get_id_version(dataset_id)[0]))
+        return blob
 
     async def upload_file(
         self, blob_file: bytes, dataset_id: str, parent_record: dict,
@@ -102,8 +118,18 @@ class DatasetService(IDatasetService):
         registered_dataset = await self.dataset_client.create_or_update_dataset_registry(dataset_registries=record_list)
 
         stored_dataset = registered_dataset["datasetRegistries"][0]
+        await invalidate_cache_tags([get_dataset_tag(dataset_id)])
         return f"{stored_dataset['id']}:{stored_dataset['version']}"
 
+    def discard_signed_url(self, dataset_id: str) -> None:
+        """Discard the kept signed url of a dataset, e.g. once rejected,
+        so the next request gets a new one.
+
+        :param dataset_id: dataset id
+        :type dataset_id: str
+        """
+        get_signed_url_cache().discard(self._caller_key, [dataset_id])
+
     @handle_core_services_http_status_error(
         expected_codes=[
             status.HTTP_401_UNAUTHORIZED,
@@ -111,19 +137,25 @@ class DatasetService(IDatasetService):
         ],
         detail="Failed to get signed urls using DatasetService.",
     )
-    @cache(expire=CACHE_DEFAULT_TTL)
     async def get_signed_urls(self, dataset_ids: List[str]) -> List[Tuple[str, str]]:
         """Get a signed url per dataset id for a list of dataset_ids.
 
+        Signed urls of versioned datasets are kept until shortly before
+        they expire, so only the dataset ids without a valid url are
+        requested.
+
         :param dataset_ids: list of dataset ids
         :type dataset_ids: List[str]
         :raises exc: if dataset service raises error
         :return: a list of pairs dataset_id, signed_url
         :rtype: List[Tuple[str, str]]
         """
+        signed_url_cache = get_signed_url_cache()
+        cached_urls = signed_url_cache.get_many(self._caller_key, filter(_is_versioned, dataset_ids))
+        missing_ids = [dataset_id for dataset_id in dataset_ids if dataset_id not in cached_urls]
         max_ids_per_request = 20
         id_chunks = [
-            dataset_ids[ix: ix + max_ids_per_request] for ix in range(0, len(dataset_ids), max_ids_per_request)
+            missing_ids[ix: ix + max_ids_per_request] for ix in range(0, len(missing_ids), max_ids_per_request)
         ]
         tasks = []
         try:
@@ -134,10 +166,21 @@ class DatasetService(IDatasetService):
             for exc in eg.exceptions:  # noqa: WPS328 pylint: disable=not-an-iterable
                 raise exc
 
-        signed_urls = []
+        requested_urls = []
         for task in tasks:
-            signed_urls.extend(task.result())
-        return signed_urls
+            requested_urls.extend(task.result())
+        signed_url_cache.add(
+            self._caller_key,
+            [(dataset_id, signed_url) for dataset_id, signed_url in requested_urls if _is_versioned(dataset_id)],
+        )
+        if not cached_urls:
+            return requested_urls
+
+        # keep the order of dataset_ids
+        signed_urls = {**cached_urls, **dict(requested_urls)}
+        return [
+            (dataset_id, signed_urls[dataset_id]) for dataset_id in dataset_ids if dataset_id in signed_urls
+        ]
 
     async def _request_signed_urls(self, dataset_ids: List[str]) -> List[Tuple[str, str]]:
         """Performs the actual dataset request to fetch signed urls.
@@ -152,3 +195,50 @@ class DatasetService(IDatasetService):
         for dataset in retrieval_instructions["datasets"]:
             signed_urls.append((dataset["datasetRegistryId"], dataset["retrievalProperties"]["signedUrl"]))
         return signed_urls
+
+    async def _download_file(self, dataset_id: str) -> Optional[bytes]:
+        # the retrieval instructions check the caller may read the dataset, so the
+        # signed url is got before the file is served from the content cache
+        signed_url = await self._get_signed_url(dataset_id)
+        if signed_url is None:
+            return None
+        return await get_content(
+            self.data_partition_id,
+            dataset_id if _is_versioned(dataset_id) else None,
+            partial(self._download_blob, dataset_id, signed_url),
+        )
+
+    async def _get_signed_url(self, dataset_id: str) -> Optional[str]:
+        signed_url_cache = get_signed_url_cache()
+        is_versioned = _is_versioned(dataset_id)
+        signed_url = signed_url_cache.get(self._caller_key, dataset_id) if is_versioned else None
+        if signed_url is not None:
+            return signed_url
+        retrieval_instruction = await self.dataset_client.get_retrieval_instructions(dataset_id)
+        if not retrieval_instruction.get("datasets"):
+            reason = f"improper retrieval instructions for: {dataset_id}."
+            logger.debug(f"{self.name}: blob hasn't been downloaded due to {reason}")
+            return None
+        signed_url = retrieval_instruction["datasets"][0]["retrievalProperties"]["signedUrl"]
+        if is_versioned:
+            signed_url_cache.add(self._caller_key, [(dataset_id, signed_url)])
+        return signed_url
+
+    async def _download_blob(self, dataset_id: str, signed_url: str) -> bytes:
+        try:
+            blob = await self.blob_loader.download_blob(signed_url)
+        except Exception:  # noqa: B902
+            # each blob loader raises its own errors, the url may have been revoked
+            # so the next download gets a new one
+            get_signed_url_cache().discard(self._caller_key, [dataset_id])
+            raise
+        logger.debug(f"{self.name}: blob has been downloaded for: {dataset_id}")
+        return blob
+
+
+def _is_versioned(dataset_id: str) -> bool:
+    try:
+        _, dataset_version = get_id_version(dataset_id)
+    except UnprocessableContentException:
+        return False
+    return dataset_version is not None
@@ -15,11 +15,11 @@
 from starlette import status
 
 from app.core.settings.app import AppSettings
-from app.dev.services.osdu_clients.entitlements_client import (
-    EntitlementsServiceApiClient,
-)
 from app.models.schemas.user import User
 from app.services.error_handlers import handle_core_services_http_status_error
+from app.services.osdu_clients.entitlements_client import (
+    EntitlementsServiceApiClient,
+)
 
 
 class EntitlementsService:
@@ -14,7 +14,6 @@
 
 from typing import List, NamedTuple
 
-import httpx
 from loguru import logger
 
 from app.resources.common_headers import (
@@ -22,7 +21,7 @@ from app.resources.common_headers import (
     CONTENT_TYPE,
     DATA_PARTITION_ID,
 )
-from app.services.osdu_clients.conf import DEFAULT_RETRIES, TIMEOUT
+from app.services.osdu_clients.http_client import get_http_client
 
 
 class DatasetServicePaths(NamedTuple):
@@ -69,16 +68,14 @@ class DatasetServiceApiClient(object):
             uploading file
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            q_params = {"kindSubType": kind_subtype}
-            response = await client.post(
-                DatasetServicePaths.STORAGE_INSTRUCTIONS, headers=self.headers, params=q_params,
-            )
-            logger.debug(f"{self.name}: storage instructions response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        q_params = {"kindSubType": kind_subtype}
+        response = await client.post(
+            DatasetServicePaths.STORAGE_INSTRUCTIONS, headers=self.headers, params=q_params,
+        )
+        logger.debug(f"{self.name}: storage instructions response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_storage_instructions(self, kind_subtype: str) -> dict:
         """Get storage instructions for file uploading.
@@ -89,16 +86,14 @@ class DatasetServiceApiClient(object):
             uploading file
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            q_params = {"kindSubType": kind_subtype}
-            response = await client.get(
-                DatasetServicePaths.GET_STORAGE_INSTRUCTIONS, headers=self.headers, params=q_params,
-            )
-            logger.debug(f"{self.name}: get storage instructions response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        q_params = {"kindSubType": kind_subtype}
+        response = await client.get(
+            DatasetServicePaths.GET_STORAGE_INSTRUCTIONS, headers=self.headers, params=q_params,
+        )
+        logger.debug(f"{self.name}: get storage instructions response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def retrieval_instructions(self, dataset_ids: List[str]) -> dict:
         """Get retrieval instructions for a list of datasets to download.
@@ -110,20 +105,18 @@ class DatasetServiceApiClient(object):
             the dataset file sources
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            request_body = {
-                "datasetRegistryIds": dataset_ids,
-            }
-
-            response = await client.post(
-                DatasetServicePaths.RETRIEVAL_INSTRUCTIONS,
-                headers=self.headers,
-                json=request_body,
-            )
-            logger.debug(f"{self.name}: retrieval instructions response: {response}")
-            response.raise_for_status()
+        client = get_http_client(self.base_url)
+        request_body = {
+            "datasetRegistryIds": dataset_ids,
+        }
+
+        response = await client.post(
+            DatasetServicePaths.RETRIEVAL_INSTRUCTIONS,
+            headers=self.headers,
+            json=request_body,
+        )
+        logger.debug(f"{self.name}: retrieval instructions response: {response}")
+        response.raise_for_status()
         return response.json()
 
     async def get_retrieval_instructions(self, dataset_id: str) -> dict:
@@ -136,19 +129,17 @@ class DatasetServiceApiClient(object):
             the dataset file source
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            q_params = {"id": dataset_id}
-
-            response = await client.get(
-                DatasetServicePaths.RETRIEVAL_INSTRUCTIONS,
-                headers=self.headers,
-                params=q_params,
-            )
-            logger.debug(f"{self.name}: get retrieval instructions response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        q_params = {"id": dataset_id}
+
+        response = await client.get(
+            DatasetServicePaths.RETRIEVAL_INSTRUCTIONS,
+            headers=self.headers,
+            params=q_params,
+        )
+        logger.debug(f"{self.name}: get retrieval instructions response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def create_or_update_dataset_registry(self, dataset_registries: List[dict]) -> dict:
         """Create or update dataset registry.
@@ -158,16 +149,14 @@ class DatasetServiceApiClient(object):
         :return: response
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            request_body = {
-                "datasetRegistries": dataset_registries,
-            }
-            response = await client.put(DatasetServicePaths.REGISTER_DATASET, headers=self.headers, json=request_body)
-            logger.debug(f"{self.name}: put dataset registry response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        request_body = {
+            "datasetRegistries": dataset_registries,
+        }
+        response = await client.put(DatasetServicePaths.REGISTER_DATASET, headers=self.headers, json=request_body)
+        logger.debug(f"{self.name}: put dataset registry response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_dataset_registry(self, dataset_id: str) -> dict:
         """Get dataset registry.
@@ -177,17 +166,15 @@ class DatasetServiceApiClient(object):
         :return: the dataset registry
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            q_params = {"id": dataset_id}
-
-            response = await client.get(
-                DatasetServicePaths.GET_DATASET_REGISTRY, headers=self.headers, params=q_params,
-            )
-            logger.debug(f"{self.name}: get dataset registry response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        q_params = {"id": dataset_id}
+
+        response = await client.get(
+            DatasetServicePaths.GET_DATASET_REGISTRY, headers=self.headers, params=q_params,
+        )
+        logger.debug(f"{self.name}: get dataset registry response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_dataset_registries(self, dataset_ids: List[str]) -> dict:
         """Get dataset registries.
@@ -197,27 +184,14 @@ class DatasetServiceApiClient(object):
         :return: the dataset registries
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            request_body = {
-                "datasetRegistryIds": dataset_ids,
-            }
-
-            response = await client.post(
-                DatasetServicePaths.GET_DATASET_REGISTRY, headers=self.headers, json=request_body,
-            )
-            logger.debug(f"{self.name}: get dataset registries response: {response}")
-            response.raise_for_status()
-            return response.json()
-
-    def _transport(self, retries: int = DEFAULT_RETRIES, **kwargs) -> httpx.AsyncHTTPTransport:
-        """Create a new transport object.
-
-        :param retries: the number of retries, defaults to
-            DEFAULT_RETRIES
-        :type retries: int, optional
-        :return: A new transport object
-        :rtype: httpx.AsyncHTTPTransport
-        """
-        return httpx.AsyncHTTPTransport(retries=retries, **kwargs)
+        client = get_http_client(self.base_url)
+        request_body = {
+            "datasetRegistryIds": dataset_ids,
+        }
+
+        response = await client.post(
+            DatasetServicePaths.GET_DATASET_REGISTRY, headers=self.headers, json=request_body,
+        )
+        logger.debug(f"{self.name}: get dataset registries response: {response}")
+        response.raise_for_status()
+        return response.json()
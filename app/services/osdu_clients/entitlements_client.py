@@ -14,7 +14,6 @@
 
 from typing import NamedTuple
 
-import httpx
 from loguru import logger
 
 from app.resources.common_headers import (
@@ -22,7 +21,7 @@ from app.resources.common_headers import (
     CONTENT_TYPE,
     DATA_PARTITION_ID,
 )
-from app.services.osdu_clients.conf import DEFAULT_RETRIES, TIMEOUT
+from app.services.osdu_clients.http_client import get_http_client
 
 
 class EntitlementsServicePaths(NamedTuple):
@@ -61,20 +60,8 @@ class EntitlementsServiceApiClient(object):
         :return: the list of groups the user belongs to
         :rtype: list
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.get(EntitlementsServicePaths.GROUPS, headers=self.headers)
-            logger.debug(f"{self.name}: groups response: {response}")
-            response.raise_for_status()
-            return response.json()
-
-    def _transport(self, retries: int = DEFAULT_RETRIES, **kwargs) -> httpx.AsyncHTTPTransport:
-        """Create a new transport object.
-
-        :param retries: the number of retries, defaults to RETRIES
-        :type retries: int, optional
-        :return: A new transport object
-        :rtype: httpx.AsyncHTTPTransport
-        """
-        return httpx.AsyncHTTPTransport(retries=retries, **kwargs)
+        client = get_http_client(self.base_url)
+        response = await client.get(EntitlementsServicePaths.GROUPS, headers=self.headers)
+        logger.debug(f"{self.name}: groups response: {response}")
+        response.raise_for_status()
+        return response.json()
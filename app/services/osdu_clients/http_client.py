@@ -0,0 +1,116 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from importlib.util import find_spec
+from typing import Dict, NamedTuple, Set
+
+import httpx
+from loguru import logger
+
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.services.osdu_clients.conf import DEFAULT_RETRIES, TIMEOUT
+
+# HTTP/2 is only negotiated when the optional 'h2' package is installed
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+class PooledClient(NamedTuple):
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+
+
+_http_clients: Dict[str, PooledClient] = {}
+_closing_tasks: Set[asyncio.Task] = set()
+
+
+def get_http_client(base_url: str = "") -> httpx.AsyncClient:
+    """Get the application-lifetime client of an upstream service.
+
+    Connections are kept alive and reused across requests, so auth and
+    correlation headers must be passed per request.
+
+    :param base_url: upstream service base url, defaults to "" for
+        absolute urls (e.g. signed urls)
+    :type base_url: str
+    :return: pooled http client
+    :rtype: httpx.AsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    pooled_client = _http_clients.get(base_url)
+    if pooled_client is None or pooled_client.client.is_closed or pooled_client.loop is not loop:
+        if pooled_client is not None and not pooled_client.client.is_closed:
+            _close_in_background(pooled_client.client)
+        pooled_client = PooledClient(_create_http_client(base_url, get_app_settings()), loop)
+        _http_clients[base_url] = pooled_client
+    return pooled_client.client
+
+
+def init_http_clients(settings: AppSettings) -> None:
+    """Create pooled clients for configured upstream services.
+
+    :param settings: app settings
+    :type settings: AppSettings
+    """
+    service_hosts = {
+        settings.service_host_storage,
+        settings.service_host_dataset,
+        settings.service_host_search,
+        settings.service_host_schema,
+        settings.service_host_partition,
+        settings.service_host_entitlements,
+    }
+    for service_host in filter(None, service_hosts):
+        get_http_client(service_host)
+    http2 = settings.http2_enable and HTTP2_AVAILABLE
+    client_hosts = list(_http_clients)
+    logger.info(f"HTTP clients created for: {client_hosts}; http2: {http2}")
+
+
+async def close_http_clients() -> None:
+    """Close all pooled clients."""
+    while _http_clients:
+        _, pooled_client = _http_clients.popitem()
+        await pooled_client.client.aclose()
+
+
+def _close_in_background(client: httpx.AsyncClient) -> None:
+    # the connections of a client created in another event loop can't be reused
+    closing_task = asyncio.create_task(client.aclose())
+    _closing_tasks.add(closing_task)
+    closing_task.add_done_callback(_on_client_closed)
+
+
+def _on_client_closed(closing_task: asyncio.Task) -> None:
+    _closing_tasks.discard(closing_task)
+    if not closing_task.cancelled() and closing_task.exception() is not None:
+        logger.warning(f"Failed to close a stale HTTP client: {closing_task.exception()}")
+
+
+def _create_http_client(base_url: str, settings: AppSettings) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    http2 = settings.http2_enable and HTTP2_AVAILABLE
+    return httpx.AsyncClient(
+        base_url=base_url,
+        # the client is shared by all the callers, cookies set for one must not be sent for another
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        timeout=TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(retries=DEFAULT_RETRIES, limits=limits, http2=http2),
+    )
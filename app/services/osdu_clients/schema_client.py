@@ -13,17 +13,18 @@
 #  limitations under the License.
 
 import dataclasses
+import hashlib
 from enum import StrEnum
-from typing import Union
+from typing import Optional, Tuple, Union
 
-import httpx
+from starlette import status
 
 from app.resources.common_headers import (
     AUTHORIZATION,
     CONTENT_TYPE,
     DATA_PARTITION_ID,
 )
-from app.services.osdu_clients.conf import DEFAULT_RETRIES, TIMEOUT
+from app.services.osdu_clients.http_client import get_http_client
 
 
 @dataclasses.dataclass
@@ -155,12 +156,10 @@ class SchemaServiceApiClient(object):
             },
             "schema": schema_content,
         }
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.put(SchemaServicePaths.SCHEMA, json=payload, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        response = await client.put(SchemaServicePaths.SCHEMA, json=payload, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
 
     # @cache(expire=CACHE_DEFAULT_TTL)
     async def get_schema(self, schema_id: str) -> dict:
@@ -171,20 +170,31 @@ class SchemaServiceApiClient(object):
         :return: the schema
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.get(f"{SchemaServicePaths.SCHEMA}/{schema_id}", headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-
-    def _transport(self, retries: int = DEFAULT_RETRIES, **kwargs) -> httpx.AsyncHTTPTransport:
-        """Create a new transport object.
-
-        :param retries: the number of retries, defaults to
-            DEFAULT_RETRIES
-        :type retries: int, optional
-        :return: A new transport object
-        :rtype: httpx.AsyncHTTPTransport
+        client = get_http_client(self.base_url)
+        response = await client.get(f"{SchemaServicePaths.SCHEMA}/{schema_id}", headers=self.headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_schema_if_modified(self, schema_id: str, etag: Optional[str] = None) -> Tuple[Optional[dict], str]:
+        """Get the schema from schema service, unless it matches the etag.
+
+        The content hash is used as etag if the service doesn't return
+        one.
+
+        :param schema_id: schema id
+        :type schema_id: str
+        :param etag: etag of the known schema, defaults to None
+        :type etag: Optional[str]
+        :return: the schema, None if not modified, and its etag
+        :rtype: Tuple[Optional[dict], str]
         """
-        return httpx.AsyncHTTPTransport(retries=retries, **kwargs)
+        headers = self.headers if etag is None else {**self.headers, "If-None-Match": etag}
+        client = get_http_client(self.base_url)
+        response = await client.get(f"{SchemaServicePaths.SCHEMA}/{schema_id}", headers=headers)
+        if response.status_code == status.HTTP_304_NOT_MODIFIED:
+            return None, etag
+        response.raise_for_status()
+        response_etag = response.headers.get("ETag") or hashlib.sha256(response.content).hexdigest()
+        if response_etag == etag:
+            return None, etag
+        return response.json(), response_etag
@@ -14,7 +14,6 @@
 
 from typing import NamedTuple
 
-import httpx
 from loguru import logger
 
 from app.resources.common_headers import (
@@ -22,7 +21,7 @@ from app.resources.common_headers import (
     CONTENT_TYPE,
     DATA_PARTITION_ID,
 )
-from app.services.osdu_clients.conf import DEFAULT_RETRIES, TIMEOUT
+from app.services.osdu_clients.http_client import get_http_client
 
 
 class SearchServicePaths(NamedTuple):
@@ -64,13 +63,11 @@ class SearchServiceApiClient(object):
         :return: query result
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.post(SearchServicePaths.QUERY, json=query, headers=self.headers)
-            logger.debug(f"{self.name}: query response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        response = await client.post(SearchServicePaths.QUERY, json=query, headers=self.headers)
+        logger.debug(f"{self.name}: query response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def query_with_cursor(self, query: dict) -> dict:
         """Performa query to the osdu search service.
@@ -80,21 +77,8 @@ class SearchServiceApiClient(object):
         :return: query with cursor result
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.post(SearchServicePaths.CURSOR_QUERY, json=query, headers=self.headers)
-            logger.debug(f"{self.name}: query with cursor response: {response}")
-            response.raise_for_status()
-            return response.json()
-
-    def _transport(self, retries: int = DEFAULT_RETRIES, **kwargs) -> httpx.AsyncHTTPTransport:
-        """Create a new transport object.
-
-        :param retries: the number of retries, defaults to
-            DEFAULT_RETRIES
-        :type retries: int, optional
-        :return: A new transport object
-        :rtype: httpx.AsyncHTTPTransport
-        """
-        return httpx.AsyncHTTPTransport(retries=retries, **kwargs)
+        client = get_http_client(self.base_url)
+        response = await client.post(SearchServicePaths.CURSOR_QUERY, json=query, headers=self.headers)
+        logger.debug(f"{self.name}: query with cursor response: {response}")
+        response.raise_for_status()
+        return response.json()
@@ -14,7 +14,6 @@
 
 from typing import List, NamedTuple
 
-import httpx
 from loguru import logger
 
 from app.resources.common_headers import (
@@ -22,7 +21,7 @@ from app.resources.common_headers import (
     CONTENT_TYPE,
     DATA_PARTITION_ID,
 )
-from app.services.osdu_clients.conf import DEFAULT_RETRIES, TIMEOUT
+from app.services.osdu_clients.http_client import get_http_client
 
 
 class StorageServicePaths(NamedTuple):
@@ -64,13 +63,11 @@ class StorageServiceApiClient(object):
         :return: created or updated records ids
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.put(StorageServicePaths.RECORDS, json=records, headers=self.headers)
-            logger.debug(f"{self.name}: upsert records response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        response = await client.put(StorageServicePaths.RECORDS, json=records, headers=self.headers)
+        logger.debug(f"{self.name}: upsert records response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_latest_record(self, record_id: str) -> dict:
         """Get latest version of record.
@@ -80,13 +77,11 @@ class StorageServiceApiClient(object):
         :return: record
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.get(f"{StorageServicePaths.RECORDS}/{record_id}", headers=self.headers)
-            logger.debug(f"{self.name}: get latest version of record response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        response = await client.get(f"{StorageServicePaths.RECORDS}/{record_id}", headers=self.headers)
+        logger.debug(f"{self.name}: get latest version of record response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_specific_record(self, record_id: str, version: int) -> dict:
         """Get record by version.
@@ -98,13 +93,11 @@ class StorageServiceApiClient(object):
         :return: versioned record
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.get(f"{StorageServicePaths.RECORDS}/{record_id}/{version}", headers=self.headers)
-            logger.debug(f"{self.name}: get specific record response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        response = await client.get(f"{StorageServicePaths.RECORDS}/{record_id}/{version}", headers=self.headers)
+        logger.debug(f"{self.name}: get specific record response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_record_versions(self, record_id: str) -> dict:
         """Get record versions.
@@ -114,13 +107,11 @@ class StorageServiceApiClient(object):
         :return: record versions
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.get(f"{StorageServicePaths.RECORDS}/versions/{record_id}", headers=self.headers)
-            logger.debug(f"{self.name}: get record versions response: {response}")
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client(self.base_url)
+        response = await client.get(f"{StorageServicePaths.RECORDS}/versions/{record_id}", headers=self.headers)
+        logger.debug(f"{self.name}: get record versions response: {response}")
+        response.raise_for_status()
+        return response.json()
 
     async def soft_delete_record(self, record_id: str) -> None:
         """Mark record as deleted.
@@ -128,12 +119,10 @@ class StorageServiceApiClient(object):
         :param record_id: record id
         :type record_id: str
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.post(f"{StorageServicePaths.RECORDS}/{record_id}:delete", headers=self.headers)
-            logger.debug(f"{self.name}: soft delete record response: {response}")
-            response.raise_for_status()
+        client = get_http_client(self.base_url)
+        response = await client.post(f"{StorageServicePaths.RECORDS}/{record_id}:delete", headers=self.headers)
+        logger.debug(f"{self.name}: soft delete record response: {response}")
+        response.raise_for_status()
 
     async def delete_record(self, record_id: str) -> None:
         """Delete (purge) record.
@@ -143,12 +132,10 @@ class StorageServiceApiClient(object):
         :return: deleted record id
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            response = await client.delete(f"{StorageServicePaths.RECORDS}/{record_id}", headers=self.headers)
-            logger.debug(f"{self.name}: delete record response: {response}")
-            response.raise_for_status()
+        client = get_http_client(self.base_url)
+        response = await client.delete(f"{StorageServicePaths.RECORDS}/{record_id}", headers=self.headers)
+        logger.debug(f"{self.name}: delete record response: {response}")
+        response.raise_for_status()
 
     async def query_records(self, records: List[str]) -> dict:
         """Query records.
@@ -158,24 +145,11 @@ class StorageServiceApiClient(object):
         :return: records details
         :rtype: dict
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=TIMEOUT, transport=self._transport(),
-        ) as client:
-            query_records_request = {"records": records}
-            response = await client.post(
-                f"{StorageServicePaths.QUERY}", json=query_records_request, headers=self.headers,
-            )
-            logger.debug(f"{self.name}: query records response: {response}")
-            response.raise_for_status()
-            return response.json()
-
-    def _transport(self, retries: int = DEFAULT_RETRIES, **kwargs) -> httpx.AsyncHTTPTransport:
-        """Create a new transport object.
-
-        :param retries: the number of retries, defaults to
-            DEFAULT_RETRIES
-        :type retries: int, optional
-        :return: A new transport object
-        :rtype: httpx.AsyncHTTPTransport
-        """
-        return httpx.AsyncHTTPTransport(retries=retries, **kwargs)
+        client = get_http_client(self.base_url)
+        query_records_request = {"records": records}
+        response = await client.post(
+            f"{StorageServicePaths.QUERY}", json=query_records_request, headers=self.headers,
+        )
+        logger.debug(f"{self.name}: query records response: {response}")
+        response.raise_for_status()
+        return response.json()
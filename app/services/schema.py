@@ -14,16 +14,14 @@
 
 import datetime
 import re
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import jsonschema
-from async_lru import alru_cache
 from dateutil import parser as date_parser
-from fastapi_cache.decorator import cache
 from loguru import logger
 from starlette import status
 
-from app.core.helpers.cache.settings import CACHE_DEFAULT_TTL
+from app.core.helpers.cache.schema_cache import get_schema_cache
 from app.core.settings.app import AppSettings
 from app.models.schemas.user import User
 from app.services.error_handlers import handle_core_services_http_status_error
@@ -90,6 +88,10 @@ class OSDURefResolver(jsonschema.RefResolver):
         return document
 
 
+# compiled validators of the cached schemas, keyed by data partition and schema id
+_schema_validators: Dict[Tuple[str, str], Tuple[dict, Any]] = {}
+
+
 class SchemaService:
     """Class to get and validate wks schemas."""
 
@@ -106,7 +108,7 @@ class SchemaService:
             bearer_token=user.access_token,
             extra_headers=extra_headers,
         )
-        self._schema_validators = {}
+        self._data_partition_id = data_partition_id
 
     @handle_core_services_http_status_error(
         expected_codes=[
@@ -116,10 +118,9 @@ class SchemaService:
         ],
         detail="Failed to fetch schema from SchemaService.",
     )
-    @alru_cache(maxsize=None)
-    @cache(expire=CACHE_DEFAULT_TTL)
     async def get_schema(self, schema_id: str) -> dict:
-        """Get schema from schema service.
+        """Get schema from schema service, through the process-wide
+        schema cache.
 
         :param schema_id: schema id
         :type schema_id: str
@@ -127,7 +128,9 @@ class SchemaService:
         :rtype: dict
         """
         logger.info(f"Fetching {schema_id}")
-        return await self.schema_client.get_schema(schema_id)
+        return await get_schema_cache().get_schema(
+            self._data_partition_id, schema_id, self.schema_client.get_schema_if_modified,
+        )
 
     async def validate(self, record: dict, schema_id: str, optional_id: Optional[str] = None) -> Optional[dict]:
 
@@ -158,6 +161,8 @@ class SchemaService:
     def _get_schema_validator(self, schema: dict, schema_id: str) -> Any:
         """Get custom schema validator for OSDU Forum schemas.
 
+        Validators are compiled once per process and schema.
+
         :param schema: the schema definition
         :type schema: dict
         :param schema_id: the schema id
@@ -165,8 +170,10 @@ class SchemaService:
         :return: validator
         :rtype: Any
         """
-        if self._schema_validators.get(schema_id):
-            return self._schema_validators[schema_id]
+        validator_key = (self._data_partition_id, schema_id)
+        cached_schema, cached_validator = _schema_validators.get(validator_key, (None, None))
+        if cached_schema is schema:
+            return cached_validator
 
         validator_class = jsonschema.validators.validator_for(schema)
         resolver = OSDURefResolver(
@@ -179,7 +186,7 @@ class SchemaService:
             resolver=resolver,
             format_checker=jsonschema.FormatChecker(),
         )
-        self._schema_validators[schema_id] = validator
+        _schema_validators[validator_key] = (schema, validator)
         return validator
 
     async def _validate_against_schema(self, record: dict, schema_id: str) -> list:
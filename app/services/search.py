@@ -12,7 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List, Optional
+import asyncio
+from typing import AsyncIterator, List, Optional
 
 from starlette import status
 
@@ -74,3 +75,44 @@ class SearchService(ISearchService):
                 "limit": limit,
             }, **kwargs,
         })
+
+
+async def iter_search_pages(
+    search_service: ISearchService,
+    kind: str,
+    query: str = "*",
+    limit: int = QUERY_LIMIT,
+) -> AsyncIterator[List[dict]]:
+    """Iterate over the pages of search results, the next page is fetched
+    while the current one is processed.
+
+    :param search_service: the search service instance
+    :type search_service: ISearchService
+    :param kind: kind of the records
+    :type kind: str
+    :param query: query, defaults to "*"
+    :type query: str
+    :param limit: page size, defaults to QUERY_LIMIT
+    :type limit: int
+    :yield: records of a page
+    :rtype: AsyncIterator[List[dict]]
+    """
+    next_page = asyncio.ensure_future(search_service.find_records(kind=kind, query=query, limit=limit, cursor=None))
+    try:
+        while next_page is not None:
+            search_response = await next_page
+            records = search_response.get("results", [])
+            cursor = search_response.get("cursor", None)
+            if not records:
+                break
+            next_page = None
+            if cursor:
+                next_page = asyncio.ensure_future(
+                    search_service.find_records(kind=kind, query=query, limit=limit, cursor=cursor),
+                )
+            yield records
+    except BaseException:  # noqa: B902, WPS424
+        # e.g. the consumer stopped early or was cancelled, the prefetched page is not needed
+        if next_page is not None:
+            next_page.cancel()
+        raise
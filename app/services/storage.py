@@ -12,18 +12,33 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List, Optional
+import asyncio
+from functools import lru_cache, partial
+from typing import Dict, List, Optional
 
 from starlette import status
 
+from app.core.helpers.cache.cache_tags import (
+    add_cache_tags,
+    get_record_tag,
+    get_upserted_records_tags,
+    invalidate_cache_tags,
+    invalidate_search_tags_later,
+)
+from app.core.helpers.cache.existence_cache import get_existence_cache
+from app.core.helpers.cache.micro_batch import MicroBatcher
+from app.core.helpers.cache.record_acl import capture_record_acl
+from app.core.helpers.cache.single_flight import SingleFlight
 from app.core.settings.app import AppSettings
 from app.models.schemas.user import User
-from app.services.base import IStorageService
+from app.services.base import IStorageService, RecordVersions
 from app.services.error_handlers import handle_core_services_http_status_error
 from app.services.osdu_clients.storage_client import StorageServiceApiClient
 
 STORAGE_SERVICE_GENERIC_EXCEPTION_DETAIL = "Storage service API request failed."
 
+_record_flights = SingleFlight()
+
 
 def build_storage_service_exception_detail(method: str = ""):
     """Build the exception detail using the provided failed method."""
@@ -33,6 +48,12 @@ def build_storage_service_exception_detail(method: str = ""):
     )
 
 
+@lru_cache
+def _get_record_batcher(window: float, max_batch_size: int) -> MicroBatcher:
+    # shared by the requests with the same batching settings
+    return MicroBatcher(window, max_batch_size)
+
+
 class StorageService(IStorageService):
 
     def __init__(
@@ -48,6 +69,15 @@ class StorageService(IStorageService):
             bearer_token=user.access_token,
             extra_headers=extra_headers,
         )
+        self._data_partition_id = data_partition_id
+        self._caller_key = (data_partition_id, user.access_token)
+        self._query_limit = settings.storage_query_limit
+        self._batch_window = settings.storage_batch_window
+        self._cache_enable = settings.cache_enable
+
+    @property
+    def data_partition_id(self) -> str:
+        return self._data_partition_id
 
     @handle_core_services_http_status_error(
         expected_codes=[
@@ -67,12 +97,65 @@ class StorageService(IStorageService):
         :return: record json
         :rtype: dict
         """
-        if version is not None:
-            response = await self.storage_client.get_specific_record(record_id, version)
-        else:
-            response = await self.storage_client.get_latest_record(record_id)
+        response = None
+        if version is None and self._batch_window:
+            # concurrent reads of latest records by the same caller share one query
+            record_batcher = _get_record_batcher(self._batch_window, self._query_limit)
+            response = await record_batcher.load(self._caller_key, record_id, self._query_records_by_id)
+        if response is None:
+            response = await self._get_record(record_id, version)
+        capture_record_acl(response)
+        add_cache_tags(get_record_tag(record_id))
         return response
 
+    @handle_core_services_http_status_error(
+        expected_codes=[
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+            status.HTTP_404_NOT_FOUND,
+        ],
+        detail=build_storage_service_exception_detail("retrieve"),
+    )
+    async def get_records_batch(
+        self,
+        record_ids: List[str],
+        versions: Optional[RecordVersions] = None,
+        skip_missing: bool = False,
+    ) -> List[dict]:
+        """Get records, the latest ones through batched record queries.
+
+        Queries are split in chunks of storage_query_limit ids and sent in
+        parallel. Records missing from the query results and versioned
+        records are read one by one, so their errors are raised.
+
+        :param record_ids: record ids
+        :type record_ids: List[str]
+        :param versions: version of each record, None for the latest,
+            defaults to None for the latest of all the records
+        :type versions: Optional[RecordVersions]
+        :param skip_missing: skip the records missing from the query
+            results instead of reading them one by one, defaults to
+            False
+        :type skip_missing: bool
+        :return: records json, in the order of the ids
+        :rtype: List[dict]
+        """
+        versions = versions or [None for _ in record_ids]
+        latest_records = await self._query_latest_records(list(dict.fromkeys(
+            record_id for record_id, version in zip(record_ids, versions) if version is None
+        )))
+        records = await asyncio.gather(*(
+            self._get_batched_record(latest_records, record_id, version, skip_missing)
+            for record_id, version in zip(record_ids, versions)
+        ))
+        found_records = []
+        for record_id, record in zip(record_ids, records):
+            if record is not None:
+                capture_record_acl(record)
+                add_cache_tags(get_record_tag(record_id))
+                found_records.append(record)
+        return found_records
+
     @handle_core_services_http_status_error(
         expected_codes=[
             status.HTTP_401_UNAUTHORIZED,
@@ -91,21 +174,21 @@ class StorageService(IStorageService):
         """
         return await self.storage_client.get_record_versions(record_id)
 
-    @handle_core_services_http_status_error(
-        expected_codes=[
-            status.HTTP_401_UNAUTHORIZED,
-            status.HTTP_403_FORBIDDEN,
-            status.HTTP_404_NOT_FOUND,
-        ],
-        detail=build_storage_service_exception_detail("delete"),
-    )
     async def soft_delete_record(self, record_id: str) -> None:
         """Make record unavailable without admin rights.
 
         :param record_id: record id
         :type record_id: str
         """
-        await self.storage_client.soft_delete_record(record_id)
+        if not self._cache_enable:
+            await self._soft_delete_record(record_id)
+            return
+        # read first, the analysis types of the record tag the search responses listing it
+        record = await self.get_record(record_id)
+        await self._soft_delete_record(record_id)
+        changed_tags = get_upserted_records_tags(self._data_partition_id, [record])
+        await invalidate_cache_tags(changed_tags)
+        invalidate_search_tags_later(changed_tags)
 
     @handle_core_services_http_status_error(
         expected_codes=[
@@ -124,7 +207,11 @@ class StorageService(IStorageService):
         :return: upserted records ids
         :rtype: dict
         """
-        return await self.storage_client.create_update_records(records)
+        storage_response = await self.storage_client.create_update_records(records)
+        changed_tags = get_upserted_records_tags(self._data_partition_id, records)
+        await invalidate_cache_tags(changed_tags)
+        invalidate_search_tags_later(changed_tags)
+        return storage_response
 
     @handle_core_services_http_status_error(
         expected_codes=[
@@ -142,3 +229,49 @@ class StorageService(IStorageService):
         :rtype: dict
         """
         return await self.storage_client.query_records(record_ids)
+
+    @handle_core_services_http_status_error(
+        expected_codes=[
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+            status.HTTP_404_NOT_FOUND,
+        ],
+        detail=build_storage_service_exception_detail("delete"),
+    )
+    async def _soft_delete_record(self, record_id: str) -> None:
+        await self.storage_client.soft_delete_record(record_id)
+        get_existence_cache().discard(self._data_partition_id, record_id)
+
+    async def _get_record(self, record_id: str, version: Optional[int] = None) -> dict:
+        if version is not None:
+            get_record = partial(self.storage_client.get_specific_record, record_id, version)
+        else:
+            get_record = partial(self.storage_client.get_latest_record, record_id)
+        # concurrent reads of the same record by the same caller share one request
+        response, _ = await _record_flights.run((*self._caller_key, record_id, version), get_record)
+        return response
+
+    async def _query_latest_records(self, record_ids: List[str]) -> Dict[str, dict]:
+        id_chunks = [record_ids[idx:idx + self._query_limit] for idx in range(0, len(record_ids), self._query_limit)]
+        queried_chunks = await asyncio.gather(*(self._query_records_by_id(id_chunk) for id_chunk in id_chunks))
+        return {
+            record_id: record for queried_chunk in queried_chunks for record_id, record in queried_chunk.items()
+        }
+
+    async def _get_batched_record(
+        self,
+        latest_records: Dict[str, dict],
+        record_id: str,
+        version: Optional[int],
+        skip_missing: bool,
+    ) -> Optional[dict]:
+        if version is not None:
+            return await self._get_record(record_id, version)
+        record = latest_records.get(record_id)
+        if record is None and not skip_missing:
+            record = await self._get_record(record_id)
+        return record
+
+    async def _query_records_by_id(self, record_ids: List[str]) -> Dict[str, dict]:
+        storage_response = await self.storage_client.query_records(record_ids)
+        return {record["id"]: record for record in storage_response.get("records", [])}
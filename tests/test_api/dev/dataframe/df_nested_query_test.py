@@ -91,3 +91,31 @@ class TestPandasDFQueryNested:
         selected = query_df.select(column, operator, comp_val, prop_path)
         expected_df = sample_dataframe.iloc[[0, 1, 2]]
         assert selected.df.equals(expected_df)
+
+    @pytest.mark.parametrize(
+        "object_column,operator,comp_val,expected_rows", [
+            ([{"a": {"b": 1}}, {"a": {"b": 2}}, {"a": {"b": 3}}, {"a": {"b": 4}}], ">=", 3, [2, 3]),
+            ([{"a": {"b": 1}}, {"a": {"b": "2"}}, {"a": {"b": 3}}, {"a": {"b": 4}}], "=", 3, [2]),
+            ([{"a": {"b": 1}}, {"a": {}}, {"a": {"b": 3}}, {"a": {"b": 4}}], "!=", 3, [0, 1, 3]),
+        ],
+    )
+    def test_select_deeply_nested(self, object_column, operator, comp_val, expected_rows, sample_dataframe):
+        sample_dataframe["ObjectColumn"] = object_column
+        query_df = PandasDFQueryNested(sample_dataframe)
+        selected = query_df.select("ObjectColumn", operator, comp_val, ["a", "b"])
+        assert selected.df.equals(sample_dataframe.iloc[expected_rows])
+
+    def test_select_deeply_nested_missing_object(self, sample_dataframe):
+        sample_dataframe["ObjectColumn"] = [{"a": {"b": 1}}, {}, {"a": {"b": 3}}, {"a": {"b": 4}}]
+        query_df = PandasDFQueryNested(sample_dataframe)
+        with pytest.raises(AttributeError):
+            query_df.select("ObjectColumn", "=", 3, ["a", "b"])
+
+    def test_select_nested_sparse_column(self, sample_dataframe, mocker):
+        sample_dataframe["ObjectColumn"] = [{"number": 1.0}, {"text": "InnerText2"}, {"number": None}, {"number": 4.0}]
+        apply_spy = mocker.spy(pd.Series, "apply")
+        query_df = PandasDFQueryNested(sample_dataframe)
+        selected = query_df.select("ObjectColumn", "!=", 1.0, ["number"])
+        assert selected.df.equals(sample_dataframe.iloc[[1, 2, 3]])
+        # only the rows without the value are compared row by row
+        assert [len(call.args[0]) for call in apply_spy.call_args_list] == [2]
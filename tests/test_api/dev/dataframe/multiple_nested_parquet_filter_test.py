@@ -17,6 +17,7 @@ import json
 import pandas as pd
 import pytest
 
+from app.dev.dataframe import multiple_nested_parquet_filter
 from app.dev.dataframe.multiple_nested_parquet_filter import (
     ColumnsAggregationProcessor,
     ColumnsFilterProcessor,
@@ -27,6 +28,7 @@ from app.dev.dataframe.multiple_nested_parquet_filter import (
 from app.dev.dataframe.nested_query import PandasDFQueryNested
 from app.dev.resources.multiple_nested_filters import (
     DFMultipleNestedFilterValidator,
+    RowsFilter,
 )
 from tests.test_api.dev.dataframe.sample_dataframe_data import (
     SAMPLE_DATA,
@@ -118,6 +120,43 @@ def test_rows_filter_array(sample_dataframe, sample_schema, raw_rows_filter):
     assert result_df.equals(expected_df)
 
 
+@pytest.mark.parametrize(
+    "column,operator,comp_value,expected_arrays", [
+        ("ArrayColumn[]", ">=", 2, {30: [2, 3], 10: [5]}),
+        ("ArrayColumn[]", "!=", 1, {30: [2, 3], 20: [None], 10: [5]}),
+        ("ObjectArrayColumn[].value", "=", "b", {20: [{"value": "b"}]}),
+        ("NestedArrayColumn[].items[].value", ">", 1, {30: [{"items": [{"value": 2}]}]}),
+    ],
+)
+def test_rows_filter_array_column_keeps_matching_items(column, operator, comp_value, expected_arrays, mocker):
+    df = pd.DataFrame(
+        {
+            "TextColumn": ["Row1", "Row2", "Row3"],
+            "ArrayColumn": [[1, 2, 3], [], [5]],
+            "ObjectArrayColumn": [[{"value": "a"}], [{"value": "b"}, {"value": "c"}], [{"value": "c"}]],
+            "NestedArrayColumn": [
+                [{"items": [{"value": 1}]}, {"items": [{"value": 2}]}],
+                [{"items": [{"value": 1}]}],
+                [{"items": [{"value": 0}]}],
+            ],
+        },
+        index=[30, 20, 10],
+    )
+    explode_spy = mocker.spy(pd.DataFrame, "explode")
+    rows_filter = RowsFilter(column=column, operator=operator, comp_value=comp_value)
+
+    result_df = RowsFilterProcessor().apply_rows_filter(PandasDFQueryNested(df), rows_filter).df
+
+    explode_spy.assert_not_called()
+    array_column = column.split("[]")[0]
+    assert list(result_df.index) == sorted(expected_arrays)
+    assert list(result_df.columns) == list(df.columns)
+    for index, expected_array in expected_arrays.items():
+        result_array = [None if isinstance(item, float) and pd.isna(item) else item for item in result_df.loc[index, array_column]]
+        assert result_array == expected_array
+        assert result_df.loc[index, "TextColumn"] == df.loc[index, "TextColumn"]
+
+
 @pytest.mark.parametrize(
     "raw_columns_aggregation,result", [
         (
@@ -320,3 +359,169 @@ def test_rows_multiple_filter(sample_dataframe, sample_schema, raw_rows_multiple
     ).df
 
     assert result_df.equals(expected_df)
+
+
+@pytest.mark.parametrize(
+    "raw_rows_multiple_filter,expected_rows_filter_calls", [
+        (
+            """
+            {
+                "$and": [
+                    {"IntColumn": {"$gt": 1000}},
+                    {"FloatColumn": {"$gt": 2.0}},
+                    {"TextColumn": {"$eq": "Row3"}}
+                ]
+            }
+            """,
+            1,
+        ),
+        (
+            """
+            {
+                "$or": [
+                    {"IntColumn": {"$gt": 0}},
+                    {"FloatColumn": {"$gt": 2.0}}
+                ]
+            }
+            """,
+            1,
+        ),
+        (
+            """
+            {
+                "$and": [
+                    {"IntColumn": {"$gt": 25}},
+                    {"FloatColumn": {"$lt": 4.0}}
+                ]
+            }
+            """,
+            2,
+        ),
+    ],
+)
+def test_rows_multiple_filter_short_circuit(
+    sample_dataframe, sample_schema, raw_rows_multiple_filter, expected_rows_filter_calls, mocker,
+):
+    df_filter = DFMultipleNestedFilterValidator(
+        schema=sample_schema,
+        raw_rows_multiple_filter=raw_rows_multiple_filter,
+    )
+    rows_filter_processor = RowsFilterProcessor()
+    get_rows_selection = mocker.spy(rows_filter_processor, "get_rows_selection")
+
+    RowsMultipleFilterProcessor(rows_filter_processor).apply_rows_multiple_filter(
+        PandasDFQueryNested(sample_dataframe), df_filter.valid_rows_multiple_filter,
+    )
+
+    assert get_rows_selection.call_count == expected_rows_filter_calls
+
+
+@pytest.mark.parametrize(
+    "raw_rows_multiple_filter,expected_index,expected_numbers", [
+        (
+            '{"$and": [{"ArrayColumn.number": {"$gt": 6}}, {"IntColumn": {"$gt": 25}}]}',
+            [1, 2, 3],
+            [[7.0, 8.0], [9.0, 10.0, 11.0, 12.0], [13.0, 14.0, 15.0, 16.0]],
+        ),
+        (
+            '{"$and": [{"IntColumn": {"$gt": 25}}, {"ArrayColumn.number": {"$gt": 6}}]}',
+            [1, 2, 3],
+            [[5.0, 6.0, 7.0, 8.0], [9.0, 10.0, 11.0, 12.0], [13.0, 14.0, 15.0, 16.0]],
+        ),
+        (
+            '{"$or": [{"IntColumn": {"$gt": 30}}, {"IntColumn": {"$lt": 27}}]}',
+            [0, 2, 3],
+            [[1.0, 2.0, 3.0, 4.0], [9.0, 10.0, 11.0, 12.0], [13.0, 14.0, 15.0, 16.0]],
+        ),
+        (
+            '{"$or": [{"ArrayColumn.number": {"$gt": 14}}, {"IntColumn": {"$lt": 27}}]}',
+            [0, 3],
+            [[1.0, 2.0, 3.0, 4.0], [15.0, 16.0]],
+        ),
+        (
+            '{"$or": [{"IntColumn": {"$lt": 27}}, {"ArrayColumn.number": {"$lt": 2}}]}',
+            [0],
+            [[1.0, 2.0, 3.0, 4.0]],
+        ),
+        (
+            '{"$or": [{"ArrayColumn.number": {"$lt": 2}}, {"IntColumn": {"$lt": 27}}]}',
+            [0],
+            [[1.0]],
+        ),
+    ],
+)
+def test_rows_multiple_filter_keeps_matched_items(
+    sample_dataframe, sample_schema, raw_rows_multiple_filter, expected_index, expected_numbers,
+):
+    df_filter = DFMultipleNestedFilterValidator(
+        schema=sample_schema,
+        raw_rows_multiple_filter=raw_rows_multiple_filter,
+    )
+
+    result_df = RowsMultipleFilterProcessor().apply_rows_multiple_filter(
+        PandasDFQueryNested(sample_dataframe), df_filter.valid_rows_multiple_filter,
+    ).df
+
+    assert list(result_df.index) == expected_index
+    assert [[item["number"] for item in array] for array in result_df["ArrayColumn"]] == expected_numbers
+
+
+def test_rows_multiple_filter_conjunction_without_rows(sample_dataframe, sample_schema):
+    df_filter = DFMultipleNestedFilterValidator(
+        schema=sample_schema,
+        raw_rows_multiple_filter='{"$and": [{"IntColumn": {"$gt": 1000}}, {"FloatColumn": {"$gt": 0}}]}',
+    )
+
+    result_df = RowsMultipleFilterProcessor().apply_rows_multiple_filter(
+        PandasDFQueryNested(sample_dataframe), df_filter.valid_rows_multiple_filter,
+    ).df
+
+    assert result_df.empty
+    assert list(result_df.columns) == []
+
+
+@pytest.mark.parametrize(
+    "raw_rows_multiple_filter,expected_index", [
+        (
+            """
+            {
+                "$and": [
+                    {"$or": [{"IntColumn": {"$gt": 30}}, {"IntColumn": {"$lt": 27}}]},
+                    {"FloatColumn": {"$gt": 0}}
+                ]
+            }
+            """,
+            [0, 2, 3],
+        ),
+        (
+            """
+            {
+                "$or": [
+                    {"$and": [{"IntColumn": {"$gt": 25}}, {"ArrayColumn.number": {"$gt": 14}}]},
+                    {"$or": [{"TextColumn": {"$eq": "Row2"}}, {"IntColumn": {"$lt": 27}}]}
+                ]
+            }
+            """,
+            [0, 1, 3],
+        ),
+    ],
+)
+def test_rows_multiple_filter_slices_once(
+    sample_dataframe, sample_schema, raw_rows_multiple_filter, expected_index, mocker,
+):
+    df_filter = DFMultipleNestedFilterValidator(
+        schema=sample_schema,
+        raw_rows_multiple_filter=raw_rows_multiple_filter,
+    )
+    rows_filter_processor = RowsFilterProcessor()
+    apply_rows_filter = mocker.spy(rows_filter_processor, "apply_rows_filter")
+    select_rows = mocker.spy(multiple_nested_parquet_filter, "select_rows")
+
+    result_df = RowsMultipleFilterProcessor(rows_filter_processor).apply_rows_multiple_filter(
+        PandasDFQueryNested(sample_dataframe), df_filter.valid_rows_multiple_filter,
+    ).df
+
+    # the whole tree is sliced once, no frame is built per predicate
+    assert select_rows.call_count == 1
+    assert apply_rows_filter.call_count == 0
+    assert list(result_df.index) == expected_index
@@ -23,6 +23,7 @@ from app.dev.resources.multiple_nested_filters import (
     ColumnsFilter,
     DFMultipleNestedFilterValidator,
     RowsFilter,
+    get_filter_plan,
 )
 from app.resources.errors import FilterValidationError
 
@@ -160,3 +161,37 @@ def test_invalid_aggregatiom_dotted_colums():
     with pytest.raises(FilterValidationError) as exc_info:
         nested_aggregation_validator.valid_rows_filter
     assert str(exc_info.value) == "Wrong property name: Field3.. Reason:  not in ['nested_field']"
+
+
+def test_get_filter_plan_is_reused():
+    raw_rows_filter = '{"Field3.nested_field": {"$eq": "value1"}}'
+
+    filter_plan = get_filter_plan(MockModel, raw_rows_filter=raw_rows_filter)
+
+    assert get_filter_plan(MockModel, raw_rows_filter=raw_rows_filter) is filter_plan
+    assert get_filter_plan(MockModelSameNestedName, raw_rows_filter=raw_rows_filter) is not filter_plan
+    assert filter_plan.valid_rows_filter == RowsFilter("Field3.nested_field", "=", "value1")
+
+
+def test_get_filter_plan_invalid_filter_is_not_cached():
+    cache_size = get_filter_plan.cache_info().currsize
+
+    with pytest.raises(FilterValidationError):
+        get_filter_plan(MockModel, raw_columns_filter='["Field4"]')
+
+    assert get_filter_plan.cache_info().currsize == cache_size
+
+
+def test_without_aggregation_reuses_validated_filters():
+    validator = DFMultipleNestedFilterValidator(
+        MockModel.schema(),
+        raw_rows_filter='{"Field2": {"$gt": 1}}',
+        raw_columns_aggregation='["Field2", "sum"]',
+    )
+    rows_filter = validator.valid_rows_filter
+
+    validator_wo_agg = validator.without_aggregation
+
+    assert validator_wo_agg.valid_columns_aggregation is None
+    assert validator_wo_agg.valid_rows_filter is rows_filter
+    assert validator.valid_columns_aggregation == ColumnsAggregation("Field2", "sum")
@@ -58,7 +58,7 @@ def mock_redis_client(urn):
     ft_mock = AsyncMock()
     redis_client.ft.return_value = ft_mock
     json_str = json.dumps({"DDMSDatasets": urn, "ACLOwners": "owners_group", "ACLViewers": "viewers_group"})
-    ft_mock.search.side_effect = [MagicMock(docs=[MagicMock(json=json_str)]), MagicMock()]
+    ft_mock.search.side_effect = [MagicMock(docs=[MagicMock(json=json_str)], total=1), MagicMock()]
     return redis_client
 
 
@@ -92,6 +92,19 @@ class TestOsduAnalysisTypeIdsFetcher:
         dataset_id = f"opendes:dataset--File.Generic:{analysis_type}-1"
         assert result == [(dataset_id, samples_analysis_id)]
 
+    @pytest.mark.asyncio
+    async def test_next_page_is_prefetched(self, osdu_fetcher, mock_search_service, urn, analysis_type):
+        page = {"results": [{"data": {"DDMSDatasets": [urn]}}]}
+        mock_search_service.find_records.side_effect = [
+            {**page, "cursor": "cursor-1"}, {**page, "cursor": "cursor-2"}, {"results": [], "cursor": "cursor-3"},
+        ]
+
+        result = await osdu_fetcher.get_ids("test_partition", analysis_type, "1.0.0")
+
+        assert len(result) == 2
+        cursors = [find_call.kwargs["cursor"] for find_call in mock_search_service.find_records.await_args_list]
+        assert cursors == [None, "cursor-1", "cursor-2"]
+
 
 class TestRedisAnalysisTypeIdsFetcher:
     @pytest.mark.asyncio
@@ -105,3 +118,15 @@ class TestRedisAnalysisTypeIdsFetcher:
         samples_analysis_id = "opendes:work-product-component--SamplesAnalysis:SA_ID"
         dataset_id = f"opendes:dataset--File.Generic:{analysis_type}-1"
         assert result == [(dataset_id, samples_analysis_id)]
+
+    @pytest.mark.asyncio
+    async def test_next_pages_are_searched_after_total(self, redis_fetcher, mock_redis_client, analysis_type, urn):
+        json_str = json.dumps({"DDMSDatasets": urn, "ACLOwners": "owners_group", "ACLViewers": "viewers_group"})
+        page = MagicMock(docs=[MagicMock(json=json_str)], total=2500)
+        mock_redis_client.ft.return_value.search.side_effect = [page, page, page]
+
+        result = await redis_fetcher.get_ids("test_partition", analysis_type, "1.0.0")
+
+        assert len(result) == 3
+        queries = [search_call.args[0] for search_call in mock_redis_client.ft.return_value.search.await_args_list]
+        assert sorted(query._offset for query in queries) == [0, 1000, 2000]
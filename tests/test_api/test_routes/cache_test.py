@@ -0,0 +1,122 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from contextlib import contextmanager
+from unittest.mock import create_autospec
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from app.api.dependencies.services import get_async_entitlements_service
+from app.core.config import get_app_settings
+from app.main import app
+from app.models.schemas.cache import WarmupQuery, WarmupReport
+from app.services.entitlements import EntitlementsService
+from tests.test_api.test_routes import dependencies
+from tests.test_api.test_routes.osdu.storage_mock_objects import (
+    TEST_HEADERS,
+    TEST_SERVER,
+)
+
+TOP_KEYS_URL = "/api/os-rafs-ddms/cache/top-keys"
+WARMUP_URL = "/api/os-rafs-ddms/cache/warmup"
+ADMIN_GROUPS = {"groups": [{"name": "users.datalake.admins", "email": "users.datalake.admins@opendes.com"}]}
+VIEWER_GROUPS = {"groups": [{"name": "users.datalake.viewers", "email": "users.datalake.viewers@opendes.com"}]}
+
+entitlements_service_mock = create_autospec(EntitlementsService, spec_set=True, instance=True)
+
+
+async def mock_get_async_entitlements_service():
+    yield entitlements_service_mock
+
+
+@contextmanager
+def entitlements_override():
+    overrides = {
+        get_async_entitlements_service: mock_get_async_entitlements_service,
+    }
+    with dependencies.DependencyOverrider(app, overrides) as mock_dependencies:
+        yield mock_dependencies
+
+
+@pytest.mark.asyncio
+async def test_top_keys_of_enabled_cache(mocker):
+    entitlements_service_mock.get_groups.return_value = ADMIN_GROUPS
+    settings = get_app_settings().copy(update={"cache_enable": True})
+    mocker.patch("app.api.routes.cache.get_app_settings", return_value=settings)
+    mocker.patch("app.api.routes.cache.get_top_keys", return_value=[("key", 10)])
+
+    with entitlements_override():
+        async with AsyncClient(base_url=TEST_SERVER, app=app) as client:
+            response = await client.get(TOP_KEYS_URL, params={"limit": 1}, headers=TEST_HEADERS)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"keys": [{"key": "key", "size": 10}]}
+
+
+@pytest.mark.asyncio
+async def test_top_keys_of_disabled_cache():
+    entitlements_service_mock.get_groups.return_value = ADMIN_GROUPS
+
+    with entitlements_override():
+        async with AsyncClient(base_url=TEST_SERVER, app=app) as client:
+            response = await client.get(TOP_KEYS_URL, headers=TEST_HEADERS)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"keys": []}
+
+
+@pytest.mark.asyncio
+async def test_top_keys_require_admin_role():
+    entitlements_service_mock.get_groups.return_value = VIEWER_GROUPS
+
+    with entitlements_override():
+        async with AsyncClient(base_url=TEST_SERVER, app=app) as client:
+            response = await client.get(TOP_KEYS_URL, headers=TEST_HEADERS)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_warmup_replays_queries_with_caller_token(mocker):
+    entitlements_service_mock.get_groups.return_value = ADMIN_GROUPS
+    settings = get_app_settings().copy(update={"cache_enable": True})
+    mocker.patch("app.api.routes.cache.get_app_settings", return_value=settings)
+    warm_up_cache = mocker.patch(
+        "app.api.routes.cache.warm_up_cache",
+        return_value=WarmupReport(replayed=1, failed=0),
+    )
+    query = {"data_partition_id": "opendes", "analysis_type": "rca", "content_schema_version": "1.0.0"}
+
+    with entitlements_override():
+        async with AsyncClient(base_url=TEST_SERVER, app=app) as client:
+            response = await client.post(WARMUP_URL, json=[query], headers=TEST_HEADERS)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"replayed": 1, "failed": 0}
+    _, queries, token, _ = warm_up_cache.call_args.args
+    assert queries == [WarmupQuery(**query)]
+    assert token == TEST_HEADERS["Authorization"].split()[-1]
+
+
+@pytest.mark.asyncio
+async def test_warmup_require_admin_role():
+    entitlements_service_mock.get_groups.return_value = VIEWER_GROUPS
+
+    with entitlements_override():
+        async with AsyncClient(base_url=TEST_SERVER, app=app) as client:
+            response = await client.post(WARMUP_URL, headers=TEST_HEADERS)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
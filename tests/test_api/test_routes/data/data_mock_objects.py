@@ -383,6 +383,7 @@ class StorageService:
     def __init__(self, record_data: dict, query_records_response=None):
         self.record_data = record_data
         self.query_records_response = query_records_response
+        self.data_partition_id = "opendes"
 
     async def get_record(self, record_id: str, version: Optional[str] = None) -> Optional[dict]:
         return self.record_data
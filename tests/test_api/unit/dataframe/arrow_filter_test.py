@@ -0,0 +1,202 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+from typing import Optional
+
+import pandas as pd
+import pytest
+from pyarrow import parquet as pq
+from pydantic import BaseModel
+
+from app.dataframe.arrow_filter import read_parquet_with_pushdown
+from app.dataframe.errors import PushdownNotSupportedError
+from app.dataframe.parquet_filter import (
+    apply_filters_from_bytes,
+    apply_filters_from_df,
+)
+from app.exceptions.exceptions import UnprocessableContentException
+from app.resources.filters import DataFrameFilterValidator, RowsFilter
+
+
+class InnerModel(BaseModel):
+    number: Optional[float]
+    text: Optional[str]
+
+
+class SampleModel(BaseModel):
+    TextColumn: Optional[str]
+    IntColumn: Optional[int]
+    FloatColumn: Optional[float]
+    ObjectColumn: Optional[InnerModel]
+
+
+@pytest.fixture
+def sample_dataframe():
+    return pd.DataFrame(
+        {
+            "TextColumn": ["Row1", "Row2", None, "Row4", "Row5", "Row6"],
+            "ObjectColumn": [
+                {"number": 1.0, "text": "InnerText1"},
+                {"number": 2.0, "text": "InnerText2"},
+                {"number": 3.0, "text": "InnerText3"},
+                {"number": 4.0, "text": "InnerText4"},
+                {"number": 5.0, "text": "InnerText5"},
+                {"number": 6.0, "text": "InnerText6"},
+            ],
+            "IntColumn": [25, 30, 35, 40, 45, 50],
+            "FloatColumn": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+        },
+    )
+
+
+@pytest.fixture
+def sample_parquet(sample_dataframe):
+    return sample_dataframe.to_parquet(row_group_size=2)
+
+
+@pytest.mark.parametrize(
+    "raw_rows_filter,raw_columns_filter", [
+        ("IntColumn,lt,35", None),
+        ("IntColumn,gte,40", "TextColumn"),
+        ("IntColumn,eq,45", None),
+        ("IntColumn,neq,45", "IntColumn,FloatColumn"),
+        ("FloatColumn,gt,1.5", None),
+        ("FloatColumn,neq,2.0", None),
+        ("TextColumn,lt,Row4", None),
+        ("TextColumn,neq,Row4", "IntColumn"),
+        ("ObjectColumn.number,lte,3.0", None),
+        ("ObjectColumn.text,eq,InnerText5", "IntColumn"),
+        ("IntColumn,gt,100", None),
+        (None, "TextColumn,IntColumn"),
+    ],
+)
+def test_apply_filters_from_bytes_as_pandas(sample_dataframe, sample_parquet, raw_rows_filter, raw_columns_filter):
+    df_filter = DataFrameFilterValidator(
+        model=SampleModel,
+        raw_rows_filter=raw_rows_filter,
+        raw_columns_filter=raw_columns_filter,
+    )
+
+    result = apply_filters_from_bytes(sample_parquet, df_filter)
+
+    expected = apply_filters_from_df(sample_dataframe, df_filter)
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+    assert result.to_json(orient="split") == expected.to_json(orient="split")
+
+
+@pytest.mark.parametrize(
+    "raw_rows_filter,raw_columns_filter", [
+        ("IntColumn,gte,35", None),
+        ("IntColumn,eq,45", "TextColumn"),
+        ("ObjectColumn.number,lte,3.0", None),
+    ],
+)
+def test_apply_filters_from_bytes_without_index(sample_dataframe, raw_rows_filter, raw_columns_filter):
+    sample_parquet = sample_dataframe.to_parquet(index=False, row_group_size=2)
+    df_filter = DataFrameFilterValidator(
+        model=SampleModel,
+        raw_rows_filter=raw_rows_filter,
+        raw_columns_filter=raw_columns_filter,
+    )
+
+    result = apply_filters_from_bytes(sample_parquet, df_filter)
+
+    expected = apply_filters_from_df(pd.read_parquet(io.BytesIO(sample_parquet)), df_filter)
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+    assert result.to_json(orient="split") == expected.to_json(orient="split")
+
+
+@pytest.mark.parametrize(
+    "raw_rows_filter,raw_columns_aggregation", [
+        ("IntColumn,gt,30", "FloatColumn,mean"),
+        (None, "IntColumn,sum"),
+        (None, "ObjectColumn.number,max"),
+    ],
+)
+def test_apply_filters_from_bytes_aggregation(
+    sample_dataframe, sample_parquet, raw_rows_filter, raw_columns_aggregation,
+):
+    df_filter = DataFrameFilterValidator(
+        model=SampleModel,
+        raw_rows_filter=raw_rows_filter,
+        raw_columns_aggregation=raw_columns_aggregation,
+    )
+
+    result = apply_filters_from_bytes(sample_parquet, df_filter)
+
+    pd.testing.assert_frame_equal(result, apply_filters_from_df(sample_dataframe, df_filter))
+
+
+def test_apply_filters_from_bytes_aggregation_not_projected(sample_parquet):
+    df_filter = DataFrameFilterValidator(
+        model=SampleModel,
+        raw_columns_filter="TextColumn",
+        raw_columns_aggregation="IntColumn,sum",
+    )
+
+    with pytest.raises(UnprocessableContentException):
+        apply_filters_from_bytes(sample_parquet, df_filter)
+
+
+def test_apply_filters_from_bytes_fallback(sample_dataframe, mocker):
+    sample_parquet = sample_dataframe.to_parquet()
+    df_filter = DataFrameFilterValidator(model=SampleModel, raw_rows_filter="IntColumn,lt,35")
+    mocker.patch(
+        "app.dataframe.parquet_filter.read_parquet_with_pushdown",
+        side_effect=PushdownNotSupportedError("not supported"),
+    )
+
+    result = apply_filters_from_bytes(sample_parquet, df_filter)
+
+    pd.testing.assert_frame_equal(result, apply_filters_from_df(sample_dataframe, df_filter))
+
+
+def test_read_parquet_with_pushdown_keeps_materialized_index(sample_dataframe):
+    indexed_df = sample_dataframe.set_index("TextColumn")
+
+    result = read_parquet_with_pushdown(
+        indexed_df.to_parquet(row_group_size=2),
+        columns=["FloatColumn"],
+        rows_filter=RowsFilter(column="IntColumn", operator=">", comp_value=30),
+    )
+
+    assert list(result.index) == [None, "Row4", "Row5", "Row6"]
+    assert list(result.columns) == ["FloatColumn"]
+
+
+@pytest.mark.parametrize(
+    "rows_filter", [
+        RowsFilter(column="IntColumn", operator="<", comp_value="text"),
+        RowsFilter(column="TextColumn", operator="=", comp_value=1),
+        RowsFilter(column="IntColumn", operator="=", comp_value=1, field="number"),
+        RowsFilter(column="ObjectColumn", operator="=", comp_value=1, field="missing"),
+        RowsFilter(column="MissingColumn", operator="=", comp_value=1),
+    ],
+)
+def test_read_parquet_with_pushdown_not_supported(sample_parquet, rows_filter):
+    with pytest.raises(PushdownNotSupportedError):
+        read_parquet_with_pushdown(sample_parquet, rows_filter=rows_filter)
+
+
+def test_read_parquet_with_pushdown_skips_row_groups(sample_parquet, mocker):
+    read_row_groups = mocker.spy(pq.ParquetFile, "read_row_groups")
+
+    result = read_parquet_with_pushdown(
+        sample_parquet,
+        rows_filter=RowsFilter(column="IntColumn", operator=">=", comp_value=45),
+    )
+
+    assert read_row_groups.call_args.args[1] == [2]
+    assert list(result.index) == [4, 5]
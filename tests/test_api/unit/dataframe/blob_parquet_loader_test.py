@@ -51,7 +51,7 @@ from app.exceptions.exceptions import NotFoundException
     ],
 )
 async def test_read_parquet_files(blob_ids, blob_data, df_filter_processor, expected_result):
-    blob_loader = BlobParquetLoader()
+    blob_loader = BlobParquetLoader("opendes")
 
     # Mock IBlobStorage
     mock_blob_storage_service = AsyncMock()
@@ -82,7 +82,7 @@ async def test_read_parquet_files(blob_ids, blob_data, df_filter_processor, expe
 
 @pytest.mark.asyncio
 async def test_read_parquet_handles_pyarrow_exception():
-    blob_loader = BlobParquetLoader()
+    blob_loader = BlobParquetLoader("opendes")
 
     # Mock IBlobStorage
     mock_blob_storage_service = AsyncMock()
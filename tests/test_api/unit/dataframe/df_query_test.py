@@ -15,7 +15,12 @@
 import pandas as pd
 import pytest
 
-from app.dataframe.query import PandasDFQueryBase
+from app.dataframe import query
+from app.dataframe.query import (
+    PandasDFQueryBase,
+    get_nested_values,
+    get_struct_array,
+)
 
 
 @pytest.fixture
@@ -110,6 +115,64 @@ class TestPandasDFQueryBase:
         expected_df = sample_dataframe.iloc[[0, 1, 2]]
         assert selected.df.equals(expected_df)
 
+    def test_select_nested_vectorized(self, sample_dataframe, mocker):
+        apply_spy = mocker.spy(pd.Series, "apply")
+        query_df = PandasDFQueryBase(sample_dataframe)
+        selected = query_df.select("ObjectColumn", ">", 2.0, "number")
+        assert selected.df.equals(sample_dataframe.iloc[[2, 3]])
+        apply_spy.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "object_column,operator,comp_val,expected_rows", [
+            ([{"number": 1}, {"number": "2"}, {"number": 3}, {"number": 4}], "=", 3, [2]),
+            ([{"number": 1}, {"number": "3"}, {"number": 3}, {"number": 4}], "!=", 3, [0, 1, 3]),
+        ],
+    )
+    def test_select_nested_heterogeneous(self, object_column, operator, comp_val, expected_rows, sample_dataframe):
+        sample_dataframe["ObjectColumn"] = object_column
+        query_df = PandasDFQueryBase(sample_dataframe)
+        selected = query_df.select("ObjectColumn", operator, comp_val, "number")
+        assert selected.df.equals(sample_dataframe.iloc[expected_rows])
+
+    def test_select_nested_missing_object(self, sample_dataframe):
+        sample_dataframe["ObjectColumn"] = [{"number": 1}, None, {"number": 3}, {"number": 4}]
+        query_df = PandasDFQueryBase(sample_dataframe)
+        with pytest.raises(TypeError):
+            query_df.select("ObjectColumn", ">", 2, "number")
+
+    def test_select_nested_missing_field(self, sample_dataframe):
+        sample_dataframe["ObjectColumn"] = [{"number": 1}, {"other": 2}, {"number": 3}, {"number": 4}]
+        query_df = PandasDFQueryBase(sample_dataframe)
+        with pytest.raises(KeyError):
+            query_df.select("ObjectColumn", "=", 3, "number")
+
+    def test_select_nested_converts_column_once(self, sample_dataframe, mocker):
+        struct_array_spy = mocker.spy(query, "get_struct_array")
+        query_df = PandasDFQueryBase(sample_dataframe)
+        query_df.select("ObjectColumn", ">", 2.0, "number")
+        query_df.select("ObjectColumn", "=", "InnerText1", "text")
+        struct_array_spy.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "object_column,prop_path,expected", [
+            ([{"a": {"b": 1}}, {"a": {"b": 2}}], ["a", "b"], [1, 2]),
+            ([{"a": {"b": "x"}}, {"a": {"b": "y"}}], ["a", "b"], ["x", "y"]),
+            ([{"a": {"b": 1}}, {"a": None}], ["a", "b"], [1, None]),
+            ([{"a": {"b": 1}}, {"a": {"c": 2}}], ["a", "b"], [1, None]),
+            ([{"a": {"b": 1}}, None], ["a", "b"], [1, None]),
+            ([{"a": {"b": 1}}, {"a": {"b": [2]}}], ["a", "b"], None),
+            ([{"a": [1]}, {"a": [2]}], ["a"], None),
+            ([{"a": 1}, {"a": 2}], ["c"], None),
+            ([{"a": 1}, {"a": "2"}], ["a"], None),
+        ],
+    )
+    def test_get_nested_values(self, object_column, prop_path, expected):
+        nested_values = get_nested_values(get_struct_array(pd.Series(object_column)), prop_path)
+        if expected is None:
+            assert nested_values is None
+        else:
+            assert nested_values.to_pylist() == expected
+
     @pytest.mark.parametrize(
         "column,aggregator_funcs,field, results", [
             ("IntColumn", ["mean", "max", "min", "sum"], None, [32.5, 40, 25, 130]),
@@ -74,7 +74,7 @@ class AsyncContextManager:
 
 @pytest.fixture
 def parquet_loader():
-    return ParquetLoader()
+    return ParquetLoader(Mock(data_partition_id="opendes"))
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,71 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.dataframe.partial_aggregation import PartialAggregation
+from app.exceptions.exceptions import UnprocessableContentException
+
+SAMPLE_VALUES = (
+    pd.Series([1, 2, 3], name="IntColumn"),
+    pd.Series([4.5, np.nan], name="IntColumn"),
+    pd.Series([np.nan], name="IntColumn"),
+    pd.Series([-2], name="IntColumn"),
+)
+SAMPLE_TEXT_VALUES = (
+    pd.Series(["Row1", "Row2"], name="TextColumn"),
+    pd.Series(["Row0", "Row3"], name="TextColumn"),
+)
+
+
+@pytest.mark.parametrize("agg_func", ["sum", "count", "min", "max", "mean", "describe"])
+@pytest.mark.parametrize("values", [SAMPLE_VALUES, SAMPLE_VALUES[:1], SAMPLE_VALUES[2:]])
+def test_partial_aggregation_as_concatenated(agg_func, values):
+    partial_aggregation = PartialAggregation(agg_func)
+
+    for partial_values in values:
+        partial_aggregation.update(partial_values)
+
+    expected = pd.concat(values, ignore_index=True).agg([agg_func])
+    if isinstance(expected, pd.Series):
+        expected = expected.to_frame()
+    pd.testing.assert_frame_equal(partial_aggregation.get_result(), expected)
+
+
+@pytest.mark.parametrize("agg_func", ["count", "min", "max", "describe"])
+def test_partial_aggregation_text(agg_func):
+    partial_aggregation = PartialAggregation(agg_func)
+
+    for partial_values in SAMPLE_TEXT_VALUES:
+        partial_aggregation.update(partial_values)
+
+    expected = pd.concat(SAMPLE_TEXT_VALUES, ignore_index=True).agg([agg_func])
+    if isinstance(expected, pd.Series):
+        expected = expected.to_frame()
+    pd.testing.assert_frame_equal(partial_aggregation.get_result(), expected)
+
+
+def test_partial_aggregation_text_mean():
+    partial_aggregation = PartialAggregation("mean")
+
+    with pytest.raises(UnprocessableContentException):
+        for partial_values in SAMPLE_TEXT_VALUES:
+            partial_aggregation.update(partial_values)
+        partial_aggregation.get_result()
+
+
+def test_partial_aggregation_empty():
+    assert PartialAggregation("sum").get_result().empty
@@ -12,11 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.core.config import get_app_settings
 from app.exceptions.exceptions import UnprocessableContentException
+from app.providers.dependencies import blob_storage as blob_storage_module
 from app.providers.dependencies.az.blob_storage import (
     STORAGE_ACCOUNT_KEY,
     STORAGE_ACCOUNT_NAME,
@@ -26,6 +29,8 @@ from app.providers.dependencies.blob_storage import (
     Blob,
     BlobMetadata,
     StoragePartitionInfo,
+    close_blob_storages,
+    get_blob_storage,
 )
 from app.resources.mime_types import SupportedMimeTypes
 
@@ -57,7 +62,7 @@ def storage_partition_info():
 @pytest.mark.asyncio
 async def test_create_blob_success(blob_metadata, storage_partition_info):
     test_blob = Blob(blob_data=b"data", blob_metadata=blob_metadata)
-    blob_storage = AzureBlobStorage(storage_partition_info)
+    blob_storage = AzureBlobStorage(storage_partition_info, get_app_settings())
 
     with patch.object(blob_storage, "_upload_blob", AsyncMock(return_value=blob_metadata)) as mock_upload:
         result = await blob_storage.create_blob(test_blob)
@@ -68,7 +73,7 @@ async def test_create_blob_success(blob_metadata, storage_partition_info):
 @pytest.mark.asyncio
 async def test_update_blob_success(blob_metadata, storage_partition_info):
     test_blob = Blob(blob_data=b"data", blob_metadata=blob_metadata)
-    blob_storage = AzureBlobStorage(storage_partition_info)
+    blob_storage = AzureBlobStorage(storage_partition_info, get_app_settings())
 
     with patch.object(blob_storage, "_upload_blob", AsyncMock(return_value=blob_metadata)) as mock_upload:
         result = await blob_storage.update_blob(test_blob)
@@ -78,7 +83,7 @@ async def test_update_blob_success(blob_metadata, storage_partition_info):
 
 @pytest.mark.asyncio
 async def test_list_blobs_success(storage_partition_info):
-    blob_storage = AzureBlobStorage(storage_partition_info)
+    blob_storage = AzureBlobStorage(storage_partition_info, get_app_settings())
 
     with patch.object(blob_storage, "list_blobs", AsyncMock(return_value=["blob1", "blob2"])) as mock_list:
         result = await blob_storage.list_blobs("some_path")
@@ -89,9 +94,95 @@ async def test_list_blobs_success(storage_partition_info):
 @pytest.mark.asyncio
 async def test_upload_blob_failure_due_to_azure_exception(blob_metadata, storage_partition_info):
     test_blob = Blob(blob_data=b"data", blob_metadata=blob_metadata)
-    blob_storage = AzureBlobStorage(storage_partition_info)
+    blob_storage = AzureBlobStorage(storage_partition_info, get_app_settings())
 
     with patch.object(blob_storage, "_upload_blob", AsyncMock(side_effect=UnprocessableContentException())) as mock_upload:
         with pytest.raises(UnprocessableContentException):
             await blob_storage.create_blob(test_blob)
         mock_upload.assert_called_once_with(test_blob)
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused(storage_partition_info):
+    blob_storage = AzureBlobStorage(storage_partition_info, get_app_settings())
+    container_client = blob_storage._get_container_client()
+
+    blob_storage.update_partition_info(storage_partition_info)
+
+    assert blob_storage._get_container_client() is container_client
+    await blob_storage.close()
+
+
+@pytest.mark.asyncio
+async def test_rotated_key_reuses_the_connection_pool(storage_partition_info):
+    blob_storage = AzureBlobStorage(storage_partition_info, get_app_settings())
+    container_client = blob_storage._get_container_client()
+    session = blob_storage._session
+
+    rotated_info = StoragePartitionInfo(
+        data_partition_id="dp1",
+        storage_account_info={**storage_partition_info.storage_account_info, STORAGE_ACCOUNT_KEY: "rotated+key=="},
+    )
+    blob_storage.update_partition_info(rotated_info)
+    rotated_client = blob_storage._get_container_client()
+
+    assert rotated_client is not container_client
+    assert rotated_client.credential.account_key == "rotated+key=="
+    assert blob_storage._session is session
+    await blob_storage.close()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_session_of_another_loop_is_replaced(storage_partition_info):
+    blob_storage = AzureBlobStorage(storage_partition_info, get_app_settings())
+    blob_storage._get_container_client()
+    stale_session = blob_storage._session
+    other_loop = asyncio.new_event_loop()
+    blob_storage._loop = other_loop
+
+    blob_storage._get_container_client()
+
+    # left to the other loop
+    assert not stale_session.closed
+    assert blob_storage._session is not stale_session
+    other_loop.close()
+    await blob_storage.close()
+    await stale_session.close()
+
+
+@pytest.mark.asyncio
+async def test_session_of_another_loop_is_not_closed(storage_partition_info):
+    blob_storage = AzureBlobStorage(storage_partition_info, get_app_settings())
+    blob_storage._get_container_client()
+    session = blob_storage._session
+    other_loop = asyncio.new_event_loop()
+    blob_storage._loop = other_loop
+
+    await blob_storage.close()
+
+    assert not session.closed
+    other_loop.close()
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_blob_storage_is_kept_per_data_partition(storage_partition_info, mocker):
+    settings = get_app_settings().copy(update={"local_dev_mode": False, "cloud_provider": "azure"})
+    account_info = MagicMock()
+    account_info.return_value.__aenter__.return_value.get_info = AsyncMock(
+        return_value=storage_partition_info.storage_account_info,
+    )
+    mocker.patch("app.providers.dependencies.az.storage_account_info.AzureStorageAccountInfo", account_info)
+
+    first_storage = await get_blob_storage("dp1", settings, None)
+    assert await get_blob_storage("dp1", settings, None) is first_storage
+    assert await get_blob_storage("dp2", settings, None) is not first_storage
+    assert account_info.call_count == 2
+
+    mocker.patch.object(blob_storage_module.time, "time", return_value=float("inf"))
+    assert await get_blob_storage("dp1", settings, None) is first_storage
+    assert account_info.call_count == 3
+
+    await close_blob_storages()
+    assert not blob_storage_module._blob_storages
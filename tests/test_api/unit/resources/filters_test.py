@@ -23,6 +23,7 @@ from app.resources.filters import (
     ColumnsFilter,
     DataFrameFilterValidator,
     RowsFilter,
+    get_filter_plan,
 )
 
 
@@ -134,3 +135,11 @@ def test_invalid_aggregatiom_dotted_colums():
     with pytest.raises(FilterValidationError) as exc_info:
         nested_aggregation_validator.valid_rows_filter
     assert str(exc_info.value) == "Wrong Column or Field name syntax: correct form: {ColumnName.FieldName}"
+
+
+def test_get_filter_plan_is_reused():
+    filter_plan = get_filter_plan(MockModel, raw_rows_filter="Field2,gt,1", raw_columns_aggregation="Field2,sum")
+
+    assert get_filter_plan(MockModel, raw_rows_filter="Field2,gt,1", raw_columns_aggregation="Field2,sum") is filter_plan
+    assert filter_plan.without_aggregation.valid_columns_aggregation is None
+    assert filter_plan.without_aggregation.valid_rows_filter is filter_plan.valid_rows_filter
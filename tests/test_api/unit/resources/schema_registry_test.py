@@ -0,0 +1,81 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from app.dev.resources.multiple_nested_filters import PropertyInfoProcessor
+from app.models.data_schemas.base import ALL_PATHS_TO_DATA_MODEL
+from app.resources.schema_registry import (
+    PropertyInfo,
+    get_schema_entry,
+    init_schema_registry,
+)
+
+
+class ArrayItem(BaseModel):
+    number: float
+
+
+class ObjectValue(BaseModel):
+    text: str
+    items: List[ArrayItem]
+
+
+class TreeNode(BaseModel):
+    name: str
+    children: Optional[List["TreeNode"]]
+
+
+TreeNode.update_forward_refs()
+
+
+class SampleModel(BaseModel):
+    IntColumn: int
+    ObjectColumn: ObjectValue = Field(description="refers the definition through allOf")
+    ArrayColumn: List[ObjectValue]
+    Tree: TreeNode
+
+
+def test_schema_entry_is_built_once():
+    schema_entry = get_schema_entry(SampleModel)
+
+    assert get_schema_entry(SampleModel) is schema_entry
+    assert json.loads(schema_entry.schema_json) == SampleModel.schema()
+
+
+def test_schema_entry_prop_infos():
+    prop_infos = get_schema_entry(SampleModel).prop_infos
+
+    assert prop_infos["IntColumn"] == PropertyInfo("IntColumn", "integer")
+    assert prop_infos["ObjectColumn.items"] == PropertyInfo("ObjectColumn.items", "array", is_array=True)
+    assert prop_infos["ObjectColumn.items.number"] == PropertyInfo("ObjectColumn.items[].number", "number")
+    assert prop_infos["ArrayColumn.items.number"] == PropertyInfo("ArrayColumn[].items[].number", "number")
+    assert prop_infos["Tree.children.name"] == PropertyInfo("Tree.children[].name", "string")
+    assert "Tree.children.children.name" not in prop_infos
+
+
+@pytest.mark.parametrize("model", sorted({
+    model for version_models in ALL_PATHS_TO_DATA_MODEL.values() for model in version_models.values()
+}, key=lambda model: f"{model.__module__}.{model.__qualname__}"))
+def test_schema_entry_prop_infos_match_schema_traversal(model):
+    init_schema_registry([model])
+    schema_entry = get_schema_entry(model)
+    prop_processor = PropertyInfoProcessor(schema_entry.expanded_schema)
+
+    for prop_name, prop_info in schema_entry.prop_infos.items():
+        assert prop_processor.get_prop_info(prop_name) == prop_info
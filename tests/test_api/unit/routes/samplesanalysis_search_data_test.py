@@ -0,0 +1,151 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import inspect
+from typing import Optional
+
+import pandas as pd
+import pytest
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+from app.api.dependencies.validation import (
+    get_search_data_pagination_parameters,
+)
+from app.api.routes.samplesanalysis.endpoints import (
+    SamplesAnalysisSearchDataView,
+)
+from app.dataframe.parquet_loader import DFPayload
+from app.exceptions.exceptions import UnprocessableContentException
+from app.resources.filters import DataFrameFilterValidator
+
+N_DATASETS = 10
+BATCH_SIZE = 2
+
+
+class SampleModel(BaseModel):
+    Value: Optional[int]
+
+
+class BatchesReader:
+    """Async generator of DFPayload batches recording the batches read."""
+
+    def __init__(self):
+        self.read_batches = 0
+        self.closed = False
+
+    async def read(self):
+        try:
+            for batch_offset in range(0, N_DATASETS, BATCH_SIZE):
+                self.read_batches += 1
+                yield [
+                    DFPayload(f"dataset-{dataset_i}", pd.DataFrame({"Value": [dataset_i]}), None)
+                    for dataset_i in range(batch_offset, batch_offset + BATCH_SIZE)
+                ]
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def search_data_view():
+    return SamplesAnalysisSearchDataView(APIRouter())
+
+
+@pytest.fixture
+def df_filter():
+    return DataFrameFilterValidator(model=None)
+
+
+@pytest.mark.parametrize(
+    "offset,page_limit,expected_values,expected_read_batches", [
+        (0, 1, [0], 1),
+        (0, 2, [0, 1], 2),
+        (3, 2, [3, 4], 3),
+        (8, 2, [8, 9], 5),
+    ],
+)
+@pytest.mark.asyncio
+async def test_build_result_df_stops_reading_after_page(
+    search_data_view, df_filter, offset, page_limit, expected_values, expected_read_batches,
+):
+    batches_reader = BatchesReader()
+
+    result_df, total_size = await search_data_view._build_result_df(  # noqa: WPS437
+        batches_reader.read(), df_filter, offset, page_limit, [], count_total=False,
+    )
+
+    assert result_df["Value"].tolist() == expected_values
+    assert batches_reader.read_batches == expected_read_batches
+    assert batches_reader.closed
+    assert total_size == (N_DATASETS if expected_read_batches == N_DATASETS // BATCH_SIZE else None)
+
+
+def test_search_data_counts_total_by_default():
+    count_total = inspect.signature(get_search_data_pagination_parameters).parameters["count_total"]
+
+    assert count_total.default.default is True
+
+
+@pytest.mark.asyncio
+async def test_build_result_df_count_total(search_data_view, df_filter):
+    batches_reader = BatchesReader()
+
+    result_df, total_size = await search_data_view._build_result_df(  # noqa: WPS437
+        batches_reader.read(), df_filter, 0, 2, [], count_total=True,
+    )
+
+    assert result_df["Value"].tolist() == [0, 1]
+    assert batches_reader.read_batches == N_DATASETS // BATCH_SIZE
+    assert total_size == N_DATASETS
+
+
+@pytest.mark.parametrize(
+    "agg_func,expected_value", [
+        ("sum", 45),
+        ("max", 9),
+        ("mean", 4.5),
+    ],
+)
+@pytest.mark.asyncio
+async def test_build_result_df_aggregation(search_data_view, agg_func, expected_value):
+    batches_reader = BatchesReader()
+    df_filter = DataFrameFilterValidator(model=SampleModel, raw_columns_aggregation=f"Value,{agg_func}")
+
+    result_df, total_size = await search_data_view._build_result_df(  # noqa: WPS437
+        batches_reader.read(), df_filter, 0, 1, [], count_total=False,
+    )
+
+    assert result_df.to_dict() == {"Value": {agg_func: expected_value}}
+    assert batches_reader.read_batches == N_DATASETS // BATCH_SIZE
+    assert total_size == N_DATASETS
+
+
+class ProjectedModel(BaseModel):
+    Value: Optional[int]
+    Other: Optional[int]
+
+
+@pytest.mark.asyncio
+async def test_build_result_df_aggregation_of_filtered_out_column(search_data_view):
+    df_filter = DataFrameFilterValidator(
+        model=ProjectedModel, raw_columns_filter="Other", raw_columns_aggregation="Value,sum",
+    )
+
+    async def read_projected():
+        yield [DFPayload(f"dataset-{dataset_i}", pd.DataFrame({"Other": [dataset_i]}), None) for dataset_i in range(2)]
+
+    with pytest.raises(UnprocessableContentException):
+        await search_data_view._build_result_df(  # noqa: WPS437
+            read_projected(), df_filter, 0, 1, [], count_total=False,
+        )
@@ -0,0 +1,188 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+
+from app.core.config import get_app_settings
+from app.dev.dataframe.multiple_nested_filter_processor import (
+    DFMultipleNestedFilterProcessor,
+)
+from app.dev.resources.multiple_nested_filters import (
+    DFMultipleNestedFilterValidator,
+)
+from app.exceptions.exceptions import ClientDisconnectedException
+from app.services import asyncify
+from app.services.asyncify import (
+    WORKER_POOL_TASKS,
+    PoolName,
+    TaskState,
+    WorkerPool,
+    get_worker_pool,
+    init_worker_pools,
+    run_in_processpool,
+    run_detached,
+    run_in_threadpool,
+    run_until_disconnected,
+    shutdown_worker_pools,
+)
+from tests.test_api.dev.dataframe.sample_dataframe_data import (
+    SAMPLE_DATA,
+    generate_json_schema,
+)
+
+
+def get_task_count(pool_name: str, state: str) -> float:
+    return WORKER_POOL_TASKS.labels(pool_name, state)._value.get()  # noqa: WPS437
+
+
+@pytest.fixture
+def worker_pools():
+    yield asyncify._worker_pools  # noqa: WPS437
+    shutdown_worker_pools()
+
+
+@pytest.mark.asyncio
+async def test_run_in_threadpool_out_of_event_loop(worker_pools):
+    main_thread = threading.get_ident()
+
+    result = await run_in_threadpool(lambda value, multiplier: (threading.get_ident(), value * multiplier), 2, 3)
+
+    assert result[0] != main_thread
+    assert result[1] == 6
+
+
+@pytest.mark.asyncio
+async def test_run_in_processpool_falls_back_to_threadpool(worker_pools):
+    result = await run_in_processpool(sum, [1, 2, 3])
+
+    assert result == 6
+    assert PoolName.PROCESS not in worker_pools
+
+
+@pytest.mark.asyncio
+async def test_run_in_processpool_runs_nested_filters(worker_pools):
+    init_worker_pools(get_app_settings().copy(update={"worker_process_pool_max_workers": 1}))
+    sample_df = pd.DataFrame(SAMPLE_DATA)
+    schema = generate_json_schema(json.loads(sample_df.to_json(orient="records"))[0])
+    df_filter = DFMultipleNestedFilterValidator(schema=schema, raw_rows_filter='{"IntColumn": {"$lte": 30}}')
+    filter_processor = DFMultipleNestedFilterProcessor(df_filter)
+    parquet_bytes = sample_df.to_parquet()
+
+    result_df = await run_in_processpool(filter_processor.apply_filters_from_bytes, parquet_bytes)
+
+    assert PoolName.PROCESS in worker_pools
+    assert result_df["TextColumn"].tolist() == ["Row1", "Row2"]
+    pd.testing.assert_frame_equal(result_df, filter_processor.apply_filters_from_bytes(parquet_bytes))
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_exception(worker_pools):
+    def fail():
+        raise ValueError("failure")
+
+    with pytest.raises(ValueError):
+        await run_in_threadpool(fail)
+
+
+def test_init_worker_pools(worker_pools):
+    settings = get_app_settings().copy(update={"worker_pool_max_workers": 2})
+
+    init_worker_pools(settings)
+
+    thread_pool = get_worker_pool(PoolName.THREAD)
+    assert thread_pool._executor._max_workers == 2  # noqa: WPS437
+    assert get_worker_pool(PoolName.PROCESS) is None
+
+
+def test_shutdown_worker_pools(worker_pools):
+    get_worker_pool(PoolName.THREAD)
+
+    shutdown_worker_pools()
+
+    assert not worker_pools
+
+
+@pytest.mark.asyncio
+async def test_cancelled_task_is_not_run():
+    worker_pool = WorkerPool("test-cancel", ThreadPoolExecutor(max_workers=1))
+    release = threading.Event()
+    executed = []
+    blocking_task = asyncio.create_task(worker_pool.run(release.wait))
+    queued_task = asyncio.create_task(worker_pool.run(executed.append, "executed"))
+    await asyncio.sleep(0.1)
+
+    assert get_task_count("test-cancel", TaskState.QUEUED) == 1
+    assert get_task_count("test-cancel", TaskState.RUNNING) == 1
+
+    queued_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued_task
+    release.set()
+    await blocking_task
+    worker_pool.shutdown()
+
+    assert not executed
+    assert get_task_count("test-cancel", TaskState.QUEUED) == 0
+    assert get_task_count("test-cancel", TaskState.RUNNING) == 0
+
+
+def build_request(disconnected: bool) -> MagicMock:
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=disconnected)
+    return request
+
+
+@pytest.mark.asyncio
+async def test_job_is_cancelled_once_client_disconnects():
+    worker_pool = WorkerPool("test-disconnect", ThreadPoolExecutor(max_workers=1))
+    release = threading.Event()
+    executed = []
+    blocking_task = asyncio.create_task(worker_pool.run(release.wait))
+
+    with pytest.raises(ClientDisconnectedException):
+        await run_until_disconnected(
+            build_request(disconnected=True), worker_pool.run(executed.append, "executed"), poll_interval=0.01,
+        )
+    release.set()
+    await blocking_task
+    worker_pool.shutdown()
+
+    assert not executed
+
+
+@pytest.mark.asyncio
+async def test_job_result_while_client_connected():
+    request = build_request(disconnected=False)
+
+    job_result = await run_until_disconnected(request, run_in_threadpool(sum, [1, 2]), poll_interval=0.01)
+
+    assert job_result == 3
+
+
+@pytest.mark.asyncio
+async def test_detached_job_is_not_cancelled():
+    request = build_request(disconnected=True)
+
+    async def run_job() -> int:
+        return await run_until_disconnected(request, run_in_threadpool(sum, [1, 2]), poll_interval=0)
+
+    assert await asyncio.create_task(run_detached(run_job)) == 3
+    request.is_disconnected.assert_not_called()
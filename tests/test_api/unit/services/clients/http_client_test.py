@@ -0,0 +1,106 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+import pytest
+from httpx import AsyncClient, Request, Response
+
+from app.core.config import get_app_settings
+from app.services.osdu_clients import http_client
+from app.services.osdu_clients.http_client import (
+    PooledClient,
+    close_http_clients,
+    get_http_client,
+    init_http_clients,
+)
+from app.services.osdu_clients.storage_client import StorageServiceApiClient
+
+STORAGE_URL = "http://storage.test/api/storage/v2"
+DATASET_URL = "http://dataset.test/api/dataset/v1"
+
+
+@pytest.fixture
+def http_clients():
+    http_client._http_clients.clear()  # noqa: WPS437
+    yield http_client._http_clients  # noqa: WPS437
+    http_client._http_clients.clear()  # noqa: WPS437
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_is_reused(http_clients):
+    storage_client = get_http_client(STORAGE_URL)
+
+    assert get_http_client(STORAGE_URL) is storage_client
+    assert get_http_client(DATASET_URL) is not storage_client
+    assert str(storage_client.base_url) == f"{STORAGE_URL}/"
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_recreates_closed_client(http_clients):
+    storage_client = get_http_client(STORAGE_URL)
+    await storage_client.aclose()
+
+    assert get_http_client(STORAGE_URL) is not storage_client
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_closes_client_of_another_loop(http_clients):
+    stale_client = get_http_client(STORAGE_URL)
+    http_clients[STORAGE_URL] = PooledClient(stale_client, Mock())
+
+    assert get_http_client(STORAGE_URL) is not stale_client
+    await asyncio.sleep(0)
+    assert stale_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_does_not_keep_cookies(http_clients):
+    storage_client = get_http_client(STORAGE_URL)
+    response = Response(
+        HTTPStatus.OK,
+        headers={"Set-Cookie": "session=caller-1; Path=/"},
+        request=Request("GET", f"{STORAGE_URL}/records"),
+    )
+
+    storage_client.cookies.extract_cookies(response)
+
+    assert not storage_client.cookies
+
+
+@pytest.mark.asyncio
+async def test_init_and_close_http_clients(http_clients):
+    settings = get_app_settings().copy(
+        update={"service_host_storage": STORAGE_URL, "service_host_dataset": DATASET_URL},
+    )
+
+    init_http_clients(settings)
+    clients = [pooled_client.client for pooled_client in http_clients.values()]
+    await close_http_clients()
+
+    assert {STORAGE_URL, DATASET_URL}.issubset({str(client.base_url).rstrip("/") for client in clients})
+    assert all(client.is_closed for client in clients)
+    assert not http_clients
+
+
+@pytest.mark.asyncio
+async def test_api_clients_share_connection_pool(http_clients):
+    with patch.object(AsyncClient, "get", return_value=Mock(status_code=HTTPStatus.OK, json=Mock(return_value={}))):
+        for token in ("token1", "token2"):
+            api_client = StorageServiceApiClient(base_url=STORAGE_URL, data_partition_id="partition", bearer_token=token)
+            await api_client.get_latest_record("record_id")
+
+    assert list(http_clients) == [STORAGE_URL]
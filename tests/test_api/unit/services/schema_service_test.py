@@ -0,0 +1,90 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from unittest.mock import Mock, patch
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache import schema_cache
+from app.models.schemas.user import User
+from app.services.osdu_clients.schema_client import SchemaServiceApiClient
+from app.services.schema import SchemaService
+
+KIND = "osdu:wks:work-product-component--SamplesAnalysis:1.0.0"
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "$id": KIND,
+    "type": "object",
+    "required": ["data"],
+}
+
+
+def build_schema_service():
+    return SchemaService(
+        data_partition_id="opendes",
+        settings=get_app_settings(),
+        user=User(access_token="token"),
+        extra_headers={},
+    )
+
+
+@pytest.fixture
+def fresh_schema_cache(mocker):
+    settings = get_app_settings().copy(update={"schema_cache_revalidate_after": 60, "schema_cache_dir": None})
+    mocker.patch.object(schema_cache, "get_app_settings", return_value=settings)
+    schema_cache.get_schema_cache.cache_clear()
+    yield
+    schema_cache.get_schema_cache.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_schema_and_validator_are_shared_between_requests(fresh_schema_cache):
+    with patch.object(
+        SchemaServiceApiClient, "get_schema_if_modified", return_value=(SCHEMA, "etag"),
+    ) as get_schema_if_modified:
+        first_errors = await build_schema_service().validate({"kind": KIND, "data": {}}, KIND)
+        second_errors = await build_schema_service().validate({"kind": KIND}, KIND)
+
+    get_schema_if_modified.assert_awaited_once_with(KIND, None)
+    assert first_errors is None
+    assert second_errors["errors"] == ["'data' is a required property"]
+    first_service, second_service = build_schema_service(), build_schema_service()
+    assert first_service._get_schema_validator(SCHEMA, KIND) is second_service._get_schema_validator(SCHEMA, KIND)
+
+
+@pytest.mark.asyncio
+async def test_not_modified_schema_keeps_etag():
+    response = Mock(status_code=status.HTTP_304_NOT_MODIFIED)
+    with patch.object(AsyncClient, "get", return_value=response) as httpx_get:
+        api_client = SchemaServiceApiClient(base_url="http://test-api.com", data_partition_id="opendes")
+        schema, etag = await api_client.get_schema_if_modified(KIND, "etag")
+
+    assert (schema, etag) == (None, "etag")
+    assert httpx_get.call_args.kwargs["headers"]["If-None-Match"] == "etag"
+
+
+@pytest.mark.asyncio
+async def test_schema_content_hash_is_used_without_etag():
+    response = Mock(status_code=status.HTTP_200_OK, headers={}, content=b"{}", json=Mock(return_value={}))
+    with patch.object(AsyncClient, "get", return_value=response):
+        api_client = SchemaServiceApiClient(base_url="http://test-api.com", data_partition_id="opendes")
+        schema, etag = await api_client.get_schema_if_modified(KIND)
+        not_modified_schema, _ = await api_client.get_schema_if_modified(KIND, etag)
+
+    assert schema == {}
+    assert not_modified_schema is None
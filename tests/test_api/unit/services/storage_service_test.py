@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
@@ -21,9 +22,14 @@ from httpx import HTTPStatusError
 from starlette import status
 
 from app.core.config import get_app_settings
+from app.core.helpers.cache.cache_tags import (
+    get_analysis_type_tag,
+    get_record_tag,
+)
 from app.exceptions.exceptions import OsduApiException
 from app.models.schemas.user import User
 from app.resources.common_headers import CORRELATION_ID
+from app.services import storage
 from app.services.osdu_clients.storage_client import StorageServiceApiClient
 from app.services.storage import (
     StorageService,
@@ -33,6 +39,8 @@ from tests.test_api.test_routes.osdu.storage_mock_objects import (
     OSDU_GENERIC_RECORD,
 )
 
+CACHE_ENABLED_SETTINGS = get_app_settings().copy(update={"cache_enable": True})
+
 
 def build_reason(status_code: int, reason_detail: str, message: str):
     return json.dumps({
@@ -56,12 +64,17 @@ def mock_user():
 
 
 @pytest.fixture
-def storage_service(mock_user):
+def app_settings():
+    yield get_app_settings()
+
+
+@pytest.fixture
+def storage_service(mock_user, app_settings):
     data_partition_id = "test_partition"
     correlation_id = "test_id"
     yield StorageService(
         data_partition_id,
-        get_app_settings(),
+        app_settings,
         mock_user,
         {CORRELATION_ID: correlation_id},
     )
@@ -180,7 +193,20 @@ async def test_upsert_records(storage_service, mock_record_client, mock_user):
 
 
 @pytest.mark.asyncio
-async def test_soft_delete_record(storage_service, mock_record_client, mock_user):
+async def test_upsert_records_invalidates_record_cache_tags(storage_service, mock_record_client, mocker):
+    records = [OSDU_GENERIC_RECORD.dict(exclude_none=True)]
+    mock_record_client.create_update_records.return_value = {"recordIdVersions": ["test-id:1"]}
+    storage_service.storage_client = mock_record_client
+    invalidate_cache_tags = mocker.patch("app.services.storage.invalidate_cache_tags")
+
+    await storage_service.upsert_records(records)
+
+    invalidated_tags = invalidate_cache_tags.call_args.args[0]
+    assert get_record_tag(records[0]["id"]) in invalidated_tags
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_record(storage_service, mock_record_client, mock_user, mock_get_response):
     record_id = "test_id"
     mock_record_client.soft_delete_record.return_value = None
     mock_record_client.storage_url = "https://test-url"
@@ -189,6 +215,28 @@ async def test_soft_delete_record(storage_service, mock_record_client, mock_user
     assert await storage_service.soft_delete_record(record_id) is None
 
     mock_record_client.soft_delete_record.assert_called_once_with(record_id)
+    # without the cache the record is not read for its tags
+    mock_record_client.get_latest_record.assert_not_called()
+
+
+@pytest.mark.parametrize("app_settings", [CACHE_ENABLED_SETTINGS])
+@pytest.mark.asyncio
+async def test_soft_delete_record_invalidates_record_cache_tags(
+    storage_service, mock_record_client, mock_get_response, mocker,
+):
+    record = OSDU_GENERIC_RECORD.dict(exclude_none=True)
+    record["data"]["SampleAnalysisTypeIDs"] = [
+        "opendes:reference-data--SampleAnalysisType:PVT.ConstantVolumeDepletion:",
+    ]
+    mock_record_client.get_latest_record.return_value = record
+    invalidate_cache_tags = mocker.patch("app.services.storage.invalidate_cache_tags")
+
+    await storage_service.soft_delete_record(record["id"])
+
+    invalidate_cache_tags.assert_awaited_once_with([
+        get_analysis_type_tag("test_partition", "constantvolumedepletion"),
+        get_record_tag(record["id"]),
+    ])
 
 
 @pytest.mark.parametrize(
@@ -266,6 +314,7 @@ async def test_error_handler_soft_delete_record(
         storage_service,
         mock_record_client,
         mock_user,
+        mock_get_response,
         with_patched_storage_client_error,
 ):
     record_id = "test-id"
@@ -282,6 +331,36 @@ async def test_error_handler_soft_delete_record(
     assert exc.value.detail == reason
 
 
+@pytest.mark.parametrize(
+    "storage_method,response_code", [
+        ("get_latest_record", status.HTTP_429_TOO_MANY_REQUESTS),
+        ("get_latest_record", status.HTTP_500_INTERNAL_SERVER_ERROR),
+    ],
+)
+@pytest.mark.parametrize("app_settings", [CACHE_ENABLED_SETTINGS])
+@pytest.mark.asyncio
+async def test_error_handler_soft_delete_record_read(
+        storage_method,
+        response_code,
+        storage_service,
+        mock_record_client,
+        mock_user,
+        with_patched_storage_client_error,
+):
+    record_id = "test-id"
+
+    with pytest.raises(OsduApiException) as exc:
+        await storage_service.soft_delete_record(record_id)
+
+    assert exc.value.status_code == status.HTTP_424_FAILED_DEPENDENCY
+    reason = build_reason(
+        status_code=response_code,
+        reason_detail=build_storage_service_exception_detail("retrieve"),
+        message="",
+    )
+    assert exc.value.detail == reason
+
+
 @pytest.mark.parametrize(
     "storage_method,response_code", [
         ("create_update_records", status.HTTP_429_TOO_MANY_REQUESTS),
@@ -358,6 +437,7 @@ async def test_error_handler_message_from_service(
     storage_service,
     mock_record_client,
     mock_user,
+    mock_get_response,
     with_patched_storage_client_error_json_from_dependecy,
 ):
     record_id = "test-id"
@@ -376,3 +456,66 @@ async def test_error_handler_message_from_service(
 
     assert exc.value.status_code == status.HTTP_424_FAILED_DEPENDENCY
     assert exc.value.detail == json.dumps(response_json)
+
+
+def build_record(record_id: str) -> dict:
+    return {"id": record_id, "acl": {"viewers": [], "owners": []}}
+
+
+@pytest.fixture
+def batching_storage_service(mocker, mock_user, mock_record_client):
+    storage._get_record_batcher.cache_clear()  # noqa: WPS437
+    settings = get_app_settings().copy(update={"storage_query_limit": 2, "storage_batch_window": 0.01})
+    storage_service = StorageService("test_partition", settings, mock_user, {CORRELATION_ID: "test_id"})
+    storage_service.storage_client = mock_record_client
+    mock_record_client.query_records.side_effect = lambda record_ids: {
+        "records": [build_record(record_id) for record_id in record_ids if record_id != "missing-id"],
+        "invalidRecords": [record_id for record_id in record_ids if record_id == "missing-id"],
+    }
+    mock_record_client.get_latest_record.side_effect = build_record
+    mock_record_client.get_specific_record.side_effect = lambda record_id, version: build_record(record_id)
+    yield storage_service
+
+
+@pytest.mark.asyncio
+async def test_get_records_batch_queries_chunks(batching_storage_service, mock_record_client):
+    record_ids = ["id-1", "id-2", "id-3", "id-1"]
+
+    records = await batching_storage_service.get_records_batch(record_ids)
+
+    assert [record["id"] for record in records] == record_ids
+    assert [query_call.args for query_call in mock_record_client.query_records.call_args_list] == [
+        (["id-1", "id-2"],), (["id-3"],),
+    ]
+    mock_record_client.get_latest_record.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_records_batch_reads_versioned_and_missing_records(batching_storage_service, mock_record_client):
+    records = await batching_storage_service.get_records_batch(["id-1", "missing-id", "id-2"], [None, None, 1])
+
+    assert [record["id"] for record in records] == ["id-1", "missing-id", "id-2"]
+    mock_record_client.query_records.assert_called_once_with(["id-1", "missing-id"])
+    mock_record_client.get_latest_record.assert_called_once_with("missing-id")
+    mock_record_client.get_specific_record.assert_called_once_with("id-2", 1)
+
+
+@pytest.mark.asyncio
+async def test_get_records_batch_skips_missing_records(batching_storage_service, mock_record_client):
+    records = await batching_storage_service.get_records_batch(["missing-id", "id-1"], skip_missing=True)
+
+    assert [record["id"] for record in records] == ["id-1"]
+    mock_record_client.get_latest_record.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_record_are_batched(batching_storage_service, mock_record_client):
+    records = await asyncio.gather(*(
+        batching_storage_service.get_record(record_id) for record_id in ("id-1", "id-2", "id-3", "missing-id")
+    ))
+
+    assert [record["id"] for record in records] == ["id-1", "id-2", "id-3", "missing-id"]
+    assert [query_call.args for query_call in mock_record_client.query_records.call_args_list] == [
+        (["id-1", "id-2"],), (["id-3", "missing-id"],),
+    ]
+    mock_record_client.get_latest_record.assert_called_once_with("missing-id")
@@ -0,0 +1,66 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Callable
+
+import pytest
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends import Backend
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache import signed_url_cache
+
+
+@pytest.fixture
+def backend_wrapper() -> Callable[[Backend], Backend]:
+    """Wraps the in-memory backend of cache_backend, overridden to test a
+    backend wrapper."""
+    return lambda backend: backend
+
+
+@pytest.fixture
+def cache_backend(backend_wrapper):
+    cache_state = {name: getattr(FastAPICache, name) for name in ("_init", "_backend", "_prefix", "_enable")}
+    FastAPICache.reset()
+    backend = InMemoryBackend()
+    backend._store.clear()  # noqa: WPS437
+    wrapped_backend = backend_wrapper(backend)
+    FastAPICache.init(wrapped_backend, prefix="test")
+    yield wrapped_backend
+    backend._store.clear()  # noqa: WPS437
+    for name, state_value in cache_state.items():
+        setattr(FastAPICache, name, state_value)
+
+
+@pytest.fixture
+def cache_settings_target() -> str:
+    """The settings getter patched by cache_enabled, overridden per
+    module."""
+    return "app.core.helpers.cache.cache_tags.get_app_settings"
+
+
+@pytest.fixture
+def cache_enabled(mocker, cache_settings_target):
+    settings = get_app_settings().copy(update={"cache_enable": True})
+    mocker.patch(cache_settings_target, return_value=settings)
+
+
+@pytest.fixture
+def fresh_signed_url_cache(mocker):
+    settings = get_app_settings().copy(update={"signed_url_expiry_margin": 0, "signed_url_cache_size": 10})
+    mocker.patch.object(signed_url_cache, "get_app_settings", return_value=settings)
+    signed_url_cache.get_signed_url_cache.cache_clear()
+    yield signed_url_cache.get_signed_url_cache()
+    signed_url_cache.get_signed_url_cache.cache_clear()
@@ -0,0 +1,46 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+
+import pyarrow as pa
+import pytest
+
+from app.core.helpers.cache.cache_files import (
+    get_cache_file_path,
+    write_cache_file,
+)
+
+
+@pytest.mark.parametrize("file_content,expected_content", [
+    ("text", b"text"),
+    (b"\x00binary", b"\x00binary"),
+    (pa.py_buffer(b"buffer"), b"buffer"),
+])
+def test_write_cache_file(tmp_path, file_content, expected_content):
+    file_path = get_cache_file_path(str(tmp_path), "entry", ".suffix")
+
+    write_cache_file(file_path, file_content)
+
+    with open(file_path, "rb") as cache_file:
+        assert cache_file.read() == expected_content
+    assert os.listdir(tmp_path) == [os.path.basename(file_path)]
+
+
+def test_cache_file_path_is_per_entry(tmp_path):
+    file_path = get_cache_file_path(str(tmp_path), "entry", ".suffix")
+
+    assert file_path.endswith(".suffix")
+    assert os.path.dirname(file_path) == str(tmp_path)
+    assert file_path != get_cache_file_path(str(tmp_path), "other_entry", ".suffix")
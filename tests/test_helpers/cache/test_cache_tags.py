@@ -0,0 +1,208 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache.cache_tags import (
+    add_cache_tags,
+    collect_cache_tags,
+    get_analysis_type_tag,
+    get_record_tag,
+    get_upserted_records_tags,
+    invalidate_cache_tags,
+    invalidate_search_tags_later,
+    tag_entry,
+)
+from app.models.schemas.user import User
+from app.search.analysis_type_ids_fetcher import (
+    SearchServiceSamplesAnalysisTypeIdsFetcher,
+)
+from app.services.osdu_clients.storage_client import StorageServiceApiClient
+from app.services.storage import StorageService
+
+RECORD_ID = "opendes:work-product-component--SamplesAnalysis:test"
+RECORD_TAG = get_record_tag(RECORD_ID)
+
+
+def test_tags_are_only_collected_while_collecting():
+    add_cache_tags(RECORD_TAG)
+    with collect_cache_tags() as cache_tags:
+        add_cache_tags(RECORD_TAG, RECORD_TAG)
+
+    assert cache_tags == {RECORD_TAG}
+
+
+def test_upserted_records_tags():
+    records = [
+        {
+            "id": RECORD_ID,
+            "data": {
+                "SampleAnalysisTypeIDs": [
+                    "opendes:reference-data--SampleAnalysisType:PVT.ConstantVolumeDepletion:",
+                    "opendes:reference-data--SampleAnalysisType:Unknown:",
+                ],
+            },
+        },
+        {"data": {}},
+    ]
+
+    assert get_upserted_records_tags("opendes", records) == [
+        get_analysis_type_tag("opendes", "constantvolumedepletion"),
+        RECORD_TAG,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_invalidation_clears_tagged_entries(cache_enabled, cache_backend):
+    await cache_backend.set("test:entry1", "value1", 60)
+    await cache_backend.set("test:entry2", "value2", 60)
+    await cache_backend.set("test:entry3", "value3", 60)
+    await tag_entry("test:entry1", [RECORD_TAG], 60)
+    await tag_entry("test:entry2", [RECORD_TAG, "dataset:other"], 60)
+    await tag_entry("test:entry3", ["dataset:other"], 60)
+
+    await invalidate_cache_tags([RECORD_TAG])
+
+    assert await cache_backend.get("test:entry1") is None
+    assert await cache_backend.get("test:entry2") is None
+    assert await cache_backend.get("test:entry3") == "value3"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_skips_expired_entries(cache_enabled, cache_backend):
+    await tag_entry("test:expired_entry", [RECORD_TAG], 60)
+
+    await invalidate_cache_tags([RECORD_TAG])
+
+    assert not cache_backend._store  # noqa: WPS437
+
+
+@pytest.mark.asyncio
+async def test_deleted_record_clears_search_entries(cache_enabled, cache_backend, mocker):
+    mocker.patch("app.core.helpers.cache.cache_tags.CACHE_SEARCH_INDEX_DELAY", 0)
+
+    async def iter_search_pages(*args, **kwargs):  # noqa: WPS430
+        yield []
+
+    mocker.patch("app.search.analysis_type_ids_fetcher.search.iter_search_pages", iter_search_pages)
+    with collect_cache_tags() as search_tags:
+        await SearchServiceSamplesAnalysisTypeIdsFetcher(MagicMock()).get_ids(
+            "opendes", "constantvolumedepletion", "1.0.0",
+        )
+    await cache_backend.set("test:search_entry", "value", 60)
+    await tag_entry("test:search_entry", search_tags, 60)
+    storage_service = StorageService(
+        "opendes",
+        get_app_settings().copy(update={"cache_enable": True}),
+        MagicMock(spec=User, access_token="token"),
+        {},
+    )
+    storage_service.storage_client = MagicMock(spec=StorageServiceApiClient, instance=True)
+    storage_service.storage_client.get_latest_record.return_value = {
+        "id": RECORD_ID,
+        "data": {"SampleAnalysisTypeIDs": ["opendes:reference-data--SampleAnalysisType:PVT.ConstantVolumeDepletion:"]},
+    }
+
+    await storage_service.soft_delete_record(RECORD_ID)
+
+    assert await cache_backend.get("test:search_entry") is None
+
+
+@pytest.mark.asyncio
+async def test_search_entries_filled_before_indexing_are_cleared_later(cache_enabled, cache_backend, mocker):
+    mocker.patch("app.core.helpers.cache.cache_tags.CACHE_SEARCH_INDEX_DELAY", 0.01)
+    analysis_type_tag = get_analysis_type_tag("opendes", "constantvolumedepletion")
+    invalidate_search_tags_later([analysis_type_tag, RECORD_TAG])
+    # filled after the first invalidation, before the change got indexed
+    await cache_backend.set("test:search_entry", "value", 60)
+    await cache_backend.set("test:record_entry", "value", 60)
+    await tag_entry("test:search_entry", [analysis_type_tag], 60)
+    await tag_entry("test:record_entry", [RECORD_TAG], 60)
+
+    await asyncio.sleep(0.05)
+
+    assert await cache_backend.get("test:search_entry") is None
+    assert await cache_backend.get("test:record_entry") == "value"
+
+
+@pytest.mark.asyncio
+async def test_redis_keeps_tagged_keys_in_sets(cache_enabled, cache_backend):
+    redis = AsyncMock()
+    redis.smembers.return_value = {b"test:entry"}
+    redis.ttl.return_value = -1
+    FastAPICache.reset()
+    FastAPICache.init(RedisBackend(redis), prefix="test")
+
+    await tag_entry("test:entry", [RECORD_TAG], 60)
+    await invalidate_cache_tags([RECORD_TAG])
+
+    tag_key = f"test:tag:{RECORD_TAG}"
+    redis.sadd.assert_awaited_once_with(tag_key, "test:entry")
+    redis.expire.assert_awaited_once_with(tag_key, 60)
+    assert [call.args for call in redis.delete.await_args_list] == [("test:entry",), (tag_key,)]
+
+
+@pytest.mark.asyncio
+async def test_redis_tag_ttl_is_only_extended(cache_enabled, cache_backend):
+    redis = AsyncMock()
+    redis.ttl.return_value = 120
+    FastAPICache.reset()
+    FastAPICache.init(RedisBackend(redis), prefix="test")
+
+    await tag_entry("test:entry", [RECORD_TAG], 60)
+
+    redis.sadd.assert_awaited_once_with(f"test:tag:{RECORD_TAG}", "test:entry")
+    redis.expire.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tag_ttl_is_only_extended(cache_enabled, cache_backend):
+    await tag_entry("test:entry1", [RECORD_TAG], 120)
+    await tag_entry("test:entry2", [RECORD_TAG], 60)
+
+    tag_ttl, _ = await cache_backend.get_with_ttl(f"test:tag:{RECORD_TAG}")
+
+    assert tag_ttl > 60
+
+
+@pytest.mark.asyncio
+async def test_concurrently_tagged_entries_are_all_kept(cache_enabled, cache_backend, mocker):
+    get_with_ttl = cache_backend.get_with_ttl
+
+    async def yielding_get_with_ttl(key):  # noqa: WPS430
+        tagged = await get_with_ttl(key)
+        # switch to the other taggings between the read and the write of the tag
+        await asyncio.sleep(0)
+        return tagged
+
+    mocker.patch.object(cache_backend, "get_with_ttl", yielding_get_with_ttl)
+    await asyncio.gather(*(tag_entry(f"test:entry{idx}", [RECORD_TAG], 60) for idx in range(10)))
+
+    _, tagged_value = await cache_backend.get_with_ttl(f"test:tag:{RECORD_TAG}")
+
+    assert len(json.loads(tagged_value)) == 10
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_tagged_with_cache_disabled(cache_backend):
+    await tag_entry("test:entry", [RECORD_TAG], 60)
+
+    assert not cache_backend._store  # noqa: WPS437
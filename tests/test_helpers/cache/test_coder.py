@@ -1,35 +1,40 @@
 #  Copyright 2023 ExxonMobil Technology and Engineering Company
 #
 import json
+from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
 from fastapi_cache.coder import JsonCoder, PickleCoder
 from starlette.responses import Response
 
-from app.core.helpers.cache.coder import ResponseCoder
+from app.core.helpers.cache.coder import (
+    COMPRESSIONS,
+    MAGIC,
+    DataFramesCoder,
+    ResponseCoder,
+)
+from app.dataframe.parquet_loader import DFPayload, DFPayloadCoder
 from app.resources.mime_types import SupportedMimeTypes
 
 
-@pytest.mark.parametrize(
-    "media_type,coder", [
-        (SupportedMimeTypes.JSON.mime_type, JsonCoder),
-        ("application/any", PickleCoder),
-    ],
-)
-def test_response_coder_encode(media_type, coder):
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+@pytest.mark.parametrize("media_type", [SupportedMimeTypes.JSON.mime_type, "application/any"])
+def test_response_coder_encode(media_type, compression):
     response = Response(
-        content="content",
+        content="content" * 100,
         media_type=media_type,
     )
-    encoded_content = coder.encode(response.body)
-    test_result = json.dumps({
-        "encoded_content": encoded_content,
-        "media_type": media_type,
-    })
 
-    expected_result = ResponseCoder.encode(response)
+    with patch("app.core.helpers.cache.coder.CACHE_COMPRESSION", compression):
+        encoded_response = ResponseCoder.encode(response)
+    decoded_response = ResponseCoder.decode(encoded_response)
 
-    assert test_result == expected_result
+    assert encoded_response.startswith(MAGIC)
+    assert (media_type.encode() + response.body in encoded_response) is not bool(compression)
+    assert decoded_response.body == response.body
+    assert decoded_response.media_type == media_type
 
 
 @pytest.mark.parametrize(
@@ -62,3 +67,38 @@ def test_response_coder_decode(value_to_decode, coder):
 
     assert test_result.body == expected_result.body
     assert test_result.media_type == expected_result.media_type
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_dataframes_coder(compression):
+    payloads = [
+        ("content1", pd.DataFrame({"a": [1, 2], "b": ["x", None], "c": [[1.0], [np.nan, 2.0]]}), None),
+        ("content2", pd.DataFrame(), "Not found"),
+        ("content3", pd.DataFrame({"mixed": [1, "text"]}, index=["i1", "i2"]), None),
+    ]
+
+    with patch("app.core.helpers.cache.coder.CACHE_COMPRESSION", compression):
+        encoded_payloads = DataFramesCoder.encode(payloads)
+    decoded_payloads = DataFramesCoder.decode(encoded_payloads)
+
+    assert [payload[::2] for payload in decoded_payloads] == [payload[::2] for payload in payloads]
+    for (_, decoded_df, _), (_, df, _) in zip(decoded_payloads, payloads):
+        pd.testing.assert_frame_equal(decoded_df, df, check_column_type=False, check_index_type=False)
+
+
+def test_df_payload_coder_decodes_pickled_values():
+    payloads = [DFPayload("content", pd.DataFrame({"a": [1]}), None)]
+
+    decoded_payloads = DFPayloadCoder.decode(PickleCoder.encode(payloads))
+
+    assert isinstance(decoded_payloads[0], DFPayload)
+    pd.testing.assert_frame_equal(decoded_payloads[0].df, payloads[0].df)
+
+
+def test_df_payload_coder():
+    payloads = [DFPayload("content", pd.DataFrame({"a": [1]}), None)]
+
+    decoded_payloads = DFPayloadCoder.decode(DFPayloadCoder.encode(payloads))
+
+    assert isinstance(decoded_payloads[0], DFPayload)
+    pd.testing.assert_frame_equal(decoded_payloads[0].df, payloads[0].df)
@@ -0,0 +1,176 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pandas as pd
+import pytest
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache import content_cache
+from app.core.helpers.cache.content_cache import (
+    ContentCache,
+    DiskLRUCache,
+    get_content,
+    get_content_cache,
+)
+from app.dataframe.blob_parquet_loader import BlobParquetLoader
+from app.models.schemas.user import User
+from app.providers.dependencies.blob_loader import IBlobLoader
+from app.services.dataset import DatasetService
+from app.services.osdu_clients.dataset_client import DatasetServiceApiClient
+
+DATASET_ID = "opendes:dataset--File.Generic:dataset:1"
+
+
+@pytest.fixture
+def enabled_content_cache(mocker, tmp_path):
+    settings = get_app_settings().copy(update={"content_cache_max_bytes": 1024, "content_cache_dir": str(tmp_path)})
+    mocker.patch.object(content_cache, "get_app_settings", return_value=settings)
+    get_content_cache.cache_clear()
+    yield get_content_cache()
+    get_content_cache.cache_clear()
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    disk_cache = DiskLRUCache(str(tmp_path), max_bytes=10)
+    disk_cache.set("content1", b"1234")
+    disk_cache.set("content2", b"1234")
+    disk_cache.get("content1")
+    disk_cache.set("content3", b"1234")
+
+    assert disk_cache.get("content2") is None
+    assert disk_cache.get("content1").to_pybytes() == b"1234"
+    assert disk_cache.size == 8
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_disk_cache_keeps_files_across_instances(tmp_path):
+    DiskLRUCache(str(tmp_path), max_bytes=10).set("content", b"1234")
+
+    disk_cache = DiskLRUCache(str(tmp_path), max_bytes=10)
+
+    assert disk_cache.size == 4
+    assert disk_cache.get("content").to_pybytes() == b"1234"
+
+
+def test_disk_cache_skips_contents_over_budget(tmp_path):
+    disk_cache = DiskLRUCache(str(tmp_path), max_bytes=10)
+    disk_cache.set("content", b"12345678901")
+
+    assert disk_cache.get("content") is None
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_content_cache_downloads_once(tmp_path):
+    cache = ContentCache(max_bytes=10, disk_directory=str(tmp_path), disk_max_bytes=10)
+    download = AsyncMock(return_value=b"1234")
+
+    for _ in range(2):
+        assert await cache.get_content("content", download) == b"1234"
+    cache.memory_cache.clear()
+    disk_content = await cache.get_content("content", download)
+
+    download.assert_awaited_once()
+    assert disk_content.to_pybytes() == b"1234"
+
+
+@pytest.mark.asyncio
+async def test_content_cache_skips_empty_contents():
+    cache = ContentCache(max_bytes=10)
+    download = AsyncMock(return_value=None)
+
+    for _ in range(2):
+        assert await cache.get_content("content", download) is None
+
+    assert download.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content_id", [None, "content"])
+async def test_get_content_without_content_cache(content_id):
+    download = AsyncMock(return_value=b"1234")
+
+    for _ in range(2):
+        assert await get_content("opendes", content_id, download) == b"1234"
+
+    assert download.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_content_without_content_id(enabled_content_cache):
+    download = AsyncMock(return_value=b"1234")
+
+    for _ in range(2):
+        await get_content("opendes", None, download)
+
+    assert download.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_content_per_data_partition(enabled_content_cache):
+    download = AsyncMock(side_effect=[b"1234", b"5678"])
+
+    assert await get_content("partition1", "content", download) == b"1234"
+    assert await get_content("partition2", "content", download) == b"5678"
+    assert await get_content("partition1", "content", download) == b"1234"
+
+    assert download.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_blob_parquet_loader_uses_content_cache(enabled_content_cache):
+    blob_storage_service = AsyncMock()
+    blob_storage_service.get_blob.return_value = MagicMock(blob_data=pd.DataFrame({"a": [1]}).to_parquet())
+
+    for _ in range(2):
+        df_payloads = await BlobParquetLoader("opendes").read_parquet_files(
+            blob_ids=["family/type/1.0.0/uuid"],
+            blob_storage_service=blob_storage_service,
+        )
+
+    blob_storage_service.get_blob.assert_awaited_once()
+    assert df_payloads[0].df.equals(pd.DataFrame({"a": [1]}))
+
+
+def build_dataset_service(mocker, token: str) -> DatasetService:
+    mocker.patch("app.services.dataset.get_blob_loader")
+    dataset_service = DatasetService("opendes", get_app_settings(), User(access_token=token), extra_headers={})
+    dataset_service.dataset_client = MagicMock(spec=DatasetServiceApiClient)
+    dataset_service.dataset_client.get_retrieval_instructions.return_value = {
+        "datasets": [{"retrievalProperties": {"signedUrl": f"https://host/blob?token={token}"}}],
+    }
+    dataset_service.blob_loader = create_autospec(IBlobLoader, spec_set=True)
+    dataset_service.blob_loader.download_blob.return_value = b"1234"
+    return dataset_service
+
+
+@pytest.mark.asyncio
+async def test_dataset_download_checks_each_caller_before_cache_hit(
+    mocker, enabled_content_cache, fresh_signed_url_cache,
+):
+    viewer_service = build_dataset_service(mocker, "viewer_token")
+    other_service = build_dataset_service(mocker, "other_token")
+    other_service.dataset_client.get_retrieval_instructions.side_effect = PermissionError("Not entitled")
+
+    assert await viewer_service.download_file(DATASET_ID) == b"1234"
+    assert await viewer_service.download_file(DATASET_ID) == b"1234"
+    with pytest.raises(PermissionError):
+        await other_service.download_file(DATASET_ID)
+
+    viewer_service.dataset_client.get_retrieval_instructions.assert_awaited_once_with(DATASET_ID)
+    viewer_service.blob_loader.download_blob.assert_awaited_once()
+    other_service.blob_loader.download_blob.assert_not_called()
@@ -0,0 +1,110 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.routes.utils.query import find_missing_records
+from app.core.config import get_app_settings
+from app.core.helpers.cache import existence_cache
+from app.core.helpers.cache.existence_cache import ExistenceCache
+
+PARTITION = "opendes"
+UNIT_ID = "opendes:reference-data--UnitOfMeasure:m"
+WELLBORE_ID = "opendes:master-data--Wellbore:1"
+SAMPLE_ID = "opendes:master-data--Sample:missing"
+REPORT_ID = "opendes:work-product-component--SamplesAnalysesReport:1"
+
+
+@pytest.fixture
+def storage_service():
+    storage_service = MagicMock(data_partition_id=PARTITION)
+    storage_service.query_records = AsyncMock(side_effect=lambda record_ids: {
+        "records": [],
+        "invalidRecords": [record_id for record_id in record_ids if record_id == SAMPLE_ID],
+    })
+    return storage_service
+
+
+@pytest.fixture
+def cached_existence(mocker):
+    settings = get_app_settings().copy(update={
+        "storage_query_limit": 2, "storage_query_concurrency": 1, "reference_exists_cache_ttl": 60,
+    })
+    mocker.patch("app.api.routes.utils.query.get_app_settings", return_value=settings)
+    mocker.patch.object(existence_cache, "get_app_settings", return_value=settings)
+    existence_cache.get_existence_cache.cache_clear()
+    yield
+    existence_cache.get_existence_cache.cache_clear()
+
+
+def test_only_reference_and_master_data_are_cached():
+    cache = ExistenceCache(ttl=60)
+    cache.add(PARTITION, [UNIT_ID, WELLBORE_ID, REPORT_ID])
+
+    assert cache.get_unknown_ids(PARTITION, [UNIT_ID, WELLBORE_ID, REPORT_ID]) == [REPORT_ID]
+    assert cache.get_unknown_ids("other", [UNIT_ID]) == [UNIT_ID]
+
+
+def test_ids_expire_and_are_evicted(mocker):
+    cache = ExistenceCache(ttl=60, max_size=1)
+    cache.add(PARTITION, [UNIT_ID, WELLBORE_ID])
+
+    assert cache.get_unknown_ids(PARTITION, [UNIT_ID, WELLBORE_ID]) == [UNIT_ID]
+    mocker.patch("app.core.helpers.cache.existence_cache.time.time", return_value=float("inf"))
+    assert cache.get_unknown_ids(PARTITION, [WELLBORE_ID]) == [WELLBORE_ID]
+
+
+def test_disabled_cache_keeps_nothing():
+    cache = ExistenceCache(ttl=0)
+    cache.add(PARTITION, [UNIT_ID])
+
+    assert cache.get_unknown_ids(PARTITION, [UNIT_ID]) == [UNIT_ID]
+
+
+@pytest.mark.asyncio
+async def test_missing_records_are_queried_in_chunks(cached_existence, storage_service):
+    record_ids = [UNIT_ID, WELLBORE_ID, SAMPLE_ID, REPORT_ID, UNIT_ID]
+
+    assert await find_missing_records(storage_service, record_ids) == [SAMPLE_ID]
+    assert [query_call.args for query_call in storage_service.query_records.await_args_list] == [
+        ([UNIT_ID, WELLBORE_ID],), ([SAMPLE_ID, REPORT_ID],),
+    ]
+
+    storage_service.query_records.reset_mock()
+    assert await find_missing_records(storage_service, record_ids) == [SAMPLE_ID]
+    storage_service.query_records.assert_awaited_once_with([SAMPLE_ID, REPORT_ID])
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_queried_concurrently(mocker, storage_service):
+    settings = get_app_settings().copy(update={"storage_query_limit": 1, "storage_query_concurrency": 2})
+    mocker.patch("app.api.routes.utils.query.get_app_settings", return_value=settings)
+    running_queries = []
+    max_running_queries = []
+
+    async def query_records(record_ids):
+        running_queries.append(record_ids)
+        max_running_queries.append(len(running_queries))
+        await asyncio.sleep(0.01)
+        running_queries.remove(record_ids)
+        return {"invalidRecords": []}
+
+    storage_service.query_records = query_records
+    await find_missing_records(storage_service, [REPORT_ID, f"{REPORT_ID}2", f"{REPORT_ID}3"])
+
+    assert max(max_running_queries) == 2
@@ -0,0 +1,94 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from fastapi import Response
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from prometheus_client import REGISTRY
+
+from app.core.helpers.cache import metrics
+from app.core.helpers.cache.backends.instrumented_cache import (
+    InstrumentedBackend,
+    unwrap_backend,
+)
+from app.core.helpers.cache.backends.tiered_cache import LocalLRUCache
+from app.core.helpers.cache.coder import ResponseCoder
+from app.core.helpers.cache_helper import get_top_keys
+
+
+@pytest.fixture
+def backend_wrapper():
+    return InstrumentedBackend
+
+
+def get_sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.parametrize(
+    "cache_key,namespace", [
+        ("test::0123abcd", metrics.DEFAULT_NAMESPACE),
+        ("test::shared:0123abcd", "shared"),
+        ("test:groups:0123abcd", "groups"),
+        ("test:tag:record:opendes:id", "tag"),
+    ],
+)
+def test_key_namespace(cache_backend, cache_key, namespace):
+    assert metrics.get_key_namespace(cache_key) == namespace
+
+
+@pytest.mark.asyncio
+async def test_instrumented_backend_observes_lookups_and_fills(cache_backend):
+    labels = {"namespace": "metricstest", "route": ""}
+    misses = get_sample("rafs_cache_requests_total", result="miss", **labels)
+    hits = get_sample("rafs_cache_requests_total", result="hit", **labels)
+    fills = get_sample("rafs_cache_fill_seconds_count", **labels)
+    filled_bytes = get_sample("rafs_cache_entry_bytes_sum", **labels)
+
+    assert await cache_backend.get("test:metricstest:key") is None
+    await cache_backend.set("test:metricstest:key", b"value", 60)
+    assert await cache_backend.get_with_ttl("test:metricstest:key") == (60, b"value")
+
+    assert get_sample("rafs_cache_requests_total", result="miss", **labels) == misses + 1
+    assert get_sample("rafs_cache_requests_total", result="hit", **labels) == hits + 1
+    assert get_sample("rafs_cache_fill_seconds_count", **labels) == fills + 1
+    assert get_sample("rafs_cache_entry_bytes_sum", **labels) == filled_bytes + len(b"value")
+    assert isinstance(unwrap_backend(cache_backend), InMemoryBackend)
+
+
+def test_local_cache_evictions_are_counted():
+    evictions = get_sample("rafs_cache_evictions_total", cache="test_local")
+    local_cache = LocalLRUCache(max_bytes=4, name="test_local")
+    local_cache.set("key1", b"1234", expire=60)
+    local_cache.set("key2", b"1234", expire=60)
+
+    assert get_sample("rafs_cache_evictions_total", cache="test_local") == evictions + 1
+
+
+def test_decode_time_is_observed():
+    labels = {"coder": "ResponseCoder", "route": ""}
+    decodes = get_sample("rafs_cache_decode_seconds_count", **labels)
+
+    ResponseCoder.decode(ResponseCoder.encode(Response(content=b"body", media_type="text/plain")))
+
+    assert get_sample("rafs_cache_decode_seconds_count", **labels) == decodes + 1
+
+
+@pytest.mark.asyncio
+async def test_top_keys_are_the_biggest_entries(cache_backend):
+    await cache_backend.set("test::small", b"1", 60)
+    await cache_backend.set("test::big", b"123", 60)
+    await cache_backend.set("test::medium", b"12", 60)
+
+    assert await get_top_keys(limit=2) == [("test::big", 3), ("test::medium", 2)]
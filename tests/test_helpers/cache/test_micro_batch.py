@@ -0,0 +1,64 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.helpers.cache.micro_batch import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_keys_within_window_are_loaded_in_one_batch():
+    load_batch = AsyncMock(side_effect=lambda keys: {key: {"key": key} for key in keys})
+    batcher = MicroBatcher(window=0.01, max_batch_size=10)
+
+    values = await asyncio.gather(*(batcher.load("caller", key, load_batch) for key in ("a", "b", "a")))
+
+    assert values == [{"key": "a"}, {"key": "b"}, {"key": "a"}]
+    assert values[0] is not values[2]
+    load_batch.assert_awaited_once_with(["a", "b"])
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_loaded_before_window():
+    load_batch = AsyncMock(side_effect=lambda keys: {key: key for key in keys})
+    batcher = MicroBatcher(window=60, max_batch_size=2)
+
+    values = await asyncio.wait_for(
+        asyncio.gather(*(batcher.load("caller", key, load_batch) for key in ("a", "b"))), timeout=1,
+    )
+
+    assert values == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_grouped_by_batch_key():
+    load_batch = AsyncMock(side_effect=lambda keys: {key: key for key in keys})
+    batcher = MicroBatcher(window=0.01, max_batch_size=10)
+
+    await asyncio.gather(batcher.load("caller", "a", load_batch), batcher.load("other caller", "a", load_batch))
+
+    assert load_batch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_key_is_none_and_errors_are_raised():
+    batcher = MicroBatcher(window=0.01, max_batch_size=10)
+
+    assert await batcher.load("caller", "a", AsyncMock(return_value={})) is None
+    with pytest.raises(ValueError):
+        await batcher.load("caller", "a", AsyncMock(side_effect=ValueError("storage unavailable")))
@@ -0,0 +1,116 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.helpers.cache.schema_cache import SchemaCache
+
+PARTITION = "opendes"
+KIND = "osdu:wks:work-product-component--SamplesAnalysis:1.0.0"
+SCHEMA = {"$id": KIND, "type": "object"}
+UPDATED_SCHEMA = {"$id": KIND, "type": "object", "required": ["data"]}
+
+
+@pytest.fixture
+def cache_settings_target():
+    return "app.core.helpers.cache.schema_cache.get_app_settings"
+
+
+@pytest.mark.asyncio
+async def test_schema_is_fetched_once():
+    schema_cache = SchemaCache(revalidate_after=60)
+    fetch = AsyncMock(return_value=(SCHEMA, "etag"))
+
+    schemas = await asyncio.gather(*(schema_cache.get_schema(PARTITION, KIND, fetch) for _ in range(3)))
+    schemas.append(await schema_cache.get_schema(PARTITION, KIND, fetch))
+
+    assert all(schema is schemas[0] for schema in schemas)
+    fetch.assert_awaited_once_with(KIND, None)
+
+
+@pytest.mark.asyncio
+async def test_schema_is_fetched_per_partition():
+    schema_cache = SchemaCache(revalidate_after=60)
+    fetch = AsyncMock(return_value=(SCHEMA, "etag"))
+
+    await schema_cache.get_schema(PARTITION, KIND, fetch)
+    await schema_cache.get_schema("other", KIND, fetch)
+
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_schema_is_shared_through_the_cache_backend(cache_backend, cache_enabled):
+    await SchemaCache(revalidate_after=60).get_schema(PARTITION, KIND, AsyncMock(return_value=(SCHEMA, "etag")))
+    fetch = AsyncMock()
+
+    assert await SchemaCache(revalidate_after=60).get_schema(PARTITION, KIND, fetch) == SCHEMA
+    fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_schema_is_kept_on_disk(tmp_path):
+    await SchemaCache(revalidate_after=60, directory=str(tmp_path)).get_schema(
+        PARTITION, KIND, AsyncMock(return_value=(SCHEMA, "etag")),
+    )
+    fetch = AsyncMock()
+
+    schema_cache = SchemaCache(revalidate_after=60, directory=str(tmp_path))
+
+    assert await schema_cache.get_schema(PARTITION, KIND, fetch) == SCHEMA
+    fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_not_modified_schema_is_kept():
+    schema_cache = SchemaCache(revalidate_after=0)
+    schema = await schema_cache.get_schema(PARTITION, KIND, AsyncMock(return_value=(SCHEMA, "etag")))
+    fetch = AsyncMock(return_value=(None, "etag"))
+
+    assert await schema_cache.get_schema(PARTITION, KIND, fetch) is schema
+    await asyncio.sleep(0)
+
+    fetch.assert_awaited_once_with(KIND, "etag")
+    assert await schema_cache.get_schema(PARTITION, KIND, AsyncMock(return_value=(None, "etag"))) is schema
+
+
+@pytest.mark.asyncio
+async def test_modified_schema_is_served_after_revalidation():
+    schema_cache = SchemaCache(revalidate_after=0)
+    await schema_cache.get_schema(PARTITION, KIND, AsyncMock(return_value=(SCHEMA, "etag")))
+    fetch = AsyncMock(return_value=(UPDATED_SCHEMA, "new-etag"))
+
+    assert await schema_cache.get_schema(PARTITION, KIND, fetch) == SCHEMA
+    await asyncio.sleep(0)
+
+    assert await schema_cache.get_schema(PARTITION, KIND, fetch) == UPDATED_SCHEMA
+
+
+@pytest.mark.asyncio
+async def test_failed_revalidation_keeps_schema():
+    schema_cache = SchemaCache(revalidate_after=60)
+    await schema_cache.get_schema(PARTITION, KIND, AsyncMock(return_value=(SCHEMA, "etag")))
+    schema_cache.revalidate_after = 0
+    fetch = AsyncMock(side_effect=ValueError("schema service unavailable"))
+
+    assert await schema_cache.get_schema(PARTITION, KIND, fetch) == SCHEMA
+    await asyncio.sleep(0)
+
+    schema_cache.revalidate_after = 60
+    assert await schema_cache.get_schema(PARTITION, KIND, fetch) == SCHEMA
+    fetch.assert_awaited_once()
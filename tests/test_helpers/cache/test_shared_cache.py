@@ -0,0 +1,343 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import time
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache import record_acl
+from app.core.helpers.cache.cache_tags import (
+    add_cache_tags,
+    get_record_tag,
+    invalidate_cache_tags,
+)
+from app.core.helpers.cache.coder import ResponseCoder
+from app.core.helpers.cache.record_acl import (
+    capture_record_acl,
+    collect_record_acls,
+    is_entitled,
+)
+from app.core.helpers.cache.shared_cache import (
+    SharedCacheScope,
+    get_caller_groups,
+    shared_cache,
+)
+from app.exceptions.exceptions import ClientDisconnectedException
+from app.services.entitlements import EntitlementsService
+
+RECORD = {"id": "record_id", "acl": {"viewers": ["data.viewers@test.com"], "owners": ["data.owners@test.com"]}}
+VIEWER_GROUPS = ["data.viewers@test.com"]
+OTHER_GROUPS = ["data.other@test.com"]
+
+
+class RecordReader:
+    def __init__(self):
+        self.calls = 0
+
+    @shared_cache(expire=60)
+    async def get_record(self, record_id: str) -> dict:
+        self.calls += 1
+        capture_record_acl(RECORD)
+        add_cache_tags(get_record_tag(record_id))
+        return RECORD
+
+    @shared_cache(expire=60)
+    async def get_slow_record(self, record_id: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        capture_record_acl(RECORD)
+        return RECORD
+
+    @shared_cache(expire=60)
+    async def get_entitled_record(self, record_id: str, request: Request) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if request.headers["authorization"] == "Bearer other_token":
+            raise PermissionError("Not entitled")
+        capture_record_acl(RECORD)
+        return RECORD
+
+    @shared_cache(expire=60)
+    async def get_record_once_disconnected(self, record_id: str, request: Request) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.calls == 1:
+            raise ClientDisconnectedException()
+        return RECORD
+
+    @shared_cache(expire=60, coder=ResponseCoder)
+    async def get_record_data(self, record_id: str) -> Response:
+        self.calls += 1
+        capture_record_acl(RECORD)
+        return Response(content=b"\x00parquet\n", media_type="application/x-parquet")
+
+    @shared_cache(expire=60)
+    async def get_without_record(self) -> dict:
+        self.calls += 1
+        return {}
+
+    @shared_cache(expire=60, scope=SharedCacheScope.GROUPS)
+    async def search(self, request: Request) -> dict:
+        self.calls += 1
+        return {"result": [RECORD["id"]]}
+
+    @shared_cache(expire=60, scope=SharedCacheScope.GROUPS, stale_ttl=60)
+    async def search_with_stale(self, request: Request) -> dict:
+        self.calls += 1
+        return {"calls": self.calls}
+
+
+def build_request(token: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/records",
+        "query_string": b"",
+        "headers": [
+            (b"authorization", f"Bearer {token}".encode()),
+            (b"data-partition-id", b"opendes"),
+        ],
+    })
+
+
+@pytest.fixture
+def shared_keys(mocker):
+    settings = get_app_settings().copy(update={"cache_enable": True, "cache_shared_keys": True})
+    mocker.patch("app.core.helpers.cache.shared_cache.get_app_settings", return_value=settings)
+
+
+@pytest.fixture
+def token_keys(mocker):
+    settings = get_app_settings().copy(update={"cache_enable": True})
+    mocker.patch("app.core.helpers.cache.shared_cache.get_app_settings", return_value=settings)
+
+
+@pytest.fixture
+def caller_groups(mocker):
+    groups_by_token = {"viewer_token": VIEWER_GROUPS, "viewer_token2": VIEWER_GROUPS, "other_token": OTHER_GROUPS}
+
+    async def get_caller_groups(request, expire):
+        return groups_by_token[request.headers["authorization"].split()[-1]]
+    return mocker.patch("app.core.helpers.cache.shared_cache.get_caller_groups", side_effect=get_caller_groups)
+
+
+@pytest.mark.parametrize(
+    "groups,record_acls,expected", [
+        (VIEWER_GROUPS, [RECORD["acl"]], True),
+        (["data.owners@test.com"], [RECORD["acl"]], True),
+        (OTHER_GROUPS, [RECORD["acl"]], False),
+        (VIEWER_GROUPS, [RECORD["acl"], {"viewers": OTHER_GROUPS, "owners": []}], False),
+        (VIEWER_GROUPS, [], True),
+    ],
+)
+def test_is_entitled(groups, record_acls, expected):
+    assert is_entitled(groups, record_acls) is expected
+
+
+def test_record_acls_are_only_captured_while_collecting():
+    capture_record_acl(RECORD)
+    with collect_record_acls() as record_acls:
+        capture_record_acl(RECORD)
+
+    assert record_acls == [RECORD["acl"]]
+    assert record_acl._filled_record_acls.get() is None  # noqa: WPS437
+
+
+@pytest.mark.asyncio
+async def test_record_entry_is_shared_by_entitled_callers(cache_backend, shared_keys, caller_groups):
+    reader = RecordReader()
+
+    await reader.get_record(record_id="record_id", request=build_request("viewer_token"), response=None)
+    record = await reader.get_record(record_id="record_id", request=build_request("viewer_token2"), response=None)
+
+    assert record == RECORD
+    assert reader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_record_entry_is_cleared_by_record_write(cache_backend, shared_keys, caller_groups, cache_enabled):
+    reader = RecordReader()
+
+    await reader.get_record(record_id="record_id", request=build_request("viewer_token"), response=None)
+    await invalidate_cache_tags([get_record_tag("record_id")])
+    await reader.get_record(record_id="record_id", request=build_request("viewer_token"), response=None)
+
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_binary_record_entry_is_shared(cache_backend, shared_keys, caller_groups):
+    reader = RecordReader()
+
+    for token in ("viewer_token", "viewer_token2"):
+        response = await reader.get_record_data(record_id="record_id", request=build_request(token), response=None)
+
+    assert response.body == b"\x00parquet\n"
+    assert reader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_record_entry_is_not_served_to_not_entitled_callers(cache_backend, shared_keys, caller_groups):
+    reader = RecordReader()
+
+    await reader.get_record(record_id="record_id", request=build_request("viewer_token"), response=None)
+    await reader.get_record(record_id="record_id", request=build_request("other_token"), response=None)
+
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_entry_without_records_is_not_shared(cache_backend, shared_keys, caller_groups):
+    reader = RecordReader()
+
+    for token in ("viewer_token", "viewer_token"):
+        await reader.get_without_record(request=build_request(token), response=None)
+
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_groups_entry_is_shared_by_callers_with_same_groups(cache_backend, shared_keys, caller_groups):
+    reader = RecordReader()
+
+    for token in ("viewer_token", "viewer_token2", "other_token"):
+        await reader.search(request=build_request(token))
+
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_call(cache_backend, shared_keys, caller_groups):
+    reader = RecordReader()
+
+    records = await asyncio.gather(*[
+        reader.get_slow_record(record_id="record_id", request=build_request(token), response=None)
+        for token in ("viewer_token", "viewer_token2", "other_token")
+    ])
+
+    assert records == [RECORD] * 3
+    assert records[0] is not records[1]
+    # the not entitled caller reads the record itself
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_follower_reads_itself_after_leader_failure(cache_backend, shared_keys, caller_groups):
+    reader = RecordReader()
+
+    leader_result, follower_result = await asyncio.gather(
+        *[
+            reader.get_entitled_record(record_id="record_id", request=build_request(token), response=None)
+            for token in ("other_token", "viewer_token")
+        ],
+        return_exceptions=True,
+    )
+
+    assert isinstance(leader_result, PermissionError)
+    assert follower_result == RECORD
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_token_cache_is_used_without_shared_keys(cache_backend, token_keys, caller_groups):
+    reader = RecordReader()
+
+    for token in ("viewer_token", "viewer_token2"):
+        await reader.search(request=build_request(token))
+
+    caller_groups.assert_not_called()
+    assert not cache_backend._store  # noqa: WPS437
+
+
+@pytest.mark.asyncio
+async def test_token_follower_calls_again_once_leader_disconnected(cache_backend, token_keys):
+    reader = RecordReader()
+
+    leader_record, follower_record = await asyncio.gather(
+        reader.get_record_once_disconnected("record_id", request=build_request("viewer_token")),
+        reader.get_record_once_disconnected("record_id", request=build_request("viewer_token")),
+        return_exceptions=True,
+    )
+
+    assert isinstance(leader_record, ClientDisconnectedException)
+    assert follower_record == RECORD
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_caller_groups_are_cached_per_token(cache_backend, mocker):
+    get_data_groups = mocker.patch.object(EntitlementsService, "get_data_groups", return_value=VIEWER_GROUPS)
+
+    for token in ("viewer_token", "viewer_token", "viewer_token2"):
+        assert await get_caller_groups(build_request(token), expire=60) == VIEWER_GROUPS
+
+    assert get_data_groups.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshed(cache_backend, shared_keys, caller_groups, mocker):
+    reader = RecordReader()
+    await reader.search_with_stale(request=build_request("viewer_token"))
+    mocker.patch("app.core.helpers.cache.shared_cache.time.time", return_value=time.time() + 61)
+
+    stale_response = await reader.search_with_stale(request=build_request("viewer_token2"))
+    await asyncio.sleep(0.01)
+    refreshed_response = await reader.search_with_stale(request=build_request("viewer_token"))
+
+    assert stale_response == {"calls": 1}
+    assert refreshed_response == {"calls": 2}
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_kept_per_token_without_shared_keys(cache_backend, token_keys, caller_groups, mocker):
+    reader = RecordReader()
+    await reader.search_with_stale(request=build_request("viewer_token"))
+    mocker.patch("app.core.helpers.cache.shared_cache.time.time", return_value=time.time() + 61)
+
+    stale_response = await reader.search_with_stale(request=build_request("viewer_token"))
+    await reader.search_with_stale(request=build_request("viewer_token2"))
+    await asyncio.sleep(0.01)
+
+    assert stale_response == {"calls": 1}
+    # a refresh for the stale entry and a miss for the other token
+    assert reader.calls == 3
+    caller_groups.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("legacy_entry", [b'{"id": "record_id"}', b"\x00parquet\n", b'[]\n{"id": "record_id"}'])
+async def test_entry_of_another_format_is_a_miss(cache_backend, shared_keys, caller_groups, legacy_entry):
+    reader = RecordReader()
+    await reader.get_record(record_id="record_id", request=build_request("viewer_token"), response=None)
+    for cache_key in list(cache_backend._store):  # noqa: WPS437
+        await cache_backend.set(cache_key, legacy_entry, 60)
+
+    record = await reader.get_record(record_id="record_id", request=build_request("viewer_token2"), response=None)
+
+    assert record == RECORD
+    assert reader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_key_is_apart_from_token_cache(cache_backend, token_keys, caller_groups):
+    reader = RecordReader()
+
+    await reader.search_with_stale(request=build_request("viewer_token"))
+
+    assert [cache_key for cache_key in cache_backend._store if ":swr:" in cache_key]  # noqa: WPS437
@@ -0,0 +1,149 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, create_autospec
+
+import httpx
+import pytest
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache.signed_url_cache import (
+    SignedUrlCache,
+    get_signed_url_expiry,
+)
+from app.dataframe.parquet_loader import ParquetLoader
+from app.models.schemas.user import User
+from app.providers.dependencies.blob_loader import IBlobLoader
+from app.services.dataset import DatasetService
+from app.services.osdu_clients.dataset_client import DatasetServiceApiClient
+
+CALLER = ("opendes", "token")
+EXPIRY = datetime(2030, 1, 1, tzinfo=timezone.utc).timestamp()
+SAS_URL = "https://account.blob.core.windows.net/c/blob?sv=2022-11-02&se=2030-01-01T00%3A00%3A00Z&sig=abc"
+AWS_URL = "https://bucket.s3.amazonaws.com/key?X-Amz-Date=20291231T230000Z&X-Amz-Expires=3600&X-Amz-Signature=abc"
+GCS_URL = "https://storage.googleapis.com/b/o?X-Goog-Date=20291231T220000Z&X-Goog-Expires=7200&X-Goog-Signature=a"
+GCS_V2_URL = f"https://storage.googleapis.com/b/o?GoogleAccessId=a&Expires={int(EXPIRY)}&Signature=abc"
+UNVERSIONED_DS = "opendes:dataset--File.Generic:ds-1"
+DS_1 = f"{UNVERSIONED_DS}:1"
+DS_2 = "opendes:dataset--File.Generic:ds-2:1"
+DS_3 = "opendes:dataset--File.Generic:ds-3:1"
+
+
+def signed_url(dataset_id: str) -> str:
+    return f"{SAS_URL}&id={dataset_id}"
+
+
+@pytest.mark.parametrize("url", [SAS_URL, AWS_URL, GCS_URL, GCS_V2_URL])
+def test_signed_url_expiry(url):
+    assert get_signed_url_expiry(url) == EXPIRY
+
+
+@pytest.mark.parametrize("url", ["file:///tmp/blob", "https://host/blob?se=not-a-date"])
+def test_unknown_signed_url_expiry(url):
+    assert get_signed_url_expiry(url) is None
+
+
+def test_urls_are_kept_until_expiry_minus_margin(mocker):
+    cache = SignedUrlCache(margin=300, max_size=10)
+    mocker.patch("app.core.helpers.cache.signed_url_cache.time.time", return_value=EXPIRY - 3600)
+    cache.add(CALLER, [("ds-1", SAS_URL), ("ds-2", "file:///tmp/blob")])
+
+    assert cache.get_many(CALLER, ["ds-1", "ds-2", "ds-3"]) == {"ds-1": SAS_URL, "ds-2": "file:///tmp/blob"}
+    assert cache.get(("opendes", "other-token"), "ds-1") is None
+
+    mocker.patch("app.core.helpers.cache.signed_url_cache.time.time", return_value=EXPIRY - 300)
+    assert cache.get(CALLER, "ds-1") is None
+
+
+def test_urls_are_evicted_and_discarded():
+    cache = SignedUrlCache(margin=0, max_size=1)
+    cache.add(CALLER, [("ds-1", signed_url("ds-1")), ("ds-2", signed_url("ds-2"))])
+
+    assert cache.get_many(CALLER, ["ds-1", "ds-2"]) == {"ds-2": signed_url("ds-2")}
+    cache.discard(CALLER, ["ds-2"])
+    assert cache.get(CALLER, "ds-2") is None
+
+
+class TestDatasetServiceSignedUrls:
+
+    @pytest.fixture
+    def dataset_service(self, mocker, fresh_signed_url_cache):
+        mocker.patch("app.services.dataset.get_blob_loader")
+        service = DatasetService("opendes", get_app_settings(), User(access_token="token"), extra_headers={})
+        service.dataset_client = MagicMock(spec=DatasetServiceApiClient)
+        service.dataset_client.retrieval_instructions.side_effect = lambda dataset_ids: {
+            "datasets": [
+                {"datasetRegistryId": dataset_id, "retrievalProperties": {"signedUrl": signed_url(dataset_id)}}
+                for dataset_id in dataset_ids
+            ],
+        }
+        service.blob_loader = create_autospec(IBlobLoader, spec_set=True)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_only_missing_urls_are_requested(self, dataset_service):
+        await dataset_service.get_signed_urls([DS_1, DS_2])
+        signed_urls = await dataset_service.get_signed_urls([DS_3, DS_1, DS_2])
+
+        assert signed_urls == [(dataset_id, signed_url(dataset_id)) for dataset_id in (DS_3, DS_1, DS_2)]
+        assert [request.args for request in dataset_service.dataset_client.retrieval_instructions.await_args_list] == [
+            ([DS_1, DS_2],), ([DS_3],),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_download_uses_prefetched_url(self, dataset_service):
+        await dataset_service.get_signed_urls([DS_1])
+        await dataset_service.download_file(DS_1)
+
+        dataset_service.dataset_client.get_retrieval_instructions.assert_not_called()
+        dataset_service.blob_loader.download_blob.assert_awaited_once_with(signed_url(DS_1))
+
+    @pytest.mark.asyncio
+    async def test_failed_download_drops_url(self, dataset_service, fresh_signed_url_cache):
+        await dataset_service.get_signed_urls([DS_1])
+        dataset_service.blob_loader.download_blob.side_effect = RuntimeError("revoked")
+
+        with pytest.raises(RuntimeError):
+            await dataset_service.download_file(DS_1)
+
+        assert fresh_signed_url_cache.get(CALLER, DS_1) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code,discarded", [(403, True), (404, True), (500, False)])
+    async def test_rejected_url_is_dropped_by_parquet_loader(
+        self, dataset_service, fresh_signed_url_cache, status_code, discarded,
+    ):
+        [(dataset_id, url)] = await dataset_service.get_signed_urls([DS_1])
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.stream.side_effect = httpx.HTTPStatusError("", request=None, response=MagicMock(status_code=status_code))
+
+        df_payload = await ParquetLoader(dataset_service)._read_parquet_from_url(dataset_id, url, client=client)
+
+        assert df_payload.error_msg
+        cached_url = fresh_signed_url_cache.get(CALLER, DS_1)
+        assert (cached_url is None) == discarded
+
+    @pytest.mark.asyncio
+    async def test_unversioned_urls_are_not_kept(self, dataset_service, fresh_signed_url_cache):
+        dataset_service.dataset_client.get_retrieval_instructions.return_value = {
+            "datasets": [{"retrievalProperties": {"signedUrl": signed_url(UNVERSIONED_DS)}}],
+        }
+        await dataset_service.get_signed_urls([UNVERSIONED_DS])
+        await dataset_service.download_file(UNVERSIONED_DS)
+        await dataset_service.download_file(UNVERSIONED_DS)
+
+        assert dataset_service.dataset_client.get_retrieval_instructions.await_count == 2
+        assert fresh_signed_url_cache.get(CALLER, UNVERSIONED_DS) is None
@@ -0,0 +1,151 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import pytest
+
+from app.core.helpers.cache.single_flight import SingleFlight
+
+
+class Loader:
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.error = error
+
+    async def load(self) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error:
+            raise self.error
+        return {"calls": self.calls}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_call():
+    flights = SingleFlight()
+    loader = Loader()
+
+    results = await asyncio.gather(*[flights.run("key", loader.load) for _ in range(3)])
+
+    assert loader.calls == 1
+    assert [shared for _, shared in results] == [False, True, True]
+    assert all(result == {"calls": 1} for result, _ in results)
+    assert not len(flights)
+
+
+@pytest.mark.asyncio
+async def test_followers_get_copies():
+    flights = SingleFlight()
+    loader = Loader()
+
+    (leader_result, _), (follower_result, _) = await asyncio.gather(
+        flights.run("key", loader.load),
+        flights.run("key", loader.load),
+    )
+
+    assert leader_result == follower_result
+    assert leader_result is not follower_result
+
+
+@pytest.mark.asyncio
+async def test_followers_do_not_see_leader_changes():
+    flights = SingleFlight()
+    loader = Loader()
+
+    async def run_and_change() -> dict:
+        leader_result, _ = await flights.run("key", loader.load)
+        leader_result["calls"] = 0
+        return leader_result
+
+    async def run_later() -> dict:
+        await asyncio.sleep(0)
+        follower_result, _ = await flights.run("key", loader.load)
+        return follower_result
+
+    leader_result, follower_result = await asyncio.gather(run_and_change(), run_later())
+
+    assert leader_result == {"calls": 0}
+    assert follower_result == {"calls": 1}
+
+
+@pytest.mark.asyncio
+async def test_followers_share_result_without_copies():
+    flights = SingleFlight(copy_results=False)
+    loader = Loader()
+
+    (leader_result, _), (follower_result, _) = await asyncio.gather(
+        flights.run("key", loader.load),
+        flights.run("key", loader.load),
+    )
+
+    assert leader_result is follower_result
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_shared():
+    flights = SingleFlight()
+    loader = Loader()
+
+    await asyncio.gather(flights.run("key", loader.load), flights.run("other_key", loader.load))
+
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_is_raised_to_all_callers():
+    flights = SingleFlight()
+    loader = Loader(error=ValueError("load failed"))
+
+    results = await asyncio.gather(
+        flights.run("key", loader.load),
+        flights.run("key", loader.load),
+        return_exceptions=True,
+    )
+
+    assert loader.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not len(flights)
+
+
+@pytest.mark.asyncio
+async def test_leader_cancellation_does_not_cancel_call():
+    flights = SingleFlight()
+    loader = Loader()
+
+    leader = asyncio.ensure_future(flights.run("key", loader.load))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flights.run("key", loader.load))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    result, shared = await follower
+
+    assert result == {"calls": 1}
+    assert shared
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_started_call_is_shared():
+    flights = SingleFlight()
+    loader = Loader()
+
+    flight = flights.start("key", loader.load)
+    result, shared = await flights.run("key", loader.load)
+
+    assert await flight == result
+    assert shared
+    assert "key" not in flights
+    assert loader.calls == 1
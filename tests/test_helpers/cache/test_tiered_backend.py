@@ -0,0 +1,167 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.helpers.cache.backends.tiered_cache import (
+    LocalLRUCache,
+    TieredBackend,
+    TieredCacheBackend,
+)
+
+CHANNEL = "test-channel"
+
+
+@pytest.fixture
+def tiered_backend():
+    backend = TieredBackend(MagicMock(publish=AsyncMock()), max_bytes=10, channel=CHANNEL)
+    backend._remote = AsyncMock()  # noqa: WPS437
+    backend._remote.get_with_ttl.return_value = (-2, None)  # noqa: WPS437
+    return backend
+
+
+def test_local_cache_evicts_least_recently_used():
+    local_cache = LocalLRUCache(max_bytes=10)
+    local_cache.set("key1", b"1234", expire=60)
+    local_cache.set("key2", b"1234", expire=60)
+    local_cache.get_with_ttl("key1")
+    local_cache.set("key3", b"1234", expire=60)
+
+    assert local_cache.get_with_ttl("key2") == (0, None)
+    assert local_cache.get_with_ttl("key1")[1] == b"1234"
+    assert local_cache.size == 8
+
+
+def test_local_cache_skips_values_over_budget():
+    local_cache = LocalLRUCache(max_bytes=10)
+    local_cache.set("key", b"1234", expire=60)
+    local_cache.set("key", b"12345678901", expire=60)
+
+    assert not local_cache
+    assert local_cache.size == 0
+
+
+def test_local_cache_entry_expires():
+    local_cache = LocalLRUCache(max_bytes=10)
+    with patch("app.core.helpers.cache.backends.tiered_cache.time.monotonic", side_effect=[0, 0, 61]):
+        local_cache.set("key", b"1234", expire=60)
+        assert local_cache.get_with_ttl("key") == (60, b"1234")
+        assert local_cache.get_with_ttl("key") == (0, None)
+
+    assert local_cache.size == 0
+
+
+@pytest.mark.asyncio
+async def test_get_fills_local_cache_from_redis(tiered_backend):
+    tiered_backend._remote.get_with_ttl.return_value = (30, b"value")  # noqa: WPS437
+
+    assert await tiered_backend.get_with_ttl("key") == (30, b"value")
+    assert await tiered_backend.get("key") == b"value"
+
+    tiered_backend._remote.get_with_ttl.assert_awaited_once_with("key")  # noqa: WPS437
+    assert tiered_backend.local_cache.get_with_ttl("key")[0] <= 30
+
+
+@pytest.mark.asyncio
+async def test_set_writes_both_tiers_and_publishes(tiered_backend):
+    await tiered_backend.set("key", "value", expire=60)
+
+    tiered_backend._remote.set.assert_awaited_once_with("key", "value", 60)  # noqa: WPS437
+    assert tiered_backend.local_cache.get_with_ttl("key")[1] == b"value"
+    channel, message = tiered_backend.redis.publish.await_args.args
+    assert channel == CHANNEL
+    assert json.loads(message)["key"] == "key"
+
+
+@pytest.mark.asyncio
+async def test_clear_namespace(tiered_backend):
+    await tiered_backend.set("prefix:key", "value", expire=60)
+    await tiered_backend.set("other:key", "value", expire=60)
+
+    await tiered_backend.clear(namespace="prefix")
+
+    assert tiered_backend.local_cache.get_with_ttl("prefix:key") == (0, None)
+    assert tiered_backend.local_cache.get_with_ttl("other:key")[1] == b"value"
+    tiered_backend._remote.clear.assert_awaited_once_with("prefix", None)  # noqa: WPS437
+
+
+@pytest.mark.parametrize(
+    "message,expected_value", [
+        ({"node": "other", "namespace": None, "key": "key"}, None),
+        ({"node": "other", "namespace": "ke", "key": None}, None),
+        ({"node": "other", "namespace": None, "key": "other_key"}, b"value"),
+    ],
+)
+def test_invalidate_from_other_worker(tiered_backend, message, expected_value):
+    tiered_backend.local_cache.set("key", b"value", expire=60)
+
+    tiered_backend.invalidate(message)
+
+    assert tiered_backend.local_cache.get_with_ttl("key")[1] == expected_value
+
+
+def test_invalidate_skips_own_messages(tiered_backend):
+    tiered_backend.local_cache.set("key", b"value", expire=60)
+
+    tiered_backend.invalidate({"node": tiered_backend._node_id, "namespace": None, "key": "key"})  # noqa: WPS437
+
+    assert tiered_backend.local_cache.get_with_ttl("key")[1] == b"value"
+
+
+@pytest.mark.asyncio
+@patch.object(TieredCacheBackend, "_validate_redis_settings")
+@patch("app.core.helpers.cache.backends.tiered_cache.redis_client")
+async def test_get_backend(redis_mock, mock_validate_redis_settings):
+    with patch.object(TieredBackend, "start_listener") as start_listener:
+        backend = await TieredCacheBackend().get_backend()
+
+    mock_validate_redis_settings.assert_called_with(redis_mock)
+    start_listener.assert_called_once()
+    assert backend.redis is redis_mock
+
+
+class PubSubMock:
+    def __init__(self, messages):
+        self.messages = messages
+        self.subscribe = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_listener_invalidates_local_entries(tiered_backend):
+    message = {"data": json.dumps({"node": "other", "namespace": None, "key": "key"}).encode()}
+    pubsub = PubSubMock([message])
+    tiered_backend.redis.pubsub.return_value = pubsub
+    tiered_backend.local_cache.set("key", b"value", expire=60)
+
+    tiered_backend.start_listener()
+    await asyncio.sleep(0)
+    await tiered_backend.stop_listener()
+
+    pubsub.subscribe.assert_awaited_once_with(CHANNEL)
+    assert tiered_backend.local_cache.get_with_ttl("key") == (0, None)
@@ -0,0 +1,199 @@
+#  Copyright 2024 ExxonMobil Technology and Engineering Company
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.core.config import get_app_settings
+from app.core.helpers.cache import warmup
+from app.models.schemas.cache import WarmupEndpoint, WarmupQuery
+
+SEARCH_QUERY = WarmupQuery(
+    data_partition_id="opendes",
+    analysis_type="rca",
+    content_schema_version="1.0.0",
+)
+SEARCH_DATA_QUERY = WarmupQuery(
+    data_partition_id="opendes",
+    analysis_type="rca",
+    content_schema_version="1.0.0",
+    endpoint=WarmupEndpoint.SEARCH_DATA,
+    params={"columns_filter": "SampleID"},
+)
+CREDENTIAL_SETTINGS = {
+    "cache_warmup_token_url": "https://login.test/token",
+    "cache_warmup_client_id": "client",
+    "cache_warmup_client_secret": "secret",
+}
+
+
+def _with_request(response: httpx.Response) -> httpx.Response:
+    response.request = httpx.Request("POST", CREDENTIAL_SETTINGS["cache_warmup_token_url"])
+    return response
+
+
+@pytest.fixture
+def search_app():
+    search_app = FastAPI()
+    search_app.state.requests = []
+
+    @search_app.get("/api/os-rafs-ddms/v2/samplesanalysis/{analysis_type}/search")
+    async def search(request: Request, analysis_type: str):
+        search_app.state.requests.append(request)
+        return JSONResponse({"result": []})
+
+    return search_app
+
+
+def test_recorder_keeps_most_frequent_queries():
+    recorder = warmup.WarmupRecorder(max_queries=1)
+    recorder.record(SEARCH_QUERY)
+    recorder.record(SEARCH_QUERY)
+    recorder.record(SEARCH_DATA_QUERY)
+
+    assert recorder._counts == {SEARCH_QUERY.query_key: 2}  # noqa: WPS437
+
+
+@pytest.mark.asyncio
+async def test_saved_queries_are_merged(cache_backend):
+    settings = get_app_settings().copy(update={"cache_warmup_recorded_queries": 2})
+    recorder = warmup.WarmupRecorder(max_queries=2)
+    recorder.record(SEARCH_DATA_QUERY)
+    await recorder.save()
+    recorder.record(SEARCH_QUERY)
+    recorder.record(SEARCH_QUERY)
+    await recorder.save()
+
+    assert await warmup.get_warmup_queries(settings) == [SEARCH_QUERY, SEARCH_DATA_QUERY]
+
+
+@pytest.mark.asyncio
+async def test_warmup_file_queries_come_first(cache_backend, tmp_path):
+    warmup_file = tmp_path / "warmup.json"
+    warmup_file.write_text(json.dumps([SEARCH_DATA_QUERY.dict()]))
+    settings = get_app_settings().copy(
+        update={"cache_warmup_file": str(warmup_file), "cache_warmup_recorded_queries": 2},
+    )
+    recorder = warmup.WarmupRecorder(max_queries=2)
+    recorder.record(SEARCH_QUERY)
+    recorder.record(SEARCH_DATA_QUERY)
+    recorder.record(SEARCH_DATA_QUERY)
+    await recorder.save()
+
+    assert await warmup.get_warmup_queries(settings) == [SEARCH_DATA_QUERY, SEARCH_QUERY]
+
+
+@pytest.mark.asyncio
+async def test_invalid_warmup_file_is_skipped(tmp_path):
+    warmup_file = tmp_path / "warmup.json"
+    warmup_file.write_text(json.dumps([{"analysis_type": "rca"}]))
+    settings = get_app_settings().copy(update={"cache_warmup_file": str(warmup_file)})
+
+    assert await warmup.get_warmup_queries(settings) == []
+
+
+@pytest.mark.asyncio
+async def test_queries_are_replayed_through_the_app(search_app):
+    report = await warmup.warm_up_cache(search_app, [SEARCH_QUERY, SEARCH_DATA_QUERY], "token", concurrency=1)
+
+    assert (report.replayed, report.failed) == (2, 1)
+    replayed_request = search_app.state.requests[0]
+    assert replayed_request.headers["Authorization"] == "Bearer token"
+    assert replayed_request.headers["data-partition-id"] == "opendes"
+    assert replayed_request.headers["Accept"] == "*/*;version=1.0.0"
+
+
+@pytest.mark.asyncio
+async def test_warmup_on_start_requires_a_credential(mocker, search_app):
+    settings = get_app_settings().copy(update={
+        "cache_enable": True, "cache_warmup_on_start": True, "cache_shared_keys": True,
+    })
+    warm_up_cache = mocker.patch("app.core.helpers.cache.warmup.warm_up_cache")
+
+    await warmup.warm_up_cache_on_start(search_app, settings)
+
+    warm_up_cache.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_warmup_on_start_requires_shared_keys(mocker, search_app):
+    settings = get_app_settings().copy(update={
+        "cache_enable": True, "cache_warmup_on_start": True, **CREDENTIAL_SETTINGS,
+    })
+    warm_up_cache = mocker.patch("app.core.helpers.cache.warmup.warm_up_cache")
+    logger_warning = mocker.patch("app.core.helpers.cache.warmup.logger.warning")
+
+    await warmup.warm_up_cache_on_start(search_app, settings)
+
+    warm_up_cache.assert_not_called()
+    assert "CACHE_SHARED_KEYS" in logger_warning.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_warmup_credential_refreshes_expiring_tokens(mocker, search_app):
+    token_responses = iter([
+        httpx.Response(200, json={"access_token": "token1", "expires_in": 30}),
+        httpx.Response(200, json={"access_token": "token2", "expires_in": 3600}),
+    ])
+    post = mocker.patch(
+        "app.core.helpers.cache.warmup.httpx.AsyncClient.post",
+        side_effect=lambda *args, **kwargs: _with_request(next(token_responses)),
+    )
+    credential = warmup.WarmupCredential(get_app_settings().copy(update=CREDENTIAL_SETTINGS))
+
+    await warmup.warm_up_cache(search_app, [SEARCH_QUERY, SEARCH_QUERY, SEARCH_QUERY], credential, concurrency=1)
+
+    # the first token expires within the refresh margin, the second one is reused
+    assert post.call_count == 2
+    assert post.call_args.kwargs["data"]["grant_type"] == "client_credentials"
+    assert [request.headers["Authorization"] for request in search_app.state.requests] == [
+        "Bearer token1", "Bearer token2", "Bearer token2",
+    ]
+
+
+def test_query_params_keep_repeated_names():
+    query = WarmupQuery(**{**SEARCH_DATA_QUERY.dict(), "params": [("columns_filter", "A"), ("columns_filter", "B")]})
+
+    assert query.params == [("columns_filter", "A"), ("columns_filter", "B")]
+    assert SEARCH_DATA_QUERY.params == [("columns_filter", "SampleID")]
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_params_are_replayed(search_app):
+    query = WarmupQuery(**{**SEARCH_QUERY.dict(), "params": [("columns_filter", "A"), ("columns_filter", "B")]})
+
+    await warmup.warm_up_cache(search_app, [query], "token", concurrency=1)
+
+    assert search_app.state.requests[0].query_params.getlist("columns_filter") == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_warmup_on_start_runs_in_background(mocker, search_app):
+    warmup_started = asyncio.Event()
+
+    async def warm_up_cache_on_start(app, settings):
+        warmup_started.set()
+        await asyncio.sleep(60)
+    mocker.patch("app.core.helpers.cache.warmup.warm_up_cache_on_start", side_effect=warm_up_cache_on_start)
+
+    warmup_task = warmup.start_cache_warmup(search_app, get_app_settings())
+    await asyncio.wait_for(warmup_started.wait(), timeout=1)
+    await warmup.stop_cache_warmup()
+
+    assert warmup_task.cancelled()
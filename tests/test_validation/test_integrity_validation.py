@@ -50,7 +50,7 @@ async def test_validate_ids_from_records_raises(mocker):
 
 @pytest.mark.asyncio
 async def test_validate_referential_integrity(mocker):
-    mock_get_storage_service = StorageService(None, query_records_response={"invalidRecords": [EXPECTED_IDS_LIST]})
+    mock_get_storage_service = StorageService(None, query_records_response={"invalidRecords": EXPECTED_IDS_LIST})
     with pytest.raises(HTTPException) as exc_info:
         await validate_referential_integrity(
             [TEST_RECORD],
@@ -61,7 +61,7 @@ async def test_validate_referential_integrity(mocker):
     assert exc_info.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
 
     error_title = "Request can't be processed due to missing referenced records."
-    error_details = f"Records not found: [{EXPECTED_IDS_LIST}]"
+    error_details = f"Records not found: {EXPECTED_IDS_LIST}"
     expected_response_detail = f"{error_title} {error_details}"
     assert exc_info.value.detail == expected_response_detail
 